@@ -47,23 +47,94 @@ quiescence window supersedes the candidate — the pending value was dialed
 for the stream that just changed, so its target profile is ambiguous and
 dropping beats storing it under the wrong key.
 
-Stores also defer while the addon settings dialog (window 10140) is open:
-the dialog saves its working copy of our settings on close, which would
-clobber any write made underneath it (settings-state doctrine). The quiesced
-candidate is simply held on the active cadence until the dialog closes.
+Stores go through the settings writer, which holds them while the addon
+settings dialog (window 10140) is open — its save-on-close would clobber a
+write made underneath it (settings-state doctrine) — and retries a failed
+store. The watcher hands the value over and accounts for it at once: the
+writer stages it in the OffsetTable, so the applier and the watcher read
+the user's value back immediately, and the watcher never polls the dialog.
 
 Store-time profile derivation closes the adopt-vs-store interleaving hazard:
 adoption (StreamDetector) and store (here) are serialized on ONE thread and
 the setting key is derived from ``session.profile`` at the store instant, so
 a value always lands under the profile in force when quiescence completed.
 
-On a successful store the watcher posts a session-stamped
-``UserOffsetSaved`` (profile + ms captured at store time).
+On a store the watcher posts a session-stamped ``UserOffsetSaved``
+(profile + ms captured at store time). A stored 0 means "uncalibrated"
+(``aom.domain.resolution``), so a 0 dialed for a profile that inherits a
+non-zero offset (its all-FPS row or HDR default) cannot be stored: the
+next apply would resolve straight back to the inherited value. The
+watcher stores nothing, accounts for the 0 as the baseline, and posts
+``UserOffsetRefused`` with the inherited offset still in force.
+
+Adaptive cadence: a film is mostly one long stable stretch, so polling it
+at ``IDLE_TICK_SECONDS`` throughout is thousands of reads for nothing.
+Once the reading has held the baseline for ``BACKOFF_AFTER_SECONDS`` each
+further stable tick doubles the idle cadence, up to the ceiling
+(``max_idle_tick``). Anything that is not a stable reading — an apply, a
+candidate, a store, an unreadable delay — settles back to the idle cadence
+first. Hints that the user may be adjusting snap the chain to
+``ACTIVE_TICK_SECONDS`` at once: a resume, a ``Player.OnPropertyChanged``
+notification, and — checked on the backed-off ticks themselves — the
+playback audio settings dialog being open. No polling while paused: the
+chain is cancelled on ``Paused`` and restarted on ``Resumed``, and a
+candidate pending across the pause restarts its quiescence window, so it
+must still hold ``QUIESCENCE_SECONDS`` of playback. Quiescence and the
+store-time teardown guard are untouched: a candidate always polls at the
+active cadence.
+
+Notification hints: a ``Player.OnPropertyChanged`` reads the delay at
+once (``_observe`` from the notification) instead of waiting for the next
+tick. Whether Kodi announces an audio-delay change at all is not a
+version we can look up, so it is learned at runtime:
+
+- Kodi 20 Nexus, 21 Omega: an audio-delay change (OSD slider, keymap,
+  JSON-RPC ``Player.SetAudioDelay``) is not announced; hints are never
+  confirmed and the watcher is pure polling at the adaptive cadence.
+- Kodi 22: not announced either as of writing; a release or build that
+  does announce it is picked up with no code change.
+- Any version: other property changes (an audio stream switch, ...) read
+  at once, and while hints are untrusted still snap the chain to the
+  active cadence — an adjustment often follows one.
+
+Hints are trusted once ``HINT_CONFIRMATIONS`` consecutive fresh
+candidates of the session were each seen on a hinted read; the idle
+ceiling then relaxes to ``SAFETY_NET_TICK_SECONDS``, the poll only a
+safety net. One hinted candidate proves nothing: a track or subtitle
+change that happens to coincide with an adjustment hints it too. Trust is
+per session (``session.watch_hint_streak``), so a coincidence never
+outlives its playback. A fresh candidate found by a plain tick restarts
+the count — while trusted, it means a hint went missing, and polling is
+back in charge at the ``max_idle_tick`` ceiling. The fallback when hints
+never arrive is the polling above, unchanged.
+
+Learned quiescence: ``QUIESCENCE_SECONDS`` is sized for the worst box
+measured; most platforms tear down faster. A stop (``PlaybackStopped``/
+``PlaybackEnded``) after a phantom 0 was read measures the local window
+from that first phantom reading to the stop. A phantom 0 is a candidate,
+so once one is read the ticks run at ``ACTIVE_TICK_SECONDS`` whatever the
+idle cadence was; a stop after back-off is sampled like any other. A stop
+with no phantom read teaches nothing (the gap since the last clean reading
+would measure the tick phase, not the teardown), nor does one across a
+pause; a phantom that outlasted quiescence and reached the store-time
+guard is a full ``QUIESCENCE_SECONDS`` sample. Samples fold into
+``policies.phantom_bound`` (peak hold, slow decay), persisted as the
+read-only ``platform_phantom_ms`` setting once ``MIN_PHANTOM_SAMPLES``
+stops agree on it; from then on quiescence is the bound plus
+``PHANTOM_MARGIN_SECONDS``, never below ``MIN_QUIESCENCE_SECONDS`` nor
+above ``QUIESCENCE_SECONDS``. The store-time guard stays the backstop.
+
+Tick cost: a steady tick reads the same infolabel string as the tick
+before, so the session keeps the last raw string with its parsed value
+and parses only a string it has not seen. A reading on the baseline with
+no candidate pending goes straight to the cadence (the common case needs
+nothing else). Eligibility is memoized per profile and dropped on
+``ProfileChanged``/``SettingsChanged`` — the only ways its inputs change.
 
 Pure app layer: Kodi I/O via the injected gateway, eligibility reads via the
-injected settings adapter, offset reads/writes via the injected OffsetTable
-(get/store by profile — the key is the table's concern), log sinks injected;
-no Kodi imports.
+injected settings adapter, offset reads via the injected OffsetTable (get
+by profile — the key is the table's concern) and writes via the injected
+settings writer, log sinks injected; no Kodi imports.
 """
 
 import time
@@ -77,31 +148,60 @@ class AdjustmentWatcher:
 
     IDLE_TICK_SECONDS = 1.0     # poll cadence when nothing is happening
     ACTIVE_TICK_SECONDS = 0.25  # tightened cadence while observing a change
+    # Backoff: after this long on the baseline the idle cadence doubles per
+    # stable tick, up to the ceiling (the constructor's max_idle_tick).
+    BACKOFF_AFTER_SECONDS = 30.0
+    MAX_IDLE_TICK_SECONDS = 8.0
+    # The idle ceiling once notification hints are trusted (see module doc),
+    # after this many consecutive hinted candidates in the session.
+    SAFETY_NET_TICK_SECONDS = 30.0
+    HINT_CONFIRMATIONS = 3
     # Foreign value must hold this long to be stored. 2.0s outruns the
     # teardown phantom: field-measured stop windows where the delay infolabel
     # reads a parseable 0 while the session is still alive ran up to 1.15s
     # (a shorter quiescence would let that window store 0 over the user's
     # offset).
     QUIESCENCE_SECONDS = 2.0
+    # Learned quiescence (see module doc): the local bound plus a margin,
+    # used once enough stops were measured, within [MIN, QUIESCENCE].
+    MIN_QUIESCENCE_SECONDS = 0.5
+    PHANTOM_MARGIN_SECONDS = 0.25
+    MIN_PHANTOM_SAMPLES = 3
+    PHANTOM_DECAY = 8
+    PHANTOM_SETTING = 'platform_phantom_ms'
     INFOLABEL_AUDIO_DELAY = 'Player.AudioDelay'
     _TICK_KEY = 'aom.watcher.tick'
 
     def __init__(self, dispatcher, session_tracker, gateway, settings,
-                 offsets, clock=time.monotonic, *, log_debug, log_warning):
+                 offsets, writer, clock=time.monotonic, *, log_debug,
+                 max_idle_tick=MAX_IDLE_TICK_SECONDS):
         self._dispatcher = dispatcher
         self._sessions = session_tracker
         self._gateway = gateway
         self._settings = settings
-        self._offsets = offsets      # OffsetTable: get/store by profile
+        self._offsets = offsets      # OffsetTable: get by profile
+        self._writer = writer        # SettingsWriter: write_offset/_int
         self._clock = clock
         self._log = log_debug
-        self._warn = log_warning
+        self._max_idle = max(max_idle_tick, self.IDLE_TICK_SECONDS)
+        # The last clean reading and the first phantom 0 after it
+        # (monotonic), and whether the next stop may be sampled.
+        self._clean_at = None
+        self._phantom_at = None
+        self._sample_stop = True
+        self._phantom_ms = None      # the learned bound, read on first use
+        self._phantom_learned = False
+        self._phantom_samples = 0
+        self._eligibility = None     # (profile, eligible), see _eligible
 
         dispatcher.subscribe(events.ProfileChanged, self._on_profile_changed)
         dispatcher.subscribe(events.SettingsChanged, self._on_settings_changed)
         dispatcher.subscribe(events.WatchTick, self._on_watch_tick)
         dispatcher.subscribe(events.PlaybackStopped, self._on_playback_ended)
         dispatcher.subscribe(events.PlaybackEnded, self._on_playback_ended)
+        dispatcher.subscribe(events.Paused, self._on_paused)
+        dispatcher.subscribe(events.Resumed, self._on_resumed)
+        dispatcher.subscribe(events.PlayerNotified, self._on_player_notified)
 
     # -- eligibility ------------------------------------------------------------
 
@@ -112,16 +212,24 @@ class AdjustmentWatcher:
         NOT audio — an audio-unknown stream is still watched. The store path
         (_store) re-validates the whole profile before writing, so nothing
         incomplete is ever persisted.
+
+        Memoized for the profile it was answered for; ProfileChanged and
+        SettingsChanged drop the memo.
         """
-        return (profile is not None
+        if self._eligibility is not None and self._eligibility[0] is profile:
+            return self._eligibility[1]
+        eligible = (profile is not None
                 and self._settings.active_monitoring_enabled()
                 and profile.hdr_type != formats.UNKNOWN
                 and profile.fps_type != formats.UNKNOWN
                 and self._settings.is_hdr_enabled(profile.hdr_type))
+        self._eligibility = (profile, eligible)
+        return eligible
 
     # -- eligibility triggers (dispatcher thread) -------------------------------
 
     def _on_profile_changed(self, event):
+        self._eligibility = None
         if not self._sessions.is_alive(event.session_id):
             return
         session = self._sessions.current
@@ -134,10 +242,17 @@ class AdjustmentWatcher:
         self._clear_observation(session)
         self._evaluate(session)
 
-    def _on_settings_changed(self, _event):
+    def _on_settings_changed(self, event):
+        self._eligibility = None
         session = self._sessions.current
         if session is None:
             return
+        # Only the eligibility inputs matter; any other save is a no-op.
+        hdr_toggle = (f"enable_{session.profile.hdr_type}"
+                      if session.profile is not None else None)
+        if not policies.save_touches(event.changed,
+                                     'enable_active_monitoring', hdr_toggle):
+            return
         self._evaluate(session)
 
     def _evaluate(self, session):
@@ -155,6 +270,52 @@ class AdjustmentWatcher:
 
     def _on_playback_ended(self, _event):
         self._dispatcher.cancel(self._TICK_KEY)
+        phantom_at = self._phantom_at
+        sample_stop, self._sample_stop = self._sample_stop, True
+        self._clean_at = self._phantom_at = None
+        if phantom_at is not None and sample_stop:
+            self._learn_phantom(self._clock() - phantom_at)
+
+    # -- pause and hints (dispatcher thread) ------------------------------------
+
+    def _on_paused(self, _event):
+        # Nothing to watch in a paused player; Resumed restarts the chain.
+        self._dispatcher.cancel(self._TICK_KEY)
+        self._clean_at = self._phantom_at = None
+
+    def _on_resumed(self, _event):
+        session = self._sessions.current
+        if session is None or not self._eligible(session.profile):
+            return
+        if session.watch_pending is not None:
+            # Quiescence counts playback: the candidate holds from now.
+            session.watch_pending = (session.watch_pending[0], self._clock())
+        self._snap_back(session, "resumed")
+
+    def _on_player_notified(self, event):
+        if event.method != 'Player.OnPropertyChanged':
+            return
+        session = self._sessions.current
+        if (session is None or session.paused
+                or not self._eligible(session.profile)):
+            return
+        if self._hints_trusted(session):
+            # The hint is the detection: read now, stay on the safety net.
+            self._schedule_tick(session.session_id,
+                                self._observe(session, hinted=True))
+            return
+        self._unsettle(session)
+        self._log("AOM_AdjustmentWatcher: player property changed; polling "
+                  "at the active cadence")
+        self._schedule_tick(session.session_id, min(
+            self._observe(session, hinted=True), self.ACTIVE_TICK_SECONDS))
+
+    def _snap_back(self, session, reason):
+        """The user may be adjusting: poll at the active cadence now."""
+        self._unsettle(session)
+        self._log(f"AOM_AdjustmentWatcher: {reason}; polling at the active "
+                  f"cadence")
+        self._schedule_tick(session.session_id, self.ACTIVE_TICK_SECONDS)
 
     # -- the poll (dispatcher thread) -------------------------------------------
 
@@ -162,8 +323,11 @@ class AdjustmentWatcher:
         if not self._sessions.is_alive(event.session_id):
             return  # a superseded session's chain is inert
         session = self._sessions.current
+        if session.paused:
+            return  # Resumed restarts the chain
         if not self._eligible(session.profile):
             self._clear_observation(session)
+            self._clean_at = self._phantom_at = None
             self._log("AOM_AdjustmentWatcher: no longer eligible; stopping "
                       "watch")
             return  # ProfileChanged/SettingsChanged restart the chain
@@ -171,23 +335,47 @@ class AdjustmentWatcher:
         # picks the next cadence — every continue-watching path funnels here.
         self._schedule_tick(session.session_id, self._observe(session))
 
-    def _observe(self, session):
-        """Classify the current delay reading; return the next tick cadence."""
-        observed = policies.parse_delay_ms(
-            self._gateway.infolabel(self.INFOLABEL_AUDIO_DELAY))
+    def _observe(self, session, hinted=False):
+        """Classify the current delay reading; return the next tick cadence.
+
+        ``hinted``: the read was triggered by a notification, not a tick.
+        """
+        raw = self._gateway.infolabel(self.INFOLABEL_AUDIO_DELAY)
+        reading = session.watch_reading
+        if reading is not None and reading[0] == raw:
+            observed = reading[1]
+        else:
+            observed = policies.parse_delay_ms(raw)
+            session.watch_reading = (raw, observed)
+        if (observed is not None and observed == session.watch_baseline_ms
+                and session.watch_pending is None):
+            # Steady state: on the baseline, nothing pending.
+            self._clean_at, self._phantom_at = self._clock(), None
+            return self._settled(session)
         if observed is None:
             self._log("AOM_AdjustmentWatcher: audio delay unreadable; "
                       "retrying")
+            self._unsettle(session)
             return self.IDLE_TICK_SECONDS
 
+        now = self._clock()
+        if observed == 0 and session.watch_baseline_ms not in (None, 0):
+            if self._phantom_at is None:
+                self._phantom_at = now          # a stop would make it a phantom
+        else:
+            self._clean_at, self._phantom_at = now, None
+
         applied_ms = session.applied[1] if session.applied is not None else None
 
         if observed == applied_ms:
             # Our own apply echoing back (the applier records session.applied
             # BEFORE the RPC, so this comparison is always current).
+            if (observed != session.watch_baseline_ms
+                    or session.watch_pending is not None):
+                self._unsettle(session)        # a fresh apply, or dialed back
             session.watch_baseline_ms = observed
             session.watch_pending = None
-            return self.IDLE_TICK_SECONDS
+            return self._settled(session)
 
         if session.watch_baseline_ms is None:
             # First observation and it isn't ours: adopt as baseline silently.
@@ -197,23 +385,28 @@ class AdjustmentWatcher:
             session.watch_baseline_ms = observed
             self._log(f"AOM_AdjustmentWatcher: adopting baseline "
                       f"{observed}ms (first observation)")
-            return self.IDLE_TICK_SECONDS
+            self._unsettle(session)
+            return self._settled(session)
 
         if observed == session.watch_baseline_ms:
             # Nothing changed, or the user dialed back to the baseline before
             # quiescence ("adjust back to what it was" stores nothing).
+            if session.watch_pending is not None:
+                self._unsettle(session)
             session.watch_pending = None
-            return self.IDLE_TICK_SECONDS
+            return self._settled(session)
 
         # A foreign CHANGE away from the baseline: a quiescence candidate.
-        now = self._clock()
         pending = session.watch_pending
         if pending is None or pending[0] != observed:
+            if pending is None:
+                self._count_hint(session, hinted)
             session.watch_pending = (observed, now)
+            self._unsettle(session)
             self._log(f"AOM_AdjustmentWatcher: observing manual adjustment "
                       f"{observed}ms; awaiting quiescence")
             return self.ACTIVE_TICK_SECONDS
-        if now - pending[1] < self.QUIESCENCE_SECONDS:
+        if now - pending[1] < self._quiescence():
             return self.ACTIVE_TICK_SECONDS
         if self._gateway.active_player_id() == -1:
             # Teardown phantom guard: during a slow stop
@@ -221,21 +414,94 @@ class AdjustmentWatcher:
             # hasn't landed yet, so the quiesced "adjustment" belongs to a
             # dying player. Never store an adjustment for a player that no
             # longer exists — discard the whole observation chain (the
-            # baseline is teardown-tainted too).
+            # baseline is teardown-tainted too). A phantom outlasted
+            # quiescence: a full-window sample, and this stop teaches nothing.
+            if self._clean_at is not None and self._sample_stop:
+                self._learn_phantom(self.QUIESCENCE_SECONDS)
+            self._sample_stop = False
             self._clear_observation(session)
             self._log("AOM_AdjustmentWatcher: no active player at store "
                       "time; discarding pending adjustment")
             return self.IDLE_TICK_SECONDS
-        if self._gateway.settings_dialog_open():
-            # Settings-state doctrine: never write a setting while the addon
-            # settings dialog is open — its save-on-close would clobber the
-            # store. Hold the quiesced candidate and retry until it closes.
-            self._log("AOM_AdjustmentWatcher: settings dialog open; "
-                      "deferring store")
-            return self.ACTIVE_TICK_SECONDS
         self._store(session, observed)
+        self._unsettle(session)
         return self.IDLE_TICK_SECONDS
 
+    def _hints_trusted(self, session):
+        return session.watch_hint_streak >= self.HINT_CONFIRMATIONS
+
+    def _count_hint(self, session, hinted):
+        """A fresh candidate: extend or restart the session's hint streak."""
+        if not hinted:
+            if self._hints_trusted(session):
+                self._log("AOM_AdjustmentWatcher: adjustment without a "
+                          "notification; back to polling")
+            session.watch_hint_streak = 0
+            return
+        session.watch_hint_streak += 1
+        if session.watch_hint_streak == self.HINT_CONFIRMATIONS:
+            self._log("AOM_AdjustmentWatcher: adjustments announced by "
+                      "notifications; polling as a safety net")
+        else:
+            self._log(f"AOM_AdjustmentWatcher: adjustment announced by a "
+                      f"notification ({session.watch_hint_streak} of "
+                      f"{self.HINT_CONFIRMATIONS})")
+
+    def _settled(self, session):
+        """The cadence after a reading on the baseline: IDLE_TICK_SECONDS,
+        doubling per tick once the reading has held BACKOFF_AFTER_SECONDS
+        (up to the ceiling)."""
+        now = self._clock()
+        if session.watch_stable_since is None:
+            session.watch_stable_since = now
+        if now - session.watch_stable_since < self.BACKOFF_AFTER_SECONDS:
+            return self.IDLE_TICK_SECONDS
+        idle = session.watch_idle_seconds
+        if idle is not None and self._gateway.audio_settings_dialog_open():
+            # Backed off while the user is in the audio settings: snap back.
+            self._unsettle(session)
+            return self.ACTIVE_TICK_SECONDS
+        ceiling = (max(self._max_idle, self.SAFETY_NET_TICK_SECONDS)
+                   if self._hints_trusted(session) else self._max_idle)
+        idle = min(ceiling, (idle or self.IDLE_TICK_SECONDS) * 2)
+        session.watch_idle_seconds = idle
+        return idle
+
+    # -- learned quiescence (dispatcher thread) ---------------------------------
+
+    def _quiescence(self):
+        """QUIESCENCE_SECONDS, or the learned bound plus the margin."""
+        bound_ms = self._phantom_bound_ms()
+        if not self._phantom_learned:
+            return self.QUIESCENCE_SECONDS
+        return min(self.QUIESCENCE_SECONDS,
+                   max(self.MIN_QUIESCENCE_SECONDS,
+                       bound_ms / 1000 + self.PHANTOM_MARGIN_SECONDS))
+
+    def _phantom_bound_ms(self):
+        if self._phantom_ms is None:
+            self._phantom_ms = self._settings.phantom_window_ms()
+            self._phantom_learned = self._phantom_ms > 0
+        return self._phantom_ms
+
+    def _learn_phantom(self, seconds):
+        sample_ms = int(round(min(seconds, self.QUIESCENCE_SECONDS) * 1000))
+        bound_ms = self._phantom_bound_ms()
+        self._phantom_samples += 1
+        if self._phantom_learned:
+            bound_ms = policies.phantom_bound(bound_ms, sample_ms,
+                                              self.PHANTOM_DECAY)
+        else:
+            # Until enough stops agree, the largest window seen stands.
+            bound_ms = max(bound_ms, sample_ms)
+            self._phantom_learned = (self._phantom_samples
+                                     >= self.MIN_PHANTOM_SAMPLES)
+        self._phantom_ms = bound_ms
+        self._log(f"AOM_AdjustmentWatcher: stop window {sample_ms}ms; bound "
+                  f"{bound_ms}ms ({self._phantom_samples} sample(s))")
+        if self._phantom_learned:
+            self._writer.write_int(self.PHANTOM_SETTING, bound_ms)
+
     # -- store (dispatcher thread) ----------------------------------------------
 
     def _store(self, session, observed_ms):
@@ -261,13 +527,23 @@ class AdjustmentWatcher:
                       f"for {setting_id}; nothing to do")
             return
 
-        if not self._offsets.store(profile, observed_ms):
-            # The value is still foreign; leave the baseline untouched so the
-            # next quiescence cycle retries the store.
-            self._warn(f"AOM_AdjustmentWatcher: failed to store "
-                       f"{observed_ms}ms for setting {setting_id}")
-            return
-
+        if observed_ms == 0:
+            inherited_ms, level = self._offsets.inherited(profile)
+            if inherited_ms:
+                # Storing 0 would hand the cell back to its chain; say so
+                # instead of claiming a save the next apply undoes.
+                session.watch_baseline_ms = observed_ms
+                self._log(f"AOM_AdjustmentWatcher: 0ms for {setting_id} "
+                          f"cannot be stored; it inherits {inherited_ms}ms "
+                          f"({level})")
+                self._dispatcher.post(events.UserOffsetRefused(
+                    session_id=session.session_id, profile=profile,
+                    ms=inherited_ms, level=level))
+                return
+
+        # Staged at once, written when the settings dialog allows (the
+        # writer owns the dialog deferral and the retries).
+        self._writer.write_offset(profile, observed_ms)
         session.watch_baseline_ms = observed_ms
         # The user's value is now the applied value too, so the applier's
         # dedupe guard stays honest.
@@ -290,6 +566,12 @@ class AdjustmentWatcher:
         """
         session.watch_pending = None
         session.watch_baseline_ms = None
+        self._unsettle(session)
+
+    def _unsettle(self, session):
+        """Restart the stable stretch: back to the idle cadence."""
+        session.watch_stable_since = None
+        session.watch_idle_seconds = None
 
     def _schedule_tick(self, session_id, delay):
         """One place for the self-scheduled poll chain (key-replaced)."""
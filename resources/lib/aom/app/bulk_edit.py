@@ -0,0 +1,117 @@
+"""Bulk offset edits — script.py's side of ``RunScript`` bulk commands.
+
+One command (``aom.domain.bulk_ops``) is parsed, planned against the
+stored offsets read in one bulk read, and written as one batch through the
+offset backend — the settings store or the sparse offset store, whichever
+the service uses. Only the ids whose value changes are written.
+
+The running service must see the batch as ONE change. Each write to the
+settings store makes Kodi call every monitor's ``onSettingsChanged``, so
+the writes run under a hold: ``HOLD_PROPERTY`` on the home window carries
+the hold's start (wall-clock seconds, ``time.time``: the stamp crosses
+processes) and the service ignores settings saves while it is set (see
+``hold_active``). When the batch is written
+``gateway.notify_all(NOTIFICATION)`` tells the service, which releases the
+hold, reloads once and posts one ``SettingsChanged`` carrying every
+changed id. The script leaves the hold set: Kodi delivers the writes'
+saves asynchronously, after ``run`` has returned, and they must still find
+it. Saves queued behind the notification re-diff to nothing. The sparse
+store's single file write raises no save at all, so the notification is
+its only signal. A hold nobody released (a crashed script, no service
+running) expires after ``HOLD_SECONDS``.
+
+Not while the addon settings dialog is open: its working copy is saved
+back on close and would undo the batch (settings doctrine).
+
+Pure app layer: Kodi I/O via the injected gateway and gui, offsets via the
+injected backend, log sinks injected; no Kodi imports.
+"""
+
+import time
+
+from resources.lib.aom.domain import bulk_ops, formats
+
+HOLD_PROPERTY = 'script.audiooffsetmanager.bulk'
+HOLD_SECONDS = 10.0
+NOTIFICATION = 'OffsetsBulkWritten'
+
+STRING_BULK_EDIT = 32114
+STRING_OFFSETS_CHANGED = 32115
+STRING_BULK_EDIT_FAILED = 32116
+STRING_CLOSE_SETTINGS = 32117
+
+
+def hold_active(stamp, now):
+    """True while a bulk edit stamped ``stamp`` (the property text) holds."""
+    try:
+        started = float(stamp)
+    except ValueError:
+        return False
+    # The stamp is written to the millisecond, so a fresh one can read up
+    # to half a millisecond ahead of ``now``.
+    return -0.001 < now - started < HOLD_SECONDS
+
+
+class BulkEditor:
+    """Runs one bulk command from script.py's arguments."""
+
+    def __init__(self, offsets, gateway, gui, settings, clock=time.time, *,
+                 log_debug, log_warning):
+        """``offsets`` is the offset backend (``read_ints``/``write_ints``)
+        and ``settings`` answers the toast duration."""
+        self._offsets = offsets
+        self._gateway = gateway
+        self._gui = gui
+        self._settings = settings
+        self._clock = clock
+        self._log = log_debug
+        self._warn = log_warning
+
+    def run(self, args):
+        """Parse, plan and write ``args``; return the number of offsets
+        changed, or None when nothing was written."""
+        try:
+            command = bulk_ops.parse_command(args)
+        except ValueError as e:
+            self._warn(f"AOM_BulkEdit: {e}: {', '.join(args)}")
+            self._toast(STRING_BULK_EDIT_FAILED)
+            return None
+        if self._gateway.settings_dialog_open():
+            self._warn("AOM_BulkEdit: the settings dialog is open; "
+                       "nothing written")
+            self._toast(STRING_CLOSE_SETTINGS)
+            return None
+
+        started = self._clock()
+        keys = formats.all_offset_keys()
+        changes = bulk_ops.plan(command,
+                                dict(zip(keys, self._offsets.read_ints(keys))))
+        if not changes:
+            self._log(f"AOM_BulkEdit: {command.name} changes no offset")
+            self._toast(STRING_OFFSETS_CHANGED, 0)
+            return 0
+
+        # The service releases the hold when it handles the notification.
+        self._gateway.set_window_property(HOLD_PROPERTY, f"{started:.3f}")
+        try:
+            written = self._offsets.write_ints(changes)
+        finally:
+            self._gateway.notify_all(NOTIFICATION)
+        elapsed_ms = (self._clock() - started) * 1000
+        if not written:
+            self._warn(f"AOM_BulkEdit: {command.name} failed to write some "
+                       f"of {len(changes)} offset(s)")
+            self._toast(STRING_BULK_EDIT_FAILED)
+            return None
+        self._log(f"AOM_BulkEdit: {command.name} wrote {len(changes)} "
+                  f"offset(s) in {elapsed_ms:.0f}ms")
+        self._toast(STRING_OFFSETS_CHANGED, len(changes))
+        return len(changes)
+
+    def _toast(self, string_id, count=None):
+        message = self._gui.localized(string_id)
+        if count is not None:
+            message = f"{message}: {count}"
+        self._gui.notification(message,
+                               self._settings.notification_duration_ms(),
+                               title=self._gui.localized(STRING_BULK_EDIT))
@@ -64,14 +64,49 @@ class SpeedChanged:
     speed: int
 
 
+@dataclass(frozen=True)
+class SettingsSaved:
+    """Kodi Monitor.onSettingsChanged: a settings save landed (raw).
+
+    Consumed by the runtime alone: it diffs the settings snapshot and posts
+    the ``SettingsChanged`` every other handler reacts to. ``bulk`` marks
+    a bulk offset edit's closing notification, which also releases the
+    edit's hold.
+    """
+    bulk: bool = False
+
+
 @dataclass(frozen=True)
 class SettingsChanged:
-    """Kodi Monitor.onSettingsChanged: a settings save landed.
+    """A settings save, diffed against the settings snapshot.
+
+    ``changed`` is the frozenset of setting ids whose value differs from
+    the snapshot — ids nobody has read are not tracked (no reader holds a
+    stale value for them). None means undiffed: any id may have changed.
+    Handlers filter on the ids they read (``policies.save_touches``), then
+    refresh cached flags, re-apply the live session's offset, or re-evaluate
+    watch eligibility — never write settings (the write would re-fire this
+    event).
+    """
+    changed: frozenset = None
+
 
-    Handlers refresh cached flags, re-apply the live session's offset, or
-    re-evaluate watch eligibility — never write settings (the write would
-    re-fire this event).
+@dataclass(frozen=True)
+class PlayerNotified:
+    """Kodi Monitor.onNotification for a ``Player.*`` JSON-RPC method.
+
+    The payload is decoded by the monitor bridge: ``player_id`` is the
+    notification's ``player.playerid`` (-1 when absent or unparsable),
+    ``item_type`` its ``item.type`` ('' when absent) and ``properties`` the
+    sorted names under ``property`` (``Player.OnPropertyChanged`` only;
+    empty otherwise). Arrives independently of the player callbacks —
+    before or after the matching ``PlaybackStarted``/``AvChanged`` — so
+    consumers treat it as a hint.
     """
+    method: str
+    player_id: int
+    item_type: str
+    properties: tuple = ()
 
 
 # --- Lifecycle events (posted by the composition root) ----------------------
@@ -95,6 +130,12 @@ class ProbeStream:
     attempt: int
 
 
+@dataclass(frozen=True)
+class ReprobeStream:
+    """Debounced AV-change re-probe (key-replaced: a burst fires once)."""
+    session_id: int
+
+
 @dataclass(frozen=True)
 class VerifyStream:
     """Scheduled whole-profile stability verification (key-replaced)."""
@@ -102,11 +143,21 @@ class VerifyStream:
     seq: int
 
 
+@dataclass(frozen=True)
+class ShadowEvent:
+    """A shadow detector's own probe/verify event, wrapped so it rides the
+    real dispatcher (same thread, same timer heap) without ever reaching
+    the live StreamDetector's handlers. See ``aom.app.shadow_detector``."""
+    event: object
+
+
 @dataclass(frozen=True)
 class StreamProbed:
     """A detection pass observed the platform (consumed by PlatformRecorder).
 
-    Posted on EVERY gather — probes, AV-change re-probes, and verifications.
+    Posted on every FULL gather — probes, AV-change re-probes, and
+    verifications — but not when the detector short-circuits a gather whose
+    raw readings repeat the previous one (same readings, same facts).
     Carries facts, not decisions: the recorder owns the writes. ``hdr_type``
     is the derived profile HDR type; the recorder latches the HDR10+
     platform capability from it.
@@ -156,12 +207,16 @@ class OffsetApplied:
     scheduler replays those like a manual adjustment ('change'), while
     detector-driven applies must never seek. The default is False so a
     hand-posted event acts like an automatic apply.
+
+    ``level`` is the ``aom.domain.resolution.LEVELS`` entry that resolved
+    ``ms`` (the profile's own offset, its all-FPS row, the HDR default).
     """
     session_id: int
     profile: object  # StreamProfile
     ms: int
     provisional: bool
     user_initiated: bool = False
+    level: str = 'exact'
 
 
 @dataclass(frozen=True)
@@ -179,6 +234,56 @@ class UserOffsetSaved:
     ms: int
 
 
+@dataclass(frozen=True)
+class UserOffsetRefused:
+    """The adjustment watcher could not store a user's 0 ms adjustment.
+
+    A stored 0 reads as "uncalibrated", so the profile keeps resolving to
+    the inherited offset ``ms`` (at resolution ``level``). Session-stamped
+    and captured at store time like ``UserOffsetSaved``.
+    """
+    session_id: int
+    profile: object  # StreamProfile
+    ms: int
+    level: str
+
+
+@dataclass(frozen=True)
+class RetryApply:
+    """Self-scheduled offset apply retry (re-derived at fire time).
+
+    ``attempt`` counts the retries of this chain so far (the backoff
+    exponent); ``user_initiated`` carries the failed apply's stamp through
+    to the ``OffsetApplied`` the retry posts. ``repair`` marks a retry of an
+    apply the read-back found missing: it re-sends an already-announced
+    value, so it bypasses the dedupe and announces nothing; it carries the
+    ``previous_ms`` of the apply it repairs. ``predicted`` is the
+    prediction a predicted apply was for: the session has no profile to
+    re-derive it from.
+    """
+    session_id: int
+    attempt: int
+    user_initiated: bool = False
+    repair: bool = False
+    previous_ms: int = None
+    predicted: object = None  # StreamProfile
+
+
+@dataclass(frozen=True)
+class VerifyApply:
+    """Self-scheduled read-back of the delay an apply just set.
+
+    ``previous_ms`` is the delay the player held before the apply (None =
+    unknown): only a read-back still showing it is an apply that did not
+    land; any third value is a manual adjustment. ``predicted`` as on
+    ``RetryApply``.
+    """
+    session_id: int
+    attempt: int
+    previous_ms: int = None
+    predicted: object = None  # StreamProfile
+
+
 # --- Seek scheduling events --------------------------------------------------
 
 @dataclass(frozen=True)
@@ -195,6 +300,26 @@ class ExecuteSeek:
     requested_at: float
 
 
+# --- Playlist prefetch events -------------------------------------------------
+
+@dataclass(frozen=True)
+class PrefetchNext:
+    """Self-scheduled look-ahead read of the next playlist item (keyed)."""
+    session_id: int
+
+
+@dataclass(frozen=True)
+class ProfilePredicted:
+    """A new session's profile as predicted from playlist stream details.
+
+    Posted by the PlaylistPrefetcher right after ``PlaybackStarted``; the
+    OffsetApplier applies it provisionally only while the detector has not
+    adopted a real profile yet. Never written to ``session.profile``.
+    """
+    session_id: int
+    profile: object  # StreamProfile
+
+
 # --- Notifier events ----------------------------------------------------------
 
 @dataclass(frozen=True)
@@ -215,6 +340,7 @@ class RaiseToast:
     string_id: int
     ms: int
     profile: object  # StreamProfile
+    level: str = 'exact'
 
 
 # --- Watcher events -----------------------------------------------------------
@@ -223,3 +349,11 @@ class RaiseToast:
 class WatchTick:
     """Recurring adjustment-watcher poll tick for a session."""
     session_id: int
+
+
+# --- Settings writer events ---------------------------------------------------
+
+@dataclass(frozen=True)
+class FlushSettings:
+    """Write the settings writer's batch (posted once per batch; a retry
+    while the settings dialog is open is scheduled under one key)."""
@@ -16,6 +16,9 @@ driven by typed events on the dispatcher thread:
 * ``UserOffsetSaved`` — a manual adjustment the AdjustmentWatcher stored.
   Toasts from the event's own profile/ms (captured at store time on the
   dispatcher thread); session/settings are deliberately NOT re-read.
+* ``UserOffsetRefused`` — a 0 ms adjustment the watcher could not store
+  (the profile inherits a non-zero offset). Toasts the inherited offset
+  that stays in force, with its level suffix, the same way.
 
 The dedupe clock for the 1s duplicate-suppression window is the injected
 ``time.monotonic`` — deliberately not ``time.time``, which would mis-measure
@@ -41,7 +44,10 @@ share the same GUI window but are invisible to this bookkeeping.
 Toast shape: the applied/saved heading (with the offset value) is the toast
 TITLE and the profile summary is the whole message — Kodi's toast message
 label is a single line, so packing both into the message with a newline
-makes it auto-scroll (perceived as flashing) and truncate the codec.
+makes it auto-scroll (perceived as flashing) and truncate the codec. An
+applied offset that the profile's own setting did not answer (it resolved
+through the all-FPS row or the HDR default) says so at the end of the
+summary.
 
 Settings (``notifications_enabled`` / ``notification_duration_ms``) are read
 through the injected facade; toasts go through the injected gui. Pure app
@@ -51,10 +57,19 @@ layer: stdlib + ``resources.lib.aom`` only.
 import time
 
 from resources.lib.aom.app import events
+from resources.lib.aom.domain import resolution
 from resources.lib.aom.domain.stream_state import StreamState
 
 STRING_OFFSET_APPLIED = 32092
 STRING_OFFSET_SAVED = 32093
+STRING_OFFSET_KEPT = 32123
+
+# Message suffix for an offset resolved above the profile's own setting
+# (aom.domain.resolution levels); an exact offset carries none.
+LEVEL_STRING_IDS = {
+    resolution.LEVEL_ALL_FPS: 32112,
+    resolution.LEVEL_HDR_DEFAULT: 32113,
+}
 
 
 class Notifier:
@@ -91,6 +106,8 @@ class Notifier:
 
         dispatcher.subscribe(events.OffsetApplied, self._on_offset_applied)
         dispatcher.subscribe(events.UserOffsetSaved, self._on_user_offset_saved)
+        dispatcher.subscribe(events.UserOffsetRefused,
+                             self._on_user_offset_refused)
         dispatcher.subscribe(events.StreamStabilized, self._on_stream_stabilized)
         dispatcher.subscribe(events.RaiseToast, self._on_raise_toast)
 
@@ -103,12 +120,14 @@ class Notifier:
         if event.provisional:
             # Held until the stream stabilizes; the release path re-derives the
             # key from the live profile and drops the toast if it changed.
-            session.pending_notification = (event.profile.setting_id(), event.ms)
+            session.pending_notification = (event.profile.setting_id(),
+                                            event.ms, event.level)
             self._log("AOM_Notifier: holding provisional notification until "
                       "the stream stabilizes")
             return
         session.pending_notification = None
-        self._toast(STRING_OFFSET_APPLIED, event.ms, event.profile)
+        self._toast(STRING_OFFSET_APPLIED, event.ms, event.profile,
+                    event.level)
 
     def _on_stream_stabilized(self, event):
         if not self._sessions.is_alive(event.session_id):
@@ -119,7 +138,8 @@ class Notifier:
         # Defensive: only release once the session is genuinely STABLE.
         if session.stream_state is not StreamState.STABLE:
             return
-        pending_setting_id, pending_ms = session.pending_notification
+        pending_setting_id, pending_ms, pending_level = \
+            session.pending_notification
         # Read the profile FRESH: a profile that changed underneath must not
         # release a toast against a stale key (settings-doctrine).
         profile = session.profile
@@ -127,7 +147,7 @@ class Notifier:
             session.pending_notification = None
             return
         session.pending_notification = None
-        self._toast(STRING_OFFSET_APPLIED, pending_ms, profile)
+        self._toast(STRING_OFFSET_APPLIED, pending_ms, profile, pending_level)
         self._log("AOM_Notifier: Released pending offset notification after "
                   "stream stabilization")
 
@@ -143,6 +163,11 @@ class Notifier:
         # do NOT re-read session/settings for the message.
         self._toast(STRING_OFFSET_SAVED, event.ms, event.profile)
 
+    def _on_user_offset_refused(self, event):
+        if not self._sessions.is_alive(event.session_id):
+            return
+        self._toast(STRING_OFFSET_KEPT, event.ms, event.profile, event.level)
+
     def _on_raise_toast(self, event):
         # The fade-guarded release. Dedupe and the guard were decided at
         # request time and cannot have gone stale (an immediate raise cancels
@@ -150,11 +175,12 @@ class Notifier:
         # live setting and must be re-checked at fire time.
         if not self._settings.notifications_enabled():
             return
-        self._raise(event.string_id, event.ms, event.profile)
+        self._raise(event.string_id, event.ms, event.profile, event.level)
 
     # -- internals --------------------------------------------------------------
 
-    def _toast(self, string_id, ms, profile):
+    def _toast(self, string_id, ms, profile,
+               level=resolution.LEVEL_EXACT):
         if not self._settings.notifications_enabled():
             return
 
@@ -169,12 +195,13 @@ class Notifier:
         if delay > 0.0:
             self._dispatcher.schedule(
                 delay,
-                events.RaiseToast(string_id=string_id, ms=ms, profile=profile),
+                events.RaiseToast(string_id=string_id, ms=ms, profile=profile,
+                                  level=level),
                 key=self._FADE_KEY)
             self._log(f"AOM_Notifier: deferring toast {delay * 1000:.0f}ms "
                       f"past the previous toast's fade-out")
             return
-        self._raise(string_id, ms, profile)
+        self._raise(string_id, ms, profile, level)
 
     def _fade_guard_delay(self, now):
         """Seconds to wait so this toast misses the previous toast's fade.
@@ -195,7 +222,7 @@ class Notifier:
             return 0.0
         return shown_s + self.FADE_GUARD_SECONDS - elapsed
 
-    def _raise(self, string_id, ms, profile):
+    def _raise(self, string_id, ms, profile, level=resolution.LEVEL_EXACT):
         # This raise makes any pending deferred release stale by definition —
         # the fresher fact is taking the window. (No-op when we ARE the
         # deferred release: its timer was consumed before dispatch.)
@@ -206,6 +233,9 @@ class Notifier:
         sign = '+' if ms > 0 else ''
         heading = f"{self._gui.localized(string_id)}: {sign}{ms} ms"
         message = profile.summary(include_fps=True)
+        if level in LEVEL_STRING_IDS:
+            message = (f"{message} | "
+                       f"{self._gui.localized(LEVEL_STRING_IDS[level])}")
 
         self._gui.notification(message, duration_ms, title=heading)
         self._log(f"AOM_Notifier: {heading} — {message}")
@@ -5,9 +5,10 @@ One decision path, three triggers:
 - ``ProfileChanged`` — the detector adopted a (new) complete profile: the
   apply trigger. NOT ``PlaybackStarted``: the profile is always None at AV
   start (discovery has not run), so an apply there could only skip.
-- ``StreamStabilized`` — the retry edge: a failed apply RPC is retried on
-  the next stabilization, and the ``session.applied`` dedupe makes the
-  common already-applied case a no-op.
+- ``StreamStabilized`` — the late edge: the apply is re-run on every
+  stabilization (a chain that gave up gets one more try there), and the
+  ``session.applied`` dedupe makes the common already-applied case a
+  no-op.
 - ``SettingsChanged`` — the settings-save edge: an offset reconfigured in
   the addon settings dialog during playback reaches the live player on
   dialog save, not on the next profile adoption. The same dedupe makes
@@ -27,6 +28,13 @@ One decision path, three triggers:
   on this trigger, so a non-actionable save must produce neither log
   noise nor a doomed RPC.
 
+A fourth, weaker trigger: ``ProfilePredicted`` — the PlaylistPrefetcher's
+guess at a new playlist item's profile. It applies (provisionally, through
+the same path and dedupe) only while the session has no adopted profile:
+once the detector has adopted one, the real profile wins and the
+prediction is dropped. When the detector later adopts the predicted key,
+the dedupe makes its apply a no-op; any other key is applied over it.
+
 Contracts (pinned by tests):
 
 - **applied-before-RPC**: ``session.applied`` is recorded BEFORE the
@@ -36,29 +44,67 @@ Contracts (pinned by tests):
   adjustment. Two flow tests pin this at the RPC boundary; do not reorder.
 - **Freshness**: the profile is read from ``session.profile`` at the moment
   of use (the detector, on this same dispatcher thread, is its sole writer)
-  — never captured across events (settings doctrine).
+  — never captured across events (settings doctrine). The one exception is
+  a prediction, which by definition is not the session's profile; its
+  offset is still read at the moment of use.
+
+Retry chain: a failed ``set_audio_delay`` is retried on its own, not left
+waiting for a stabilization that a stable stream never produces. Each
+failure schedules a ``RetryApply`` after a bounded exponential backoff
+(``policies.retry_delay``: 0.5 s doubling to 8 s, ``MAX_RETRIES`` in all),
+and the retry re-derives the profile and offset at fire time like any
+trigger — except a predicted apply's, which carries its prediction for as
+long as the session has no adopted profile (there is nothing to re-derive
+from until then; after, the real profile wins as usual). A success is not proof either: with ``enable_apply_verification``
+on, a ``VerifyApply`` reads ``Player.AudioDelay`` back shortly after, and
+a value the player did not take is re-sent through the same chain — as a
+*repair*, which bypasses the dedupe (``session.applied`` already holds the
+value) and announces nothing (the value was announced once). "Did not
+take" means the player still reads what it held before the apply (the
+watcher's baseline, else our previous value): a third value is a user
+adjustment made before the watcher's next tick saw it, and is left alone. The chain is
+one dispatcher key, so any newer apply replaces it; it is session-stamped
+and cancelled on ``PlaybackStarted``/``PlaybackStopped``/``PlaybackEnded``,
+and it stops when a manual observation is pending: the user has the dial,
+and their value is the one to keep. Every retry RPC goes through the same
+applied-before-RPC path, so the watcher's self-echo suppression
+holds for it unchanged; while a sent value has not landed the player
+still reads the watcher's baseline, which is no adjustment either.
 
 The apply is *eager*: it runs on adoption, before stability, because A/V
 sync matters immediately. It is marked ``provisional`` unless the session is
 already STABLE, and the posted ``OffsetApplied(provisional=...)`` lets the
 Notifier hold the toast until stabilization. This component never toasts.
 
-Offsets come from the injected ``OffsetTable`` (get by profile; the settings
-generator guarantees every setting id exists, so "missing offset" is not a
-state).
+Offsets come from the injected ``OffsetTable`` (resolved by profile; the
+settings generator guarantees every setting id exists, so "missing offset"
+is not a state). The table resolves an uncalibrated FPS bucket through its
+all-FPS row and the HDR default (``aom.domain.resolution``); the level that
+answered rides on ``OffsetApplied`` and in the apply log, and a save
+touching any id on the profile's chain is a save that can change its
+offset.
 
 Pure app layer: Kodi I/O via the injected gateway, settings via the injected
 adapter, log sinks injected; no Kodi imports.
 """
 
 from resources.lib.aom.app import events
-from resources.lib.aom.domain import policies
+from resources.lib.aom.domain import policies, resolution
 from resources.lib.aom.domain.stream_state import StreamState
 
 
 class OffsetApplier:
     """Applies the configured offset for the session's current profile."""
 
+    # Retry chain backoff (policies.retry_delay): 0.5, 1, 2, 4, 8 s.
+    RETRY_BASE_SECONDS = 0.5
+    RETRY_MAX_SECONDS = 8.0
+    MAX_RETRIES = 5
+    # Read-back delay after a successful apply RPC.
+    VERIFY_DELAY_SECONDS = 0.25
+    INFOLABEL_AUDIO_DELAY = 'Player.AudioDelay'
+    _RETRY_KEY = 'aom.applier.retry'
+
     def __init__(self, dispatcher, session_tracker, gateway, settings,
                  offsets, *, log_debug, log_warning):
         self._dispatcher = dispatcher
@@ -72,6 +118,13 @@ class OffsetApplier:
         dispatcher.subscribe(events.ProfileChanged, self._on_profile_changed)
         dispatcher.subscribe(events.StreamStabilized, self._on_stream_stabilized)
         dispatcher.subscribe(events.SettingsChanged, self._on_settings_changed)
+        dispatcher.subscribe(events.ProfilePredicted,
+                             self._on_profile_predicted)
+        dispatcher.subscribe(events.RetryApply, self._on_retry_apply)
+        dispatcher.subscribe(events.VerifyApply, self._on_verify_apply)
+        dispatcher.subscribe(events.PlaybackStarted, self._on_playback_boundary)
+        dispatcher.subscribe(events.PlaybackStopped, self._on_playback_boundary)
+        dispatcher.subscribe(events.PlaybackEnded, self._on_playback_boundary)
 
     # -- triggers (dispatcher thread) --------------------------------------------
 
@@ -80,10 +133,18 @@ class OffsetApplier:
         self._apply(event.session_id)
 
     def _on_stream_stabilized(self, event):
-        """Retry edge: re-run the apply; the dedupe no-ops the common case."""
+        """Late edge: re-run the apply; the dedupe no-ops the common case."""
         self._apply(event.session_id)
 
-    def _on_settings_changed(self, _event):
+    def _on_profile_predicted(self, event):
+        """Playlist prediction: apply it until the detector adopts a profile."""
+        if not self._sessions.is_alive(event.session_id):
+            return
+        if self._sessions.current.profile is not None:
+            return  # adopted already: the real profile was applied
+        self._apply(event.session_id, predicted=event.profile)
+
+    def _on_settings_changed(self, event):
         """Settings-save edge: push a reconfigured offset to the live player.
 
         Not session-stamped (the save has no session); applies to whatever
@@ -93,6 +154,10 @@ class OffsetApplier:
 
         - no session, or no complete profile yet: nothing to key the offset
           by (the adoption that completes the profile applies it anyway);
+        - a save that changed neither an id the profile's offset resolves
+          through nor its ``enable_<hdr>`` toggle (every other save, our own platform-flag
+          writes included): nothing to re-apply, and no RPC to find that
+          out;
         - a pending manual observation: the user is mid-adjustment on the
           player's own delay control — re-applying the stored value now
           would yank the dial, and the watcher would then read our write as
@@ -107,21 +172,100 @@ class OffsetApplier:
         profile = session.profile
         if profile is None or not policies.is_complete(profile):
             return
+        if not policies.save_touches(event.changed,
+                                     *resolution.source_keys(profile),
+                                     f"enable_{profile.hdr_type}"):
+            return
         if session.watch_pending is not None:
             return
         if self._gateway.active_player_id() == -1:
             return
         self._apply(session.session_id, user_initiated=True)
 
+    # -- retry chain ---------------------------------------------------------------
+
+    def _on_playback_boundary(self, event):
+        """Start/stop/end: whatever the chain was retrying is gone."""
+        self._dispatcher.cancel(self._RETRY_KEY)
+
+    def _on_retry_apply(self, event):
+        if not self._sessions.is_alive(event.session_id):
+            return
+        if self._sessions.current.watch_pending is not None:
+            self._log("AOM_OffsetApplier: Manual adjustment pending; "
+                      "dropping the apply retry")
+            return
+        self._apply(event.session_id, user_initiated=event.user_initiated,
+                    predicted=self._still_predicted(event.predicted),
+                    attempt=event.attempt, repair=event.repair,
+                    previous_ms=event.previous_ms)
+
+    def _on_verify_apply(self, event):
+        """Read the delay back; re-send an applied value that did not land."""
+        if not self._sessions.is_alive(event.session_id):
+            return
+        session = self._sessions.current
+        if session.applied is None or session.watch_pending is not None:
+            return
+        setting_id, delay_ms = session.applied
+        observed = policies.parse_delay_ms(
+            self._gateway.infolabel(self.INFOLABEL_AUDIO_DELAY))
+        if observed is None:
+            self._log(f"AOM_OffsetApplier: Audio delay unreadable; "
+                      f"{delay_ms}ms for {setting_id} not verified")
+        elif observed == delay_ms:
+            self._log(f"AOM_OffsetApplier: Verified {delay_ms}ms for "
+                      f"{setting_id}")
+        elif event.previous_ms is not None and observed != event.previous_ms:
+            # Neither ours nor the pre-apply value: the user dialed it
+            # before the watcher's next tick. Theirs to keep; the watcher
+            # picks it up from here.
+            self._log(f"AOM_OffsetApplier: Player reports {observed}ms, "
+                      f"neither the {delay_ms}ms applied for {setting_id} "
+                      f"nor the {event.previous_ms}ms before it; leaving "
+                      f"the manual adjustment")
+        else:
+            self._retry(session, event.attempt,
+                        f"player reports {observed}ms after applying "
+                        f"{delay_ms}ms for {setting_id}", repair=True,
+                        previous_ms=event.previous_ms,
+                        predicted=self._still_predicted(event.predicted))
+
+    def _still_predicted(self, predicted):
+        """A chain's prediction, until the detector has adopted a profile."""
+        if self._sessions.current.profile is not None:
+            return None
+        return predicted
+
+    def _retry(self, session, attempt, why, user_initiated=False,
+               repair=False, previous_ms=None, predicted=None):
+        """Schedule the chain's next retry, or give up after MAX_RETRIES."""
+        if attempt >= self.MAX_RETRIES:
+            self._warn(f"AOM_OffsetApplier: {why}; giving up after "
+                       f"{attempt} retries until the next stabilization")
+            return
+        delay = policies.retry_delay(attempt, self.RETRY_BASE_SECONDS,
+                                     self.RETRY_MAX_SECONDS)
+        self._warn(f"AOM_OffsetApplier: {why}; will retry in {delay:g}s")
+        self._dispatcher.schedule(
+            delay, events.RetryApply(session_id=session.session_id,
+                                     attempt=attempt + 1,
+                                     user_initiated=user_initiated,
+                                     repair=repair,
+                                     previous_ms=previous_ms,
+                                     predicted=predicted),
+            key=self._RETRY_KEY)
+
     # -- the apply -----------------------------------------------------------------
 
-    def _apply(self, session_id, user_initiated=False):
+    def _apply(self, session_id, user_initiated=False, predicted=None,
+               attempt=0, repair=False, previous_ms=None):
         if not self._sessions.is_alive(session_id):
             return  # superseded session: the event is inert
         session = self._sessions.current
 
         # Freshly derived at the moment of use (settings doctrine).
-        profile = session.profile
+        profile = session.profile if predicted is None else predicted
         if not self._should_apply(profile):
             return
 
@@ -131,9 +275,12 @@ class OffsetApplier:
             return
 
         setting_id = profile.setting_id()
-        delay_ms = self._offsets.get(profile)
+        delay_ms, level = self._offsets.resolve(profile)
 
-        if session.applied == (setting_id, delay_ms):
+        # A repair re-sends the value session.applied already holds; if that
+        # changed since, this is a plain apply of the new value.
+        repair = repair and session.applied == (setting_id, delay_ms)
+        if session.applied == (setting_id, delay_ms) and not repair:
             self._log(f"AOM_OffsetApplier: Offset already applied for "
                       f"{setting_id} at {delay_ms}ms; skipping duplicate "
                       f"apply")
@@ -145,19 +292,45 @@ class OffsetApplier:
         # module docstring). Restored on failure so the dedupe guard cannot
         # block the retry.
         previous_applied = session.applied
+        # What the player held before this apply, for the read-back: the
+        # watcher's baseline, else our last value. A repair keeps the one
+        # from the apply it repairs (the player still holds it).
+        if not repair:
+            previous_ms = session.watch_baseline_ms
+            if previous_ms is None and previous_applied is not None:
+                previous_ms = previous_applied[1]
         session.applied = (setting_id, delay_ms)
         if not self._gateway.set_audio_delay(profile.player_id,
                                              delay_ms / 1000.0):
             session.applied = previous_applied
-            self._warn(f"AOM_OffsetApplier: audio delay RPC failed for "
-                       f"{setting_id}; will retry on the next stabilization")
+            self._retry(session, attempt,
+                        f"audio delay RPC failed for {setting_id}",
+                        user_initiated=user_initiated, repair=repair,
+                        previous_ms=previous_ms, predicted=predicted)
+            return
+
+        # The newest apply owns the chain: verify it, or end the chain.
+        if self._settings.apply_verification_enabled():
+            self._dispatcher.schedule(
+                self.VERIFY_DELAY_SECONDS,
+                events.VerifyApply(session_id=session.session_id,
+                                   attempt=attempt, previous_ms=previous_ms,
+                                   predicted=predicted),
+                key=self._RETRY_KEY)
+        else:
+            self._dispatcher.cancel(self._RETRY_KEY)
+        if repair:
+            self._log(f"AOM_OffsetApplier: Re-applied {delay_ms}ms for "
+                      f"{setting_id} (retry {attempt})")
             return
 
         self._log(f"AOM_OffsetApplier: Applied {delay_ms}ms for {setting_id} "
-                  f"(provisional={provisional}); {session.describe()}")
+                  f"(level={level}, provisional={provisional}, "
+                  f"predicted={predicted is not None}); {session.describe()}")
         self._dispatcher.post(events.OffsetApplied(
             session_id=session.session_id, profile=profile, ms=delay_ms,
-            provisional=provisional, user_initiated=user_initiated))
+            provisional=provisional, user_initiated=user_initiated,
+            level=level))
 
     def _should_apply(self, profile):
         """Resolve the inputs and log the reason; the decision is the policy's."""
@@ -1,7 +1,7 @@
 """Platform capability recorder: the detection side effects, made explicit.
 
 This component performs the platform-capability writes
-(``platform_hdr_full`` / ``advanced_hlg``, store-if-changed on every probe)
+(``platform_hdr_full`` / ``advanced_hlg``, written on every probe)
 as an event-driven consumer of ``StreamProbed``, so detection itself stays
 pure. The flags drive settings-UI visibility: capability-gated elements
 appear once the first playback stores them.
@@ -25,15 +25,13 @@ across the non-HDR10+ streams that follow.
 No session guard on purpose: platform facts are session-independent — a
 probe stamped with a superseded session still observed the real platform.
 
-Writes defer while the addon settings dialog is open (settings-state
-doctrine: its save-on-close would clobber them). A skipped probe is not
-retried explicitly — the values are re-observed and re-stored by the next
-gather, so nothing is lost, only delayed. A deferred startup check (only
-possible on a service restart, never on Kodi startup) recovers the same
-way: the next Kodi start or HDR10+ observation re-latches.
+Writes go through the settings writer: each flag is an intended value,
+batched with the rest of the probe's and written once the addon settings
+dialog is closed (settings-state doctrine), so a probe or startup check
+landing while the dialog is open is delayed, never lost.
 
-Pure app layer: no Kodi imports; settings via the injected adapter, the
-dialog question and the build-version InfoLabel via the injected gateway.
+Pure app layer: no Kodi imports; settings writes via the injected writer,
+the build-version InfoLabel via the injected gateway.
 """
 
 import re
@@ -58,35 +56,23 @@ def parse_kodi_major(raw):
 
 
 class PlatformRecorder:
-    def __init__(self, dispatcher, gateway, settings, *, log_debug):
+    def __init__(self, dispatcher, gateway, writer, *, log_debug):
         self._gateway = gateway
-        self._settings = settings
+        self._writer = writer
         self._log = log_debug
         dispatcher.subscribe(events.ServiceStarted, self._on_service_started)
         dispatcher.subscribe(events.StreamProbed, self._on_probed)
 
     def _on_service_started(self, _event):
-        if self._gateway.settings_dialog_open():
-            self._log("AOM_PlatformRecorder: settings dialog open; "
-                      "deferring startup capability check")
-            return
         major = parse_kodi_major(
             self._gateway.infolabel(INFOLABEL_BUILD_VERSION))
         if major is not None and major >= NATIVE_HDR10PLUS_MAJOR:
             self._log(f"AOM_PlatformRecorder: Kodi {major} detects HDR10+ "
                       f"natively; latching platform_hdr10plus")
-            self._settings.store_boolean_if_changed('platform_hdr10plus',
-                                                    True)
+            self._writer.write_bool('platform_hdr10plus', True)
 
     def _on_probed(self, event):
-        if self._gateway.settings_dialog_open():
-            # Deferred, not dropped: the next probe re-observes everything.
-            self._log("AOM_PlatformRecorder: settings dialog open; "
-                      "deferring platform writes")
-            return
-        self._settings.store_boolean_if_changed('platform_hdr_full',
-                                                event.platform_hdr_full)
-        self._settings.store_boolean_if_changed('advanced_hlg',
-                                                event.advanced_hlg)
+        self._writer.write_bool('platform_hdr_full', event.platform_hdr_full)
+        self._writer.write_bool('advanced_hlg', event.advanced_hlg)
         if event.platform_hdr_full or event.hdr_type == 'hdr10plus':
-            self._settings.store_boolean_if_changed('platform_hdr10plus', True)
+            self._writer.write_bool('platform_hdr10plus', True)
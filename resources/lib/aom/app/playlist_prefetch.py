@@ -0,0 +1,124 @@
+"""Playlist look-ahead: predict the next item's profile while this one plays.
+
+Back-to-back playlist items (TV episodes) otherwise start cold: the new
+session has no profile until discovery adopts one, and until then the
+previous item's delay stays on the player. This component reads ahead:
+
+- ``PrefetchNext`` is scheduled ``PREFETCH_DELAY_SECONDS`` after a
+  session's INITIAL stabilization (off the startup RPC burst). It reads the
+  playlist position and the next item's library stream details — two
+  single-shot RPCs — and derives the profile that item is expected to have
+  with the detector's own pure derivation. Stream details carry no frame
+  rate, so an HDR type with the per-HDR FPS override on cannot be predicted
+  (the profile is incomplete) and is skipped.
+- The prediction survives ``PlaybackEnded`` for ``PREDICTION_TTL_SECONDS``
+  (the gap to the next item's start). ``PlaybackStopped`` discards it: the
+  user stopped, so the next start is not the playlist advancing.
+- On the next ``PlaybackStarted`` it is posted as ``ProfilePredicted`` for
+  the new session. The post lands AFTER the detector's probe #1 (subscribed
+  earlier, it posts first), so a stream that is complete at AV start is
+  adopted normally and the prediction is ignored; only slow discovery — the
+  case that started with the wrong delay — gets the predicted offset,
+  applied provisionally by the OffsetApplier. The detector then confirms
+  it (the applier's dedupe makes that a no-op) or corrects it.
+
+Only the profile is preloaded. The offset is read when it is applied, like
+every other apply (settings doctrine: never a captured value).
+
+Pure app layer: Kodi I/O via the injected gateway; no Kodi imports.
+"""
+
+import time
+
+from resources.lib.aom.app import events
+from resources.lib.aom.app.stream_detector import derive_stream_facts
+from resources.lib.aom.domain import policies
+
+
+class PlaylistPrefetcher:
+    """Predicts the next playlist item's profile; posts it at the next start."""
+
+    PREFETCH_DELAY_SECONDS = 5.0
+    PREDICTION_TTL_SECONDS = 10.0
+
+    _PREFETCH_KEY = 'aom.prefetch.next'
+
+    def __init__(self, dispatcher, session_tracker, gateway, settings_facade,
+                 clock=time.monotonic, *, log_debug):
+        self._dispatcher = dispatcher
+        self._sessions = session_tracker
+        self._gateway = gateway
+        self._settings = settings_facade
+        self._clock = clock
+        self._log = log_debug
+        self._prediction = None      # StreamProfile of the next item, or None
+        self._ended_at = None        # monotonic PlaybackEnded time, or None
+
+        dispatcher.subscribe(events.StreamStabilized, self._on_stream_stabilized)
+        dispatcher.subscribe(events.PrefetchNext, self._on_prefetch)
+        dispatcher.subscribe(events.PlaybackStarted, self._on_playback_started)
+        dispatcher.subscribe(events.PlaybackStopped, self._on_playback_stopped)
+        dispatcher.subscribe(events.PlaybackEnded, self._on_playback_ended)
+
+    # -- look-ahead ----------------------------------------------------------------
+
+    def _on_stream_stabilized(self, event):
+        if not event.initial:
+            return
+        self._dispatcher.schedule(
+            self.PREFETCH_DELAY_SECONDS,
+            events.PrefetchNext(session_id=event.session_id),
+            key=self._PREFETCH_KEY)
+
+    def _on_prefetch(self, event):
+        if not self._sessions.is_alive(event.session_id):
+            return
+        self._prediction = None
+        profile = self._sessions.current.profile
+        if profile is None or profile.player_id == -1:
+            return
+        position = self._gateway.playlist_position(profile.player_id)
+        if position is None:
+            return
+        playlist_id, index = position
+        streams = self._gateway.playlist_item_streams(playlist_id, index + 1)
+        if streams is None:
+            self._log("AOM_PlaylistPrefetcher: no next playlist item with "
+                      "stream details")
+            return
+        raw_codec, raw_channels, raw_hdr = streams
+        predicted = derive_stream_facts(
+            profile.player_id, raw_codec, raw_channels, '', raw_hdr, '', '',
+            fps_override_enabled=self._settings.fps_override_enabled).profile
+        if not policies.is_complete(predicted):
+            self._log(f"AOM_PlaylistPrefetcher: next item not predictable "
+                      f"({predicted})")
+            return
+        self._prediction = predicted
+        self._log(f"AOM_PlaylistPrefetcher: next item predicted: "
+                  f"{predicted.setting_id()}")
+
+    # -- lifecycle -------------------------------------------------------------------
+
+    def _on_playback_ended(self, _event):
+        self._dispatcher.cancel(self._PREFETCH_KEY)
+        self._ended_at = self._clock()
+
+    def _on_playback_stopped(self, _event):
+        self._dispatcher.cancel(self._PREFETCH_KEY)
+        self._prediction = None
+        self._ended_at = None
+
+    def _on_playback_started(self, _event):
+        self._dispatcher.cancel(self._PREFETCH_KEY)
+        prediction, self._prediction = self._prediction, None
+        ended_at, self._ended_at = self._ended_at, None
+        session = self._sessions.current
+        if prediction is None or ended_at is None or session is None:
+            return
+        if self._clock() - ended_at > self.PREDICTION_TTL_SECONDS:
+            self._log("AOM_PlaylistPrefetcher: prediction expired; "
+                      "discarding")
+            return
+        self._dispatcher.post(events.ProfilePredicted(
+            session_id=session.session_id, profile=prediction))
@@ -1,8 +1,7 @@
 """Seek-back scheduling: the quiet-window policy, enforced by rescheduling.
 
 ONE rule, decided by the pure ``policies.seek_decision`` and enforced by
-``ExecuteSeek`` events that re-check every 0.5s instead of blocking the
-dispatcher:
+rescheduled ``ExecuteSeek`` events instead of blocking the dispatcher:
 
     Do not seek until there has been no seek activity — ours, another
     addon's, or the user's — for QUIET_WINDOW seconds. Defer by
@@ -17,6 +16,19 @@ STABILITY_GRACE seconds — after which the quiet window alone decides, so a
 stream whose profile never completes still gets its replay (holding the
 user's replay hostage to detection success would be wrong).
 
+Exact-deadline wakeups: a deferred attempt sleeps until its verdict can
+next change — the policy's ``next_change`` (quiet window end, deadline),
+or the grace end for a stability defer — so a seek lands the moment it is
+allowed. Early wakeups: ``StreamStabilized`` fires the stability-deferred
+attempts at once. Vendor busy properties have no change event, and a busy
+spell that starts and ends between two probes is never recorded as
+activity, so while a vendor addon is installed (or one reads busy) every
+defer — the quiet-window and the stability one alike — wakes at most
+``VENDOR_RECHECK_SECONDS`` later to probe again; the quiet window runs
+from the last busy sighting. Without a vendor the exact wakeups stand. A
+``SeekOccurred`` only ever moves the verdict later, so it wakes nothing:
+the pending wakeup re-decides when it fires.
+
 Behavior notes:
 
 - Triggers: PlaybackStarted -> 'resume'; Resumed -> 'unpause'; a
@@ -77,6 +89,8 @@ class ExternalSeekCoordinator:
         'script.plex.playback_seeking',
         'script.plex.playback_initializing',
     )
+    # The addons that set them (PM4K under its current and former ids).
+    VENDOR_ADDONS = ('script.plexmod', 'script.plex')
     RECIPROCAL_PROPERTY = 'script.audiooffsetmanager.seeking'
 
     def __init__(self, gateway, clock=time.monotonic, *, log_debug):
@@ -96,6 +110,11 @@ class ExternalSeekCoordinator:
                 return True
         return False
 
+    def vendor_installed(self):
+        """True if any addon that announces its seeks is installed."""
+        return any(self._gateway.addon_installed(addon_id)
+                   for addon_id in self.VENDOR_ADDONS)
+
     def last_activity(self, session):
         """Most recent seek-like activity relevant to this session.
 
@@ -135,7 +154,8 @@ class SeekScheduler:
 
     QUIET_WINDOW_SECONDS = 2.0
     DEADLINE_SECONDS = 8.0
-    RECHECK_SECONDS = 0.5
+    # Re-probe cadence while a vendor may seek (see module docstring).
+    VENDOR_RECHECK_SECONDS = 0.5
     DEBOUNCE_SECONDS = 2.0
     # How long a 'seek' verdict defers waiting for STABLE before the quiet
     # window alone decides (never-stabilizing streams keep their replay).
@@ -154,6 +174,8 @@ class SeekScheduler:
         self._clock = clock
         self._log = log_debug
         self._warn = log_warning
+        # reason -> the ExecuteSeek deferred until the stream is STABLE.
+        self._awaiting_stable = {}
 
         dispatcher.subscribe(events.PlaybackStarted, self._on_playback_started)
         dispatcher.subscribe(events.Resumed, self._on_resumed)
@@ -184,6 +206,10 @@ class SeekScheduler:
     def _on_stream_stabilized(self, event):
         if not self._sessions.is_alive(event.session_id):
             return
+        # STABLE: the stability-deferred attempts may seek now.
+        waiting, self._awaiting_stable = self._awaiting_stable, {}
+        for reason, pending in waiting.items():
+            self._dispatcher.schedule(0.0, pending, key=self._key(reason))
         if not event.profile_changed:
             return  # pure re-confirmation: nothing changed, nothing to replay
         if event.initial:
@@ -217,6 +243,7 @@ class SeekScheduler:
     # -- execution ---------------------------------------------------------------
 
     def _on_execute_seek(self, event):
+        self._awaiting_stable.pop(event.reason, None)
         if not self._sessions.is_alive(event.session_id):
             return
         session = self._sessions.current
@@ -231,10 +258,12 @@ class SeekScheduler:
 
         # Probe vendors on EVERY attempt (a busy sighting during
         # stabilization must count): the recording feeds last_activity, so
-        # the policy's quiet window is the only vendor gate needed.
-        self._coordinator.vendor_busy()
+        # the policy's quiet window is the only vendor gate needed. With a
+        # vendor around, _defer caps every wakeup at the re-probe cadence
+        # so a busy spell is sighted unless it is shorter than that.
+        vendor_busy = self._coordinator.vendor_busy()
 
-        decision = policies.seek_decision(
+        decision, next_change = policies.seek_decision(
             now=now,
             requested_at=event.requested_at,
             last_activity=self._coordinator.last_activity(session),
@@ -247,14 +276,17 @@ class SeekScheduler:
                       f"back (already served or deadline passed)")
             return
         if decision == 'defer':
-            self._defer(event, 'awaiting quiet window')
+            self._defer(event, 'awaiting quiet window', next_change,
+                        vendor_busy)
             return
 
         # 'seek' — apply the stability preference: wait for STABLE up to the
         # grace, then let quietness alone decide (see module docstring).
-        if (session.stream_state is not StreamState.STABLE
-                and now - event.requested_at < self.STABILITY_GRACE_SECONDS):
-            self._defer(event, 'stream not stable yet')
+        grace_end = event.requested_at + self.STABILITY_GRACE_SECONDS
+        if session.stream_state is not StreamState.STABLE and now < grace_end:
+            self._awaiting_stable[event.reason] = event
+            self._defer(event, 'stream not stable yet',
+                        min(grace_end, next_change), vendor_busy)
             return
 
         enabled, seek_seconds = self._settings.seek_back_config(event.reason)
@@ -304,19 +336,26 @@ class SeekScheduler:
         # A re-trigger while pending key-replaces the attempt chain; the
         # fresh requested_at restarts the deadline (the newest user action
         # is the one served).
+        self._awaiting_stable.pop(reason, None)
         self._dispatcher.schedule(
             0.0,
             events.ExecuteSeek(session_id=session.session_id, reason=reason,
                                requested_at=now),
             key=self._key(reason))
 
-    def _defer(self, event, why):
+    def _defer(self, event, why, wake_at, vendor_busy):
+        """Sleep until ``wake_at``, when the verdict can next change — or
+        the vendor re-probe, whichever is sooner, while a vendor may seek."""
+        now = self._clock()
+        if vendor_busy or self._coordinator.vendor_installed():
+            wake_at = min(wake_at, now + self.VENDOR_RECHECK_SECONDS)
+        delay = max(wake_at - now, 0.0)
         self._log(f"AOM_SeekScheduler: Deferring {event.reason} seek back "
-                  f"({why})")
-        self._dispatcher.schedule(self.RECHECK_SECONDS, event,
-                                  key=self._key(event.reason))
+                  f"({why}; rechecking in {delay:.2f}s)")
+        self._dispatcher.schedule(delay, event, key=self._key(event.reason))
 
     def _cancel_scheduled(self):
+        self._awaiting_stable.clear()
         for reason in self.REASONS:
             self._dispatcher.cancel(self._key(reason))
 
@@ -57,7 +57,8 @@ class PlaybackSession:
     # same-profile AV event re-apply and re-notify). It is both the applier's
     # dedupe guard and the watcher's self-echo reference.
     applied: tuple = None
-    pending_notification: tuple = None      # (setting_key, delay_ms) awaiting STABLE
+    # (setting_key, delay_ms, level) awaiting STABLE.
+    pending_notification: tuple = None
     paused: bool = False
     # How many times this session has earned STABLE. Written only by
     # mark_stable() (the diagram's one edge into STABLE); the detector stamps
@@ -73,9 +74,19 @@ class PlaybackSession:
     # it can become a user adjustment, so a pre-existing delay the watcher
     # first observes (e.g. left behind by a failed apply RPC) is adopted
     # silently, never stored. watch_pending is the quiescence candidate:
-    # (observed_ms, first_seen_monotonic).
+    # (observed_ms, first_seen_monotonic). watch_stable_since is when the
+    # reading last settled on the baseline (monotonic; None = not settled)
+    # and watch_idle_seconds the idle cadence it has backed off to (None =
+    # not backed off) — the watcher's adaptive poll. watch_reading is the
+    # last (raw infolabel string, parsed ms) pair, so an unchanged string is
+    # not parsed again. watch_hint_streak counts the consecutive fresh
+    # candidates a notification announced (the watcher's hint trust).
     watch_baseline_ms: Optional[int] = None
     watch_pending: tuple = None
+    watch_stable_since: Optional[float] = None
+    watch_idle_seconds: Optional[float] = None
+    watch_reading: tuple = None
+    watch_hint_streak: int = 0
 
     def describe(self):
         """One-line state snapshot for field logs.
@@ -0,0 +1,148 @@
+"""Write-behind settings writer: batched, dialog-aware flushes.
+
+The service's own settings writes (the recorder's platform flags, the
+watcher's user-offset stores and learned teardown window) go through here instead of straight to the
+adapters. A write is recorded as the INTENDED value for its setting id —
+the latest write per id wins — and a single ``FlushSettings`` is posted
+for the batch, so every write made before it is dispatched (a probe's
+three platform flags, say) lands in one flush.
+
+A flush asks the settings-dialog question ONCE. While the addon settings
+dialog is open, nothing is written (settings-state doctrine: its
+save-on-close would clobber the write) and the whole batch is retried
+``RETRY_SECONDS`` later; later writes join it. Nothing is lost while the
+dialog stays open, and no caller polls for it.
+
+Offsets are read back by the applier and the watcher before they reach
+Kodi, so ``write_offset`` STAGES the value in the OffsetTable at once
+(read-your-writes; the table keeps a staged cell across reloads until the
+store lands). Boolean flags and integers are only read by the settings
+UI or at the next start and are not staged.
+
+A write whose store fails stays in the batch and is retried with it, up to
+``MAX_ATTEMPTS`` flushes; then it is dropped with a warning (a dropped
+offset is unstaged, so the table reads Kodi's value again). At service
+shutdown the runtime calls ``shutdown()`` after the dispatcher has
+stopped: the batch is written one last time, dialog or not — an open
+dialog may still clobber it, but not writing loses it for certain.
+
+Pure app layer: settings/offset writes via the injected adapters, the
+dialog question via the injected gateway; no Kodi imports.
+"""
+
+from resources.lib.aom.app import events
+
+
+class SettingsWriter:
+    """Latest-wins write batch, flushed when the settings dialog is closed."""
+
+    RETRY_SECONDS = 1.0
+    MAX_ATTEMPTS = 3
+
+    _FLUSH_KEY = 'aom.writer.flush'
+
+    def __init__(self, dispatcher, gateway, settings, offsets, *, log_debug,
+                 log_warning):
+        self._dispatcher = dispatcher
+        self._gateway = gateway
+        self._settings = settings
+        self._offsets = offsets
+        self._log = log_debug
+        self._warn = log_warning
+        self._bools = {}             # setting_id -> value
+        self._ints = {}              # setting_id -> value
+        self._offset_writes = {}     # setting_id -> (profile, ms)
+        self._attempts = {}          # setting_id -> failed flushes so far
+        self._flush_pending = False  # a FlushSettings is queued or scheduled
+
+        dispatcher.subscribe(events.FlushSettings, self._on_flush)
+
+    # -- intended writes (dispatcher thread) -------------------------------------
+
+    def write_bool(self, setting_id, value):
+        self._bools[setting_id] = value
+        self._request_flush()
+
+    def write_int(self, setting_id, value):
+        self._ints[setting_id] = value
+        self._request_flush()
+
+    def write_offset(self, profile, ms):
+        self._offsets.stage(profile, ms)
+        self._offset_writes[profile.setting_id()] = (profile, ms)
+        self._request_flush()
+
+    def _request_flush(self):
+        if not self._flush_pending:
+            self._flush_pending = True
+            self._dispatcher.post(events.FlushSettings())
+
+    # -- the flush -----------------------------------------------------------------
+
+    def _on_flush(self, _event):
+        self._flush_pending = False
+        if not (self._bools or self._ints or self._offset_writes):
+            return
+        if self._gateway.settings_dialog_open():
+            held = (len(self._bools) + len(self._ints)
+                    + len(self._offset_writes))
+            self._log(f"AOM_SettingsWriter: settings dialog open; holding "
+                      f"{held} write(s)")
+            self._schedule_retry()
+            return
+        if self._flush():
+            self._schedule_retry()
+
+    def _flush(self):
+        """Write the batch; return True when failed writes remain in it."""
+        bools, self._bools = self._bools, {}
+        ints, self._ints = self._ints, {}
+        offset_writes, self._offset_writes = self._offset_writes, {}
+        for setting_id, value in bools.items():
+            if self._settings.store_boolean_if_changed(setting_id, value):
+                self._attempts.pop(setting_id, None)
+            elif self._keep(setting_id):
+                self._bools[setting_id] = value
+        for setting_id, value in ints.items():
+            if self._settings.store_integer_if_changed(setting_id, value):
+                self._attempts.pop(setting_id, None)
+            elif self._keep(setting_id):
+                self._ints[setting_id] = value
+        for setting_id, (profile, ms) in offset_writes.items():
+            if self._offsets.store(profile, ms):
+                self._attempts.pop(setting_id, None)
+            elif self._keep(setting_id):
+                self._offset_writes[setting_id] = (profile, ms)
+            else:
+                self._offsets.unstage(profile)
+        return bool(self._bools or self._ints or self._offset_writes)
+
+    def _keep(self, setting_id):
+        """Count a failed store; False once it has used its attempts."""
+        attempts = self._attempts.get(setting_id, 0) + 1
+        if attempts < self.MAX_ATTEMPTS:
+            self._attempts[setting_id] = attempts
+            return True
+        self._attempts.pop(setting_id, None)
+        self._warn(f"AOM_SettingsWriter: giving up writing {setting_id} "
+                   f"after {attempts} failed attempts")
+        return False
+
+    def _schedule_retry(self):
+        self._flush_pending = True
+        self._dispatcher.schedule(self.RETRY_SECONDS, events.FlushSettings(),
+                                  key=self._FLUSH_KEY)
+
+    # -- shutdown (service main thread, dispatcher stopped) ----------------------
+
+    def shutdown(self):
+        """Write whatever is still batched; the dispatcher is gone by now."""
+        if not (self._bools or self._ints or self._offset_writes):
+            return
+        self._log("AOM_SettingsWriter: flushing pending writes at shutdown")
+        self._flush()
+        lost = (sorted(self._bools) + sorted(self._ints)
+                + sorted(self._offset_writes))
+        if lost:
+            self._warn(f"AOM_SettingsWriter: writes lost at shutdown: "
+                       f"{', '.join(lost)}")
@@ -0,0 +1,244 @@
+"""Shadow-mode detection: an alternative StreamDetector, evaluated side by side.
+
+A second ``StreamDetector`` (typically with a different ``VerifyPlan``)
+consumes the same playback events and reads the same gateway as the live
+one, but can never change what the service does:
+
+- its session view is a private MIRROR of the live session (same ids, own
+  ``PlaybackSession`` objects), so the shadow's adoptions never touch the
+  live ``session.profile`` or stream state;
+- its dispatcher is a ``_ShadowBus``: lifecycle/AV/settings subscriptions
+  go straight to the real dispatcher, its own probe/verify events are
+  wrapped in ``ShadowEvent`` under namespaced timer keys (the live
+  detector never sees them, and neither detector can key-replace the
+  other's timers), and everything it would announce — ``ProfileChanged``,
+  ``StreamStabilized``, ``StreamProbed`` — is recorded instead of posted.
+
+The ``ShadowDetector`` also listens to the live ``ProfileChanged`` /
+``StreamStabilized`` and keeps one report per session: time-to-profile and
+time-to-stable for both detectors (from ``PlaybackStarted``, on the
+injected monotonic clock), the keys each settled on, and how many
+stabilizations disagreed with the other side's profile at that moment.
+The report is logged when the session ends (stop, end or in-place reopen).
+
+Opt-in and dev-facing: the runtime builds it only when the advanced
+``enable_shadow_detection`` setting is on at service start, and it doubles
+the detection reads while active. Pure app layer: no Kodi imports.
+"""
+
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from resources.lib.aom.app import events
+from resources.lib.aom.app.session import PlaybackSession
+from resources.lib.aom.app.stream_detector import (SAMPLED_VERIFY,
+                                                   StreamDetector)
+
+
+# The real-dispatcher events the shadow consumes directly (the inputs it
+# shares with the live detector). Every other subscription is internal.
+_SHARED_INPUTS = (events.PlaybackStarted, events.AvChanged,
+                  events.PlaybackStopped, events.PlaybackEnded,
+                  events.SettingsChanged, events.PlayerNotified)
+
+
+class _ShadowBus:
+    """Dispatcher facade for the shadow detector (see module docstring)."""
+
+    _KEY_PREFIX = 'aom.shadow:'
+
+    def __init__(self, dispatcher, on_output):
+        self._dispatcher = dispatcher
+        self._on_output = on_output
+        self._handlers = {}          # internal event type -> [handlers]
+
+    def subscribe(self, event_type, handler):
+        if event_type in _SHARED_INPUTS:
+            self._dispatcher.subscribe(event_type, handler)
+        else:
+            self._handlers.setdefault(event_type, []).append(handler)
+
+    def post(self, event):
+        if type(event) in self._handlers:
+            self._dispatcher.post(events.ShadowEvent(event))
+        else:
+            self._on_output(event)
+
+    def schedule(self, delay_s, event, key=None):
+        if key is not None:
+            key = self._KEY_PREFIX + key
+        return self._dispatcher.schedule(delay_s, events.ShadowEvent(event),
+                                         key=key)
+
+    def cancel(self, key):
+        self._dispatcher.cancel(self._KEY_PREFIX + key)
+
+    def deliver(self, event):
+        for handler in list(self._handlers.get(type(event), ())):
+            handler(event)
+
+
+class _MirrorSessions:
+    """Shadow session view: the live session ids, private session objects."""
+
+    def __init__(self, bus, live_sessions):
+        self._live = live_sessions
+        self.current = None
+        bus.subscribe(events.PlaybackStarted, self._on_started)
+        bus.subscribe(events.PlaybackStopped, self._on_ended)
+        bus.subscribe(events.PlaybackEnded, self._on_ended)
+
+    def is_alive(self, session_id):
+        current = self.current
+        return current is not None and current.session_id == session_id
+
+    def _on_started(self, _event):
+        live = self._live.current
+        self.current = None if live is None else PlaybackSession(
+            session_id=live.session_id, started_at=live.started_at)
+
+    def _on_ended(self, _event):
+        self.current = None
+
+
+@dataclass
+class ShadowReport:
+    """One session's live-vs-shadow comparison; times are seconds from start."""
+    session_id: int
+    started_at: float
+    live_profile_s: Optional[float] = None
+    live_stable_s: Optional[float] = None
+    shadow_profile_s: Optional[float] = None
+    shadow_stable_s: Optional[float] = None
+    live_key: Optional[str] = None
+    shadow_key: Optional[str] = None
+    stabilizations: int = 0
+    disagreements: int = 0
+
+    def summary(self):
+        def seconds(value):
+            return 'never' if value is None else f"{value:.2f}s"
+        return (f"session #{self.session_id}: "
+                f"live profile={seconds(self.live_profile_s)} "
+                f"stable={seconds(self.live_stable_s)} "
+                f"key={self.live_key}; "
+                f"shadow profile={seconds(self.shadow_profile_s)} "
+                f"stable={seconds(self.shadow_stable_s)} "
+                f"key={self.shadow_key}; "
+                f"disagreements={self.disagreements}/{self.stabilizations}")
+
+
+def _key(session):
+    if session is None or session.profile is None:
+        return None
+    return session.profile.setting_id()
+
+
+class ShadowDetector:
+    """Runs a shadow StreamDetector and reports how it compares to the live one."""
+
+    # Finished reports kept in memory (the log has them all).
+    REPORT_HISTORY = 16
+
+    def __init__(self, dispatcher, session_tracker, gateway, settings_facade,
+                 clock=time.monotonic, *, log_debug, rng=random.random,
+                 verify_plan=SAMPLED_VERIFY):
+        self._sessions = session_tracker
+        self._clock = clock
+        self._log = log_debug
+        self._report = None
+        self.reports = deque(maxlen=self.REPORT_HISTORY)  # oldest first
+
+        self._bus = _ShadowBus(dispatcher, self._on_shadow_output)
+        self._mirror = _MirrorSessions(self._bus, session_tracker)
+        # Subscribed after the mirror, so the shadow session exists first.
+        self.detector = StreamDetector(
+            self._bus, self._mirror, gateway, settings_facade,
+            log_debug=self._shadow_log, log_warning=self._shadow_log,
+            rng=rng, verify_plan=verify_plan)
+
+        dispatcher.subscribe(events.ShadowEvent, self._on_shadow_event)
+        dispatcher.subscribe(events.PlaybackStarted, self._on_started)
+        dispatcher.subscribe(events.PlaybackStopped, self._on_ended)
+        dispatcher.subscribe(events.PlaybackEnded, self._on_ended)
+        dispatcher.subscribe(events.ProfileChanged, self._on_live_profile)
+        dispatcher.subscribe(events.StreamStabilized, self._on_live_stable)
+
+    def _shadow_log(self, message):
+        # Never a warning: nothing the shadow decides is user-visible.
+        self._log(message.replace('AOM_StreamDetector:',
+                                  'AOM_ShadowDetector: [shadow]', 1))
+
+    # -- session lifecycle -------------------------------------------------------
+
+    def _on_started(self, _event):
+        self._finish()               # in-place reopen: report the old one
+        session = self._sessions.current
+        if session is not None:
+            self._report = ShadowReport(session_id=session.session_id,
+                                        started_at=self._clock())
+
+    def _on_ended(self, _event):
+        self._finish()
+
+    def _finish(self):
+        report, self._report = self._report, None
+        if report is None:
+            return
+        self.reports.append(report)
+        self._log(f"AOM_ShadowDetector: report {report.summary()}")
+
+    def _open_report(self, session_id):
+        report = self._report
+        if report is None or report.session_id != session_id:
+            return None
+        return report
+
+    # -- live decisions ------------------------------------------------------------
+
+    def _on_live_profile(self, event):
+        report = self._open_report(event.session_id)
+        if report is not None and report.live_profile_s is None:
+            report.live_profile_s = self._clock() - report.started_at
+
+    def _on_live_stable(self, event):
+        report = self._open_report(event.session_id)
+        if report is None:
+            return
+        if report.live_stable_s is None:
+            report.live_stable_s = self._clock() - report.started_at
+        report.live_key = _key(self._sessions.current)
+        self._compare(report, report.live_key, _key(self._mirror.current),
+                      'live')
+
+    # -- shadow decisions ----------------------------------------------------------
+
+    def _on_shadow_event(self, event):
+        self._bus.deliver(event.event)
+
+    def _on_shadow_output(self, event):
+        if isinstance(event, events.ProfileChanged):
+            report = self._open_report(event.session_id)
+            if report is not None and report.shadow_profile_s is None:
+                report.shadow_profile_s = self._clock() - report.started_at
+        elif isinstance(event, events.StreamStabilized):
+            report = self._open_report(event.session_id)
+            if report is None:
+                return
+            if report.shadow_stable_s is None:
+                report.shadow_stable_s = self._clock() - report.started_at
+            report.shadow_key = _key(self._mirror.current)
+            self._compare(report, report.shadow_key,
+                          _key(self._sessions.current), 'shadow')
+        # StreamProbed: the live detector's gathers already feed the recorder.
+
+    def _compare(self, report, stabilized_key, other_key, side):
+        report.stabilizations += 1
+        if other_key is not None and other_key != stabilized_key:
+            report.disagreements += 1
+            self._log(f"AOM_ShadowDetector: session #{report.session_id} "
+                      f"{side} stabilized on {stabilized_key} while the "
+                      f"other side holds {other_key}")
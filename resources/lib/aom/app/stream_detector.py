@@ -9,17 +9,67 @@ scheduled events — never as sleeps:
   and the audio codec.
 - A complete profile is adopted (this component is the SOLE writer of
   ``session.profile`` and the owner of every stream-state transition), then
-  verified: ``VerifyStream`` re-gathers after 1s and requires the WHOLE
-  profile — HDR, FPS and audio, not just the codec — to have held before
-  marking the session STABLE and posting ``StreamStabilized``.
+  verified: ``VerifyStream`` re-gathers and requires the WHOLE profile —
+  HDR, FPS and audio, not just the codec — to have held before marking the
+  session STABLE and posting ``StreamStabilized``. How long it must hold is
+  the injected ``VerifyPlan``: ``agreement`` consecutive gathers keying to
+  the adopted profile (the adopting gather counts as the first), taken
+  ``spacing_seconds`` apart. The default ``WINDOW_VERIFY`` (2 gathers, 1s
+  apart) is the single re-gather after 1s; ``SAMPLED_VERIFY`` takes lighter
+  samples at 0.25s and exits as soon as 3 in a row agree, so a clean start
+  is STABLE in 0.5s and a blip costs three short samples (0.75s) instead
+  of two whole seconds.
+- Kodi's ``Player.OnAVStart``/``Player.OnAVChange`` JSON-RPC notifications
+  (``PlayerNotified``) are readiness hints: one arriving mid-discovery pulls
+  the pending probe forward to NOW (key-replaced, so the chain never runs
+  twice), instead of waiting out the 0.5s cadence. Any notification that
+  carries a player id also spares the ``GetActivePlayers`` round-trip on
+  every later gather of the playback. No notification, no change: the
+  probe chain is the fallback and is untouched.
 - A failed verification (profile changed or went incomplete inside the
   window) re-adopts or re-schedules verification instead of stranding the
-  session STABILIZING — the recovery edge.
-- ``AvChanged`` triggers an immediate single-shot re-probe: unchanged
-  profile → ignored; changed → re-adopt + re-verify; lost → regress to
-  STABILIZING and let the verify loop chase it.
-
-Every gather posts ``StreamProbed`` platform facts for the PlatformRecorder.
+  session STABILIZING — the recovery edge. Either way the agreement run
+  restarts, anchored on the adopted profile: a re-adoption's gather counts
+  as its first sample, but after a blip or a loss the run starts from
+  zero — the latest sample disagreed, so only the samples after it count.
+- ``AvChanged`` is debounced: it schedules ONE key-replaced
+  ``ReprobeStream`` ``AV_SETTLE_SECONDS`` out, so a burst of callbacks
+  (passthrough negotiation, HDR mode switches fire several within a few
+  hundred ms) becomes a single gather of the final state instead of one
+  gather — and possibly one transient adoption and apply — per callback.
+  The re-probe then decides: unchanged profile → ignored; changed →
+  re-adopt + re-verify; lost → regress to STABILIZING and let the verify
+  loop chase it.
+- Most mid-play changes are audio-stream switches, and Kodi names them: a
+  ``Player.OnPropertyChanged`` whose properties are all audio
+  (``AUDIO_PROPERTIES``) arms the audio hint. While it is armed, gathers
+  outside discovery re-read only the audio stream and reuse the video
+  readings (fps, HDR, HDR fallback, gamut) cached from the last gather
+  that read them — one RPC instead of five. The merged reading then takes
+  the ordinary memo/derivation path, so adoption decisions are the same as
+  a full re-read of an unchanged picture. The hint covers one switch: the
+  re-probe it served drops it unless it adopted the switched profile, and
+  then it lasts only through that profile's verification — the next
+  ``AvChanged`` (news the switch does not cover) or the stabilization
+  drops it. A same-codec switch (nothing adopted) therefore never lends
+  it to a later video change. It is also dropped on any other property
+  change, on an
+  ``OnAVStart``, on a second ``OnAVChange`` (the first is the switch's
+  own, announced on either side of the property change), on stabilization
+  and at session start/end, and at most ``AUDIO_ONLY_RUN_LIMIT``
+  consecutive audio-only gathers run before a full one re-reads the video
+  axes (the drift guard). Discovery always reads everything.
+
+Every FULL gather posts ``StreamProbed`` platform facts for the
+PlatformRecorder. A gather whose raw readings (player id, codec, channels,
+and the four InfoLabels) are identical to the previous gather of the same
+session is short-circuited: the prior ``StreamFacts`` are reused, and the
+derivation, the probe log line and the ``StreamProbed`` post are skipped —
+the same readings derive the same facts, and the recorder already holds
+them. The reading memo is cleared on session start/stop and on a
+``SettingsChanged`` that touches an FPS-override toggle (it feeds the
+derivation). ``full_gathers`` / ``short_circuited_gathers`` count both
+kinds for the service lifetime and are logged at every session end.
 
 "Same stream" is judged on the OFFSET-RELEVANT identity — the setting_id()
 axes (hdr/fps-bucket/audio) — not raw dataclass equality: incidental fields
@@ -38,7 +88,7 @@ import random
 from dataclasses import dataclass
 
 from resources.lib.aom.app import events
-from resources.lib.aom.domain import formats, policies
+from resources.lib.aom.domain import classify, formats, policies
 from resources.lib.aom.domain.profile import StreamProfile
 
 
@@ -47,6 +97,11 @@ INFOLABEL_HDR = 'Player.Process(video.source.hdr.type)'
 INFOLABEL_HDR_FALLBACK = 'VideoPlayer.HdrType'
 INFOLABEL_GAMUT = 'Player.Process(amlogic.eoft_gamut)'
 
+# Precompiled raw-reading tables (aom.domain.classify). The primary label's
+# echo classifies as blank, exactly like an empty reading.
+_classify_audio = classify.audio_classifier()
+_classify_hdr = classify.hdr_classifier(blank_readings=(INFOLABEL_HDR,))
+
 
 @dataclass(frozen=True)
 class StreamFacts:
@@ -75,23 +130,20 @@ def _same_stream(profile, adopted):
 
     See the module docstring — raw dataclass equality would also compare
     player_id/audio_channels/video_fps, which may wiggle between gathers.
+    An interned re-read of identical readings is the same instance, so the
+    steady-state answer is an identity check; otherwise the precomputed
+    integer cells decide.
     """
-    return adopted is not None and profile.setting_id() == adopted.setting_id()
+    return profile.same_key(adopted)
 
 
 def _derive_audio_format(raw_codec):
     """Map a reported codec string onto the settings vocabulary.
 
-    Ordered substring match — eac3 before ac3 is load-bearing — with PCM
-    fallback; 'unknown'/'none' normalize to the unknown sentinel.
+    Exact table, then longest-token match — so eac3 always beats ac3 —
+    with PCM fallback; 'unknown'/'none' normalize to the unknown sentinel.
     """
-    reported = raw_codec.lower()
-    for valid_format in formats.AUDIO_FORMATS:
-        if valid_format in reported:
-            return valid_format
-    if raw_codec in ('unknown', 'none'):
-        return formats.UNKNOWN
-    return 'pcm'
+    return _classify_audio(raw_codec)
 
 
 def derive_stream_facts(player_id, raw_codec, raw_channels, raw_fps, raw_hdr,
@@ -127,14 +179,10 @@ def derive_stream_facts(player_id, raw_codec, raw_channels, raw_fps, raw_hdr,
         hdr_type = raw_hdr_fallback
         hdr_source = 'fallback'
 
-    hdr_type = hdr_type.replace('+', 'plus').replace(' ', '').lower()
-    if not hdr_type or hdr_type == INFOLABEL_HDR.lower():
+    hdr_type = _classify_hdr(hdr_type)
+    if hdr_type is None:
         hdr_type = 'sdr'
         hdr_source = 'default-sdr'
-    elif hdr_type == 'hlghdr':
-        hdr_type = 'hlg'
-    if hdr_type not in formats.HDR_TYPES:
-        hdr_type = formats.UNKNOWN
 
     gamut_valid = _is_valid_infolabel(INFOLABEL_GAMUT, raw_gamut)
     gamut_info = raw_gamut if gamut_valid else 'not available'
@@ -145,7 +193,7 @@ def derive_stream_facts(player_id, raw_codec, raw_channels, raw_fps, raw_hdr,
     if hdr_type != formats.UNKNOWN and not fps_override_enabled(hdr_type):
         fps_type = formats.FPS_ALL
 
-    profile = StreamProfile(
+    profile = StreamProfile.interned(
         hdr_type=hdr_type,
         fps_type=fps_type,
         audio_format=audio_format,
@@ -162,6 +210,20 @@ def derive_stream_facts(player_id, raw_codec, raw_channels, raw_fps, raw_hdr,
     )
 
 
+@dataclass(frozen=True)
+class VerifyPlan:
+    """How stability is earned: ``agreement`` consecutive same-key gathers,
+    ``spacing_seconds`` apart, counting the adopting gather as the first."""
+    spacing_seconds: float
+    agreement: int
+
+
+# One re-gather a full second after adoption.
+WINDOW_VERIFY = VerifyPlan(spacing_seconds=1.0, agreement=2)
+# Lighter, denser samples with an early exit.
+SAMPLED_VERIFY = VerifyPlan(spacing_seconds=0.25, agreement=3)
+
+
 class StreamDetector:
     """Probe/verify orchestration; sole writer of ``session.profile``."""
 
@@ -169,13 +231,28 @@ class StreamDetector:
     # ~10s of discovery at 0.5s spacing — enough for slow platforms to
     # negotiate the player id and the audio codec.
     PROBE_BUDGET = 20
-    VERIFY_WINDOW_SECONDS = 1.0
+    VERIFY_WINDOW_SECONDS = WINDOW_VERIFY.spacing_seconds
+    # AvChanged settle window: each callback pushes the re-probe this far
+    # out, so a burst gathers once, after its last callback.
+    AV_SETTLE_SECONDS = 0.3
 
     _PROBE_KEY = 'aom.detector.probe'
+    _REPROBE_KEY = 'aom.detector.reprobe'
     _VERIFY_KEY = 'aom.detector.verify'
 
+    # Notifications meaning "the player has (re)configured its streams".
+    _READY_NOTIFICATIONS = frozenset(('Player.OnAVStart', 'Player.OnAVChange'))
+    _PROPERTY_NOTIFICATION = 'Player.OnPropertyChanged'
+    # OnPropertyChanged properties that touch only the audio axis.
+    AUDIO_PROPERTIES = frozenset(('currentaudiostream', 'audiostreams'))
+    # Consecutive audio-only gathers before the video axes are re-read.
+    AUDIO_ONLY_RUN_LIMIT = 3
+    # The settings the derivation reads (a save touching one clears the memo).
+    _FPS_OVERRIDE_IDS = tuple(f"enable_fps_{hdr}" for hdr in formats.HDR_TYPES)
+
     def __init__(self, dispatcher, session_tracker, gateway, settings_facade,
-                 *, log_debug, log_warning, rng=random.random):
+                 *, log_debug, log_warning, rng=random.random,
+                 verify_plan=WINDOW_VERIFY):
         self._dispatcher = dispatcher
         self._sessions = session_tracker
         self._gateway = gateway
@@ -183,17 +260,41 @@ class StreamDetector:
         self._log = log_debug
         self._warn = log_warning
         self._rng = rng
+        self._verify_plan = verify_plan
         # Single live session at a time: plain fields, reset on start/stop.
         # Events stamped with a superseded session_id are dropped on receipt.
         self._discovering = False
         self._verify_seq = 0
+        # Consecutive gathers keying to the adopted profile in this run.
+        self._agreement = 0
+        # Player id from the last Player.* notification (-1: none yet), and
+        # the attempt number of the scheduled discovery probe (None: none).
+        self._notified_player_id = -1
+        self._pending_attempt = None
+        # (raw reading tuple, StreamFacts) of the last full gather, or None.
+        self._last_reading = None
+        # Audio-switch hint (see the module docstring): armed by an
+        # audio-only OnPropertyChanged; the OnAVChange notifications seen
+        # while armed, the cached raw video readings and the current run of
+        # gathers that reused them.
+        self._audio_hint = False
+        self._hint_av_changes = 0
+        self._hint_served = False    # its re-probe ran; verification's now
+        self._video_readings = None
+        self._audio_only_run = 0
+        self.full_gathers = 0
+        self.short_circuited_gathers = 0
+        self.audio_only_gathers = 0
 
         dispatcher.subscribe(events.PlaybackStarted, self._on_playback_started)
         dispatcher.subscribe(events.AvChanged, self._on_av_changed)
         dispatcher.subscribe(events.ProbeStream, self._on_probe)
+        dispatcher.subscribe(events.ReprobeStream, self._on_reprobe)
         dispatcher.subscribe(events.VerifyStream, self._on_verify)
         dispatcher.subscribe(events.PlaybackStopped, self._on_playback_ended)
         dispatcher.subscribe(events.PlaybackEnded, self._on_playback_ended)
+        dispatcher.subscribe(events.SettingsChanged, self._on_settings_changed)
+        dispatcher.subscribe(events.PlayerNotified, self._on_player_notified)
 
     # -- lifecycle (dispatcher thread) -----------------------------------------
 
@@ -203,6 +304,8 @@ class StreamDetector:
             return  # tracker subscribes first; defensive only
         self._cancel_scheduled()
         self._discovering = True
+        self._last_reading = None
+        self._reset_audio_hint()
         self._log(f"AOM_StreamDetector: session #{session.session_id} "
                   f"discovery started")
         self._dispatcher.post(
@@ -211,9 +314,32 @@ class StreamDetector:
     def _on_playback_ended(self, _event):
         self._cancel_scheduled()
         self._discovering = False
+        self._last_reading = None
+        self._notified_player_id = -1
+        self._reset_audio_hint()
+        self._log(f"AOM_StreamDetector: gathers so far: "
+                  f"full={self.full_gathers}, "
+                  f"short_circuited={self.short_circuited_gathers}, "
+                  f"audio_only={self.audio_only_gathers}")
+
+    def _on_settings_changed(self, event):
+        # The derivation reads enable_fps_<hdr>: identical raw readings may
+        # derive a different profile after such a save, so re-derive next time.
+        if policies.save_touches(event.changed, *self._FPS_OVERRIDE_IDS):
+            self._last_reading = None
+
+    def _reset_audio_hint(self):
+        self._audio_hint = False
+        self._hint_av_changes = 0
+        self._hint_served = False
+        self._hint_served = False    # its re-probe ran; verification's now
+        self._video_readings = None
+        self._audio_only_run = 0
 
     def _cancel_scheduled(self):
+        self._pending_attempt = None
         self._dispatcher.cancel(self._PROBE_KEY)
+        self._dispatcher.cancel(self._REPROBE_KEY)
         self._dispatcher.cancel(self._VERIFY_KEY)
 
     # -- discovery: budgeted probe chain ---------------------------------------
@@ -221,6 +347,7 @@ class StreamDetector:
     def _on_probe(self, event):
         if not self._sessions.is_alive(event.session_id):
             return  # superseded session: the scheduled probe is inert
+        self._pending_attempt = None
         session = self._sessions.current
         facts = self._gather(event.session_id)
         if policies.is_complete(facts.profile):
@@ -229,6 +356,7 @@ class StreamDetector:
                       f"{event.attempt}: {facts.profile}")
             self._adopt(session, facts.profile)
         elif event.attempt < self.PROBE_BUDGET:
+            self._pending_attempt = event.attempt + 1
             self._dispatcher.schedule(
                 self._jittered_spacing(),
                 events.ProbeStream(session_id=event.session_id,
@@ -239,6 +367,37 @@ class StreamDetector:
             self._warn(f"AOM_StreamDetector: giving up discovery after "
                        f"{event.attempt} attempts; last probe: {facts.profile}")
 
+    def _on_player_notified(self, event):
+        if event.player_id >= 0:
+            self._notified_player_id = event.player_id
+        if event.method == self._PROPERTY_NOTIFICATION:
+            self._audio_hint = (bool(event.properties) and
+                                self.AUDIO_PROPERTIES.issuperset(
+                                    event.properties))
+            self._hint_av_changes = 0
+            self._hint_served = False
+            return
+        if event.method not in self._READY_NOTIFICATIONS:
+            return
+        if self._audio_hint:
+            # Any AV notification but the switch's own OnAVChange is news
+            # about the picture the cached video readings no longer cover.
+            self._hint_av_changes += 1
+            if (event.method != 'Player.OnAVChange'
+                    or self._hint_av_changes > 1):
+                self._audio_hint = False
+        session = self._sessions.current
+        if session is None or self._pending_attempt is None:
+            return  # not mid-discovery, or probe #1 is already queued
+        self._log(f"AOM_StreamDetector: {event.method} during discovery; "
+                  f"probing now (attempt {self._pending_attempt})")
+        # key-replace: the notified probe supersedes the cadence probe.
+        self._dispatcher.schedule(
+            0.0,
+            events.ProbeStream(session_id=session.session_id,
+                               attempt=self._pending_attempt),
+            key=self._PROBE_KEY)
+
     # -- change detection --------------------------------------------------------
 
     def _on_av_changed(self, _event):
@@ -246,13 +405,32 @@ class StreamDetector:
         if session is None:
             self._log("AOM_StreamDetector: AV change with no session; ignoring")
             return
+        if self._hint_served:
+            # A change after the switch's own re-probe: not the switch's.
+            self._audio_hint = self._hint_served = False
         if self._discovering:
             # The probe chain reads fresh facts on every attempt, so it will
             # observe whatever this change did — no extra work to schedule.
             self._log("AOM_StreamDetector: AV change during discovery; "
                       "probes will observe it")
             return
+        # key-replace: a later callback of the same burst pushes this out.
+        self._dispatcher.schedule(
+            self.AV_SETTLE_SECONDS,
+            events.ReprobeStream(session_id=session.session_id),
+            key=self._REPROBE_KEY)
+
+    def _on_reprobe(self, event):
+        """The settled AV change: one gather of the burst's final state."""
+        if not self._sessions.is_alive(event.session_id):
+            return
+        if self._discovering:
+            return  # discovery restarted meanwhile; its probes observe it
+        session = self._sessions.current
         facts = self._gather(session.session_id)
+        # This gather was the switch's; only its adoption's verification
+        # may reuse the video readings after it.
+        served, self._audio_hint = self._audio_hint, False
         if _same_stream(facts.profile, session.profile):
             # Same offset-relevant stream: refresh incidental fields
             # (player_id/channels/raw fps) silently — no events, no state.
@@ -264,6 +442,7 @@ class StreamDetector:
             self._log(f"AOM_StreamDetector: stream change detected: "
                       f"{session.profile} -> {facts.profile}")
             self._adopt(session, facts.profile)
+            self._audio_hint = self._hint_served = served
         elif session.profile is None:
             # Discovery gave up earlier and the stream is still incomplete —
             # a change means it may be completing now; restart the budget.
@@ -279,7 +458,7 @@ class StreamDetector:
             session.mark_verifying()
             self._log("AOM_StreamDetector: profile lost mid-playback; "
                       "verifying until it settles")
-            self._schedule_verify(session.session_id)
+            self._restart_verification(session.session_id)
 
     # -- verification: whole-profile quiescence ---------------------------------
 
@@ -295,11 +474,18 @@ class StreamDetector:
         facts = self._gather(event.session_id)
         if _same_stream(facts.profile, session.profile):
             session.profile = facts.profile   # silent incidental-field refresh
+            self._agreement += 1
+            if self._agreement < self._verify_plan.agreement:
+                self._schedule_verify(event.session_id)  # next sample
+                return
             session.mark_stable()
+            self._audio_hint = self._hint_served = False
             announce = session.profile_changed_since_stabilized
             session.profile_changed_since_stabilized = False
+            held = ((self._verify_plan.agreement - 1)
+                    * self._verify_plan.spacing_seconds)
             self._log(f"AOM_StreamDetector: profile held for "
-                      f"{self.VERIFY_WINDOW_SECONDS}s; session "
+                      f"{held}s; session "
                       f"#{event.session_id} stable "
                       f"(profile_changed={announce})")
             self._dispatcher.post(events.StreamStabilized(
@@ -315,7 +501,7 @@ class StreamDetector:
             # keep watching. Session-bound: playback stop cancels the key.
             self._log("AOM_StreamDetector: profile incomplete during "
                       "verification; re-verifying")
-            self._schedule_verify(event.session_id)
+            self._restart_verification(event.session_id)
 
     # -- internals ----------------------------------------------------------------
 
@@ -327,32 +513,58 @@ class StreamDetector:
             session.mark_verifying()
         self._dispatcher.post(
             events.ProfileChanged(session_id=session.session_id))
-        self._schedule_verify(session.session_id)
+        # The adopting gather read this profile: it is the run's first sample.
+        self._restart_verification(session.session_id, agreement=1)
+
+    def _restart_verification(self, session_id, agreement=0):
+        """Start a fresh agreement run anchored on the adopted profile;
+        ``agreement`` is the samples it already holds."""
+        self._agreement = agreement
+        self._schedule_verify(session_id)
 
     def _schedule_verify(self, session_id):
         self._verify_seq += 1
         self._dispatcher.schedule(
-            self.VERIFY_WINDOW_SECONDS,
+            self._verify_plan.spacing_seconds,
             events.VerifyStream(session_id=session_id, seq=self._verify_seq),
             key=self._VERIFY_KEY)
 
     def _gather(self, session_id):
-        """One single-shot detection pass; posts platform facts as it goes."""
-        player_id = self._gateway.active_player_id()
+        """One single-shot detection pass; posts platform facts as it goes.
+
+        An unchanged raw reading reuses the previous facts silently, and an
+        armed audio hint reuses the cached video readings (see the module
+        docstring).
+        """
+        player_id = self._notified_player_id
+        if player_id == -1:
+            player_id = self._gateway.active_player_id()
         if player_id == -1:
             raw_codec, raw_channels = formats.UNKNOWN, formats.UNKNOWN
         else:
             raw_codec, raw_channels = self._gateway.audio_info(player_id)
+        if (self._audio_hint and not self._discovering
+                and self._video_readings is not None
+                and self._audio_only_run < self.AUDIO_ONLY_RUN_LIMIT):
+            self._audio_only_run += 1
+            self.audio_only_gathers += 1
+        else:
+            self._audio_only_run = 0
+            self._video_readings = (
+                self._gateway.infolabel(INFOLABEL_FPS),
+                self._gateway.infolabel(INFOLABEL_HDR),
+                self._gateway.infolabel(INFOLABEL_HDR_FALLBACK),
+                self._gateway.infolabel(INFOLABEL_GAMUT))
+        reading = (player_id, raw_codec, raw_channels) + self._video_readings
+        last = self._last_reading
+        if last is not None and last[0] == reading:
+            self.short_circuited_gathers += 1
+            return last[1]
+
         facts = derive_stream_facts(
-            player_id=player_id,
-            raw_codec=raw_codec,
-            raw_channels=raw_channels,
-            raw_fps=self._gateway.infolabel(INFOLABEL_FPS),
-            raw_hdr=self._gateway.infolabel(INFOLABEL_HDR),
-            raw_hdr_fallback=self._gateway.infolabel(INFOLABEL_HDR_FALLBACK),
-            raw_gamut=self._gateway.infolabel(INFOLABEL_GAMUT),
-            fps_override_enabled=self._settings.fps_override_enabled,
-        )
+            *reading, fps_override_enabled=self._settings.fps_override_enabled)
+        self.full_gathers += 1
+        self._last_reading = (reading, facts)
         self._log(f"AOM_StreamDetector: probed {facts.profile} "
                   f"(hdr_source={facts.hdr_source}, "
                   f"platform_hdr_full={facts.platform_hdr_full}, "
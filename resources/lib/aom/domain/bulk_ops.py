@@ -0,0 +1,155 @@
+"""Bulk offset edits: the RunScript commands, parsed and planned.
+
+``RunScript(script.audiooffsetmanager, <command>, <name>=<value>, ...)``
+runs one of three commands over the offset ids (``formats.all_offset_keys``):
+
+- ``shift ms=<N> [hdr=<hdr>] [fps=<fps>] [audio=<audio>]`` — add N ms to
+  every calibrated offset of the slice;
+- ``copy from=<hdr> to=<hdr>`` — make one HDR type's offsets, its default
+  included, an exact copy of another's;
+- ``reset [hdr=<hdr>] [fps=<fps>] [audio=<audio>]`` — zero the slice.
+
+A slice names at least one axis (an accidental whole-matrix edit is one
+typo away otherwise) and holds every cell matching the named values; an
+HDR type's ``<hdr>_default`` belongs to it when the slice names no FPS or
+audio value, the axes a default does not have.
+
+``shift`` moves calibrated (non-zero) offsets only: a shifted 0 would turn
+every untouched slot into a calibration and hide the all-FPS row and HDR
+default it resolves through (``aom.domain.resolution``). N must be a
+multiple of the sliders' step: any other shift leaves values the dialog
+can neither show nor reproduce. Results are clamped to the sliders'
+range; one that lands on 0 is uncalibrated like any other 0.
+
+``plan()`` returns the ids whose value changes and their new values — the
+whole edit, written as one batch by the caller.
+
+Pure Python: no Kodi imports.
+"""
+
+from dataclasses import dataclass
+
+from resources.lib.aom.domain import formats
+
+SHIFT = 'shift'
+COPY = 'copy'
+RESET = 'reset'
+COMMANDS = (SHIFT, COPY, RESET)
+
+# The offset sliders' range and step (tools/generate_settings.py).
+OFFSET_LIMIT_MS = 1000
+OFFSET_STEP_MS = 25
+
+_SLICE_ARGUMENTS = ('hdr', 'fps', 'audio')
+_ARGUMENTS = {
+    SHIFT: ('ms',) + _SLICE_ARGUMENTS,
+    COPY: ('from', 'to'),
+    RESET: _SLICE_ARGUMENTS,
+}
+
+
+@dataclass(frozen=True)
+class BulkCommand:
+    name: str
+    hdr: str = None
+    fps: str = None
+    audio: str = None
+    ms: int = 0
+    source: str = None           # copy: from=<hdr>
+    target: str = None           # copy: to=<hdr>
+
+
+def parse_command(args):
+    """Parse RunScript arguments into a BulkCommand; raise ValueError."""
+    if not args:
+        raise ValueError("no command given")
+    name = args[0].strip().lower()
+    if name not in COMMANDS:
+        raise ValueError(f"unknown command '{name}'")
+    values = {}
+    for arg in args[1:]:
+        key, separator, value = arg.partition('=')
+        key, value = key.strip().lower(), value.strip()
+        if not separator or key not in _ARGUMENTS[name]:
+            raise ValueError(f"unexpected argument '{arg.strip()}' for {name}")
+        values[key] = value
+
+    if name == COPY:
+        source = _hdr(values.get('from'), 'from')
+        target = _hdr(values.get('to'), 'to')
+        if source == target:
+            raise ValueError(f"copy from {source} to itself")
+        return BulkCommand(name, source=source, target=target)
+
+    hdr, fps, audio = (values.get(key) for key in _SLICE_ARGUMENTS)
+    if hdr is None and fps is None and audio is None:
+        raise ValueError(f"{name} needs hdr=, fps= or audio=")
+    if hdr is not None:
+        hdr = _hdr(hdr, 'hdr')
+    if fps is not None and fps.lower() not in formats.FPS_ORDINALS:
+        raise ValueError(f"unknown fps '{fps}'")
+    if audio is not None and audio.lower() not in formats.AUDIO_ORDINALS:
+        raise ValueError(f"unknown audio format '{audio}'")
+    ms = 0
+    if name == SHIFT:
+        try:
+            ms = int(values.get('ms', ''))
+        except ValueError:
+            raise ValueError("shift needs a whole number of ms (ms=<N>)") \
+                from None
+        if ms % OFFSET_STEP_MS:
+            raise ValueError(f"shift ms must be a multiple of "
+                             f"{OFFSET_STEP_MS}")
+    return BulkCommand(name, hdr=hdr, fps=fps and fps.lower(),
+                       audio=audio and audio.lower(), ms=ms)
+
+
+def _hdr(value, key):
+    if value is None:
+        raise ValueError(f"missing {key}=<hdr type>")
+    if value.lower() not in formats.HDR_ORDINALS:
+        raise ValueError(f"unknown hdr type '{value}'")
+    return value.lower()
+
+
+def slice_keys(hdr=None, fps=None, audio=None):
+    """The offset ids of a slice, in ``formats.all_offset_keys()`` order."""
+    keys = []
+    for hdr_type in formats.HDR_TYPES:
+        if hdr not in (None, hdr_type):
+            continue
+        for fps_key in formats.FPS_KEYS:
+            if fps not in (None, fps_key):
+                continue
+            for audio_format in formats.AUDIO_FORMATS:
+                if audio in (None, audio_format):
+                    keys.append(formats.setting_key(hdr_type, fps_key,
+                                                    audio_format))
+    if fps is None and audio is None:
+        keys += [formats.hdr_default_key(hdr_type)
+                 for hdr_type in formats.HDR_TYPES if hdr in (None, hdr_type)]
+    return keys
+
+
+def plan(command, current):
+    """``{setting_id: ms}`` of every offset ``command`` changes.
+
+    ``current`` maps each offset id to its stored value (absent reads 0).
+    """
+    if command.name == COPY:
+        source_keys = slice_keys(hdr=command.source)
+        targets = dict(zip(slice_keys(hdr=command.target),
+                           (current.get(key, 0) for key in source_keys)))
+    else:
+        keys = slice_keys(command.hdr, command.fps, command.audio)
+        if command.name == RESET:
+            targets = dict.fromkeys(keys, 0)
+        else:
+            targets = {key: _clamp(current[key] + command.ms)
+                       for key in keys if current.get(key, 0)}
+    return {key: ms for key, ms in targets.items()
+            if current.get(key, 0) != ms}
+
+
+def _clamp(ms):
+    return max(-OFFSET_LIMIT_MS, min(OFFSET_LIMIT_MS, ms))
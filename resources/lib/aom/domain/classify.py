@@ -0,0 +1,113 @@
+"""Raw-reading classification: precompiled tables over the format vocabulary.
+
+Kodi and the platform builds under it report the same format under many
+spellings ('eac3', 'EAC3', 'eac3-joc', 'e-ac-3', 'pt-truehd', 'HLG HDR',
+'Dolby Vision' ...). A ``Classifier`` maps a raw reading onto the
+vocabulary in three tiers:
+
+1. the exact table — seeded from ``aom.domain.formats`` (every vocabulary
+   token), the platform alias tables below and the axis sentinels, then
+   grown with every raw string already classified, so a steady-state
+   gather is one dict hit;
+2. on a miss, the normalized reading is looked up again, then scanned for
+   the LONGEST known token it contains (ties broken by vocabulary order,
+   so 'eac3-joc' keys to eac3, never ac3);
+3. nothing matched: the axis default.
+
+The learned part of the table is bounded: when it outgrows ``SEEN_LIMIT``
+it is reset to the seed. ``tests/data/classification_corpus.json`` holds
+real readings and their expected buckets; it is both the regression suite
+for these tables and the input of ``tools/bench.py classify``.
+
+Pure Python: no Kodi imports.
+"""
+
+from resources.lib.aom.domain import formats
+
+
+# Audio spellings the substring scan alone would misfile (keys lowercase).
+AUDIO_ALIASES = {
+    'e-ac-3': 'eac3',
+    'ec-3': 'eac3',
+    'ac-3': 'ac3',
+    'mlp': 'truehd',
+    'dts': 'dca',
+    'dts-hd ma': 'dtshd_ma',
+    'dts-hd hra': 'dtshd_hra',
+    'dtshd-ma': 'dtshd_ma',
+    'dtshd-hra': 'dtshd_hra',
+}
+
+# Audio readings that mean "not negotiated yet", not a format.
+AUDIO_SENTINELS = {
+    'unknown': formats.UNKNOWN,
+    'none': formats.UNKNOWN,
+}
+
+# HDR spellings, keyed by their NORMALIZED form (see normalize_hdr).
+HDR_ALIASES = {
+    'hlghdr': 'hlg',
+    'dovi': 'dolbyvision',
+    'dolbyvisionhdr': 'dolbyvision',
+    'hdr10dynamic': 'hdr10plus',
+}
+
+
+def normalize_hdr(raw):
+    """'HDR10+' -> 'hdr10plus', 'HLG HDR' -> 'hlghdr': the HDR table key."""
+    return raw.replace('+', 'plus').replace(' ', '').lower()
+
+
+class Classifier:
+    """Raw string -> vocabulary value (see the module docstring)."""
+
+    SEEN_LIMIT = 512
+
+    def __init__(self, vocabulary, aliases, exact, default, normalize):
+        tokens = [(token, token) for token in vocabulary]
+        tokens += [(alias, value) for alias, value in aliases.items()]
+        # Stable sort: equal-length tokens keep vocabulary order.
+        self._tokens = tuple(sorted(tokens, key=lambda pair: -len(pair[0])))
+        self._seed = dict(tokens)
+        self._seed.update(exact)
+        self._table = dict(self._seed)
+        self._default = default
+        self._normalize = normalize
+
+    def __call__(self, raw):
+        try:
+            return self._table[raw]
+        except KeyError:
+            pass
+        table = self._table
+        value = self._classify(self._normalize(raw))
+        if len(table) >= len(self._seed) + self.SEEN_LIMIT:
+            self._table = table = dict(self._seed)
+        table[raw] = value
+        return value
+
+    def _classify(self, key):
+        if key in self._seed:
+            return self._seed[key]
+        for token, value in self._tokens:
+            if token in key:
+                return value
+        return self._default
+
+
+def audio_classifier():
+    """Raw codec -> audio format; unrecognized-but-present codecs are 'pcm'."""
+    return Classifier(formats.AUDIO_FORMATS, AUDIO_ALIASES, AUDIO_SENTINELS,
+                      default='pcm', normalize=str.lower)
+
+
+def hdr_classifier(blank_readings=()):
+    """Raw HDR label -> HDR type, or None for a blank reading.
+
+    ``blank_readings`` are raw values that mean "no data" (label echoes);
+    they classify like the empty string. Unmatched labels are UNKNOWN.
+    """
+    exact = {'': None}
+    exact.update((normalize_hdr(raw), None) for raw in blank_readings)
+    return Classifier(formats.HDR_TYPES, HDR_ALIASES, exact,
+                      default=formats.UNKNOWN, normalize=normalize_hdr)
@@ -14,9 +14,9 @@ Pure Python: no Kodi imports.
 # HDR types, in settings.xml category order.
 HDR_TYPES = ('dolbyvision', 'hdr10', 'hdr10plus', 'hlg', 'sdr')
 
-# Audio formats, in settings.xml row order. ORDER IS LOAD-BEARING for
-# substring matching: 'ac3' is a substring of 'eac3', so 'eac3' must be
-# tested first or Dolby Digital+ streams would key to the ac3 bucket.
+# Audio formats, in settings.xml row order. The classifier
+# (aom.domain.classify) prefers the LONGEST token a reading contains, so
+# 'eac3' beats its substring 'ac3'; this order breaks equal-length ties.
 AUDIO_FORMATS = ('truehd', 'eac3', 'ac3', 'dtshd_ma', 'dtshd_hra', 'dca', 'pcm')
 
 # Specific FPS buckets (integer values as detected from the player), plus the
@@ -86,6 +86,10 @@ HDR_ENABLE_STRING_IDS = {
     'sdr': ('32032', '32033'),
 }
 
+# The per-HDR default offset slider (label_id, help_id), shared by every HDR
+# category like the FPS-override toggle's.
+HDR_DEFAULT_STRING_IDS = ('32110', '32111')
+
 # Per-HDR settings category (label_id, help_id).
 HDR_CATEGORY_LABELS = {
     'dolbyvision': ('32076', '32088'),
@@ -119,6 +123,37 @@ FPS_OPTION_LABEL_IDS = {
 }
 
 
+# --- Axis ordinals (the dense offset cube) ----------------------------------
+
+# The fps axis as setting-key strings: 'all' first, then every bucket — the
+# same order all_setting_keys() walks.
+FPS_KEYS = (FPS_ALL,) + tuple(str(bucket) for bucket in FPS_BUCKETS)
+
+# value -> position on its axis. The fps index is keyed by str(bucket):
+# fps_type travels as int or str depending on source.
+HDR_ORDINALS = {hdr: index for index, hdr in enumerate(HDR_TYPES)}
+FPS_ORDINALS = {fps: index for index, fps in enumerate(FPS_KEYS)}
+AUDIO_ORDINALS = {audio: index for index, audio in enumerate(AUDIO_FORMATS)}
+
+# Ordinal of any value outside the vocabulary ('unknown' included).
+NO_ORDINAL = -1
+
+# Cells in the HDR x FPS x audio cube (315 today).
+CELL_COUNT = len(HDR_TYPES) * len(FPS_KEYS) * len(AUDIO_FORMATS)
+
+
+def cell_index(hdr_ordinal, fps_ordinal, audio_ordinal):
+    """Flat index of an offset in the cube, or NO_ORDINAL if any axis is.
+
+    Row-major in settings.xml order, so ``all_setting_keys()[cell]`` is the
+    setting id of ``cell``.
+    """
+    if NO_ORDINAL in (hdr_ordinal, fps_ordinal, audio_ordinal):
+        return NO_ORDINAL
+    return ((hdr_ordinal * len(FPS_KEYS) + fps_ordinal) * len(AUDIO_FORMATS)
+            + audio_ordinal)
+
+
 def setting_key(hdr_type, fps_key, audio_format):
     """The settings.xml id for an offset: `<hdr>_<fps>_<audio>`.
 
@@ -135,3 +170,17 @@ def all_setting_keys():
             for audio in AUDIO_FORMATS:
                 keys.append(setting_key(hdr, fps, audio))
     return keys
+
+
+def hdr_default_key(hdr_type):
+    """The settings.xml id of an HDR type's default offset: `<hdr>_default`.
+
+    The last level of offset resolution (``aom.domain.resolution``): it
+    answers for every cell of the HDR type that resolves to no calibration.
+    """
+    return f"{hdr_type}_default"
+
+
+def all_offset_keys():
+    """Every offset id: the 315 cells, then one default per HDR type."""
+    return all_setting_keys() + [hdr_default_key(hdr) for hdr in HDR_TYPES]
@@ -0,0 +1,47 @@
+"""The offset file format: calibrated offsets keyed by setting id.
+
+One small JSON document, shared by every file-based offset source (the
+sparse offset store and its tools)::
+
+    {"version": 1, "offsets": {"dolbyvision_all_truehd": -125, ...}}
+
+Keys are ``formats.setting_key`` ids; values are integer milliseconds. Only
+calibrated entries are meaningful — an id without an entry is 0, like an
+untouched slider — so decoding drops zeros along with anything that is not
+an int inside the +/-10 s delay range. A layer over other offsets (the
+fleet overlay) keeps them instead (``keep_zeros``): there an explicit 0
+replaces the value beneath, where a missing entry leaves it.
+
+Pure Python: no Kodi imports, no I/O.
+"""
+
+import json
+
+FORMAT_VERSION = 1
+
+# Kodi's audio delay range; also keeps every value inside OffsetTable's
+# 16-bit cube cells.
+MAX_OFFSET_MS = 10000
+
+
+def parse_offsets(text, keep_zeros=False):
+    """Decode an offset file into ``{setting_id: ms}``; raises ValueError.
+
+    Unknown ids are kept: an axis this build does not know yet must survive
+    a round-trip. Explicit zeros are kept only with ``keep_zeros``.
+    """
+    document = json.loads(text)
+    if not isinstance(document, dict) \
+            or not isinstance(document.get('offsets'), dict):
+        raise ValueError("not an offset file document")
+    return {setting_id: ms for setting_id, ms in document['offsets'].items()
+            if isinstance(ms, int) and not isinstance(ms, bool)
+            and (ms or keep_zeros)
+            and -MAX_OFFSET_MS <= ms <= MAX_OFFSET_MS}
+
+
+def format_offsets(offsets):
+    """Encode ``{setting_id: ms}`` as an offset file (sorted, one line)."""
+    return json.dumps({'version': FORMAT_VERSION,
+                       'offsets': dict(sorted(offsets.items()))},
+                      separators=(',', ':'))
@@ -1,5 +1,6 @@
 """Pure decision functions: offset gating, profile completeness, delay
-parsing, and the seek quiet-window policy.
+parsing, the seek quiet-window policy, settings-save relevance and the
+learned teardown-window bound.
 
 Pure Python: no Kodi imports, no I/O. Callers resolve settings/state and pass
 explicit values; these functions only decide.
@@ -55,6 +56,17 @@ def is_complete(profile):
     )
 
 
+def save_touches(changed, *setting_ids):
+    """True when a settings save may have changed any of ``setting_ids``.
+
+    ``changed`` is a ``SettingsChanged.changed`` set; None (an undiffed
+    save) touches every id.
+    """
+    if changed is None:
+        return True
+    return not changed.isdisjoint(setting_ids)
+
+
 def seek_decision(now, requested_at, last_activity, last_own_seek,
                   quiet_window, deadline):
     """The seek quiet-window policy, stated as one rule.
@@ -79,17 +91,45 @@ def seek_decision(now, requested_at, last_activity, last_own_seek,
         deadline: max seconds after requested_at before giving up.
 
     Returns:
-        'seek' | 'defer' | 'abandon'. Deadline is checked before quietness:
-        a request that aged past the deadline is abandoned even if the
-        window happens to be quiet now.
+        ``(verdict, next_change)``: verdict is 'seek' | 'defer' | 'abandon';
+        ``next_change`` is the (monotonic) time the verdict changes next
+        with no new activity — 'defer' turns at the end of the quiet window
+        or at the deadline, whichever is first; 'seek' turns to 'abandon'
+        at the deadline; 'abandon' is final (None). Deadline is checked
+        before quietness: a request that aged past the deadline is
+        abandoned even if the window happens to be quiet now. The verdict
+        compares ``now`` against those same instants, so a caller woken
+        exactly at ``next_change`` sees the new verdict.
     """
     if last_own_seek is not None and last_own_seek >= requested_at:
-        return 'abandon'
-    if now - requested_at >= deadline:
-        return 'abandon'
-    if now - last_activity < quiet_window:
-        return 'defer'
-    return 'seek'
+        return 'abandon', None
+    expires = requested_at + deadline
+    if now >= expires:
+        return 'abandon', None
+    quiet_at = last_activity + quiet_window
+    if now < quiet_at:
+        return 'defer', min(quiet_at, expires)
+    return 'seek', expires
+
+
+def phantom_bound(bound_ms, sample_ms, decay):
+    """Fold a teardown-window sample into the learned bound (ms).
+
+    A peak hold with slow decay: a sample above the bound raises it at
+    once, one below only lowers it by ``1/decay`` of the difference. The
+    bound is what quiescence must outrun, so a long window is believed
+    immediately and a short one only after it keeps recurring; one stray
+    long sample fades instead of pinning the bound forever.
+    """
+    if sample_ms >= bound_ms:
+        return sample_ms
+    return bound_ms - (bound_ms - sample_ms) // decay
+
+
+def retry_delay(attempt, base_s, max_s):
+    """Seconds before retry ``attempt + 1``: ``base_s`` doubled per attempt
+    already made, capped at ``max_s``."""
+    return min(base_s * 2 ** attempt, max_s)
 
 
 def should_apply(profile, hdr_enabled):
@@ -1,9 +1,19 @@
 """Immutable stream profile — the settings-lookup key and display helpers.
 
-Pure Python: no Kodi imports. Display names and the setting-key format come
-from aom.domain.formats (the vocabulary single source of truth).
+Profiles are compared and keyed on every gather, apply, dedupe and store, so
+the key is computed ONCE: construction precomputes the setting id (interned
+with ``sys.intern``, so equal keys are the same string object and compare at
+identity speed) and the integer ordinals of the HDR/FPS/audio axes plus the
+flat ``cell`` index into the dense offset cube. Instances are slotted, and
+``StreamProfile.interned`` hands back the SAME instance for identical
+readings — steady-state gathers then allocate nothing new.
+
+Pure Python: no Kodi imports. Display names, the setting-key format and the
+axis ordinals come from aom.domain.formats (the vocabulary single source of
+truth).
 """
 
+import sys
 from dataclasses import dataclass
 
 from resources.lib.aom.domain import formats
@@ -13,6 +23,14 @@ from resources.lib.aom.domain import formats
 class StreamProfile:
     """Immutable stream characteristics used for settings lookups and display."""
 
+    # Declared by hand (dataclass(slots=True) is 3.10+): the six fields, then
+    # the derived caches filled once in __post_init__. The caches are not
+    # dataclass fields, so equality, hashing and repr are unchanged.
+    __slots__ = ('hdr_type', 'fps_type', 'audio_format', 'video_fps',
+                 'player_id', 'audio_channels',
+                 '_setting_id', 'hdr_ordinal', 'fps_ordinal', 'audio_ordinal',
+                 'cell')
+
     hdr_type: str
     fps_type: object  # int (specific bucket), 'all', or 'unknown'
     audio_format: str
@@ -20,10 +38,66 @@ class StreamProfile:
     player_id: int
     audio_channels: object
 
+    # Intern table for interned(). Bounded: the incidental fields (player id,
+    # channel count, raw fps) keep the live population small, but a long
+    # service lifetime must not grow it without limit.
+    _INTERNED = {}
+    _INTERN_LIMIT = 256
+
+    def __post_init__(self):
+        fps_key = str(self.fps_type)
+        hdr_ordinal = formats.HDR_ORDINALS.get(self.hdr_type,
+                                               formats.NO_ORDINAL)
+        fps_ordinal = formats.FPS_ORDINALS.get(fps_key, formats.NO_ORDINAL)
+        audio_ordinal = formats.AUDIO_ORDINALS.get(self.audio_format,
+                                                   formats.NO_ORDINAL)
+        # Frozen: the caches are written once, here, past the frozen guard.
+        init = object.__setattr__
+        init(self, '_setting_id', sys.intern(
+            formats.setting_key(self.hdr_type, fps_key, self.audio_format)))
+        init(self, 'hdr_ordinal', hdr_ordinal)
+        init(self, 'fps_ordinal', fps_ordinal)
+        init(self, 'audio_ordinal', audio_ordinal)
+        init(self, 'cell', formats.cell_index(hdr_ordinal, fps_ordinal,
+                                              audio_ordinal))
+
+    @classmethod
+    def interned(cls, hdr_type, fps_type, audio_format, video_fps, player_id,
+                 audio_channels):
+        """The shared instance for these readings, built on first sight.
+
+        Equal readings return the identical object, so ``a is b`` answers
+        "same gather result" without comparing fields.
+        """
+        key = (hdr_type, fps_type, audio_format, video_fps, player_id,
+               audio_channels)
+        profile = cls._INTERNED.get(key)
+        if profile is None:
+            if len(cls._INTERNED) >= cls._INTERN_LIMIT:
+                cls._INTERNED.clear()
+            profile = cls(hdr_type=hdr_type, fps_type=fps_type,
+                          audio_format=audio_format, video_fps=video_fps,
+                          player_id=player_id, audio_channels=audio_channels)
+            cls._INTERNED[key] = profile
+        return profile
+
     def setting_id(self):
         """Settings id for this profile: `<hdr>_<fps>_<audio>`. FROZEN format."""
-        return formats.setting_key(self.hdr_type, self._fps_key(),
-                                   self.audio_format)
+        return self._setting_id
+
+    def same_key(self, other):
+        """True when ``other`` maps to the same setting id as this profile.
+
+        Identity, then the integer cell; the interned setting id only
+        decides for profiles with an axis outside the vocabulary.
+        """
+        if other is self:
+            return True
+        if other is None:
+            return False
+        if self.cell != formats.NO_ORDINAL:
+            return self.cell == other.cell
+        return self._setting_id is other._setting_id
 
     def display_hdr(self):
         return formats.HDR_DISPLAY_NAMES.get(self.hdr_type, self.hdr_type)
@@ -0,0 +1,93 @@
+"""Offset resolution — the effective offset of every cube cell.
+
+An offset lookup walks a fixed precedence, most specific first:
+
+1. ``exact`` — the cell's own ``<hdr>_<fps>_<audio>`` calibration;
+2. ``all_fps`` — for a specific FPS bucket, the ``<hdr>_all_<audio>``
+   calibration (a bucket the user never calibrated inherits the all-FPS
+   value rather than answering 0);
+3. ``hdr_default`` — the HDR type's ``<hdr>_default`` offset;
+4. ``unset`` — nothing calibrated anywhere on the chain: 0.
+
+A level answers when its stored value is non-zero. Zero is what an
+untouched slider holds, so the settings cannot tell "calibrated to 0" from
+"never calibrated"; 0 reads as the latter and falls through. A cell whose
+chain answers non-zero therefore cannot be calibrated to 0: ``inherited``
+says what storing 0 for it would leave in force, so a caller can refuse.
+
+``build_index`` resolves the whole cube in one pass — the OffsetTable runs
+it once per change of the stored offsets, so a lookup stays an index.
+
+Pure Python: no Kodi imports.
+"""
+
+from array import array
+
+from resources.lib.aom.domain import formats
+
+LEVEL_EXACT = 'exact'
+LEVEL_ALL_FPS = 'all_fps'
+LEVEL_HDR_DEFAULT = 'hdr_default'
+LEVEL_UNSET = 'unset'
+
+# Precedence order; build_index() encodes a cell's level as its index here.
+LEVELS = (LEVEL_EXACT, LEVEL_ALL_FPS, LEVEL_HDR_DEFAULT, LEVEL_UNSET)
+
+_EXACT, _ALL_FPS, _HDR_DEFAULT, _UNSET = range(len(LEVELS))
+
+
+def build_index(cube, defaults):
+    """Resolve every cell; return ``(values, levels)``.
+
+    ``cube`` holds the stored offsets in cell order (``formats.cell_index``),
+    ``defaults`` the ``<hdr>_default`` offsets in ``formats.HDR_TYPES``
+    order. ``values`` is an ``array('h')`` of effective offsets and
+    ``levels`` a ``bytes`` of ``LEVELS`` indices, both indexed by cell.
+    """
+    audio_count = len(formats.AUDIO_FORMATS)
+    span = len(formats.FPS_KEYS) * audio_count
+    values = array('h', cube)
+    levels = bytearray(len(values))
+    for hdr_ordinal, default in enumerate(defaults):
+        base = hdr_ordinal * span
+        for cell in range(base, base + span):
+            if cube[cell]:
+                continue                       # exact: already in place
+            inherited = cube[base + (cell - base) % audio_count]
+            if inherited:                      # the all-FPS row (0 if we are it)
+                values[cell] = inherited
+                levels[cell] = _ALL_FPS
+            elif default:
+                values[cell] = default
+                levels[cell] = _HDR_DEFAULT
+            else:
+                levels[cell] = _UNSET
+    return values, bytes(levels)
+
+
+def inherited(cube, defaults, cell):
+    """``(ms, level)`` ``cell`` resolves to without a calibration of its own.
+
+    Same inputs as ``build_index``. The answer is the all-FPS row (unless
+    ``cell`` is in it), else the HDR default, else ``(0, unset)``.
+    """
+    audio_count = len(formats.AUDIO_FORMATS)
+    hdr_ordinal, offset = divmod(cell, len(formats.FPS_KEYS) * audio_count)
+    row = cell - offset + offset % audio_count
+    if row != cell and cube[row]:
+        return cube[row], LEVEL_ALL_FPS
+    if defaults[hdr_ordinal]:
+        return defaults[hdr_ordinal], LEVEL_HDR_DEFAULT
+    return 0, LEVEL_UNSET
+
+
+def source_keys(profile):
+    """The setting ids ``profile``'s offset resolves through, in precedence
+    order (a save touching none of them cannot change its offset)."""
+    own = profile.setting_id()
+    all_fps = formats.setting_key(profile.hdr_type, formats.FPS_ALL,
+                                  profile.audio_format)
+    default = formats.hdr_default_key(profile.hdr_type)
+    if own == all_fps:
+        return (own, default)
+    return (own, all_fps, default)
@@ -14,6 +14,8 @@ import json
 import xbmc
 import xbmcgui
 
+from resources.lib.aom.kodi.settings import ADDON_ID
+
 # Kodi's home window. Its window properties are the inter-addon signaling
 # channel (e.g. PM4K/Plexmod seek coordination).
 _HOME_WINDOW_ID = 10000
@@ -94,6 +96,73 @@ class KodiGateway:
             self._log(f"AOM_Gateway: Error getting audio info: {str(e)}", xbmc.LOGERROR)
             return "unknown", "unknown"
 
+    def playlist_position(self, player_id):
+        """Return ``(playlist_id, position)`` of the playing item, or None.
+
+        Single ``Player.GetProperties`` call. None when the player reports
+        no playlist (id -1) or no position, or on any error (LOGERROR).
+        """
+        try:
+            response = self._execute_rpc({
+                "jsonrpc": "2.0",
+                "method": "Player.GetProperties",
+                "params": {
+                    "playerid": player_id,
+                    "properties": ["playlistid", "position"]
+                },
+                "id": 1
+            })
+
+            result = response.get("result") or {}
+            playlist_id = result.get("playlistid", -1)
+            position = result.get("position", -1)
+            if playlist_id == -1 or position == -1:
+                return None
+            return playlist_id, position
+        except Exception as e:
+            self._log(f"AOM_Gateway: Error getting playlist position: {str(e)}",
+                      xbmc.LOGERROR)
+            return None
+
+    def playlist_item_streams(self, playlist_id, index):
+        """Return ``(audio_codec, audio_channels, hdr_type)`` from the stream
+        details of playlist item ``index``, or None.
+
+        Single ``Playlist.GetItems`` call limited to that one item. Library
+        stream details are scanned metadata, not live player state: the
+        first audio and video streams are reported, ``hdr_type`` is Kodi's
+        ``hdrtype`` ('' for SDR), and the codec's 'pt-' prefix is stripped
+        like :meth:`audio_info`. None when the item does not exist, has no
+        stream details, or on any error (LOGERROR).
+        """
+        try:
+            response = self._execute_rpc({
+                "jsonrpc": "2.0",
+                "method": "Playlist.GetItems",
+                "params": {
+                    "playlistid": playlist_id,
+                    "properties": ["streamdetails"],
+                    "limits": {"start": index, "end": index + 1}
+                },
+                "id": 1
+            })
+
+            items = (response.get("result") or {}).get("items") or []
+            if not items:
+                return None
+            details = items[0].get("streamdetails") or {}
+            audio = details.get("audio") or []
+            video = details.get("video") or []
+            if not audio or not video:
+                return None
+            return (audio[0].get("codec", "unknown").replace('pt-', ''),
+                    audio[0].get("channels", "unknown"),
+                    video[0].get("hdrtype", ""))
+        except Exception as e:
+            self._log(f"AOM_Gateway: Error getting playlist item details: "
+                      f"{str(e)}", xbmc.LOGERROR)
+            return None
+
     def infolabel(self, label):
         """Return ``xbmc.getInfoLabel(label)``, or '' if the read raises.
 
@@ -176,6 +245,15 @@ class KodiGateway:
             self._log(f"AOM_Gateway: Error executing seek command: {str(e)}", xbmc.LOGERROR)
             return False
 
+    def notify_all(self, message):
+        """Broadcast ``message`` from this addon (``NotifyAll``); monitors
+        receive it as ``onNotification(ADDON_ID, 'Other.<message>', ...)``."""
+        try:
+            xbmc.executebuiltin(f"NotifyAll({ADDON_ID},{message})")
+        except Exception as e:
+            self._log(f"AOM_Gateway: Error sending notification {message}: "
+                      f"{str(e)}", xbmc.LOGERROR)
+
     # Kodi's WINDOW_DIALOG_ADDON_SETTINGS. While it is open, its working copy
     # of our settings is saved back on close, clobbering programmatic writes
     # made underneath it (settings-state doctrine) — writers defer past it.
@@ -185,8 +263,8 @@ class KodiGateway:
         """True while an addon-settings dialog is the active dialog.
 
         The window-id knowledge lives HERE (the Kodi layer): the app-layer
-        writers (adjustment watcher, platform recorder) only ask the
-        doctrine-level question. ``getCurrentWindowDialogId()`` reports 9999
+        settings writer only asks the doctrine-level question, once per
+        flush. ``getCurrentWindowDialogId()`` reports 9999
         when no dialog is open; the error fallback answers False — a
         transient read failure must not wedge a store forever.
         """
@@ -197,6 +275,33 @@ class KodiGateway:
                       xbmc.LOGERROR)
             return False
 
+    # Kodi's WINDOW_DIALOG_AUDIO_OSD_SETTINGS, the in-playback audio settings
+    # (where the audio delay slider lives).
+    _AUDIO_OSD_DIALOG_ID = 10124
+
+    def audio_settings_dialog_open(self):
+        """True while the playback audio settings dialog is the active dialog
+        (the adjustment watcher's hint that the user may be adjusting).
+        The error fallback answers False, like ``settings_dialog_open``."""
+        try:
+            return (xbmcgui.getCurrentWindowDialogId()
+                    == self._AUDIO_OSD_DIALOG_ID)
+        except Exception as e:
+            self._log(f"AOM_Gateway: Error reading current dialog id: {str(e)}",
+                      xbmc.LOGERROR)
+            return False
+
+    def addon_installed(self, addon_id):
+        """True if ``addon_id`` is installed (``System.HasAddon``). The error
+        fallback answers True: a caller asking "might it be there?" must
+        not stop looking over a transient read failure."""
+        try:
+            return bool(xbmc.getCondVisibility(f"System.HasAddon({addon_id})"))
+        except Exception as e:
+            self._log(f"AOM_Gateway: Error checking for addon {addon_id}: "
+                      f"{str(e)}", xbmc.LOGERROR)
+            return True
+
     def _window(self):
         """The cached home-window handle, created on first use."""
         if self._home_window is None:
@@ -1,12 +1,68 @@
-"""Kodi monitor bridge: settings-change callback posts to the dispatcher.
+"""Kodi monitor bridge: settings saves and player notifications post to the
+dispatcher.
 
 Also serves as the service's abort monitor (the runtime blocks on
-``waitForAbort()`` of this instance). Zero logic, like the player bridge.
+``waitForAbort()`` of this instance). Zero logic, like the player bridge —
+with one exception: Kodi's ``Player.*`` JSON-RPC notifications are decoded
+here (a small JSON payload, a few microseconds) so the app receives a typed
+``PlayerNotified`` instead of a raw string. script.py's bulk-edit
+notification posts a ``SettingsSaved``. Both are taken only from their
+real sender (``xbmc`` and this addon): NotifyAll lets any addon broadcast
+any method name, and a spoofed ``Player.OnAVChange`` would drive stream
+discovery. Every other notification is dropped without parsing.
 """
 
+import json
+
 import xbmc
 
-from resources.lib.aom.app import events
+from resources.lib.aom.app import bulk_edit, events
+from resources.lib.aom.kodi.settings import ADDON_ID
+
+
+# Kodi's own sender id for its JSON-RPC announcements.
+PLAYER_SENDER = 'xbmc'
+
+# The notifications that carry the player id for the stream being set up;
+# OnPropertyChanged is also the adjustment watcher's read-now hint.
+PLAYER_NOTIFICATIONS = frozenset((
+    'Player.OnAVStart',
+    'Player.OnAVChange',
+    'Player.OnPropertyChanged',
+))
+
+
+# script.py's NotifyAll after a bulk offset edit (aom.app.bulk_edit).
+BULK_EDIT_NOTIFICATION = f"Other.{bulk_edit.NOTIFICATION}"
+
+
+def parse_player_notification(method, data):
+    """Decode a ``Player.*`` notification payload into a PlayerNotified.
+
+    Payloads look like ``{"item": {"type": "movie", ...},
+    "player": {"playerid": 1, ...}}`` (``Player.OnPropertyChanged`` adds
+    ``"property": {"currentaudiostream": {...}}``); anything missing or
+    malformed decodes to the "unknown" values (player id -1, item type '',
+    no properties) rather than raising.
+    """
+    try:
+        payload = json.loads(data) if data else {}
+    except ValueError:
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+    player = payload.get('player')
+    item = payload.get('item')
+    changed = payload.get('property')
+    player_id = player.get('playerid') if isinstance(player, dict) else None
+    item_type = item.get('type') if isinstance(item, dict) else None
+    if not isinstance(player_id, int) or isinstance(player_id, bool):
+        player_id = -1
+    if not isinstance(item_type, str):
+        item_type = ''
+    properties = tuple(sorted(changed)) if isinstance(changed, dict) else ()
+    return events.PlayerNotified(method=method, player_id=player_id,
+                                 item_type=item_type, properties=properties)
 
 
 class MonitorBridge(xbmc.Monitor):
@@ -15,4 +71,11 @@ class MonitorBridge(xbmc.Monitor):
         self._dispatcher = dispatcher
 
     def onSettingsChanged(self):
-        self._dispatcher.post(events.SettingsChanged())
+        self._dispatcher.post(events.SettingsSaved())
+
+    def onNotification(self, sender, method, data):
+        if method in PLAYER_NOTIFICATIONS and sender == PLAYER_SENDER:
+            self._dispatcher.post(parse_player_notification(method, data))
+        elif method == BULK_EDIT_NOTIFICATION and sender == ADDON_ID:
+            # script.py finished a bulk offset edit: one save for the batch.
+            self._dispatcher.post(events.SettingsSaved(bulk=True))
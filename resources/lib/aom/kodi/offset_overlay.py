@@ -0,0 +1,76 @@
+"""Fleet offset overlay: a read-only offset file layered over the offsets.
+
+Identical boxes wired to identical AV receivers share one calibration. The
+overlay is an offset file (``aom.domain.offset_file``, keyed by
+``formats.setting_key`` ids — ``<hdr>_default`` included) at the path in
+``fleet_overlay_path``, local or on a mounted share (``special://`` paths
+are translated; other VFS URLs are not supported). Rolling a calibration
+out is copying one file: ``OffsetTable.set_overlay`` puts its offsets above
+the stored ones, and nothing is ever written back to it. Explicit zeros are
+kept (``parse_offsets(keep_zeros=True)``): a 0 in the file replaces a
+box's own calibration of that id, where leaving the id out keeps it.
+
+``check(path)`` is the runtime's per-save (and service start) poll. It is
+one ``os.stat``: the file is re-read only when the path, its mtime or its
+size changed, and only then does the table's overlay change — which
+reports just the ids whose overlay value changed, so a re-copied identical
+file announces nothing. An empty path or a missing file is an empty
+overlay (removing the file rolls the fleet calibration back); an
+unreadable or malformed file keeps the overlay held before it, and is not
+re-parsed until it changes again.
+
+This is an ``aom.kodi`` adapter: the path translation comes from ``xbmcvfs``.
+"""
+
+import os
+
+import xbmc
+import xbmcvfs
+
+from resources.lib.aom.domain.offset_file import parse_offsets
+
+
+class OffsetOverlay:
+    """The overlay file's offsets, re-read only when the file changed."""
+
+    def __init__(self, *, log):
+        """``log`` is a REQUIRED ``(message, level)`` sink (same convention as
+        ``Settings``)."""
+        self._log = log
+        self._path = ''              # the translated path last checked
+        self._stat = None            # (mtime_ns, size) at the last check
+        self.file_loads = 0
+
+    def check(self, path):
+        """The overlay's offsets if ``path`` or its file changed since the
+        last check, else None (keep the overlay you have)."""
+        if path:
+            path = xbmcvfs.translatePath(path)
+        stat = _stat(path) if path else None
+        if path == self._path and stat == self._stat:
+            return None
+        self._path, self._stat = path, stat
+        if stat is None:
+            if path:
+                self._log(f"AOM_OffsetOverlay: {path} not found; "
+                          f"no overlay", xbmc.LOGINFO)
+            return {}
+        try:
+            with open(path, encoding='utf-8') as handle:
+                offsets = parse_offsets(handle.read(), keep_zeros=True)
+        except (OSError, ValueError) as e:
+            self._log(f"AOM_OffsetOverlay: Error reading {path}: {str(e)}",
+                      xbmc.LOGWARNING)
+            return None
+        self.file_loads += 1
+        self._log(f"AOM_OffsetOverlay: {len(offsets)} offset(s) from {path}",
+                  xbmc.LOGINFO)
+        return offsets
+
+
+def _stat(path):
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+    return (status.st_mtime_ns, status.st_size)
@@ -0,0 +1,195 @@
+"""Sparse offset store: calibrated offsets in one small JSON file.
+
+The settings-backed offset matrix is a dense Cartesian product — every
+``<hdr>_<fps>_<audio>`` id is a slider in ``settings.xml`` whether it was
+ever calibrated or not, and every new axis multiplies it. This store holds
+only the calibrated (non-zero) entries, in the addon's profile directory,
+in the offset file format (``aom.domain.offset_file``).
+
+It is the optional backend of ``OffsetTable`` (``enable_sparse_offsets``,
+read once at service start): it answers the same three calls the table
+makes of ``Settings`` — ``get_int``, ``read_ints``, ``store_integer_if_changed``
+— so the table, its cube and everything above it are unchanged. Bulk
+edits (``aom.app.bulk_edit``) also use ``write_ints``, a whole batch in
+one file write.
+
+Resolution: an id with an entry answers it; an id without one answers 0,
+the same value an untouched slider holds. Zero is never stored (storing 0
+removes the entry), so the file stays exactly the calibrated set and the
+settings-backed and sparse answers agree id for id.
+
+The file is re-read when its mtime or size changes, checked on every bulk
+read (``OffsetTable.reload()`` runs one per settings save), so an external
+edit — a bulk tool, a copied-in file — is picked up at the next save. Our
+own writes replace the file atomically (temp file + ``os.replace``) and
+record its new stat, so they are not re-read as external edits.
+
+``migrate_from(settings)`` is the one-time import: when the file does not
+exist yet, every offset id (the cells and the per-HDR defaults) is read
+from the settings store and the non-zero ones become the file. Nothing is
+lost (a zero is the default either way) and the sliders are left as they
+were. There is no reverse migration: while the store is on the sliders
+are hidden (``settings.xml`` makes them visible only with
+``enable_sparse_offsets`` off), and turning the store off again shows
+them with the values they held at migration; later calibrations stay in
+the file, and turning the store back on resumes from it.
+
+This is an ``aom.kodi`` adapter: the profile path comes from ``xbmcvfs``.
+"""
+
+import os
+
+import xbmc
+import xbmcvfs
+
+from resources.lib.aom.domain import formats
+from resources.lib.aom.domain.offset_file import format_offsets, parse_offsets
+from resources.lib.aom.kodi.settings import ADDON_ID
+
+FILE_NAME = 'offsets.json'
+
+
+def default_path():
+    """``offsets.json`` in the addon's profile (addon_data) directory."""
+    return os.path.join(
+        xbmcvfs.translatePath(f'special://profile/addon_data/{ADDON_ID}'),
+        FILE_NAME)
+
+
+def offset_backend(settings, *, log):
+    """The offset backend ``enable_sparse_offsets`` selects: ``settings``
+    itself, or the sparse store, migrated from it on first use. Both
+    processes (the service and script.py's bulk edits) choose here."""
+    if not settings.sparse_offsets_enabled():
+        return settings
+    store = SparseOffsetStore(default_path(), log=log)
+    store.migrate_from(settings)
+    log(f"AOM_OffsetStore: sparse offset store holds {len(store)} "
+        f"calibrated offset(s)", xbmc.LOGDEBUG)
+    return store
+
+
+class SparseOffsetStore:
+    """Calibrated offsets only, backed by one JSON file (see module doc)."""
+
+    def __init__(self, path, *, log):
+        """``log`` is a REQUIRED ``(message, level)`` sink (same convention as
+        ``Settings``)."""
+        self._path = path
+        self._log = log
+        self._offsets = {}           # setting_id -> ms, non-zero only
+        self._stat = None            # (mtime_ns, size) of the file we hold
+        self.file_loads = 0
+
+    def __len__(self):
+        self._refresh()
+        return len(self._offsets)
+
+    def exists(self):
+        return os.path.exists(self._path)
+
+    # --- the Settings surface OffsetTable uses ---------------------------------
+
+    def get_int(self, setting_id, default=0):
+        self._refresh()
+        return self._offsets.get(setting_id, default)
+
+    def read_ints(self, setting_ids, default=0):
+        self._refresh()
+        offsets = self._offsets
+        return [offsets.get(setting_id, default) for setting_id in setting_ids]
+
+    def store_integer_if_changed(self, setting_id, value):
+        """Write one offset (0 removes the entry); return success."""
+        self._refresh()
+        if self._offsets.get(setting_id, 0) == value:
+            return True
+        updated = dict(self._offsets)
+        if value:
+            updated[setting_id] = value
+        else:
+            updated.pop(setting_id, None)
+        if not self._write(updated):
+            return False
+        self._log(f"AOM_OffsetStore: Storing {setting_id}: {value}",
+                  xbmc.LOGDEBUG)
+        return True
+
+    def write_ints(self, values):
+        """Write many offsets in one file write (bulk edits); return success."""
+        self._refresh()
+        updated = dict(self._offsets)
+        for setting_id, value in values.items():
+            if value:
+                updated[setting_id] = value
+            else:
+                updated.pop(setting_id, None)
+        if updated == self._offsets:
+            return True
+        if not self._write(updated):
+            return False
+        self._log(f"AOM_OffsetStore: Storing {len(values)} offset(s)",
+                  xbmc.LOGDEBUG)
+        return True
+
+    # --- migration ---------------------------------------------------------------
+
+    def migrate_from(self, settings):
+        """Create the file from the settings-backed offsets, once.
+
+        Returns the number of entries migrated, or None when the file
+        already exists (nothing is read or written then).
+        """
+        if self.exists():
+            return None
+        setting_ids = formats.all_offset_keys()
+        values = settings.read_ints(setting_ids)
+        offsets = {setting_id: ms for setting_id, ms
+                   in zip(setting_ids, values) if ms}
+        if not self._write(offsets):
+            return None
+        self._log(f"AOM_OffsetStore: migrated {len(offsets)} calibrated "
+                  f"offset(s) from the settings store", xbmc.LOGINFO)
+        return len(offsets)
+
+    # --- file I/O ----------------------------------------------------------------
+
+    def _refresh(self):
+        """Re-read the file if it changed on disk since we last held it."""
+        try:
+            status = os.stat(self._path)
+        except OSError:
+            stat = None
+        else:
+            stat = (status.st_mtime_ns, status.st_size)
+        if stat == self._stat:
+            return
+        self._stat = stat
+        if stat is None:
+            self._offsets = {}
+            return
+        try:
+            with open(self._path, encoding='utf-8') as handle:
+                self._offsets = parse_offsets(handle.read())
+        except (OSError, ValueError) as e:
+            # Keep what we held: a half-copied file must not zero every offset.
+            self._log(f"AOM_OffsetStore: Error reading {self._path}: "
+                      f"{str(e)}", xbmc.LOGWARNING)
+            return
+        self.file_loads += 1
+
+    def _write(self, offsets):
+        temp_path = self._path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as handle:
+                handle.write(format_offsets(offsets))
+            os.replace(temp_path, self._path)
+            status = os.stat(self._path)
+        except OSError as e:
+            self._log(f"AOM_OffsetStore: Error writing {self._path}: "
+                      f"{str(e)}", xbmc.LOGWARNING)
+            return False
+        self._offsets = offsets
+        self._stat = (status.st_mtime_ns, status.st_size)
+        return True
@@ -11,6 +11,32 @@ values and every write is visible everywhere at once, so the store cannot
 drift out of sync with itself. Holding one proxy per process is a tidiness
 convenience, not the thing that makes reads/writes consistent.
 
+SNAPSHOT: reads are served from an in-memory snapshot, filled on first read
+of each id and refreshed by our own writes, so the hot-path reads (watcher
+eligibility on every tick, the FPS override inside every gather, seek
+configs) are dict lookups instead of Kodi calls. On every Kodi save the
+runtime calls ``refresh()``, which re-reads the cached ids and returns the
+ones whose value changed — the diff ``SettingsChanged`` carries, so
+handlers see the saved values and can ignore saves that touch nothing they
+read. That makes the single instance load-bearing for the snapshot (a
+second ``Settings`` would not see the first one's writes until the next
+save). Reads and refreshes both run on the dispatcher thread
+(construction-time reads aside, which precede it). ``kodi_reads`` counts
+the reads that reached Kodi.
+
+ECHOES: each of our own writes makes Kodi fire ``onSettingsChanged`` back
+at us. A successful write leaves an echo token naming the id it wrote
+(expiring after ``ECHO_WINDOW_SECONDS``) and remembers the id's value
+before it; ``refresh()`` keeps our writes out of its diff but notes which
+written ids the save carried (value moved off the pre-write one). A save
+is our echo when it carried a written id with a live token and changed
+nothing else — ``is_own_echo`` says so, consumes the tokens of every
+written id it carried (one save for several coalesced writes spends them
+all) and the runtime drops it before any handler runs. A save that
+carried none of our writes (a user save touching only ids we never read,
+say) is not an echo and leaves the tokens alone; a user save landing with
+ours goes through. ``suppressed_echoes`` counts the dropped saves.
+
 LIFETIME RULE (field-verified on Kodi 21.2/Windows): the proxy is
 live ONLY while the ``xbmcaddon.Addon`` it came from stays alive. A
 ``Settings`` object whose parent ``Addon`` was a garbage-collected temporary
@@ -22,61 +48,198 @@ never rewrite it as ``xbmcaddon.Addon(...).getSettings()``.
 The read-before-write skip in the ``store_*_if_changed`` helpers is
 load-bearing: it keeps the settings-dialog clobber surface minimal (no write
 means nothing for a dialog save-on-close to fight over) per the doctrine.
+Its pre-read therefore always goes to Kodi, never to the snapshot: a user
+save still queued behind the write must not make it skip.
 
 This layer may import ``xbmc*``/``xbmcaddon`` and ``resources.lib.aom.*``
 only (``tests/contract/test_architecture.py`` enforces the layering).
 """
 
+import collections
+import time
+from array import array
+
 import xbmc
 import xbmcaddon
 
+from resources.lib.aom.domain import formats, resolution
+
 ADDON_ID = 'script.audiooffsetmanager'
 
+# Every offset setting id, in cube-cell order (formats.cell_index).
+_CELL_KEYS = tuple(formats.all_setting_keys())
+# What OffsetTable loads: the cells, then the per-HDR defaults.
+_OFFSET_KEYS = tuple(formats.all_offset_keys())
+_OFFSET_POSITIONS = {key: position for position, key in enumerate(_OFFSET_KEYS)}
+
 
 class Settings:
     """Typed access to the addon settings store over Kodi's live proxy."""
 
-    def __init__(self, *, log):
+    # How long a write's echo token waits for Kodi's onSettingsChanged.
+    ECHO_WINDOW_SECONDS = 5.0
+
+    def __init__(self, *, log, clock=time.monotonic):
         """``log`` is a REQUIRED ``(message, level)`` sink (same convention as
         ``KodiGateway``)."""
         self._log = log
+        self._clock = clock
         # The Addon must outlive the Settings proxy (see LIFETIME RULE above).
         self._addon = xbmcaddon.Addon(ADDON_ID)
         self._settings = self._addon.getSettings()
+        self._snapshot = {}          # setting_id -> last value read/written
+        # (write time, setting_id), oldest first.
+        self._echo_tokens = collections.deque()
+        self._unsaved = {}           # written id -> its value before the write
+        self._saved_writes = frozenset()   # written ids the last save carried
+        self.kodi_reads = 0
+        self.suppressed_echoes = 0
+
+    def refresh(self):
+        """Re-read every cached id from Kodi; return the ids that changed.
+
+        A frozenset. An id whose re-read fails is dropped from the snapshot
+        and reported changed (its value is unknown, the safe side). Our own
+        writes are not reported; the ones this save carried are noted for
+        ``is_own_echo``.
+        """
+        previous, self._snapshot = self._snapshot, {}
+        unsaved, self._unsaved = self._unsaved, {}
+        changed = []
+        for setting_id, value in previous.items():
+            if isinstance(value, bool):
+                fresh = self._read(self._settings.getBool, setting_id, None,
+                                   "boolean")
+            elif isinstance(value, str):
+                fresh = self._read(self._settings.getString, setting_id, None,
+                                   "string")
+            else:
+                fresh = self._read(self._settings.getInt, setting_id, None,
+                                   "integer")
+            if fresh is None or fresh != value:
+                changed.append(setting_id)
+        self._saved_writes = frozenset(
+            setting_id for setting_id, before in unsaved.items()
+            if self._snapshot.get(setting_id) != before)
+        return frozenset(changed)
+
+    def is_own_echo(self, changed):
+        """True when a save with diff ``changed`` is the echo of our write.
+
+        Consumes the tokens of the written ids the save carried, echo or
+        not (see ECHOES in the module docstring).
+        """
+        tokens = self._echo_tokens
+        expired = self._clock() - self.ECHO_WINDOW_SECONDS
+        while tokens and tokens[0][0] < expired:
+            tokens.popleft()
+        carried = self._saved_writes.intersection(
+            setting_id for _, setting_id in tokens)
+        self._saved_writes = frozenset()
+        if not carried:
+            return False
+        self._echo_tokens = collections.deque(
+            token for token in tokens if token[1] not in carried)
+        if changed:
+            return False
+        self.suppressed_echoes += 1
+        self._log(f"AOM_Settings: suppressed the echo of our own write "
+                  f"({self.suppressed_echoes} so far)", xbmc.LOGDEBUG)
+        return True
 
     # --- typed primitives ---------------------------------------------------
 
     def get_bool(self, setting_id, default=False):
         """Read a boolean setting; on ANY error, log and return ``default``."""
         try:
-            return self._settings.getBool(setting_id)
-        except Exception:
-            self._log(
-                f"AOM_Settings: Error getting boolean setting '{setting_id}'. "
-                f"Using default: {default}", xbmc.LOGWARNING)
-            return default
+            return self._snapshot[setting_id]
+        except KeyError:
+            return self._read(self._settings.getBool, setting_id, default,
+                              "boolean")
 
     def get_int(self, setting_id, default=0):
         """Read an integer setting; on ANY error, log and return ``default``."""
         try:
-            return self._settings.getInt(setting_id)
+            return self._snapshot[setting_id]
+        except KeyError:
+            return self._read(self._settings.getInt, setting_id, default,
+                              "integer")
+
+    def get_string(self, setting_id, default=''):
+        """Read a string setting; on ANY error, log and return ``default``."""
+        try:
+            return self._snapshot[setting_id]
+        except KeyError:
+            return self._read(self._settings.getString, setting_id, default,
+                              "string")
+
+    def read_ints(self, setting_ids, default=0):
+        """Read integer settings live, bypassing the snapshot (bulk loads).
+
+        Returns a list in ``setting_ids`` order; an id whose read fails is
+        logged and answers ``default``.
+        """
+        get_int = self._settings.getInt
+        values = []
+        for setting_id in setting_ids:
+            try:
+                values.append(get_int(setting_id))
+            except Exception:
+                self._log(
+                    f"AOM_Settings: Error getting integer setting "
+                    f"'{setting_id}'. Using default: {default}",
+                    xbmc.LOGWARNING)
+                values.append(default)
+        self.kodi_reads += len(values)
+        return values
+
+    def write_ints(self, values):
+        """Write integer settings in one pass (bulk edits); return success.
+
+        ``values`` maps setting id -> int. No pre-read and no per-id log
+        line: the caller writes a diff. A failed write is logged and the
+        rest are still written.
+        """
+        set_int = self._settings.setInt
+        written = True
+        for setting_id, value in values.items():
+            try:
+                set_int(setting_id, value)
+            except Exception:
+                written = False
+                self._snapshot.pop(setting_id, None)
+                self._log(
+                    f"AOM_Settings: Error storing integer setting "
+                    f"'{setting_id}'.", xbmc.LOGWARNING)
+            else:
+                self._snapshot[setting_id] = value
+        return written
+
+    def _read(self, operation, setting_id, default, value_type):
+        """Read from Kodi into the snapshot; a failed read is not cached."""
+        self.kodi_reads += 1
+        try:
+            value = operation(setting_id)
         except Exception:
             self._log(
-                f"AOM_Settings: Error getting integer setting '{setting_id}'. "
-                f"Using default: {default}", xbmc.LOGWARNING)
+                f"AOM_Settings: Error getting {value_type} setting "
+                f"'{setting_id}'. Using default: {default}", xbmc.LOGWARNING)
             return default
+        self._snapshot[setting_id] = value
+        return value
 
     def store_boolean_if_changed(self, setting_id, value):
         """Write a boolean only if it differs from the stored value.
 
         Returns True when the store succeeds or is skipped (already equal);
-        False when the underlying write raises. NOTE the pre-read runs
-        through get_bool, which swallows read errors into the default — so a
+        False when the underlying write raises. NOTE the (live) pre-read
+        swallows read errors into the default like get_bool — so a
         failed read of a setting whose target value equals that default
         skips the write and reports success (accepted: reads of valid ids
         do not fail in practice).
         """
-        if self.get_bool(setting_id) == value:
+        if self._read(self._settings.getBool, setting_id, False,
+                      "boolean") == value:
             return True
         return self._store(self._settings.setBool, setting_id, value, "boolean")
 
@@ -87,7 +250,8 @@ class Settings:
         False when the underlying write raises. See store_boolean_if_changed
         for the pre-read-vs-default caveat.
         """
-        if self.get_int(setting_id) == value:
+        if self._read(self._settings.getInt, setting_id, 0,
+                      "integer") == value:
             return True
         return self._store(self._settings.setInt, setting_id, value, "integer")
 
@@ -98,8 +262,13 @@ class Settings:
                 f"AOM_Settings: Storing {value_type} setting {setting_id}: "
                 f"{value}", xbmc.LOGDEBUG)
             operation(setting_id, value)
+            self._unsaved.setdefault(setting_id,
+                                     self._snapshot.get(setting_id))
+            self._snapshot[setting_id] = value
+            self._echo_tokens.append((self._clock(), setting_id))
             return True
         except Exception:
+            self._snapshot.pop(setting_id, None)
             self._log(
                 f"AOM_Settings: Error storing {value_type} setting "
                 f"'{setting_id}'.", xbmc.LOGWARNING)
@@ -130,18 +299,210 @@ class Settings:
     def debug_logging_enabled(self):
         return self.get_bool('enable_debug_logging')
 
+    def shadow_detection_enabled(self):
+        return self.get_bool('enable_shadow_detection')
+
+    def sparse_offsets_enabled(self):
+        return self.get_bool('enable_sparse_offsets')
+
+    def apply_verification_enabled(self):
+        return self.get_bool('enable_apply_verification')
+
+    def phantom_window_ms(self):
+        """The learned teardown-phantom window; 0 until one is learned."""
+        return max(self.get_int('platform_phantom_ms'), 0)
+
+    def fleet_overlay_path(self):
+        """The fleet offset overlay file; '' when none is configured."""
+        return self.get_string('fleet_overlay_path').strip()
+
 
 class OffsetTable:
-    """Per-profile offset storage. tools/generate_settings.py guarantees every
-    <hdr>_<fps>_<audio> setting id exists, so get() always answers an int
-    ('no stored value' is not a state). The setting key is derived from the
-    profile AT CALL TIME (settings doctrine: never a captured key)."""
+    """Per-profile offset storage. Every <hdr>_<fps>_<audio> id answers an
+    int ('no stored value' is not a state): tools/generate_settings.py
+    guarantees each id exists as a setting, and the optional sparse store
+    (``aom.kodi.offset_store``, the other backend this table takes in place
+    of ``Settings``) answers 0 for an id it holds no entry for. The setting
+    key — here, its cube cell — is derived from the profile AT CALL TIME
+    (settings doctrine: never a captured key).
+
+    The offsets form a dense HDR x FPS x audio cube (``formats.CELL_COUNT``
+    cells). It is read in one pass on first use into an ``array('h')``
+    indexed by ``profile.cell``, so a lookup is an index, not a settings
+    read. The table clamps nothing: its values come from the sliders
+    (+/-1000 ms) or an offset file (+/-10 s, ``offset_file.MAX_OFFSET_MS``),
+    both well inside 16 bits. Our own stores write through to their cell.
+    Kodi's save notification does not say which ids a save touched, so
+    ``reload()`` re-reads the cube on every save that is not our own echo
+    (in-process reads, no RPC) and returns the offset ids that changed; the
+    runtime merges them into the ``SettingsChanged`` diff, so only a save
+    that changed an offset reaches the offset consumers.
+
+    The settings writer STAGES an offset it has not written yet
+    (``stage``): get() answers the staged value at once, and reload()
+    keeps it — and does not report it — until ``store`` lands it or
+    ``unstage`` gives it up.
+
+    get() answers the RESOLVED offset (``aom.domain.resolution``: the
+    cell's own calibration, else its all-FPS row, else the HDR default);
+    ``resolve()`` also names the level that answered. The loaded values
+    carry the five ``<hdr>_default`` ids after the cells, and the
+    resolution index over them is rebuilt on the first lookup after any
+    of them changes — once per save that touches an offset, never per
+    lookup. ``by_hdr``/``nonzero`` report the stored cells, unresolved.
+
+    The fleet overlay (``aom.kodi.offset_overlay``, ``set_overlay``) is a
+    read-only layer of offsets above the stored ones: an id it names
+    answers the overlay's value instead of the stored one, and resolution
+    runs over the result. Only a staged value, a live adjustment not
+    written yet, takes precedence over it. The stored offsets underneath
+    are neither read nor written differently.
+    """
 
     def __init__(self, settings):
-        self._settings = settings
+        self._settings = settings    # Settings, or a SparseOffsetStore
+        self._cube = None            # array('h'), loaded on first use
+        self._index = None           # (values, levels), built on first use
+        self._staged = {}            # setting_id -> (cell, ms), not yet written
+        self._overlay = {}           # setting_id -> ms, the fleet overlay
 
     def get(self, profile):
-        return self._settings.get_int(profile.setting_id())
+        cell = profile.cell
+        if cell == formats.NO_ORDINAL:
+            return self._uncelled(profile)
+        index = self._index
+        if index is None:
+            index = self._indexed()
+        return index[0][cell]
+
+    def resolve(self, profile):
+        """``(ms, level)``: the offset get() answers and the
+        ``resolution.LEVELS`` entry that answered it."""
+        cell = profile.cell
+        if cell == formats.NO_ORDINAL:
+            return self._uncelled(profile), resolution.LEVEL_EXACT
+        values, levels = self._indexed()
+        return values[cell], resolution.LEVELS[levels[cell]]
+
+    def inherited(self, profile):
+        """``(ms, level)``: what ``profile`` resolves to when its own
+        setting holds 0 — the offset a stored 0 would leave in force."""
+        cell = profile.cell
+        if cell == formats.NO_ORDINAL:
+            return 0, resolution.LEVEL_UNSET
+        cube = self._effective()
+        return resolution.inherited(cube[:formats.CELL_COUNT],
+                                    cube[formats.CELL_COUNT:], cell)
+
+    def _uncelled(self, profile):
+        # An axis outside the vocabulary: no cell, no generated setting,
+        # nothing to resolve through.
+        setting_id = profile.setting_id()
+        staged = self._staged.get(setting_id)
+        if staged is not None:
+            return staged[1]
+        overlaid = self._overlay.get(setting_id)
+        if overlaid is not None:
+            return overlaid
+        return self._settings.get_int(setting_id)
+
+    def stage(self, profile, ms):
+        """Answer ``ms`` for this profile until it is stored or unstaged."""
+        cell = profile.cell
+        self._staged[profile.setting_id()] = (cell, ms)
+        if cell != formats.NO_ORDINAL:
+            self._loaded()[cell] = ms
+            self._index = None
+
+    def unstage(self, profile):
+        """Drop a staged value; the profile reads Kodi's value again."""
+        setting_id = profile.setting_id()
+        if self._staged.pop(setting_id, None) is None:
+            return
+        if self._cube is not None and profile.cell != formats.NO_ORDINAL:
+            self._cube[profile.cell] = self._settings.read_ints(
+                (setting_id,))[0]
+            self._index = None
 
     def store(self, profile, ms):
-        return self._settings.store_integer_if_changed(profile.setting_id(), ms)
+        setting_id = profile.setting_id()
+        stored = self._settings.store_integer_if_changed(setting_id, ms)
+        if stored:
+            self._staged.pop(setting_id, None)
+            if self._cube is not None and profile.cell != formats.NO_ORDINAL:
+                self._cube[profile.cell] = ms
+                self._index = None
+        return stored
+
+    def reload(self):
+        """Re-read the offsets; return the frozenset of offset ids that changed.
+
+        Nothing is read before the first lookup: no one holds a stale value.
+        Staged cells keep their staged value and are never reported.
+        """
+        if self._cube is None:
+            return frozenset()
+        previous, self._cube = self._cube, self._load()
+        for cell, ms in self._staged.values():
+            if cell != formats.NO_ORDINAL:
+                self._cube[cell] = ms
+        changed = frozenset(_OFFSET_KEYS[position]
+                            for position, (old, new)
+                            in enumerate(zip(previous, self._cube))
+                            if old != new)
+        if changed:
+            self._index = None
+        return changed
+
+    def set_overlay(self, offsets):
+        """Replace the overlay with ``offsets`` (``{setting_id: ms}``);
+        return the frozenset of ids whose overlay value changed."""
+        previous, self._overlay = self._overlay, dict(offsets)
+        changed = frozenset(setting_id for setting_id
+                            in previous.keys() | self._overlay.keys()
+                            if previous.get(setting_id)
+                            != self._overlay.get(setting_id))
+        if changed:
+            self._index = None
+        return changed
+
+    # --- bulk queries (diagnostics, bulk tools) --------------------------------
+
+    def by_hdr(self, hdr_type):
+        """``{setting_id: ms}`` for every cell of one HDR type."""
+        span = len(formats.FPS_KEYS) * len(formats.AUDIO_FORMATS)
+        start = formats.HDR_ORDINALS[hdr_type] * span
+        return dict(zip(_CELL_KEYS[start:start + span],
+                        self._loaded()[start:start + span]))
+
+    def nonzero(self):
+        """``{setting_id: ms}`` for every calibrated (non-zero) cell."""
+        cube = self._loaded()
+        return {_CELL_KEYS[cell]: ms
+                for cell, ms in enumerate(cube[:formats.CELL_COUNT]) if ms}
+
+    def _loaded(self):
+        if self._cube is None:
+            self._cube = self._load()
+        return self._cube
+
+    def _indexed(self):
+        if self._index is None:
+            cube = self._effective()
+            self._index = resolution.build_index(
+                cube[:formats.CELL_COUNT], cube[formats.CELL_COUNT:])
+        return self._index
+
+    def _effective(self):
+        """The loaded offsets with the overlay applied (staged ids excepted)."""
+        cube = self._loaded()
+        if self._overlay:
+            cube = array('h', cube)
+            for setting_id, ms in self._overlay.items():
+                position = _OFFSET_POSITIONS.get(setting_id)
+                if position is not None and setting_id not in self._staged:
+                    cube[position] = ms
+        return cube
+
+    def _load(self):
+        return array('h', self._settings.read_ints(_OFFSET_KEYS))
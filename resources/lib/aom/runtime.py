@@ -4,20 +4,32 @@ Builds the full typed graph — the dispatcher, the Kodi adapters (gateway,
 settings, gui, log), and the app components — with explicit, REQUIRED
 constructor dependencies: no fallback construction anywhere, exactly one
 instance of each adapter for the whole process. Blocks on the monitor until
-Kodi aborts, then stops the dispatcher.
+Kodi aborts, then stops the dispatcher and flushes the settings writer.
 
 Every component subscribes during construction, BEFORE the dispatcher thread
 starts, so events the bridges queue during construction are dispatched to a
 complete graph (matters when the service (re)starts while playback is
 already active).
 
+Kodi's raw settings save (``SettingsSaved``) has one subscriber, the
+runtime: it refreshes the settings snapshot and posts the diffed
+``SettingsChanged``, so every handler of a save reads the saved values and
+can skip saves that touch no id it reads. The echo of one of our own
+writes (the settings writer's flushes) is dropped there instead, before
+any handler runs — and before the offsets and the fleet overlay are
+re-read, so an echo costs only the snapshot diff.
+
 Subscription order is load-bearing (dispatch follows it, per event type):
 
 1. tracker — the session exists (or is torn down) before any other handler
    of the same lifecycle event runs;
 2. detector — owns ``session.profile`` and the stream-state machine;
-3. recorder — sole StreamProbed/ServiceStarted consumer (data flow, not an
-   ordering constraint; listed for the construction narrative);
+3. recorder — sole StreamProbed consumer, and the app's only ServiceStarted
+   one (data flow, not an ordering constraint; listed for the construction
+   narrative; the runtime's own overlay load follows it). Its writes,
+   and the watcher's offset stores, go through the settings writer, built
+   just before it: the writer's only subscription is its own
+   ``FlushSettings``, so its place in the order is immaterial;
 4. applier — on ProfileChanged/StreamStabilized/SettingsChanged the offset
    is applied (and ``session.applied`` recorded) before anything downstream
    reads it;
@@ -27,23 +39,54 @@ Subscription order is load-bearing (dispatch follows it, per event type):
    offset work for it is done;
 7. adjustment watcher — its ProfileChanged eligibility pass runs last, so
    ``session.applied`` is already current when the first watch tick of a
-   profile episode is scheduled.
+   profile episode is scheduled;
+8. playlist prefetcher — its PlaybackStarted prediction is posted after
+   the detector's probe #1, so a stream complete at AV start is adopted
+   (and applied) first and the prediction is dropped.
+
+A bulk offset edit (script.py, ``aom.app.bulk_edit``) holds the settings
+saves its writes raise: while its home-window hold is set the raw save is
+ignored, and the edit's closing notification (``SettingsSaved(bulk=True)``
+via the monitor bridge) releases the hold and diffs the whole batch into
+one ``SettingsChanged``. The service releases it, not the script: Kodi
+delivers the writes' saves after the script has returned.
+
+The offsets live in the settings store by default; with
+``enable_sparse_offsets`` (read once at service start) the OffsetTable is
+backed by the sparse offset store instead, migrated from the settings on
+first use. A fleet overlay file (``fleet_overlay_path``,
+``aom.kodi.offset_overlay``) layers read-only offsets above either: it is
+checked at service start and on every save, re-read only when it changed,
+and the ids whose overlay value changed join the save's ``SettingsChanged``.
+
+The optional shadow detector (``enable_shadow_detection``, read once at
+service start) subscribes after all of them: it only observes, and its
+mirror session must be built from a live session that already exists.
 """
 
+import time
+
 from resources.lib.aom.app import events
 from resources.lib.aom.app.adjustment_watcher import AdjustmentWatcher
+from resources.lib.aom.app.bulk_edit import HOLD_PROPERTY, hold_active
 from resources.lib.aom.app.dispatcher import Dispatcher
 from resources.lib.aom.app.notifier import Notifier
 from resources.lib.aom.app.offset_applier import OffsetApplier
 from resources.lib.aom.app.platform_recorder import PlatformRecorder
+from resources.lib.aom.app.playlist_prefetch import PlaylistPrefetcher
 from resources.lib.aom.app.seek_scheduler import (ExternalSeekCoordinator,
                                                   SeekScheduler)
 from resources.lib.aom.app.session import SessionTracker
+from resources.lib.aom.app.settings_writer import SettingsWriter
+from resources.lib.aom.app.shadow_detector import ShadowDetector
 from resources.lib.aom.app.stream_detector import StreamDetector
+from resources.lib.aom.domain import policies
 from resources.lib.aom.kodi.gateway import KodiGateway
 from resources.lib.aom.kodi.gui import Gui
 from resources.lib.aom.kodi.log import KodiLogger
 from resources.lib.aom.kodi.monitor_bridge import MonitorBridge
+from resources.lib.aom.kodi.offset_overlay import OffsetOverlay
+from resources.lib.aom.kodi.offset_store import offset_backend
 from resources.lib.aom.kodi.player_bridge import PlayerBridge
 from resources.lib.aom.kodi.settings import OffsetTable, Settings
 
@@ -54,7 +97,9 @@ class ServiceRuntime:
         self.logger = KodiLogger()
         self.settings = Settings(log=self.logger)
         self.logger.debug_escalation = self.settings.debug_logging_enabled()
-        self.offsets = OffsetTable(self.settings)
+        self.offsets = OffsetTable(offset_backend(self.settings,
+                                                  log=self.logger))
+        self.overlay = OffsetOverlay(log=self.logger)
         self.gateway = KodiGateway(log=self.logger)
         self.gui = Gui(log=self.logger)
 
@@ -62,6 +107,8 @@ class ServiceRuntime:
             log_debug=self.logger.debug,
             log_error=self.logger.error,
             log_runtimes=self.logger.debug_escalation)
+        self.dispatcher.subscribe(events.SettingsSaved,
+                                  self._on_settings_saved)
 
         # App components, in the load-bearing subscription order (docstring).
         self.session_tracker = SessionTracker(
@@ -70,8 +117,11 @@ class ServiceRuntime:
             self.dispatcher, self.session_tracker, self.gateway,
             self.settings, log_debug=self.logger.debug,
             log_warning=self.logger.warning)
+        self.settings_writer = SettingsWriter(
+            self.dispatcher, self.gateway, self.settings, self.offsets,
+            log_debug=self.logger.debug, log_warning=self.logger.warning)
         self.platform_recorder = PlatformRecorder(
-            self.dispatcher, self.gateway, self.settings,
+            self.dispatcher, self.gateway, self.settings_writer,
             log_debug=self.logger.debug)
         self.offset_applier = OffsetApplier(
             self.dispatcher, self.session_tracker, self.gateway,
@@ -88,16 +138,59 @@ class ServiceRuntime:
             log_warning=self.logger.warning)
         self.adjustment_watcher = AdjustmentWatcher(
             self.dispatcher, self.session_tracker, self.gateway,
-            self.settings, self.offsets, log_debug=self.logger.debug,
-            log_warning=self.logger.warning)
+            self.settings, self.offsets, self.settings_writer,
+            log_debug=self.logger.debug)
+        self.playlist_prefetcher = PlaylistPrefetcher(
+            self.dispatcher, self.session_tracker, self.gateway,
+            self.settings, log_debug=self.logger.debug)
+        self.shadow_detector = None
+        if self.settings.shadow_detection_enabled():
+            self.shadow_detector = ShadowDetector(
+                self.dispatcher, self.session_tracker, self.gateway,
+                self.settings, log_debug=self.logger.debug)
 
         self.player_bridge = PlayerBridge(self.dispatcher)
         self.monitor = MonitorBridge(self.dispatcher)
         self.dispatcher.subscribe(events.SettingsChanged,
                                   self._on_settings_changed)
+        self.dispatcher.subscribe(events.ServiceStarted,
+                                  self._on_service_started)
+
+    def _on_settings_saved(self, event):
+        """Diff the snapshot; announce the save with its changed ids."""
+        if event.bulk:
+            # The batch is written: saves still queued behind this
+            # notification re-diff to nothing.
+            self.gateway.clear_window_property(HOLD_PROPERTY)
+        elif hold_active(self.gateway.window_property(HOLD_PROPERTY),
+                         time.time()):
+            # A bulk edit is writing; its notification re-diffs it all.
+            self.logger.debug("AOM_Runtime: bulk offset edit in progress; "
+                              "deferring the settings reload")
+            return
+        # The echo check needs only the cheap snapshot diff: our own writes
+        # (write-behind flushes included) never pay the offset bulk read.
+        changed = self.settings.refresh()
+        if self.settings.is_own_echo(changed):
+            return
+        changed |= self.offsets.reload() | self._check_overlay()
+        self.dispatcher.post(events.SettingsChanged(changed=changed))
+
+    def _on_service_started(self, _event):
+        """Load the fleet overlay before the first offset is applied."""
+        self._check_overlay()
+
+    def _check_overlay(self):
+        """Re-read the fleet overlay if it changed; return the ids it moved."""
+        offsets = self.overlay.check(self.settings.fleet_overlay_path())
+        if offsets is None:
+            return frozenset()
+        return self.offsets.set_overlay(offsets)
 
-    def _on_settings_changed(self, _event):
+    def _on_settings_changed(self, event):
         """Refresh the cached debug flags; never write settings from here."""
+        if not policies.save_touches(event.changed, 'enable_debug_logging'):
+            return
         debug = self.settings.debug_logging_enabled()
         self.logger.debug_escalation = debug
         self.dispatcher.log_runtimes = debug
@@ -112,7 +205,8 @@ class ServiceRuntime:
         self.monitor.waitForAbort()
 
         self.logger.debug("AOM_Runtime: abort requested; shutting down")
-        # Joining the dispatcher thread is the whole shutdown: every
-        # subscription lives on the dispatcher, and posts arriving after
-        # stop are dropped by design.
+        # Joining the dispatcher thread ends every subscription (posts
+        # arriving after stop are dropped by design); what is left is the
+        # writer's batch, written here on the main thread.
         self.dispatcher.stop()
+        self.settings_writer.shutdown()
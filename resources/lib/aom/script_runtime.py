@@ -0,0 +1,32 @@
+"""Composition root for script.py, the addon's program entry point.
+
+Without arguments it opens the addon settings, as it always has. With
+arguments it runs one bulk offset command (``aom.app.bulk_edit``) over
+adapters built here, one of each, the way the service builds them: the
+offset backend is chosen by the same ``enable_sparse_offsets`` switch.
+"""
+
+import xbmcaddon
+
+from resources.lib.aom.app.bulk_edit import BulkEditor
+from resources.lib.aom.kodi.gateway import KodiGateway
+from resources.lib.aom.kodi.gui import Gui
+from resources.lib.aom.kodi.log import KodiLogger
+from resources.lib.aom.kodi.offset_store import offset_backend
+from resources.lib.aom.kodi.settings import ADDON_ID, Settings
+
+
+def run(args):
+    """Open the settings, or run the bulk command ``args`` (sys.argv[1:])."""
+    args = [arg for arg in args if arg.strip()]
+    if not args:
+        xbmcaddon.Addon(ADDON_ID).openSettings()
+        return
+    logger = KodiLogger()
+    settings = Settings(log=logger)
+    logger.debug_escalation = settings.debug_logging_enabled()
+    editor = BulkEditor(
+        offset_backend(settings, log=logger), KodiGateway(log=logger),
+        Gui(log=logger), settings, log_debug=logger.debug,
+        log_warning=logger.warning)
+    editor.run(args)
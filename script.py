@@ -1,9 +1,10 @@
-"""Addon helper script entry point: opens the addon settings."""
+"""Addon helper script entry point: opens the addon settings, or runs a
+bulk offset command given as RunScript arguments."""
 
-import xbmcaddon
+import sys
 
-from resources.lib.aom.kodi.settings import ADDON_ID
+from resources.lib.aom.script_runtime import run
 
 
 if __name__ == '__main__':
-    xbmcaddon.Addon(ADDON_ID).openSettings()
+    run(sys.argv[1:])
@@ -63,3 +63,33 @@ def test_settings_xml_is_in_lockstep_with_generator():
         "First difference at {0}".format(
             _first_diff(expected.splitlines(), actual.splitlines()))
     )
+
+
+def test_sparse_layout_drops_the_offset_matrix_only():
+    import xml.etree.ElementTree as ET
+    generator = _load_generator()
+    full = ET.fromstring(generator.build_settings_text().encode("utf-8"))
+    sparse = ET.fromstring(
+        generator.build_settings_text(generator.LAYOUT_SPARSE).encode("utf-8"))
+    full_ids = {node.get("id") for node in full.iter("setting")}
+    sparse_ids = {node.get("id") for node in sparse.iter("setting")}
+    matrix = set(generator.formats.all_offset_keys())
+    spinners = {hdr + "_fps" for hdr in generator.formats.HDR_TYPES}
+    assert sparse_ids == full_ids - matrix - spinners
+    default = sparse.find(".//setting[@id='enable_sparse_offsets']/default")
+    assert default.text == "true"
+
+
+def test_full_layout_hides_the_offset_matrix_on_the_sparse_store():
+    import xml.etree.ElementTree as ET
+    generator = _load_generator()
+    full = ET.fromstring(generator.build_settings_text().encode("utf-8"))
+    matrix = set(generator.formats.all_offset_keys())
+    spinners = {hdr + "_fps" for hdr in generator.formats.HDR_TYPES}
+    hidden = {
+        node.get("id") for node in full.iter("setting")
+        if any(condition.get("setting") == "enable_sparse_offsets"
+               and condition.text == "false"
+               for condition in node.iterfind(
+                   "dependencies/dependency[@type='visible']/and/condition"))}
+    assert hidden == matrix | spinners
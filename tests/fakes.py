@@ -80,9 +80,14 @@ class FakeGateway:
         self.channels = channels
         self.infolabels = dict(infolabels or {})
         self.settings_dialog = False   # scripted addon-settings-dialog state
+        self.audio_dialog = False      # scripted audio-OSD-dialog state
+        self.playlist = None           # (playlist_id, position) or None
+        self.playlist_items = {}       # index -> (codec, channels, hdrtype)
         self.applied = []            # (player_id, delay_seconds)
         self.seeks = []              # (seconds, player_id)
         self.window_properties = {}
+        self.addons = set()          # installed addon ids
+        self.notified = []           # notify_all messages, in order
 
     # -- reads ------------------------------------------------------------------
 
@@ -95,12 +100,24 @@ class FakeGateway:
     def infolabel(self, label):
         return self.infolabels.get(label, '')
 
+    def playlist_position(self, player_id):
+        return self.playlist
+
+    def playlist_item_streams(self, playlist_id, index):
+        return self.playlist_items.get(index)
+
     def settings_dialog_open(self):
         return self.settings_dialog
 
+    def audio_settings_dialog_open(self):
+        return self.audio_dialog
+
     def window_property(self, name):
         return self.window_properties.get(name, '')
 
+    def addon_installed(self, addon_id):
+        return addon_id in self.addons
+
     # -- writes -----------------------------------------------------------------
 
     def set_audio_delay(self, player_id, delay_seconds):
@@ -117,6 +134,9 @@ class FakeGateway:
     def clear_window_property(self, name):
         self.window_properties.pop(name, None)
 
+    def notify_all(self, message):
+        self.notified.append(message)
+
 
 class FakeFacade:
     """Scriptable settings double covering the app components' read surface.
@@ -124,7 +144,10 @@ class FakeFacade:
     ``fps_override`` drives the detector's fps-bucket collapse; ``seek_configs``
     maps a seek reason to its (enabled, seconds) pair, defaulting every reason
     to (True, 4); ``active_monitoring`` / ``hdr_enabled`` gate the adjustment
-    watcher's eligibility. Offset reads/writes live on ``FakeOffsetTable``
+    watcher's eligibility and ``phantom_window`` is its learned teardown
+    window (ms); ``apply_verification`` gates the offset applier's
+    read-back; ``store_integer_if_changed`` appends to ``stored_ints``
+    (the settings writer's integer path). Offset reads/writes live on ``FakeOffsetTable``
     (matching the real split: ``aom.kodi.settings.Settings`` + ``OffsetTable``).
     """
 
@@ -133,6 +156,9 @@ class FakeFacade:
         self.seek_configs = {}
         self.active_monitoring = True
         self.hdr_enabled = True
+        self.phantom_window = 0
+        self.apply_verification = True
+        self.stored_ints = []
 
     def fps_override_enabled(self, hdr_type):
         return self.fps_override
@@ -146,6 +172,16 @@ class FakeFacade:
     def is_hdr_enabled(self, hdr_type):
         return self.hdr_enabled
 
+    def phantom_window_ms(self):
+        return self.phantom_window
+
+    def apply_verification_enabled(self):
+        return self.apply_verification
+
+    def store_integer_if_changed(self, setting_id, value):
+        self.stored_ints.append((setting_id, value))
+        return True
+
 
 class FakeOffsetTable:
     """Scriptable stand-in for ``aom.kodi.settings.OffsetTable``.
@@ -153,21 +189,46 @@ class FakeOffsetTable:
     ``offsets`` (setting_id -> ms) backs ``get`` (0 default — the real table
     always answers an int); ``store`` appends to ``stored`` and writes
     ``offsets`` unless ``store_ok`` is False, when it reports failure.
+    ``stage`` parks a value in ``staged`` (read by ``get`` first) until a
+    store lands it or ``unstage`` drops it. ``resolve`` answers ``get``'s
+    value at the level scripted in ``levels`` (setting_id -> level;
+    'exact' otherwise) — no fallback is computed here; ``inherited``
+    answers ``fallbacks`` (setting_id -> (ms, level); (0, 'unset')).
     """
 
     def __init__(self):
         self.offsets = {}            # setting_id -> ms
+        self.staged = {}             # setting_id -> ms, not yet stored
+        self.levels = {}             # setting_id -> resolution level
+        self.fallbacks = {}          # setting_id -> (ms, level)
         self.stored = []             # (setting_id, ms), in store order
         self.store_ok = True
 
     def get(self, profile):
-        return self.offsets.get(profile.setting_id(), 0)
+        setting_id = profile.setting_id()
+        if setting_id in self.staged:
+            return self.staged[setting_id]
+        return self.offsets.get(setting_id, 0)
+
+    def resolve(self, profile):
+        return (self.get(profile),
+                self.levels.get(profile.setting_id(), 'exact'))
+
+    def inherited(self, profile):
+        return self.fallbacks.get(profile.setting_id(), (0, 'unset'))
+
+    def stage(self, profile, ms):
+        self.staged[profile.setting_id()] = ms
+
+    def unstage(self, profile):
+        self.staged.pop(profile.setting_id(), None)
 
     def store(self, profile, ms):
         if not self.store_ok:
             return False
         self.stored.append((profile.setting_id(), ms))
         self.offsets[profile.setting_id()] = ms
+        self.staged.pop(profile.setting_id(), None)
         return True
 
 
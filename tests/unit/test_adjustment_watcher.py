@@ -4,8 +4,9 @@ Driven exactly like test_seek_scheduler / test_stream_detector: a FakeClock
 plus manually pumped Dispatcher, a real SessionTracker (subscribed FIRST so
 the watcher always sees a live session), a scriptable FakeGateway (the audio
 delay is set via ``gateway.infolabels['Player.AudioDelay']``), the shared
-FakeFacade (eligibility reads) + FakeOffsetTable (offset get/store), and a
-real AdjustmentWatcher. UserOffsetSaved posts are collected off the bus.
+FakeFacade (eligibility reads) + FakeOffsetTable (offset get/store), a real
+SettingsWriter (the store path) and a real AdjustmentWatcher.
+UserOffsetSaved posts are collected off the bus.
 
 Timing facts the tests rely on (all derived from the class constants):
 
@@ -27,6 +28,8 @@ from resources.lib.aom.app import events
 from resources.lib.aom.app.adjustment_watcher import AdjustmentWatcher
 from resources.lib.aom.app.dispatcher import Dispatcher
 from resources.lib.aom.app.session import SessionTracker
+from resources.lib.aom.app.settings_writer import SettingsWriter
+from resources.lib.aom.domain import policies
 from resources.lib.aom.domain.profile import StreamProfile
 from tests.fakes import FakeClock, FakeFacade, FakeGateway, FakeOffsetTable
 
@@ -36,6 +39,8 @@ from tests.fakes import FakeClock, FakeFacade, FakeGateway, FakeOffsetTable
 IDLE = AdjustmentWatcher.IDLE_TICK_SECONDS
 ACTIVE = AdjustmentWatcher.ACTIVE_TICK_SECONDS
 QUIET = AdjustmentWatcher.QUIESCENCE_SECONDS
+BACKOFF_AFTER = AdjustmentWatcher.BACKOFF_AFTER_SECONDS
+MAX_IDLE = AdjustmentWatcher.MAX_IDLE_TICK_SECONDS
 TICK_KEY = AdjustmentWatcher._TICK_KEY
 AUDIO_DELAY = AdjustmentWatcher.INFOLABEL_AUDIO_DELAY
 # ACTIVE ticks from the first foreign observation to the store (inclusive of
@@ -54,7 +59,7 @@ def make_profile(hdr_type='dolbyvision', fps_type='all', audio_format='truehd',
 class Rig:
     """The watcher assembled on fakes; pump with post/advance."""
 
-    def __init__(self):
+    def __init__(self, **watcher_options):
         self.clock = FakeClock()
         self.errors = []
         self.debug = []
@@ -69,10 +74,13 @@ class Rig:
         self.gateway = FakeGateway()
         self.facade = FakeFacade()
         self.offset_table = FakeOffsetTable()
+        self.writer = SettingsWriter(
+            self.dispatcher, self.gateway, self.facade, self.offset_table,
+            log_debug=self.debug.append, log_warning=self.warnings.append)
         self.watcher = AdjustmentWatcher(
             self.dispatcher, self.tracker, self.gateway, self.facade,
-            self.offset_table, clock=self.clock, log_debug=self.debug.append,
-            log_warning=self.warnings.append)
+            self.offset_table, self.writer, clock=self.clock,
+            log_debug=self.debug.append, **watcher_options)
         self.saved = []
         self.dispatcher.subscribe(events.UserOffsetSaved, self.saved.append)
 
@@ -299,6 +307,39 @@ class TestQuiescence:
         assert rig.saved == []
         assert rig.session.watch_baseline_ms == -50
 
+    def test_zero_on_an_inheriting_profile_is_refused_not_stored(self, rig):
+        # A stored 0 reads as "uncalibrated": the cell would resolve back
+        # to its all-FPS row on the next apply, so the 0 is not stored and
+        # the user is told which offset stays in force.
+        profile = make_profile()
+        setting_id = profile.setting_id()
+        rig.offset_table.offsets[setting_id] = 100
+        rig.offset_table.fallbacks[setting_id] = (100, 'all_fps')
+        refused = []
+        rig.dispatcher.subscribe(events.UserOffsetRefused, refused.append)
+        rig.begin(profile, baseline_delay='0.100 s', applied=(setting_id, 100))
+
+        rig.observe_foreign('0.000 s')
+        rig.hold_to_quiescence()
+
+        assert rig.offset_table.stored == []
+        assert rig.saved == []
+        assert [(event.ms, event.level) for event in refused] == [
+            (100, 'all_fps')]
+        assert rig.session.watch_baseline_ms == 0
+        assert rig.session.watch_pending is None
+
+    def test_zero_with_nothing_to_inherit_is_stored(self, rig):
+        profile = make_profile()
+        rig.offset_table.offsets[profile.setting_id()] = -50
+        rig.begin(profile, baseline_delay='-0.050 s')
+
+        rig.observe_foreign('0.000 s')
+        rig.hold_to_quiescence()
+
+        assert rig.offset_table.stored == [(profile.setting_id(), 0)]
+        assert [event.ms for event in rig.saved] == [0]
+
 
 # ============================================================================
 # Store-path edge cases: incomplete profile, store failure
@@ -321,25 +362,29 @@ class TestStorePathGuards:
         assert rig.saved == []
         assert rig.session.watch_baseline_ms == -50
 
-    def test_store_deferred_while_settings_dialog_open(self, rig):
+    def test_store_held_by_writer_while_settings_dialog_open(self, rig):
         # Settings-state doctrine: a write made while the addon settings
-        # dialog is open is clobbered by its save-on-close. The quiesced
-        # candidate is held (active cadence) until the dialog closes, then
-        # stored exactly once.
+        # dialog is open is clobbered by its save-on-close. The watcher hands
+        # the quiesced value to the writer and accounts for it at once (the
+        # table answers it, staged); the writer holds the write until the
+        # dialog closes, then stores it exactly once.
         profile = make_profile()
         rig.begin(profile, baseline_delay='0.000 s')
 
         rig.gateway.settings_dialog = True
         rig.observe_foreign('-0.050 s')
-        rig.hold_to_quiescence()                       # quiesced, but deferred
-        rig.advance(ACTIVE)                            # keeps deferring
+        rig.hold_to_quiescence()
+        assert rig.offset_table.stored == []
+        assert rig.offset_table.get(profile) == -50    # staged
+        assert len(rig.saved) == 1
+        assert rig.session.watch_baseline_ms == -50
+        assert rig.session.applied == (profile.setting_id(), -50)
+
+        rig.advance(SettingsWriter.RETRY_SECONDS)      # still open: held
         assert rig.offset_table.stored == []
-        assert rig.saved == []
-        assert rig.watching                            # chain alive, retrying
-        assert rig.logged('settings dialog open')
 
         rig.gateway.settings_dialog = False            # dialog closed
-        rig.advance(ACTIVE)                            # next attempt stores
+        rig.advance(SettingsWriter.RETRY_SECONDS)
         assert rig.offset_table.stored == [(profile.setting_id(), -50)]
         assert len(rig.saved) == 1
 
@@ -370,26 +415,22 @@ class TestStorePathGuards:
         # the session dies before a phantom can quiesce.
         assert AdjustmentWatcher.QUIESCENCE_SECONDS >= 2.0
 
-    def test_store_failure_warns_keeps_baseline_and_retries(self, rig):
+    def test_store_failure_is_retried_by_the_writer(self, rig):
         profile = make_profile()
         rig.offset_table.store_ok = False
         rig.begin(profile, baseline_delay='0.000 s')
 
         rig.observe_foreign('-0.050 s')
-        rig.hold_to_quiescence()                       # store attempt fails
+        rig.hold_to_quiescence()                       # first write fails
 
         assert rig.offset_table.stored == []
-        assert rig.saved == []
-        assert rig.session.watch_baseline_ms == 0      # NOT updated on failure
-        assert any('failed to store' in m for m in rig.warnings)
+        assert rig.session.watch_baseline_ms == -50    # accounted for
 
-        # The value is still foreign, so a later cycle retries and succeeds.
         rig.offset_table.store_ok = True
-        rig.observe_foreign('-0.050 s')                # re-opens pending on -50
-        rig.hold_to_quiescence()
-
+        rig.advance(SettingsWriter.RETRY_SECONDS)      # the writer retries
         assert rig.offset_table.stored == [(profile.setting_id(), -50)]
         assert len(rig.saved) == 1
+        assert rig.warnings == []
 
 
 # ============================================================================
@@ -413,12 +454,24 @@ class TestEligibilityAndChain:
         rig.post(events.SettingsChanged())
         assert rig.watching
 
-        # A due tick that finds monitoring disabled reschedules NOTHING.
-        rig.facade.active_monitoring = False
+        # A due tick that finds the session ineligible reschedules NOTHING
+        # (eligibility is memoized per profile: a new profile is re-checked).
+        rig.session.profile = make_profile(hdr_type='unknown')
         rig.advance(IDLE)                              # the pending tick fires
         assert not rig.watching
         assert rig.logged('no longer eligible')
 
+    def test_eligibility_is_read_once_per_profile_and_save(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        calls = []
+        rig.facade.active_monitoring_enabled = lambda: calls.append(1) or True
+        for _ in range(5):
+            rig.advance(IDLE)
+        assert calls == []                             # memoized at arming
+        rig.post(events.SettingsChanged())
+        rig.advance(IDLE)
+        assert len(calls) == 1                         # re-read by the save
+
     def test_profile_adoption_clears_the_observation(self, rig):
         # A (re)adoption makes any in-flight candidate ambiguous: the pending
         # value was dialed against the PREVIOUS profile, so a real
@@ -470,6 +523,18 @@ class TestEligibilityAndChain:
         rig.hold_to_quiescence()
         assert rig.offset_table.stored == [(profile.setting_id(), -50)]
 
+    def test_save_of_unrelated_ids_does_not_re_evaluate(self, rig):
+        profile = make_profile()
+        rig.begin(profile, baseline_delay='0.000 s')
+        rig.facade.active_monitoring = False
+        rig.post(events.SettingsChanged(
+            changed=frozenset(('enable_notifications',))))
+        assert rig.watching                            # not re-evaluated
+
+        rig.post(events.SettingsChanged(
+            changed=frozenset(('enable_active_monitoring',))))
+        assert not rig.watching
+
     def test_hdr_disabled_profile_is_not_watched(self, rig):
         profile = make_profile()
         rig.facade.hdr_enabled = False
@@ -556,3 +621,345 @@ class TestCadenceAndLifecycle:
 
         rig.post(events.PlaybackEnded())
         assert not rig.watching
+
+
+# ============================================================================
+# Adaptive cadence: idle backoff, hints, pause suspension
+# ============================================================================
+
+def _count_reads(rig):
+    """Count the delay reads from now on; returns the (growing) list."""
+    reads = []
+    infolabel = rig.gateway.infolabel
+
+    def counting(label):
+        reads.append(label)
+        return infolabel(label)
+
+    rig.gateway.infolabel = counting
+    return reads
+
+
+def _backed_off(rig, baseline_delay='0.000 s'):
+    """A stable session polled until its idle cadence hit the ceiling."""
+    rig.begin(make_profile(), baseline_delay=baseline_delay)
+    for _ in range(int(BACKOFF_AFTER + 4 * MAX_IDLE)):
+        rig.advance(IDLE)
+    assert rig.session.watch_idle_seconds == MAX_IDLE
+
+
+class TestAdaptiveCadence:
+
+    def test_stable_stretch_backs_off_to_the_ceiling(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        reads = _count_reads(rig)
+        for _ in range(int(BACKOFF_AFTER)):
+            rig.advance(IDLE)
+        assert len(reads) == BACKOFF_AFTER          # the idle cadence first
+        for _ in range(int(10 * MAX_IDLE)):
+            rig.advance(IDLE)
+        assert rig.session.watch_idle_seconds == MAX_IDLE
+        assert len(reads) < BACKOFF_AFTER + 15      # 1s would be 80 more
+
+    def test_ceiling_is_configurable(self):
+        rig = Rig(max_idle_tick=IDLE)
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        reads = _count_reads(rig)
+        for _ in range(int(2 * BACKOFF_AFTER)):
+            rig.advance(IDLE)
+        assert len(reads) == 2 * BACKOFF_AFTER
+
+    def test_change_after_backoff_is_caught_and_quiesced(self, rig):
+        _backed_off(rig)
+        profile = rig.session.profile
+        rig.set_delay('-0.050 s')
+        rig.advance(MAX_IDLE)
+        assert rig.session.watch_pending[0] == -50
+        assert rig.session.watch_idle_seconds is None
+        rig.hold_to_quiescence()
+        assert rig.offset_table.stored == [(profile.setting_id(), -50)]
+
+    def test_audio_dialog_snaps_back_to_the_active_cadence(self, rig):
+        _backed_off(rig)
+        rig.gateway.audio_dialog = True
+        rig.advance(MAX_IDLE)
+        assert rig.session.watch_idle_seconds is None
+        rig.set_delay('-0.050 s')
+        rig.advance(ACTIVE)                         # polled at once
+        assert rig.session.watch_pending[0] == -50
+
+    def test_property_change_notification_snaps_back(self, rig):
+        _backed_off(rig)
+        rig.post(events.PlayerNotified(method='Player.OnPropertyChanged',
+                                       player_id=1, item_type='movie'))
+        rig.set_delay('-0.050 s')
+        rig.advance(ACTIVE)
+        assert rig.session.watch_pending[0] == -50
+        assert rig.logged("player property changed")
+
+    def test_other_notifications_are_not_hints(self, rig):
+        _backed_off(rig)
+        rig.post(events.PlayerNotified(method='Player.OnAVChange',
+                                       player_id=1, item_type='movie'))
+        assert rig.session.watch_idle_seconds == MAX_IDLE
+
+    def test_no_polling_while_paused(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        reads = _count_reads(rig)
+        rig.post(events.Paused())
+        assert not rig.watching
+        for _ in range(60):
+            rig.advance(IDLE)
+        assert reads == []
+        rig.post(events.Resumed())
+        rig.set_delay('-0.050 s')
+        rig.advance(ACTIVE)                         # the resume hint polls
+        assert rig.session.watch_pending[0] == -50
+
+    def test_tick_landing_in_a_pause_stops_the_chain(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        rig.session.paused = True                   # Paused not seen yet
+        rig.advance(IDLE)
+        assert not rig.watching
+
+    def test_pause_restarts_the_quiescence_window(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        rig.observe_foreign('-0.050 s')
+        rig.post(events.Paused())
+        rig.advance(10 * QUIET)
+        rig.post(events.Resumed())
+        rig.advance(ACTIVE)
+        assert rig.offset_table.stored == []        # held 0.25s of playback
+        rig.hold_to_quiescence()
+        assert [s.ms for s in rig.saved] == [-50]
+
+
+# ============================================================================
+# Notification hints: an immediate read, trusted once one announces a change
+# ============================================================================
+
+SAFETY_NET = AdjustmentWatcher.SAFETY_NET_TICK_SECONDS
+
+
+def _hint(rig):
+    rig.post(events.PlayerNotified(method='Player.OnPropertyChanged',
+                                   player_id=1, item_type='movie',
+                                   properties=('audiodelay',)))
+
+
+HINTS_NEEDED = AdjustmentWatcher.HINT_CONFIRMATIONS
+
+
+def _hinted_adjustment(rig, delay_str):
+    rig.set_delay(delay_str)
+    _hint(rig)
+    rig.hold_to_quiescence()
+
+
+def _trusted(rig):
+    """A session whose adjustments all arrived with a hint, then settled."""
+    rig.begin(make_profile(), baseline_delay='0.000 s')
+    for step in range(1, HINTS_NEEDED + 1):
+        _hinted_adjustment(rig, f'-0.0{step}0 s')
+    assert [s.ms for s in rig.saved] == [-10 * step
+                                         for step in range(1, HINTS_NEEDED + 1)]
+    assert rig.logged("polling as a safety net")
+
+
+class TestNotificationHints:
+
+    def test_hint_reads_the_delay_at_once(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        rig.set_delay('-0.050 s')
+        _hint(rig)                                  # no tick has fired
+        assert rig.session.watch_pending[0] == -50
+        assert rig.logged("adjustment announced by a notification")
+
+    def test_trusted_hints_relax_the_poll_to_a_safety_net(self, rig):
+        _trusted(rig)
+        for _ in range(int(BACKOFF_AFTER + 4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        assert rig.session.watch_idle_seconds == SAFETY_NET
+
+    def test_untrusted_hints_keep_the_polling_ceiling(self, rig):
+        _backed_off(rig)
+        for _ in range(int(4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        assert rig.session.watch_idle_seconds == MAX_IDLE
+
+    def test_trusted_hint_without_a_change_stays_backed_off(self, rig):
+        _trusted(rig)
+        for _ in range(int(BACKOFF_AFTER + 4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        reads = _count_reads(rig)
+        _hint(rig)
+        assert len(reads) == 1
+        assert rig.session.watch_idle_seconds == SAFETY_NET
+
+    def test_change_missed_by_hints_falls_back_to_polling(self, rig):
+        _trusted(rig)
+        for _ in range(int(BACKOFF_AFTER + 4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        rig.set_delay('-0.075 s')
+        rig.advance(SAFETY_NET)                     # the safety net catches it
+        assert rig.session.watch_pending[0] == -75
+        assert rig.logged("adjustment without a notification")
+        rig.hold_to_quiescence()
+        for _ in range(int(BACKOFF_AFTER + 4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        assert rig.session.watch_idle_seconds == MAX_IDLE
+
+    def test_a_coincidental_hint_does_not_relax_the_poll(self, rig):
+        # One adjustment that happened to coincide with a property change
+        # (a track switch), then adjustments Kodi does not announce.
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        _hinted_adjustment(rig, '-0.050 s')
+        for _ in range(int(BACKOFF_AFTER + 4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        assert rig.session.watch_idle_seconds == MAX_IDLE
+        for delay_str, ms in (('-0.075 s', -75), ('-0.100 s', -100)):
+            rig.set_delay(delay_str)
+            rig.advance(MAX_IDLE)               # caught by the polling ceiling
+            assert rig.session.watch_pending[0] == ms
+            rig.hold_to_quiescence()
+        assert [s.ms for s in rig.saved] == [-50, -75, -100]
+        assert rig.session.watch_hint_streak == 0
+        assert not rig.logged("polling as a safety net")
+
+    def test_hint_trust_does_not_outlive_the_session(self, rig):
+        _trusted(rig)
+        rig.post(events.PlaybackStopped())
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        for _ in range(int(BACKOFF_AFTER + 4 * SAFETY_NET)):
+            rig.advance(IDLE)
+        assert rig.session.watch_idle_seconds == MAX_IDLE
+
+    def test_hint_while_paused_reads_nothing(self, rig):
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        rig.post(events.Paused())
+        reads = _count_reads(rig)
+        _hint(rig)
+        assert reads == []
+
+
+# ============================================================================
+# Learned quiescence: the local stop window, measured at each stop
+# ============================================================================
+
+MIN_QUIET = AdjustmentWatcher.MIN_QUIESCENCE_SECONDS
+MARGIN = AdjustmentWatcher.PHANTOM_MARGIN_SECONDS
+SAMPLES = AdjustmentWatcher.MIN_PHANTOM_SAMPLES
+PHANTOM_SETTING = AdjustmentWatcher.PHANTOM_SETTING
+
+
+def _stop_after(rig, seconds, baseline_delay='-0.125 s'):
+    """A watched session stopped ``seconds`` after a phantom 0 was read."""
+    rig.begin(make_profile(), baseline_delay=baseline_delay)
+    rig.observe_foreign('0.000 s')                 # teardown phantom
+    rig.clock.advance(seconds)
+    rig.post(events.PlaybackStopped())
+
+
+def _stores_after(rig):
+    """Seconds of ACTIVE ticks a fresh adjustment needs to be stored."""
+    rig.begin(make_profile(), baseline_delay='0.000 s')
+    rig.observe_foreign('-0.050 s')
+    ticks = 0
+    while not rig.saved:
+        rig.advance(ACTIVE)
+        ticks += 1
+    return ticks * ACTIVE
+
+
+class TestLearnedQuiescence:
+
+    def test_unlearned_platform_keeps_the_full_window(self, rig):
+        assert _stores_after(rig) == QUIET
+
+    def test_stops_teach_a_shorter_window(self, rig):
+        for _ in range(SAMPLES - 1):
+            _stop_after(rig, 0.5)
+        assert rig.facade.stored_ints == []            # not yet persisted
+        _stop_after(rig, 0.75)
+        assert rig.facade.stored_ints == [(PHANTOM_SETTING, 750)]
+        assert _stores_after(rig) == 0.75 + MARGIN
+
+    def test_window_counts_from_the_first_phantom_reading(self, rig):
+        for _ in range(SAMPLES):
+            rig.begin(make_profile(), baseline_delay='-0.125 s')
+            rig.observe_foreign('0.000 s')             # teardown phantom
+            rig.advance(ACTIVE)                        # still 0: same window
+            rig.post(events.PlaybackStopped())
+        assert rig.watcher._phantom_ms == ACTIVE * 1000
+        assert rig.facade.stored_ints[-1] == (PHANTOM_SETTING, 250)
+
+    def test_stop_after_back_off_is_sampled(self, rig):
+        _backed_off(rig, baseline_delay='-0.125 s')
+        rig.set_delay('0.000 s')                       # teardown phantom
+        reads = _count_reads(rig)
+        while not reads:                               # one backed-off gap
+            rig.advance(ACTIVE)
+        rig.advance(ACTIVE)                            # candidate: fine ticks
+        rig.post(events.PlaybackStopped())
+        assert rig.watcher._phantom_samples == 1
+        assert rig.watcher._phantom_ms == ACTIVE * 1000
+
+    def test_persisted_bound_is_used_from_the_start(self, rig):
+        rig.facade.phantom_window = 100
+        assert _stores_after(rig) == MIN_QUIET
+
+    def test_stops_without_a_phantom_teach_nothing(self, rig):
+        _backed_off(rig)
+        reads = _count_reads(rig)
+        while not reads:
+            rig.advance(ACTIVE)
+        rig.clock.advance(MAX_IDLE / 2)                # one backed-off gap
+        rig.post(events.PlaybackStopped())
+        rig.begin(make_profile(), baseline_delay='-0.125 s')
+        rig.post(events.PlaybackStopped())             # clean to the end
+        rig.begin(make_profile(), baseline_delay='-0.125 s')
+        rig.observe_foreign('0.000 s')
+        rig.post(events.Paused())
+        rig.post(events.PlaybackStopped())
+        assert rig.watcher._phantom_samples == 0
+
+    def test_phantom_reaching_the_guard_restores_the_full_window(self, rig):
+        rig.facade.phantom_window = 500
+        rig.begin(make_profile(), baseline_delay='-0.125 s')
+        rig.observe_foreign('0.000 s')
+        rig.gateway.player_id = -1
+        for _ in range(QUIESCENCE_STEPS):
+            rig.advance(ACTIVE)
+        assert rig.logged('no active player at store time')
+        rig.post(events.PlaybackStopped())             # not sampled again
+        assert rig.watcher._phantom_samples == 1
+        rig.gateway.player_id = 1
+        assert _stores_after(rig) == QUIET
+
+
+# ============================================================================
+# Tick fast path: an unchanged string is not parsed again
+# ============================================================================
+
+class TestTickFastPath:
+
+    def test_unchanged_reading_is_parsed_once(self, rig, monkeypatch):
+        parses = []
+        parse = policies.parse_delay_ms
+        monkeypatch.setattr(policies, 'parse_delay_ms',
+                            lambda raw: parses.append(raw) or parse(raw))
+        rig.begin(make_profile(), baseline_delay='0.000 s')
+        for _ in range(10):
+            rig.advance(IDLE)
+        assert parses == ['0.000 s']
+        rig.observe_foreign('-0.050 s')
+        rig.hold_to_quiescence()
+        assert parses == ['0.000 s', '-0.050 s']
+        assert [s.ms for s in rig.saved] == [-50]
+
+    def test_reading_cache_is_per_session(self, rig):
+        rig.begin(make_profile(), baseline_delay='-0.050 s')
+        rig.post(events.PlaybackStopped())
+        rig.begin(make_profile(), baseline_delay='-0.050 s')
+        assert rig.session.watch_reading == ('-0.050 s', -50)
+        assert rig.session.watch_baseline_ms == -50
@@ -5,8 +5,9 @@ derivation the StreamDetector runs on every probe). Pins how a raw Kodi codec
 string is mapped to one of the seven settings audio-format buckets. Two
 properties are load-bearing and must not regress:
 
-  * substring match order: 'eac3' is tested before 'ac3' (ac3 is a substring
-    of eac3), so a Dolby Digital+ stream keys to eac3, never ac3;
+  * eac3 over ac3: 'ac3' is a substring of 'eac3', so a Dolby Digital+
+    stream must key to eac3, never ac3 (the classifier prefers the longest
+    token; vocabulary order breaks ties);
   * fallback: an unrecognized-but-present codec becomes 'pcm' (never
     'unknown'), while the 'unknown'/'none' sentinels normalize to
     formats.UNKNOWN — the legacy two-layer behavior (get_audio_info passed
@@ -0,0 +1,119 @@
+"""Unit tests for aom.app.bulk_edit.BulkEditor.
+
+The offset backend is a dict-backed double answering the two bulk calls;
+the scriptable FakeGateway records the hold property and the closing
+notification, FakeGui the toasts. The hold is checked AT WRITE TIME: the
+backend double snapshots the window properties when it is written.
+"""
+
+import pytest
+
+from resources.lib.aom.app.bulk_edit import (HOLD_PROPERTY, HOLD_SECONDS,
+                                             NOTIFICATION, BulkEditor,
+                                             hold_active)
+from tests.fakes import FakeClock, FakeGateway, FakeGui
+
+
+class DictBackend:
+    """read_ints/write_ints over a dict; ``write_ok`` False fails writes."""
+
+    def __init__(self, gateway, offsets=None):
+        self._gateway = gateway
+        self.offsets = dict(offsets or {})
+        self.writes = []             # (values, window properties at write)
+        self.write_ok = True
+
+    def read_ints(self, setting_ids, default=0):
+        return [self.offsets.get(setting_id, default)
+                for setting_id in setting_ids]
+
+    def write_ints(self, values):
+        self.writes.append((dict(values),
+                            dict(self._gateway.window_properties)))
+        if not self.write_ok:
+            return False
+        self.offsets.update(values)
+        return True
+
+
+class DurationSettings:
+    def notification_duration_ms(self):
+        return 5000
+
+
+class Rig:
+    def __init__(self, offsets=None):
+        self.clock = FakeClock(start=1000.0)
+        self.debug = []
+        self.warnings = []
+        self.gateway = FakeGateway()
+        self.gui = FakeGui()
+        self.backend = DictBackend(self.gateway, offsets)
+        self.editor = BulkEditor(
+            self.backend, self.gateway, self.gui, DurationSettings(),
+            clock=self.clock, log_debug=self.debug.append,
+            log_warning=self.warnings.append)
+
+
+@pytest.fixture
+def rig():
+    return Rig({'hdr10_all_eac3': 50, 'hdr10_24_eac3': -25,
+                'sdr_all_ac3': 100})
+
+
+def test_command_is_one_batch_under_the_hold_then_one_notification(rig):
+    assert rig.editor.run(['shift', 'hdr=hdr10', 'ms=25']) == 2
+    assert len(rig.backend.writes) == 1
+    values, held = rig.backend.writes[0]
+    assert values == {'hdr10_all_eac3': 75, 'hdr10_24_eac3': 0}
+    assert held == {HOLD_PROPERTY: '1000.000'}
+    # Still held: the service releases it on the notification.
+    assert rig.gateway.window_properties == {HOLD_PROPERTY: '1000.000'}
+    assert rig.gateway.notified == [NOTIFICATION]
+    assert rig.gui.notifications == [('#32115: 2', 5000, '#32114')]
+    assert any('shift wrote 2 offset(s)' in line for line in rig.debug)
+
+
+def test_a_command_changing_nothing_writes_and_notifies_nothing(rig):
+    assert rig.editor.run(['reset', 'hdr=hlg']) == 0
+    assert rig.backend.writes == []
+    assert rig.gateway.notified == []
+    assert rig.gui.notifications == [('#32115: 0', 5000, '#32114')]
+
+
+def test_bad_command_is_reported_and_nothing_is_read(rig):
+    assert rig.editor.run(['shift', 'ms=25']) is None
+    assert rig.backend.writes == []
+    assert any('needs hdr=' in line for line in rig.warnings)
+    assert rig.gui.notifications == [('#32116', 5000, '#32114')]
+
+
+def test_open_settings_dialog_refuses_the_edit(rig):
+    rig.gateway.settings_dialog = True
+    assert rig.editor.run(['reset', 'hdr=sdr']) is None
+    assert rig.backend.writes == []
+    assert rig.gui.notifications == [('#32117', 5000, '#32114')]
+
+
+def test_failed_write_still_notifies_the_service_to_release_the_hold(rig):
+    rig.backend.write_ok = False
+    assert rig.editor.run(['copy', 'from=sdr', 'to=hdr10']) is None
+    assert HOLD_PROPERTY in rig.gateway.window_properties
+    assert rig.gateway.notified == [NOTIFICATION]
+    assert rig.gui.notifications == [('#32116', 5000, '#32114')]
+
+
+@pytest.mark.parametrize('stamp, active', [
+    ('1000.000', True),
+    (f"{1000.0 - HOLD_SECONDS + 0.1:.3f}", True),
+    (f"{1000.0 - HOLD_SECONDS:.3f}", False),       # a crashed script's hold
+    ('1001.000', False),                           # from the future: stale
+    ('', False),
+    ('busy', False),
+])
+def test_hold_active(stamp, active):
+    assert hold_active(stamp, 1000.0) is active
+
+
+def test_hold_stamp_rounded_up_is_active():
+    assert hold_active(f"{999.9996:.3f}", 999.9996) is True
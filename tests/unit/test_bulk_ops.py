@@ -0,0 +1,70 @@
+"""Unit tests for aom.domain.bulk_ops (bulk offset command planning)."""
+
+import pytest
+
+from resources.lib.aom.domain import bulk_ops, formats
+from resources.lib.aom.domain.bulk_ops import BulkCommand, parse_command, plan
+
+
+def test_parse_shift_normalizes_its_arguments():
+    assert parse_command(['shift', ' hdr=HDR10', 'ms=-25 ']) == \
+        BulkCommand('shift', hdr='hdr10', ms=-25)
+    assert parse_command(['SHIFT', 'audio=eac3', 'fps=24', 'ms=50']) == \
+        BulkCommand('shift', fps='24', audio='eac3', ms=50)
+
+
+def test_parse_copy_and_reset():
+    assert parse_command(['copy', 'from=hdr10', 'to=hdr10plus']) == \
+        BulkCommand('copy', source='hdr10', target='hdr10plus')
+    assert parse_command(['reset', 'fps=all']) == BulkCommand('reset',
+                                                              fps='all')
+
+
+@pytest.mark.parametrize('args', [
+    [],
+    ['nudge', 'hdr=sdr'],
+    ['shift', 'ms=25'],                       # no slice: whole matrix
+    ['shift', 'hdr=sdr'],                     # no ms
+    ['shift', 'hdr=sdr', 'ms=1.5'],
+    ['shift', 'hdr=sdr', 'ms=10'],            # off the sliders' 25 ms step
+    ['shift', 'hdr=hdr9', 'ms=25'],
+    ['reset', 'audio=mp3'],
+    ['reset', 'fps=48'],
+    ['reset', 'hdr=sdr', 'ms=25'],            # argument of another command
+    ['reset', 'sdr'],
+    ['copy', 'from=sdr'],
+    ['copy', 'from=sdr', 'to=sdr'],
+])
+def test_parse_rejects_bad_commands(args):
+    with pytest.raises(ValueError):
+        parse_command(args)
+
+
+def test_slice_keys_include_the_default_only_for_a_whole_hdr_slice():
+    keys = bulk_ops.slice_keys(hdr='hlg')
+    assert len(keys) == len(formats.FPS_KEYS) * len(formats.AUDIO_FORMATS) + 1
+    assert keys[-1] == 'hlg_default'
+    assert 'hlg_default' not in bulk_ops.slice_keys(hdr='hlg', audio='pcm')
+    assert bulk_ops.slice_keys(fps='24', audio='pcm') == [
+        f"{hdr}_24_pcm" for hdr in formats.HDR_TYPES]
+
+
+def test_shift_moves_calibrated_offsets_only_and_clamps():
+    current = {'sdr_all_ac3': 50, 'sdr_24_ac3': 990, 'sdr_default': -25,
+               'hdr10_all_ac3': 50}
+    assert plan(BulkCommand('shift', hdr='sdr', ms=25), current) == {
+        'sdr_all_ac3': 75, 'sdr_24_ac3': 1000, 'sdr_default': 0}
+
+
+def test_copy_makes_the_target_an_exact_copy():
+    current = {'hdr10_all_eac3': 50, 'hdr10_default': 25,
+               'hdr10plus_all_eac3': 50, 'hdr10plus_24_pcm': -75}
+    assert plan(BulkCommand('copy', source='hdr10', target='hdr10plus'),
+                current) == {'hdr10plus_default': 25, 'hdr10plus_24_pcm': 0}
+
+
+def test_reset_zeroes_only_what_is_set():
+    current = {'dolbyvision_24_truehd': 50, 'hdr10_24_truehd': -25,
+               'hdr10_all_truehd': 75}
+    assert plan(BulkCommand('reset', fps='24', audio='truehd'), current) == {
+        'dolbyvision_24_truehd': 0, 'hdr10_24_truehd': 0}
@@ -0,0 +1,57 @@
+"""Unit tests for aom.domain.classify — the raw-reading classification tables.
+
+The corpus (tests/data/classification_corpus.json) is the regression suite:
+every real reading in it must keep classifying to its recorded bucket. The
+remaining tests pin the table mechanics (seeding from the vocabulary,
+longest-token precedence, the bounded learned tier).
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from resources.lib.aom.domain import classify, formats
+
+CORPUS_PATH = (Path(__file__).resolve().parents[1] / "data"
+               / "classification_corpus.json")
+CORPUS = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+ECHO = 'Player.Process(video.source.hdr.type)'
+
+
+@pytest.mark.parametrize("raw, expected", CORPUS["audio"])
+def test_audio_corpus(raw, expected):
+    assert classify.audio_classifier()(raw) == expected
+
+
+@pytest.mark.parametrize("raw, expected", CORPUS["hdr"])
+def test_hdr_corpus(raw, expected):
+    assert classify.hdr_classifier(blank_readings=(ECHO,))(raw) == expected
+
+
+def test_every_vocabulary_token_classifies_to_itself():
+    audio = classify.audio_classifier()
+    hdr = classify.hdr_classifier()
+    assert [audio(a) for a in formats.AUDIO_FORMATS] == \
+        list(formats.AUDIO_FORMATS)
+    assert [hdr(h) for h in formats.HDR_TYPES] == list(formats.HDR_TYPES)
+
+
+def test_aliases_only_target_the_vocabulary():
+    assert set(classify.AUDIO_ALIASES.values()) <= set(formats.AUDIO_FORMATS)
+    assert set(classify.HDR_ALIASES.values()) <= set(formats.HDR_TYPES)
+
+
+def test_longest_token_wins_over_vocabulary_order():
+    audio = classify.audio_classifier()
+    assert audio('ac3+eac3') == 'eac3'
+    assert audio('dts-hd ma') == 'dtshd_ma'
+
+
+def test_learned_tier_is_bounded():
+    audio = classify.audio_classifier()
+    for index in range(classify.Classifier.SEEN_LIMIT * 2):
+        assert audio('codec{0}'.format(index)) == 'pcm'
+    assert len(audio._table) <= \
+        len(audio._seed) + classify.Classifier.SEEN_LIMIT
+    assert audio('eac3') == 'eac3'
@@ -17,7 +17,7 @@ from resources.lib.aom.app import events
 PHASE2_GROUP = [
     "PlaybackStarted", "AvChanged", "PlaybackStopped", "PlaybackEnded",
     "Paused", "Resumed", "SeekOccurred", "SeekChapter", "SpeedChanged",
-    "SettingsChanged",
+    "SettingsSaved",
 ]
 
 # Every catalog class, paired with sample kwargs to construct an instance.
@@ -31,17 +31,29 @@ CATALOG = {
     events.SeekOccurred: {"time_ms": 1000, "offset_ms": -50},
     events.SeekChapter: {"chapter": 3},
     events.SpeedChanged: {"speed": 2},
-    events.SettingsChanged: {},
+    events.SettingsSaved: {},
+    events.SettingsChanged: {"changed": frozenset(("enable_hdr10",))},
+    events.PlayerNotified: {"method": "Player.OnAVStart", "player_id": 1,
+                            "item_type": "movie"},
     events.ProbeStream: {"session_id": 1, "attempt": 0},
+    events.ReprobeStream: {"session_id": 1},
     events.VerifyStream: {"session_id": 1, "seq": 7},
+    events.ShadowEvent: {"event": events.VerifyStream(session_id=1, seq=7)},
     events.StreamStabilized: {"session_id": 1},
     events.ProfileChanged: {"session_id": 1},
     events.OffsetApplied: {"session_id": 1, "profile": object(),
                            "ms": 75, "provisional": True,
                            "user_initiated": False},
     events.UserOffsetSaved: {"session_id": 1, "profile": object(), "ms": -25},
+    events.UserOffsetRefused: {"session_id": 1, "profile": object(),
+                               "ms": 40, "level": "hdr_default"},
+    events.RetryApply: {"session_id": 1, "attempt": 0},
+    events.VerifyApply: {"session_id": 1, "attempt": 0},
     events.ExecuteSeek: {"session_id": 1, "reason": "resume", "requested_at": 0.0},
+    events.PrefetchNext: {"session_id": 1},
+    events.ProfilePredicted: {"session_id": 1, "profile": object()},
     events.WatchTick: {"session_id": 1},
+    events.FlushSettings: {},
 }
 
 
@@ -62,6 +62,34 @@ def test_all_setting_keys_unique_and_ordered_by_hdr():
     assert keys[-1] == 'sdr_60_pcm'
 
 
+def test_all_offset_keys_append_one_default_per_hdr_type():
+    keys = formats.all_offset_keys()
+    assert keys[:formats.CELL_COUNT] == formats.all_setting_keys()
+    assert keys[formats.CELL_COUNT:] == [f"{hdr}_default"
+                                         for hdr in formats.HDR_TYPES]
+
+
+def test_cell_index_walks_all_setting_keys_in_order():
+    # The dense-cube index is row-major in settings.xml order: cell i is the
+    # setting id all_setting_keys()[i], and every cell is hit exactly once.
+    keys = formats.all_setting_keys()
+    assert formats.CELL_COUNT == len(keys)
+    for hdr in formats.HDR_TYPES:
+        for fps in formats.FPS_KEYS:
+            for audio in formats.AUDIO_FORMATS:
+                cell = formats.cell_index(formats.HDR_ORDINALS[hdr],
+                                          formats.FPS_ORDINALS[fps],
+                                          formats.AUDIO_ORDINALS[audio])
+                assert keys[cell] == formats.setting_key(hdr, fps, audio)
+
+
+def test_cell_index_of_unknown_axis_is_no_ordinal():
+    assert formats.cell_index(0, formats.NO_ORDINAL, 0) == formats.NO_ORDINAL
+    assert formats.UNKNOWN not in formats.HDR_ORDINALS
+    assert formats.UNKNOWN not in formats.FPS_ORDINALS
+    assert formats.UNKNOWN not in formats.AUDIO_ORDINALS
+
+
 def test_stream_detector_consumes_this_vocabulary():
     # The runtime consumer is the detector's pure derivation: every vocabulary
     # member must round-trip through it unchanged (a detector that stopped
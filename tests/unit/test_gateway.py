@@ -174,6 +174,64 @@ class TestAudioInfo:
         assert req["params"]["properties"] == ["currentaudiostream"]
 
 
+# --- playlist look-ahead -----------------------------------------------------
+
+class TestPlaylistPosition:
+    def test_returns_playlist_and_position(self, monkeypatch):
+        gw, rec = _make_gateway(monkeypatch, response={
+            "result": {"playlistid": 1, "position": 3}})
+        assert gw.playlist_position(1) == (1, 3)
+        assert rec.call_count == 1
+        assert rec.last_request["method"] == "Player.GetProperties"
+        assert rec.last_request["params"]["properties"] == \
+            ["playlistid", "position"]
+
+    def test_no_playlist_returns_none(self, monkeypatch):
+        gw, rec = _make_gateway(monkeypatch, response={
+            "result": {"playlistid": -1, "position": -1}})
+        assert gw.playlist_position(1) is None
+        assert rec.call_count == 1
+
+    def test_exception_returns_none_single_shot(self, monkeypatch):
+        gw, rec = _make_gateway(monkeypatch, raises=RuntimeError("rpc down"))
+        assert gw.playlist_position(1) is None
+        assert rec.call_count == 1
+
+
+class TestPlaylistItemStreams:
+    def test_returns_first_audio_and_video_details(self, monkeypatch):
+        gw, rec = _make_gateway(monkeypatch, response={"result": {"items": [
+            {"streamdetails": {
+                "audio": [{"codec": "pt-truehd", "channels": 8},
+                          {"codec": "ac3", "channels": 6}],
+                "video": [{"codec": "hevc", "hdrtype": "dolbyvision"}]}}]}})
+        assert gw.playlist_item_streams(1, 4) == ("truehd", 8, "dolbyvision")
+        assert rec.call_count == 1
+        params = rec.last_request["params"]
+        assert rec.last_request["method"] == "Playlist.GetItems"
+        assert params["playlistid"] == 1
+        assert params["properties"] == ["streamdetails"]
+        assert params["limits"] == {"start": 4, "end": 5}
+
+    def test_sdr_item_reports_empty_hdr_type(self, monkeypatch):
+        gw, _ = _make_gateway(monkeypatch, response={"result": {"items": [
+            {"streamdetails": {"audio": [{"codec": "eac3", "channels": 6}],
+                               "video": [{"codec": "h264"}]}}]}})
+        assert gw.playlist_item_streams(1, 1) == ("eac3", 6, "")
+
+    def test_missing_item_or_details_returns_none(self, monkeypatch):
+        gw, _ = _make_gateway(monkeypatch, response={"result": {"items": []}})
+        assert gw.playlist_item_streams(1, 1) is None
+        gw, _ = _make_gateway(monkeypatch, response={"result": {"items": [
+            {"streamdetails": {"audio": [], "video": []}}]}})
+        assert gw.playlist_item_streams(1, 1) is None
+
+    def test_exception_returns_none_single_shot(self, monkeypatch):
+        gw, rec = _make_gateway(monkeypatch, raises=ValueError("boom"))
+        assert gw.playlist_item_streams(1, 1) is None
+        assert rec.call_count == 1
+
+
 # --- set_audio_delay ---------------------------------------------------------
 
 class TestSetAudioDelay:
@@ -259,6 +317,64 @@ class TestInfolabel:
         assert any("Error reading infolabel" in m for m in logs)
 
 
+# --- notifications -----------------------------------------------------------
+
+def test_notify_all_broadcasts_from_the_addon(monkeypatch):
+    builtins = []
+    monkeypatch.setattr(xbmc, "executebuiltin", builtins.append)
+    KodiGateway(log=_noop_log).notify_all("OffsetsBulkWritten")
+    assert builtins == [
+        "NotifyAll(script.audiooffsetmanager,OffsetsBulkWritten)"]
+
+
+# --- dialogs -----------------------------------------------------------------
+
+class TestAudioSettingsDialogOpen:
+    def test_true_only_for_the_audio_osd_dialog(self, monkeypatch):
+        gateway = KodiGateway(log=_noop_log)
+        for dialog_id, expected in ((10124, True), (10140, False),
+                                    (9999, False)):
+            monkeypatch.setattr(xbmcgui, "getCurrentWindowDialogId",
+                                lambda: dialog_id)
+            assert gateway.audio_settings_dialog_open() is expected
+
+    def test_exception_answers_false_and_logs(self, monkeypatch):
+        logs = []
+
+        def boom():
+            raise RuntimeError("gui gone")
+
+        monkeypatch.setattr(xbmcgui, "getCurrentWindowDialogId", boom)
+        gateway = KodiGateway(log=lambda message, level=None: logs.append(
+            (message, level)))
+        assert gateway.audio_settings_dialog_open() is False
+        assert logs[0][1] == xbmc.LOGERROR
+
+
+
+class TestAddonInstalled:
+    def test_asks_system_has_addon(self, monkeypatch):
+        conditions = []
+        monkeypatch.setattr(xbmc, "getCondVisibility",
+                            lambda condition: conditions.append(condition)
+                            or True)
+        assert KodiGateway(log=_noop_log).addon_installed(
+            "script.plexmod") is True
+        assert conditions == ["System.HasAddon(script.plexmod)"]
+
+    def test_exception_answers_true_and_logs(self, monkeypatch):
+        logs = []
+
+        def boom(condition):
+            raise RuntimeError("gui gone")
+
+        monkeypatch.setattr(xbmc, "getCondVisibility", boom)
+        gateway = KodiGateway(log=lambda message, level=None: logs.append(
+            (message, level)))
+        assert gateway.addon_installed("script.plexmod") is True
+        assert logs[0][1] == xbmc.LOGERROR
+
+
 # --- window properties -------------------------------------------------------
 
 class TestWindowProperties:
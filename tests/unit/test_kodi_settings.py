@@ -1,7 +1,7 @@
 """Behavioral tests for aom.kodi.settings (Settings + OffsetTable).
 
 Kodi is faked via Kodistubs: ``xbmcaddon.Addon(...).getSettings()`` yields a
-stub ``Settings`` object whose ``getBool``/``getInt``/``setBool``/``setInt`` we
+stub ``Settings`` object whose ``getBool``/``getInt``/``getString``/``setBool``/``setInt`` we
 spy or monkeypatch per test. Log-sink calls are collected in a list of
 ``(message, level)`` tuples so assertions can pin both the message text and the
 Kodi log level. No fixtures beyond ``monkeypatch``.
@@ -10,6 +10,7 @@ Kodi log level. No fixtures beyond ``monkeypatch``.
 import xbmc
 
 from resources.lib.aom.kodi.settings import ADDON_ID, Settings, OffsetTable
+from resources.lib.aom.domain import formats
 from resources.lib.aom.domain.profile import StreamProfile
 
 
@@ -112,6 +113,163 @@ class TestTypedReads:
         settings._settings.getInt = _Spy(raises=ValueError())
         assert settings.get_int('missing') == 0
 
+    def test_get_string_normal_read_and_refresh(self):
+        settings, _ = _make_settings()
+        settings._settings.getString = _Spy(result='/mnt/fleet.json')
+        assert settings.get_string('fleet_overlay_path') == '/mnt/fleet.json'
+        settings._settings.getString = _Spy(result='')
+        assert settings.refresh() == frozenset(('fleet_overlay_path',))
+        assert settings.get_string('fleet_overlay_path') == ''
+
+    def test_get_string_exception_returns_default_and_warns(self):
+        settings, logs = _make_settings()
+        settings._settings.getString = _Spy(raises=RuntimeError("boom"))
+        assert settings.get_string('fleet_overlay_path') == ''
+        assert "Error getting string setting 'fleet_overlay_path'" \
+            in logs[0][0]
+
+
+# --- snapshot ------------------------------------------------------------------
+
+class TestSnapshot:
+    def test_repeat_reads_are_served_from_the_snapshot(self):
+        settings, _ = _make_settings()
+        spy = _Spy(result=True)
+        settings._settings.getBool = spy
+        assert settings.get_bool('enable_active_monitoring') is True
+        assert settings.get_bool('enable_active_monitoring') is True
+        assert spy.calls == [('enable_active_monitoring',)]
+        assert settings.kodi_reads == 1
+
+    def test_refresh_rereads_and_reports_the_changed_ids(self):
+        settings, _ = _make_settings()
+        settings._settings.getInt = _Spy(result=4)
+        settings._settings.getBool = _Spy(result=True)
+        assert settings.get_int('seek_back_resume_seconds') == 4
+        assert settings.get_bool('enable_notifications') is True
+        settings._settings.getInt = _Spy(result=9)
+        assert settings.get_int('seek_back_resume_seconds') == 4
+        assert settings.refresh() == frozenset(('seek_back_resume_seconds',))
+        assert settings.get_int('seek_back_resume_seconds') == 9
+        assert settings.refresh() == frozenset()
+
+    def test_refresh_reports_a_failed_reread_as_changed(self):
+        settings, _ = _make_settings()
+        settings._settings.getBool = _Spy(result=True)
+        assert settings.get_bool('enable_notifications') is True
+        settings._settings.getBool = _Spy(raises=RuntimeError("boom"))
+        assert settings.refresh() == frozenset(('enable_notifications',))
+        assert 'enable_notifications' not in settings._snapshot
+
+    def test_refresh_does_not_report_our_own_write(self):
+        settings, _ = _make_settings()
+        settings._settings.getBool = _Spy(result=False)
+        settings._settings.setBool = _Spy()
+        assert settings.store_boolean_if_changed('platform_hdr_full', True)
+        settings._settings.getBool = _Spy(result=True)   # the write landed
+        assert settings.refresh() == frozenset()
+
+    def test_failed_read_is_not_cached(self):
+        settings, _ = _make_settings()
+        settings._settings.getBool = _Spy(raises=RuntimeError("boom"))
+        assert settings.get_bool('enable_notifications') is False
+        settings._settings.getBool = _Spy(result=True)
+        assert settings.get_bool('enable_notifications') is True
+
+    def test_own_write_refreshes_the_snapshot(self):
+        settings, _ = _make_settings()
+        settings._settings.getInt = _Spy(result=100)
+        settings._settings.setInt = _Spy()
+        assert settings.get_int('dolbyvision_all_truehd') == 100
+        assert settings.store_integer_if_changed('dolbyvision_all_truehd',
+                                                 250) is True
+        settings._settings.getInt = _Spy(raises=AssertionError("no read"))
+        assert settings.get_int('dolbyvision_all_truehd') == 250
+
+    def test_failed_write_drops_the_entry(self):
+        settings, _ = _make_settings()
+        settings._settings.getInt = _Spy(result=100)
+        settings._settings.setInt = _Spy(raises=RuntimeError("no dice"))
+        assert settings.store_integer_if_changed('hdr10_all_eac3', 250) is False
+        settings._settings.getInt = _Spy(result=175)
+        assert settings.get_int('hdr10_all_eac3') == 175
+
+    def test_store_pre_read_bypasses_the_snapshot(self):
+        # A stale snapshot value equal to the target must not skip the write.
+        settings, _ = _make_settings()
+        settings._settings.getBool = _Spy(result=True)
+        assert settings.get_bool('platform_hdr_full') is True
+        settings._settings.getBool = _Spy(result=False)   # changed in Kodi
+        set_spy = _Spy()
+        settings._settings.setBool = set_spy
+        assert settings.store_boolean_if_changed('platform_hdr_full',
+                                                 True) is True
+        assert set_spy.calls == [('platform_hdr_full', True)]
+
+
+# --- own-write echoes -----------------------------------------------------------
+
+class TestOwnEchoes:
+    def _written(self, clock, *setting_ids):
+        """Settings over a dict store, ``setting_ids`` (default
+        platform_hdr_full) written True."""
+        logs = []
+        settings = Settings(log=lambda message, level=None: logs.append(
+            (message, level)), clock=lambda: clock[0])
+        store = {}
+        settings._settings.getBool = lambda key: store.get(key, False)
+        settings._settings.setBool = store.__setitem__
+        for setting_id in setting_ids or ('platform_hdr_full',):
+            assert settings.store_boolean_if_changed(setting_id, True)
+        return settings, store, logs
+
+    @staticmethod
+    def _save(settings):
+        """What the runtime does on a Kodi save."""
+        return settings.is_own_echo(settings.refresh())
+
+    def test_save_carrying_only_our_write_is_its_echo(self):
+        settings, _, logs = self._written([0.0])
+        assert self._save(settings) is True
+        assert settings.suppressed_echoes == 1
+        assert logs[-1][1] == xbmc.LOGDEBUG
+        assert self._save(settings) is False                # token spent
+
+    def test_user_change_in_the_window_gets_through(self):
+        settings, store, _ = self._written([0.0])
+        assert settings.get_bool('enable_notifications') is False
+        store['enable_notifications'] = True                # the user's save
+        assert self._save(settings) is False
+        assert self._save(settings) is False                # token spent
+        assert settings.suppressed_echoes == 0
+
+    def test_coalesced_writes_spend_every_token_on_their_one_save(self):
+        # Two writes, one Kodi save: the user's next save (touching only
+        # ids we never read, so an empty diff) is not taken for an echo.
+        settings, _, _ = self._written([0.0], 'platform_hdr_full',
+                                       'platform_hdr_hlg')
+        assert self._save(settings) is True
+        assert self._save(settings) is False
+        assert settings.suppressed_echoes == 1
+
+    def test_empty_save_without_our_write_is_not_an_echo(self):
+        settings, _, _ = self._written([0.0])
+        assert self._save(settings) is True
+        settings._echo_tokens.append((0.0, 'platform_hdr_full'))  # stray
+        assert self._save(settings) is False        # nothing of ours carried
+
+    def test_token_expires_unechoed(self):
+        clock = [0.0]
+        settings, _, _ = self._written(clock)
+        clock[0] = Settings.ECHO_WINDOW_SECONDS + 0.1
+        assert self._save(settings) is False
+
+    def test_skipped_write_leaves_no_token(self):
+        settings, _ = _make_settings()
+        settings._settings.getBool = _Spy(result=True)
+        assert settings.store_boolean_if_changed('platform_hdr_full', True)
+        assert self._save(settings) is False
+
 
 # --- store_*_if_changed ------------------------------------------------------
 
@@ -198,6 +356,34 @@ class TestStoreIntegerIfChanged:
         assert set_spy.calls == [('dolbyvision_all_truehd', 250)]
 
 
+class TestWriteInts:
+    def test_writes_every_value_without_pre_reads(self):
+        settings, logs = _make_settings()
+        settings._settings.getInt = _Spy(raises=AssertionError("no read"))
+        set_spy = _Spy()
+        settings._settings.setInt = set_spy
+        assert settings.write_ints({'hdr10_all_eac3': 50,
+                                    'sdr_default': -25}) is True
+        assert set_spy.calls == [('hdr10_all_eac3', 50), ('sdr_default', -25)]
+        assert settings.get_int('sdr_default') == -25
+        assert logs == []
+
+    def test_a_failed_write_is_reported_and_the_rest_written(self):
+        settings, logs = _make_settings()
+        writes = []
+
+        def set_int(setting_id, value):
+            if setting_id == 'hdr10_all_eac3':
+                raise RuntimeError("no dice")
+            writes.append(setting_id)
+
+        settings._settings.setInt = set_int
+        assert settings.write_ints({'hdr10_all_eac3': 50,
+                                    'sdr_all_ac3': 5}) is False
+        assert writes == ['sdr_all_ac3']
+        assert [level for _, level in logs] == [xbmc.LOGWARNING]
+
+
 # --- intent-level reads ------------------------------------------------------
 
 class TestIntentReads:
@@ -241,6 +427,30 @@ class TestIntentReads:
         assert settings.debug_logging_enabled() is True
         assert spy.calls == [('enable_debug_logging',)]
 
+    def test_shadow_detection_enabled(self):
+        settings, _ = _make_settings()
+        spy = self._spy_bool(settings)
+        assert settings.shadow_detection_enabled() is True
+        assert spy.calls == [('enable_shadow_detection',)]
+
+    def test_apply_verification_enabled(self):
+        settings, _ = _make_settings()
+        spy = self._spy_bool(settings)
+        assert settings.apply_verification_enabled() is True
+        assert spy.calls == [('enable_apply_verification',)]
+
+    def test_fleet_overlay_path_is_stripped(self):
+        settings, _ = _make_settings()
+        settings.get_string = _Spy(result=' /mnt/fleet.json ')
+        assert settings.fleet_overlay_path() == '/mnt/fleet.json'
+        assert settings.get_string.calls == [('fleet_overlay_path',)]
+
+    def test_phantom_window_clamps_negatives(self):
+        settings, _ = _make_settings()
+        settings.get_int = _Spy(result=-40)
+        assert settings.phantom_window_ms() == 0
+        assert settings.get_int.calls == [('platform_phantom_ms',)]
+
     def test_seek_back_config_maps_ids(self):
         settings, _ = _make_settings()
         settings.get_bool = _Spy(result=True)
@@ -269,15 +479,152 @@ class TestIntentReads:
 # --- OffsetTable -------------------------------------------------------------
 
 class TestOffsetTable:
-    def test_get_derives_setting_id_at_call_time(self):
+    def _table(self, stored):
+        """An OffsetTable over a dict-backed store (absent ids read 0)."""
+        settings, _ = _make_settings()
+        settings._settings.getInt = lambda key: stored.get(key, 0)
+        settings._settings.setInt = stored.__setitem__
+        return settings, OffsetTable(settings)
+
+    def test_get_indexes_the_cube_loaded_once(self):
+        settings, table = self._table({'hdr10_all_eac3': 175})
+        profile = _profile(hdr='hdr10', fps='all', audio='eac3')
+        assert table.get(profile) == 175
+        assert table.get(_profile()) == 0
+        assert settings.kodi_reads == len(formats.all_offset_keys())
+
+    def test_get_off_vocabulary_profile_reads_its_setting(self):
         settings, _ = _make_settings()
-        get_int = _Spy(result=175)
+        get_int = _Spy(result=30)
         settings.get_int = get_int
         table = OffsetTable(settings)
+        profile = _profile(hdr='unknown')
+        assert table.get(profile) == 30
+        assert get_int.calls == [('unknown_all_truehd',)]
+
+    def test_store_writes_through_to_the_cube(self):
+        stored = {}
+        settings, table = self._table(stored)
+        profile = _profile(hdr='sdr', fps=24, audio='ac3')
+        assert table.get(profile) == 0
+        assert table.store(profile, -250) is True
+        assert stored == {'sdr_24_ac3': -250}
+        reads = settings.kodi_reads
+        assert table.get(profile) == -250
+        assert settings.kodi_reads == reads
+
+    def test_reload_reports_the_changed_offsets(self):
+        stored = {'dolbyvision_all_truehd': 100}
+        _, table = self._table(stored)
+        assert table.reload() == frozenset()       # never loaded: no reads
+        assert table.get(_profile()) == 100
+        stored['dolbyvision_all_truehd'] = 125     # dialog edit
+        stored['hlg_50_pcm'] = -75
+        assert table.reload() == frozenset(('dolbyvision_all_truehd',
+                                            'hlg_50_pcm'))
+        assert table.get(_profile()) == 125
+        assert table.reload() == frozenset()
+
+    def test_staged_offset_survives_reload_until_stored(self):
+        stored = {'dolbyvision_all_truehd': 100}
+        _, table = self._table(stored)
+        profile = _profile()
+        table.stage(profile, -40)
+        assert table.get(profile) == -40           # read-your-writes
+        assert table.reload() == frozenset()       # staged: kept, unreported
+        assert table.get(profile) == -40
+        assert table.store(profile, -40) is True
+        stored['dolbyvision_all_truehd'] = 100     # a later dialog edit
+        assert table.reload() == frozenset(('dolbyvision_all_truehd',))
+        assert table.get(profile) == 100
+
+    def test_unstage_reads_kodi_again(self):
+        stored = {'hdr10_all_eac3': 175}
+        _, table = self._table(stored)
         profile = _profile(hdr='hdr10', fps='all', audio='eac3')
+        table.stage(profile, 0)
+        table.unstage(profile)
         assert table.get(profile) == 175
-        assert get_int.calls == [(profile.setting_id(),)]
-        assert get_int.calls == [('hdr10_all_eac3',)]
+        off_vocabulary = _profile(hdr='unknown')
+        table.stage(off_vocabulary, 30)
+        assert table.get(off_vocabulary) == 30
+        table.unstage(off_vocabulary)
+        assert table.get(off_vocabulary) == 0
+
+    def test_uncalibrated_bucket_resolves_through_the_chain(self):
+        stored = {'hdr10_all_eac3': 175, 'hdr10_24_eac3': -50,
+                  'hdr10_default': 40}
+        _, table = self._table(stored)
+        assert table.resolve(_profile('hdr10', 24, 'eac3')) == (-50, 'exact')
+        assert table.resolve(_profile('hdr10', 50, 'eac3')) == (175,
+                                                                'all_fps')
+        assert table.resolve(_profile('hdr10', 50, 'pcm')) == (
+            40, 'hdr_default')
+        assert table.resolve(_profile('sdr', 50, 'pcm')) == (0, 'unset')
+        assert table.get(_profile('hdr10', 50, 'eac3')) == 175
+        assert table.inherited(_profile('hdr10', 24, 'eac3')) == (175,
+                                                                  'all_fps')
+        assert table.inherited(_profile('sdr', 50, 'pcm')) == (0, 'unset')
+
+    def test_reload_reports_a_default_and_resolves_it_once(self):
+        stored = {}
+        settings, table = self._table(stored)
+        profile = _profile('sdr', 24, 'dca')
+        assert table.resolve(profile) == (0, 'unset')
+        stored['sdr_default'] = -25                # dialog edit
+        assert table.reload() == frozenset(('sdr_default',))
+        reads = settings.kodi_reads
+        assert table.resolve(profile) == (-25, 'hdr_default')
+        assert table.get(_profile('sdr', 'all', 'pcm')) == -25
+        assert settings.kodi_reads == reads        # the index, not Kodi
+
+    def test_staged_bucket_outranks_its_fallback(self):
+        _, table = self._table({'dolbyvision_all_truehd': 100})
+        profile = _profile(fps=24)
+        assert table.resolve(profile) == (100, 'all_fps')
+        table.stage(profile, -40)
+        assert table.resolve(profile) == (-40, 'exact')
+        table.unstage(profile)
+        assert table.resolve(profile) == (100, 'all_fps')
+
+    def test_overlay_overrides_the_stored_offsets(self):
+        stored = {'hdr10_all_eac3': 175, 'hdr10_24_eac3': -50}
+        _, table = self._table(stored)
+        assert table.set_overlay({'hdr10_all_eac3': 60,
+                                  'hdr10_default': 20}) == frozenset(
+            ('hdr10_all_eac3', 'hdr10_default'))
+        assert table.resolve(_profile('hdr10', 'all', 'eac3')) == (60, 'exact')
+        assert table.resolve(_profile('hdr10', 50, 'eac3')) == (60, 'all_fps')
+        assert table.resolve(_profile('hdr10', 24, 'eac3')) == (-50, 'exact')
+        assert table.get(_profile('hdr10', 50, 'pcm')) == 20
+        assert table.nonzero() == stored           # the stored cells
+        assert table.set_overlay({'hdr10_all_eac3': 60}) == frozenset(
+            ('hdr10_default',))
+        assert table.set_overlay({}) == frozenset(('hdr10_all_eac3',))
+        assert table.get(_profile('hdr10', 50, 'eac3')) == 175
+
+    def test_staged_offset_outranks_the_overlay(self):
+        _, table = self._table({})
+        profile = _profile()
+        table.set_overlay({'dolbyvision_all_truehd': 100,
+                           'unknown_all_truehd': 30})
+        table.stage(profile, -40)
+        assert table.get(profile) == -40
+        table.unstage(profile)
+        assert table.get(profile) == 100
+        assert table.get(_profile(hdr='unknown')) == 30
+
+    def test_bulk_queries(self):
+        _, table = self._table({'dolbyvision_all_truehd': 100,
+                                'dolbyvision_24_eac3': -50,
+                                'hdr10_all_eac3': 25})
+        dv = table.by_hdr('dolbyvision')
+        assert len(dv) == len(formats.FPS_KEYS) * len(formats.AUDIO_FORMATS)
+        assert dv['dolbyvision_24_eac3'] == -50
+        assert all(key.startswith('dolbyvision_') for key in dv)
+        assert table.nonzero() == {'dolbyvision_all_truehd': 100,
+                                   'dolbyvision_24_eac3': -50,
+                                   'hdr10_all_eac3': 25}
 
     def test_store_derives_setting_id_at_call_time(self):
         settings, _ = _make_settings()
@@ -0,0 +1,83 @@
+"""Unit tests for aom.kodi.monitor_bridge (under Kodistubs).
+
+The bridge posts SettingsSaved and decoded Player.* notifications; the
+payload decoder must never raise on what Kodi (or another addon) sends.
+"""
+
+import json
+
+import pytest
+
+from resources.lib.aom.app import events
+from resources.lib.aom.kodi.monitor_bridge import (MonitorBridge,
+                                                   parse_player_notification)
+
+
+class _PostRecorder:
+    def __init__(self):
+        self.posted = []
+
+    def post(self, event):
+        self.posted.append(event)
+
+
+def test_av_start_payload_is_decoded():
+    data = json.dumps({"item": {"id": 42, "type": "episode"},
+                       "player": {"playerid": 1, "speed": 1}})
+    assert parse_player_notification('Player.OnAVStart', data) == \
+        events.PlayerNotified(method='Player.OnAVStart', player_id=1,
+                              item_type='episode')
+
+
+def test_property_changed_payload_lists_the_properties():
+    data = json.dumps({"player": {"playerid": 1},
+                       "property": {"currentaudiostream": {"index": 1},
+                                    "audiostreams": []}})
+    event = parse_player_notification('Player.OnPropertyChanged', data)
+    assert event.properties == ('audiostreams', 'currentaudiostream')
+
+
+@pytest.mark.parametrize("data", [
+    '', 'not json', '[]', 'null',
+    json.dumps({"player": {"playerid": "1"}}),
+    json.dumps({"player": {"playerid": True}}),
+    json.dumps({"player": [], "item": "movie"}),
+])
+def test_malformed_payloads_decode_to_unknown(data):
+    event = parse_player_notification('Player.OnAVChange', data)
+    assert (event.player_id, event.item_type, event.properties) == \
+        (-1, '', ())
+
+
+def test_bridge_posts_only_player_notifications():
+    recorder = _PostRecorder()
+    bridge = MonitorBridge(recorder)
+    data = json.dumps({"player": {"playerid": 0}})
+    bridge.onNotification('xbmc', 'Player.OnPropertyChanged', data)
+    bridge.onNotification('xbmc', 'VideoLibrary.OnUpdate', data)
+    bridge.onNotification('xbmc', 'Player.OnPause', data)
+    bridge.onSettingsChanged()
+    assert recorder.posted == [
+        events.PlayerNotified(method='Player.OnPropertyChanged',
+                              player_id=0, item_type=''),
+        events.SettingsSaved(),
+    ]
+
+
+def test_player_notifications_from_another_sender_are_dropped():
+    recorder = _PostRecorder()
+    bridge = MonitorBridge(recorder)
+    data = json.dumps({"player": {"playerid": 1}})
+    bridge.onNotification('some.other.addon', 'Player.OnAVChange', data)
+    bridge.onNotification('script.audiooffsetmanager', 'Player.OnAVStart',
+                          data)
+    assert recorder.posted == []
+
+
+def test_bulk_edit_notification_is_one_settings_save():
+    recorder = _PostRecorder()
+    bridge = MonitorBridge(recorder)
+    bridge.onNotification('script.audiooffsetmanager',
+                          'Other.OffsetsBulkWritten', '{}')
+    bridge.onNotification('some.other.addon', 'Other.OffsetsBulkWritten', '')
+    assert recorder.posted == [events.SettingsSaved(bulk=True)]
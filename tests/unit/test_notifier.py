@@ -163,7 +163,7 @@ class TestImmediateApply:
     def test_non_provisional_clears_any_prior_pending(self, rig):
         profile = make_profile()
         session = rig.start(profile)
-        session.pending_notification = (profile.setting_id(), -999)
+        session.pending_notification = (profile.setting_id(), -999, 'exact')
 
         rig.post(events.OffsetApplied(session_id=session.session_id,
                                       profile=profile, ms=-50,
@@ -185,7 +185,8 @@ class TestDeferral:
         rig.post(events.OffsetApplied(session_id=session.session_id,
                                       profile=profile, ms=-75,
                                       provisional=True))
-        assert session.pending_notification == (profile.setting_id(), -75)
+        assert session.pending_notification == (
+            profile.setting_id(), -75, 'exact')
         assert rig.toasts == []
 
         # Detector marks STABLE, THEN posts StreamStabilized (queue order).
@@ -235,7 +236,8 @@ class TestDeferral:
         rig.post(events.StreamStabilized(session_id=session.session_id))
 
         assert rig.toasts == []
-        assert session.pending_notification == (profile.setting_id(), -75)
+        assert session.pending_notification == (
+            profile.setting_id(), -75, 'exact')
 
     def test_newest_pending_wins_across_provisional_applies(self, rig):
         # A provisional apply under A, then a profile change and a NEW
@@ -247,13 +249,15 @@ class TestDeferral:
         rig.post(events.OffsetApplied(session_id=session.session_id,
                                       profile=profile_a, ms=-75,
                                       provisional=True))
-        assert session.pending_notification == (profile_a.setting_id(), -75)
+        assert session.pending_notification == (
+            profile_a.setting_id(), -75, 'exact')
 
         session.profile = profile_b
         rig.post(events.OffsetApplied(session_id=session.session_id,
                                       profile=profile_b, ms=-40,
                                       provisional=True))
-        assert session.pending_notification == (profile_b.setting_id(), -40)
+        assert session.pending_notification == (
+            profile_b.setting_id(), -40, 'exact')
 
         rig.mark_stable(session)
         rig.post(events.StreamStabilized(session_id=session.session_id))
@@ -280,6 +284,17 @@ class TestUserOffsetSaved:
 
         assert rig.toasts == [("DV | TrueHD", DURATION_MS, "#32093: +60 ms")]
 
+    def test_refused_zero_toasts_the_offset_kept(self, rig):
+        profile = make_profile(hdr_type='dolbyvision', audio_format='truehd')
+        session = rig.start(profile)
+
+        rig.post(events.UserOffsetRefused(session_id=session.session_id,
+                                          profile=profile, ms=100,
+                                          level='all_fps'))
+
+        assert rig.toasts == [("DV | TrueHD | #32112", DURATION_MS,
+                               "#32123: +100 ms")]
+
 
 # ============================================================================
 # Stale / superseded session stamps are inert
@@ -313,7 +328,7 @@ class TestStaleSessions:
         profile = make_profile()
         session = rig.start(profile)
         dead_id = session.session_id
-        session.pending_notification = (profile.setting_id(), -50)
+        session.pending_notification = (profile.setting_id(), -50, 'exact')
         rig.post(events.PlaybackStopped())
 
         rig.post(events.StreamStabilized(session_id=dead_id))
@@ -519,7 +534,8 @@ class TestSettingsGate:
         rig.post(events.OffsetApplied(session_id=session.session_id,
                                       profile=profile, ms=-75,
                                       provisional=True))
-        assert session.pending_notification == (profile.setting_id(), -75)
+        assert session.pending_notification == (
+            profile.setting_id(), -75, 'exact')
         assert rig.toasts == []
 
         # Release still clears pending, still no toast.
@@ -529,6 +545,49 @@ class TestSettingsGate:
         assert rig.toasts == []
 
 
+class TestResolutionLevel:
+    """An offset the profile's own setting did not answer says which level
+    did, at the end of the summary; an exact offset says nothing."""
+
+    def test_all_fps_level_is_named_in_the_message(self, rig):
+        profile = make_profile(fps_type=24)
+        session = rig.start(profile)
+
+        rig.post(events.OffsetApplied(session_id=session.session_id,
+                                      profile=profile, ms=-75,
+                                      provisional=False, level='all_fps'))
+
+        assert rig.toasts == [("DV | 24.00 FPS | TrueHD | #32112",
+                               DURATION_MS, "#32092: -75 ms")]
+
+    def test_held_toast_keeps_its_level_through_release(self, rig):
+        profile = make_profile()
+        session = rig.start(profile)
+
+        rig.post(events.OffsetApplied(session_id=session.session_id,
+                                      profile=profile, ms=-75,
+                                      provisional=True, level='hdr_default'))
+        rig.mark_stable(session)
+        rig.post(events.StreamStabilized(session_id=session.session_id))
+
+        assert rig.toasts == [("DV | TrueHD | #32113", DURATION_MS,
+                               "#32092: -75 ms")]
+
+    def test_deferred_toast_keeps_its_level(self, rig):
+        profile = make_profile()
+        session = rig.start(profile)
+        rig.applied(session, profile, -50)
+
+        rig.advance(DURATION_S + 0.2)           # inside the fade guard
+        rig.post(events.OffsetApplied(session_id=session.session_id,
+                                      profile=profile, ms=-75,
+                                      provisional=False, level='all_fps'))
+        rig.advance(GUARD)
+
+        assert rig.toasts[1] == ("DV | TrueHD | #32112", DURATION_MS,
+                                 "#32092: -75 ms")
+
+
 class TestSignRendering:
 
     @pytest.mark.parametrize("ms, rendered", [
@@ -52,6 +52,10 @@ class Rig:
         self.dispatcher.post(event)
         self.dispatcher.run_pending()
 
+    def advance(self, seconds):
+        self.clock.advance(seconds)
+        self.dispatcher.run_pending()
+
     @property
     def session(self):
         return self.tracker.current
@@ -94,6 +98,7 @@ class TestApplyPath:
         assert announced.ms == -125
         assert announced.provisional is True       # not yet STABLE
         assert announced.user_initiated is False   # automatic: never seeks
+        assert announced.level == 'exact'
         assert rig.logged('session#1')             # describe() snapshot line
 
     def test_stable_session_announces_non_provisional(self, rig):
@@ -179,6 +184,200 @@ class TestApplyPath:
         assert session.applied == ('dolbyvision_all_truehd', 0)
 
 
+class TestRetryChain:
+
+    @staticmethod
+    def failing_then(rig, failures):
+        """Fail the first ``failures`` RPCs, then delegate to the fake."""
+        calls = []
+        original = rig.gateway.set_audio_delay
+
+        def scripted(player_id, delay_seconds):
+            calls.append(rig.clock())
+            if len(calls) <= failures:
+                return False
+            return original(player_id, delay_seconds)
+
+        rig.gateway.set_audio_delay = scripted
+        return calls
+
+    def test_failed_rpc_retries_with_bounded_backoff(self, rig):
+        rig.settings.apply_verification = False
+        session = rig.start(make_profile())
+        calls = self.failing_then(rig, failures=99)
+
+        rig.profile_changed()
+        for delay in (0.5, 1.0, 2.0, 4.0, 8.0):     # each retry exactly due
+            rig.advance(delay)
+        rig.advance(OffsetApplier.RETRY_MAX_SECONDS)
+
+        assert calls == [0.0, 0.5, 1.5, 3.5, 7.5, 15.5]
+        assert len(calls) == 1 + OffsetApplier.MAX_RETRIES
+        assert session.applied is None
+        assert rig.announced == []
+        assert any('giving up' in m for m in rig.warnings)
+        assert rig.dispatcher._timers == []
+
+    def test_failed_predicted_apply_retries_the_prediction(self, rig):
+        # No adopted profile to re-derive from: the retry carries it.
+        rig.settings.apply_verification = False
+        rig.post(events.PlaybackStarted())
+        predicted = make_profile()
+        rig.offsets.offsets[predicted.setting_id()] = -125
+        calls = self.failing_then(rig, failures=1)
+
+        rig.post(events.ProfilePredicted(
+            session_id=rig.session.session_id, profile=predicted))
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)
+
+        assert len(calls) == 2
+        assert rig.gateway.applied == [(1, -0.125)]
+        assert rig.session.applied == ('dolbyvision_all_truehd', -125)
+        assert rig.logged('predicted=True')
+
+    def test_adopted_profile_wins_over_a_retried_prediction(self, rig):
+        rig.settings.apply_verification = False
+        rig.post(events.PlaybackStarted())
+        predicted = make_profile(audio_format='eac3')
+        rig.offsets.offsets[predicted.setting_id()] = -50
+        self.failing_then(rig, failures=1)
+        rig.post(events.ProfilePredicted(
+            session_id=rig.session.session_id, profile=predicted))
+
+        rig.session.profile = make_profile()        # detector adopts
+        rig.offsets.offsets['dolbyvision_all_truehd'] = -125
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)
+
+        assert rig.gateway.applied == [(1, -0.125)]
+
+    def test_retry_applies_and_keeps_the_user_initiated_stamp(self, rig):
+        profile = make_profile()
+        session = rig.start(profile, offset_ms=-125)
+        session.mark_stable()
+        rig.profile_changed()
+        calls = self.failing_then(rig, failures=1)
+
+        rig.offsets.offsets[profile.setting_id()] = -150   # dialog edit
+        rig.post(events.SettingsChanged())
+        assert len(rig.announced) == 1
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)
+
+        assert len(calls) == 2
+        assert session.applied == ('dolbyvision_all_truehd', -150)
+        assert rig.announced[-1].ms == -150
+        assert rig.announced[-1].user_initiated is True
+
+    def test_retry_records_applied_before_the_rpc(self, rig):
+        session = rig.start(make_profile(), offset_ms=-75)
+        seen = []
+
+        def failing_once(player_id, delay_seconds):
+            seen.append(session.applied)
+            return len(seen) > 1
+
+        rig.gateway.set_audio_delay = failing_once
+        rig.profile_changed()
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)
+
+        assert seen == [('dolbyvision_all_truehd', -75)] * 2
+
+    def test_playback_stop_cancels_the_chain(self, rig):
+        rig.start(make_profile())
+        calls = self.failing_then(rig, failures=99)
+        rig.profile_changed()
+
+        rig.post(events.PlaybackStopped())
+        rig.advance(OffsetApplier.RETRY_MAX_SECONDS)
+
+        assert len(calls) == 1
+        assert rig.dispatcher._timers == []
+
+    def test_pending_manual_adjustment_drops_the_retry(self, rig):
+        session = rig.start(make_profile())
+        calls = self.failing_then(rig, failures=99)
+        rig.profile_changed()
+
+        session.watch_pending = (-40, rig.clock())
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)
+
+        assert len(calls) == 1
+        assert rig.logged('dropping the apply retry')
+
+
+class TestReadBack:
+
+    DELAY = 'Player.AudioDelay'
+
+    def test_value_that_landed_is_verified_once(self, rig):
+        rig.start(make_profile(), offset_ms=-125)
+        rig.gateway.infolabels[self.DELAY] = '-0.125 s'
+        rig.profile_changed()
+
+        rig.advance(OffsetApplier.VERIFY_DELAY_SECONDS)
+
+        assert rig.logged('Verified -125ms')
+        assert len(rig.gateway.applied) == 1
+        assert rig.dispatcher._timers == []
+
+    def test_value_that_did_not_land_is_resent_without_announcing(self, rig):
+        session = rig.start(make_profile(), offset_ms=-125)
+        rig.gateway.infolabels[self.DELAY] = '0.000 s'     # player ignored it
+        rig.profile_changed()
+
+        rig.advance(OffsetApplier.VERIFY_DELAY_SECONDS)
+        assert any('player reports 0ms' in m for m in rig.warnings)
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)      # the repair
+
+        assert rig.gateway.applied == [(1, -0.125), (1, -0.125)]
+        assert session.applied == ('dolbyvision_all_truehd', -125)
+        assert len(rig.announced) == 1
+
+        rig.gateway.infolabels[self.DELAY] = '-0.125 s'
+        rig.advance(OffsetApplier.VERIFY_DELAY_SECONDS)
+        assert rig.logged('Verified -125ms')
+        assert rig.dispatcher._timers == []
+
+    def test_user_adjustment_before_the_read_back_is_left_alone(self, rig):
+        # The user dials between the apply and the verify, before the
+        # watcher's tick has seen it (nothing pending yet).
+        session = rig.start(make_profile(), offset_ms=-125)
+        session.watch_baseline_ms = 0                      # player was at 0
+        rig.profile_changed()
+        rig.gateway.infolabels[self.DELAY] = '-0.050 s'    # the user's value
+
+        rig.advance(OffsetApplier.VERIFY_DELAY_SECONDS)
+
+        assert rig.gateway.applied == [(1, -0.125)]
+        assert rig.logged('leaving the manual adjustment')
+        assert rig.warnings == []
+        assert rig.dispatcher._timers == []
+
+    def test_baseline_still_showing_is_repaired(self, rig):
+        session = rig.start(make_profile(), offset_ms=-125)
+        session.watch_baseline_ms = -40
+        rig.profile_changed()
+        rig.gateway.infolabels[self.DELAY] = '-0.040 s'    # did not land
+
+        rig.advance(OffsetApplier.VERIFY_DELAY_SECONDS)
+        rig.advance(OffsetApplier.RETRY_BASE_SECONDS)
+
+        assert rig.gateway.applied == [(1, -0.125), (1, -0.125)]
+
+    def test_disabled_or_unreadable_read_back_sends_nothing_more(self, rig):
+        rig.settings.apply_verification = False
+        rig.start(make_profile())
+        rig.profile_changed()
+        assert rig.dispatcher._timers == []
+
+        rig.settings.apply_verification = True
+        rig.offsets.offsets['dolbyvision_all_truehd'] = -150
+        rig.post(events.StreamStabilized(session_id=rig.session.session_id))
+        rig.advance(OffsetApplier.VERIFY_DELAY_SECONDS)   # infolabel is ''
+
+        assert rig.logged('not verified')
+        assert len(rig.gateway.applied) == 2
+
+
 class TestSettingsChangedTrigger:
 
     def test_dialog_edit_applies_immediately(self, rig):
@@ -211,6 +410,45 @@ class TestSettingsChangedTrigger:
         assert len(rig.announced) == 1
         assert rig.logged('skipping duplicate apply')
 
+    def test_save_touching_nothing_we_read_skips_without_rpc(self, rig):
+        profile = make_profile()
+        rig.start(profile, offset_ms=-125)
+        rig.profile_changed()
+
+        rig.gateway.player_id = -1       # an RPC would now skip with a log
+        rig.offsets.offsets[profile.setting_id()] = -150
+        rig.post(events.SettingsChanged(
+            changed=frozenset(('platform_hdr_full', 'hdr10_all_eac3'))))
+
+        assert len(rig.gateway.applied) == 1
+        assert not rig.logged('skipping duplicate apply')
+
+    def test_save_of_the_current_offset_applies(self, rig):
+        profile = make_profile()
+        rig.start(profile, offset_ms=-125)
+        rig.profile_changed()
+
+        rig.offsets.offsets[profile.setting_id()] = -150
+        rig.post(events.SettingsChanged(
+            changed=frozenset((profile.setting_id(),))))
+
+        assert rig.gateway.applied[-1] == (1, -0.150)
+
+    def test_save_of_the_all_fps_row_reapplies_a_bucket_resolving_to_it(
+            self, rig):
+        profile = make_profile(fps_type=24)
+        rig.start(profile, offset_ms=-125)
+        rig.profile_changed()
+
+        rig.offsets.offsets[profile.setting_id()] = -150
+        rig.offsets.levels[profile.setting_id()] = 'all_fps'
+        rig.post(events.SettingsChanged(
+            changed=frozenset(('dolbyvision_all_truehd',))))
+
+        assert rig.gateway.applied[-1] == (1, -0.150)
+        assert rig.announced[-1].level == 'all_fps'
+        assert rig.logged('level=all_fps')
+
     def test_no_session_is_a_no_op(self, rig):
         rig.post(events.SettingsChanged())
         assert rig.gateway.applied == []
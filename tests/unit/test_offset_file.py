@@ -0,0 +1,39 @@
+"""Unit tests for aom.domain.offset_file (the offset file format)."""
+
+import json
+
+import pytest
+
+from resources.lib.aom.domain.offset_file import (FORMAT_VERSION,
+                                                  format_offsets,
+                                                  parse_offsets)
+
+
+def test_round_trip_is_sorted_and_compact():
+    text = format_offsets({'sdr_all_ac3': -25, 'hdr10_all_eac3': 50})
+    assert text == ('{"version":%d,"offsets":{"hdr10_all_eac3":50,'
+                    '"sdr_all_ac3":-25}}' % FORMAT_VERSION)
+    assert parse_offsets(text) == {'hdr10_all_eac3': 50, 'sdr_all_ac3': -25}
+
+
+def test_parse_keeps_calibrated_in_range_ints_only():
+    text = json.dumps({'version': 1, 'offsets': {
+        'hdr10_all_eac3': 50, 'sdr_all_ac3': 0, 'hlg_all_pcm': 'x',
+        'sdr_24_dca': True, 'hdr10_all_ac3': 20000,
+        'sdr_all_truehd_atmos': -25}})
+    # Unknown ids survive: a newer axis must round-trip through this build.
+    assert parse_offsets(text) == {'hdr10_all_eac3': 50,
+                                   'sdr_all_truehd_atmos': -25}
+
+
+def test_parse_keeps_explicit_zeros_on_request():
+    text = json.dumps({'version': 1, 'offsets': {
+        'hdr10_all_eac3': 0, 'sdr_all_ac3': 25, 'hlg_all_pcm': 20000}})
+    assert parse_offsets(text, keep_zeros=True) == {'hdr10_all_eac3': 0,
+                                                    'sdr_all_ac3': 25}
+
+
+@pytest.mark.parametrize('text', ['', '[]', '{"offsets": []}', '{'])
+def test_parse_rejects_malformed_documents(text):
+    with pytest.raises(ValueError):
+        parse_offsets(text)
@@ -0,0 +1,128 @@
+"""Behavioral tests for aom.kodi.offset_overlay (OffsetOverlay).
+
+The overlay is file-backed, so every test points it at a ``tmp_path`` file;
+Kodistubs' ``translatePath`` answers '' and is replaced by the identity.
+Log-sink calls are collected as ``(message, level)`` tuples like the
+settings suite. The last test layers the overlay over a real OffsetTable.
+"""
+
+import os
+
+import pytest
+import xbmc
+import xbmcvfs
+
+from resources.lib.aom.domain.offset_file import format_offsets
+from resources.lib.aom.domain.profile import StreamProfile
+from resources.lib.aom.kodi.offset_overlay import OffsetOverlay
+from resources.lib.aom.kodi.settings import OffsetTable
+
+
+@pytest.fixture(autouse=True)
+def local_paths(monkeypatch):
+    monkeypatch.setattr(xbmcvfs, 'translatePath', lambda path: path)
+
+
+def _overlay():
+    logs = []
+    overlay = OffsetOverlay(
+        log=lambda message, level=None: logs.append((message, level)))
+    return overlay, logs
+
+
+def _write(path, offsets, mtime_ns=None):
+    path.write_text(format_offsets(offsets), encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(str(path), ns=(mtime_ns, mtime_ns))
+
+
+def test_first_check_loads_the_file(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'hdr10_all_eac3': 50})
+    overlay, logs = _overlay()
+    assert overlay.check(str(path)) == {'hdr10_all_eac3': 50}
+    assert overlay.file_loads == 1
+    assert logs[-1][1] == xbmc.LOGINFO
+
+
+def test_unchanged_file_is_not_reparsed(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'hdr10_all_eac3': 50}, mtime_ns=1_000_000_000)
+    overlay, _ = _overlay()
+    overlay.check(str(path))
+    assert overlay.check(str(path)) is None
+    assert overlay.file_loads == 1
+
+
+def test_changed_mtime_or_size_reloads(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'hdr10_all_eac3': 50}, mtime_ns=1_000_000_000)
+    overlay, _ = _overlay()
+    overlay.check(str(path))
+    _write(path, {'hdr10_all_eac3': 75}, mtime_ns=2_000_000_000)   # same size
+    assert overlay.check(str(path)) == {'hdr10_all_eac3': 75}
+    _write(path, {'hdr10_all_eac3': 750}, mtime_ns=2_000_000_000)  # same mtime
+    assert overlay.check(str(path)) == {'hdr10_all_eac3': 750}
+    assert overlay.file_loads == 3
+
+
+def test_empty_path_and_missing_file_are_an_empty_overlay(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'hdr10_all_eac3': 50})
+    overlay, _ = _overlay()
+    overlay.check(str(path))
+    assert overlay.check('') == {}
+    assert overlay.check('') is None
+    assert overlay.check(str(path)) == {'hdr10_all_eac3': 50}
+    path.unlink()
+    assert overlay.check(str(path)) == {}               # rolled back
+
+
+def test_malformed_file_keeps_the_overlay_and_is_parsed_once(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'hdr10_all_eac3': 50})
+    overlay, logs = _overlay()
+    overlay.check(str(path))
+    path.write_text('{"version": 1, "offs', encoding='utf-8')
+    assert overlay.check(str(path)) is None
+    assert overlay.check(str(path)) is None
+    assert [level for _, level in logs].count(xbmc.LOGWARNING) == 1
+
+
+def test_overlay_over_the_table(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'sdr_all_ac3': 40, 'sdr_default': 15})
+    overlay, _ = _overlay()
+
+    class _Stored:
+        def read_ints(self, setting_ids, default=0):
+            return [-25 if setting_id == 'sdr_all_ac3' else default
+                    for setting_id in setting_ids]
+
+    table = OffsetTable(_Stored())
+    profile = StreamProfile(hdr_type='sdr', fps_type='all', audio_format='ac3',
+                            video_fps=24, player_id=1, audio_channels=6)
+    assert table.get(profile) == -25
+    assert table.set_overlay(overlay.check(str(path))) == frozenset(
+        ('sdr_all_ac3', 'sdr_default'))
+    assert table.get(profile) == 40
+
+
+def test_explicit_zero_replaces_a_local_calibration(tmp_path):
+    path = tmp_path / 'fleet.json'
+    _write(path, {'sdr_all_ac3': 0})
+    overlay, _ = _overlay()
+
+    class _Stored:
+        def read_ints(self, setting_ids, default=0):
+            return [-25 if setting_id == 'sdr_all_ac3' else default
+                    for setting_id in setting_ids]
+
+    table = OffsetTable(_Stored())
+    profile = StreamProfile(hdr_type='sdr', fps_type='all', audio_format='ac3',
+                            video_fps=24, player_id=1, audio_channels=6)
+    assert overlay.check(str(path)) == {'sdr_all_ac3': 0}
+    assert table.set_overlay({'sdr_all_ac3': 0}) == frozenset(
+        ('sdr_all_ac3',))
+    assert table.get(profile) == 0
+    assert table.nonzero() == {'sdr_all_ac3': -25}   # the stored cell
@@ -0,0 +1,145 @@
+"""Behavioral tests for aom.kodi.offset_store (SparseOffsetStore).
+
+The store is file-backed, so every test points it at a ``tmp_path`` file;
+log-sink calls are collected as ``(message, level)`` tuples like the
+settings suite. The OffsetTable tests at the end run the real table over
+the store: the store answers the same calls ``Settings`` does.
+"""
+
+import os
+
+import xbmc
+
+from resources.lib.aom.domain import formats
+from resources.lib.aom.domain.profile import StreamProfile
+from resources.lib.aom.domain.offset_file import format_offsets, parse_offsets
+from resources.lib.aom.kodi.offset_store import SparseOffsetStore
+from resources.lib.aom.kodi.settings import OffsetTable
+
+
+def _store(tmp_path, offsets=None):
+    logs = []
+    path = tmp_path / 'addon_data' / 'offsets.json'
+    if offsets is not None:
+        path.parent.mkdir()
+        path.write_text(format_offsets(offsets), encoding='utf-8')
+    store = SparseOffsetStore(
+        str(path), log=lambda message, level=None: logs.append((message,
+                                                                 level)))
+    return store, path, logs
+
+
+def _profile(hdr='dolbyvision', fps='all', audio='truehd'):
+    return StreamProfile(hdr_type=hdr, fps_type=fps, audio_format=audio,
+                         video_fps=24, player_id=1, audio_channels=8)
+
+
+class _Settings:
+    """A settings-store double exposing only the bulk read migration uses."""
+
+    def __init__(self, offsets):
+        self.offsets = offsets
+
+    def read_ints(self, setting_ids, default=0):
+        return [self.offsets.get(setting_id, default)
+                for setting_id in setting_ids]
+
+
+def test_absent_ids_resolve_to_zero(tmp_path):
+    store, _, _ = _store(tmp_path, {'hdr10_all_eac3': 50})
+    assert store.get_int('hdr10_all_eac3') == 50
+    assert store.get_int('sdr_all_ac3') == 0
+    assert store.read_ints(['sdr_all_ac3', 'hdr10_all_eac3']) == [0, 50]
+
+
+def test_missing_file_is_an_empty_store(tmp_path):
+    store, _, logs = _store(tmp_path)
+    assert not store.exists()
+    assert store.get_int('hdr10_all_eac3') == 0
+    assert logs == []
+
+
+def test_store_writes_only_calibrated_entries(tmp_path):
+    store, path, logs = _store(tmp_path)
+    assert store.store_integer_if_changed('hdr10_all_eac3', 50) is True
+    assert store.store_integer_if_changed('sdr_all_ac3', -25) is True
+    assert store.store_integer_if_changed('sdr_all_ac3', 0) is True
+    assert parse_offsets(path.read_text(encoding='utf-8')) == {
+        'hdr10_all_eac3': 50}
+    assert ('AOM_OffsetStore: Storing hdr10_all_eac3: 50',
+            xbmc.LOGDEBUG) in logs
+    assert not os.path.exists(str(path) + '.tmp')
+
+
+def test_unchanged_store_skips_the_write(tmp_path):
+    store, path, _ = _store(tmp_path, {'hdr10_all_eac3': 50})
+    before = path.stat().st_mtime_ns
+    assert store.store_integer_if_changed('hdr10_all_eac3', 50) is True
+    assert store.store_integer_if_changed('sdr_all_ac3', 0) is True
+    assert path.stat().st_mtime_ns == before
+
+
+def test_failed_write_reports_false_and_keeps_the_value(tmp_path):
+    store, _, logs = _store(tmp_path)
+    store._path = str(tmp_path / 'missing' / 'dir' / 'is' / 'a' / 'file')
+    (tmp_path / 'missing').write_text('', encoding='utf-8')   # blocks mkdir
+    assert store.store_integer_if_changed('hdr10_all_eac3', 50) is False
+    assert store.get_int('hdr10_all_eac3') == 0
+    assert any(level == xbmc.LOGWARNING for _, level in logs)
+
+
+def test_bulk_write_is_one_file_write(tmp_path):
+    store, path, _ = _store(tmp_path, {'hdr10_all_eac3': 50,
+                                       'sdr_all_ac3': 5})
+    assert store.write_ints({'hdr10_all_eac3': 75, 'sdr_all_ac3': 0,
+                             'hlg_default': -25}) is True
+    assert parse_offsets(path.read_text(encoding='utf-8')) == {
+        'hdr10_all_eac3': 75, 'hlg_default': -25}
+    before = path.stat().st_mtime_ns
+    assert store.write_ints({'hdr10_all_eac3': 75}) is True   # no change
+    assert path.stat().st_mtime_ns == before
+
+
+def test_external_edit_is_picked_up(tmp_path):
+    store, path, _ = _store(tmp_path, {'hdr10_all_eac3': 50})
+    assert store.get_int('hdr10_all_eac3') == 50
+    path.write_text(format_offsets({'hdr10_all_eac3': 75, 'sdr_all_ac3': 5}),
+                    encoding='utf-8')
+    assert store.read_ints(['hdr10_all_eac3', 'sdr_all_ac3']) == [75, 5]
+    assert store.file_loads == 2
+
+
+def test_unreadable_file_keeps_the_held_offsets(tmp_path):
+    store, path, logs = _store(tmp_path, {'hdr10_all_eac3': 50})
+    assert store.get_int('hdr10_all_eac3') == 50
+    path.write_text('{"version": 1, "offs', encoding='utf-8')
+    assert store.get_int('hdr10_all_eac3') == 50
+    assert any('Error reading' in message for message, _ in logs)
+
+
+def test_migration_is_lossless_and_runs_once(tmp_path):
+    store, path, _ = _store(tmp_path)
+    settings = _Settings({'dolbyvision_all_truehd': -125,
+                          'hlg_50_pcm': 30, 'sdr_default': 15})
+    assert store.migrate_from(settings) == 3
+    for setting_id in formats.all_offset_keys():
+        assert store.get_int(setting_id) == settings.offsets.get(setting_id, 0)
+    settings.offsets['sdr_all_ac3'] = 10
+    assert store.migrate_from(settings) is None         # file exists now
+    assert store.get_int('sdr_all_ac3') == 0
+    assert path.exists()
+
+
+def test_offset_table_over_the_store(tmp_path):
+    store, path, _ = _store(tmp_path, {'dolbyvision_all_truehd': -125})
+    table = OffsetTable(store)
+    assert table.get(_profile()) == -125
+    assert table.store(_profile(hdr='sdr', audio='ac3'), 40) is True
+    assert parse_offsets(path.read_text(encoding='utf-8')) == {
+        'dolbyvision_all_truehd': -125, 'sdr_all_ac3': 40}
+    path.write_text(format_offsets({'dolbyvision_all_truehd': -100,
+                                    'sdr_all_ac3': 40, 'hlg_all_pcm': 5}),
+                    encoding='utf-8')
+    assert table.reload() == frozenset(('dolbyvision_all_truehd',
+                                        'hlg_all_pcm'))
+    assert table.get(_profile()) == -100
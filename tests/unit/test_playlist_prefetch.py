@@ -0,0 +1,154 @@
+"""Unit tests for aom.app.playlist_prefetch and the applier's prediction edge.
+
+Assembled like test_session_flow: tracker -> detector -> applier ->
+prefetcher on fakes, FakeClock plus run_pending() pumping. The scripted
+gateway plays item 0 of playlist 1; ``playlist_items`` holds the library
+stream details of the items after it.
+"""
+
+from resources.lib.aom.app import events
+from resources.lib.aom.app.dispatcher import Dispatcher
+from resources.lib.aom.app.offset_applier import OffsetApplier
+from resources.lib.aom.app.playlist_prefetch import PlaylistPrefetcher
+from resources.lib.aom.app.session import SessionTracker
+from resources.lib.aom.app.stream_detector import (INFOLABEL_FPS,
+                                                   INFOLABEL_HDR,
+                                                   StreamDetector)
+from tests.fakes import (FakeClock, FakeFacade, FakeGateway,
+                         FakeOffsetTable)
+
+
+class Rig:
+
+    def __init__(self):
+        self.clock = FakeClock()
+        self.errors = []
+        self.debug = []
+        self.dispatcher = Dispatcher(clock=self.clock,
+                                     log_error=self.errors.append)
+        self.tracker = SessionTracker(self.dispatcher, clock=self.clock)
+        self.gateway = FakeGateway(infolabels={
+            INFOLABEL_FPS: '23.976',
+            INFOLABEL_HDR: 'dolbyvision',
+        })
+        self.gateway.playlist = (1, 0)
+        self.gateway.playlist_items = {1: ('truehd', 8, 'dolbyvision')}
+        self.facade = FakeFacade()
+        self.offsets = FakeOffsetTable()
+        self.offsets.offsets.update({'dolbyvision_all_truehd': 100,
+                                     'dolbyvision_all_eac3': 50})
+        self.detector = StreamDetector(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            log_debug=self.debug.append, log_warning=self.debug.append,
+            rng=lambda: 0.5)
+        self.applier = OffsetApplier(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            self.offsets, log_debug=self.debug.append,
+            log_warning=self.debug.append)
+        self.prefetcher = PlaylistPrefetcher(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            clock=self.clock, log_debug=self.debug.append)
+        self.predicted = []
+        self.dispatcher.subscribe(events.ProfilePredicted,
+                                  self.predicted.append)
+
+    def post(self, event):
+        self.dispatcher.post(event)
+        self.dispatcher.run_pending()
+
+    def advance(self, seconds):
+        self.clock.advance(seconds)
+        self.dispatcher.run_pending()
+
+    def play_first_item(self):
+        """Start, stabilize, and run the look-ahead for item 0."""
+        self.post(events.PlaybackStarted())
+        self.advance(StreamDetector.VERIFY_WINDOW_SECONDS)
+        self.advance(PlaylistPrefetcher.PREFETCH_DELAY_SECONDS)
+
+    def advance_to_next_item(self, codec):
+        """Item 0 ends; item 1 starts with ``codec`` still negotiating."""
+        self.post(events.PlaybackEnded())
+        self.gateway.codec = codec
+        self.gateway.playlist = (1, 1)
+        self.advance(1.0)
+        self.post(events.PlaybackStarted())
+
+
+def test_look_ahead_predicts_the_next_item():
+    rig = Rig()
+    rig.play_first_item()
+    assert rig.prefetcher._prediction.setting_id() == 'dolbyvision_all_truehd'
+    assert rig.errors == []
+
+
+def test_slow_discovery_starts_with_the_predicted_offset():
+    rig = Rig()
+    rig.play_first_item()
+    rig.gateway.applied.clear()
+    rig.offsets.offsets['dolbyvision_all_truehd'] = 125
+
+    rig.advance_to_next_item(codec='none')
+    assert len(rig.predicted) == 1
+    assert rig.tracker.current.profile is None       # never the session's
+    assert rig.gateway.applied == [(1, 0.125)]       # read at apply time
+
+    rig.gateway.codec = 'truehd'
+    rig.advance(StreamDetector.PROBE_SPACING_SECONDS)
+    assert rig.tracker.current.profile is not None
+    assert rig.gateway.applied == [(1, 0.125)]       # confirmed: deduped
+
+
+def test_wrong_prediction_is_corrected_by_detection():
+    rig = Rig()
+    rig.play_first_item()
+    rig.gateway.applied.clear()
+
+    rig.advance_to_next_item(codec='none')
+    rig.gateway.codec = 'eac3'
+    rig.advance(StreamDetector.PROBE_SPACING_SECONDS)
+    assert rig.gateway.applied == [(1, 0.1), (1, 0.05)]
+    assert rig.tracker.current.applied == ('dolbyvision_all_eac3', 50)
+
+
+def test_stream_complete_at_start_ignores_the_prediction():
+    rig = Rig()
+    rig.play_first_item()
+    rig.gateway.applied.clear()
+    rig.offsets.offsets['dolbyvision_all_truehd'] = 125
+
+    rig.advance_to_next_item(codec='truehd')
+    assert len(rig.predicted) == 1
+    assert rig.gateway.applied == [(1, 0.125)]       # the detector's apply
+
+
+def test_stop_discards_the_prediction():
+    rig = Rig()
+    rig.play_first_item()
+    rig.post(events.PlaybackStopped())
+    rig.post(events.PlaybackStarted())
+    assert rig.predicted == []
+
+
+def test_prediction_expires():
+    rig = Rig()
+    rig.play_first_item()
+    rig.post(events.PlaybackEnded())
+    rig.advance(PlaylistPrefetcher.PREDICTION_TTL_SECONDS + 1.0)
+    rig.post(events.PlaybackStarted())
+    assert rig.predicted == []
+
+
+def test_fps_override_makes_the_next_item_unpredictable():
+    rig = Rig()
+    rig.facade.fps_override = True
+    rig.play_first_item()
+    assert rig.prefetcher._prediction is None
+    assert any('not predictable' in line for line in rig.debug)
+
+
+def test_last_item_has_nothing_to_predict():
+    rig = Rig()
+    rig.gateway.playlist_items = {}
+    rig.play_first_item()
+    assert rig.prefetcher._prediction is None
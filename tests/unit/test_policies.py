@@ -103,3 +103,35 @@ def test_should_apply_unknown_format():
 def test_should_apply_hdr_disabled():
     assert policies.should_apply(make_profile(),
                                  hdr_enabled=False) == (False, "hdr_disabled")
+
+
+# --- save_touches ------------------------------------------------------------
+
+def test_save_touches_an_undiffed_save_touches_everything():
+    assert policies.save_touches(None, 'enable_debug_logging') is True
+
+
+def test_save_touches_matches_any_listed_id():
+    changed = frozenset(('hdr10_all_eac3', 'platform_hdr_full'))
+    assert policies.save_touches(changed, 'enable_hdr10',
+                                 'hdr10_all_eac3') is True
+    assert policies.save_touches(changed, 'enable_hdr10') is False
+    assert policies.save_touches(frozenset(), 'enable_hdr10') is False
+
+
+# --- phantom_bound -----------------------------------------------------------
+
+def test_phantom_bound_rises_to_a_longer_sample_at_once():
+    assert policies.phantom_bound(500, 1250, decay=8) == 1250
+
+
+def test_phantom_bound_decays_slowly_toward_shorter_samples():
+    assert policies.phantom_bound(2000, 400, decay=8) == 1800
+    assert policies.phantom_bound(450, 400, decay=8) == 444
+
+
+# --- retry_delay -------------------------------------------------------------
+
+def test_retry_delay_doubles_per_attempt_up_to_the_cap():
+    assert [policies.retry_delay(attempt, 0.5, 8.0)
+            for attempt in range(7)] == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
@@ -0,0 +1,71 @@
+"""Unit tests for aom.domain.resolution (the offset resolution index)."""
+
+import pytest
+
+from resources.lib.aom.domain import formats, resolution
+from resources.lib.aom.domain.profile import StreamProfile
+
+KEYS = formats.all_setting_keys()
+
+
+def _index(stored, defaults=None):
+    cube = [stored.get(key, 0) for key in KEYS]
+    defaults = defaults or {}
+    return resolution.build_index(
+        cube, [defaults.get(hdr, 0) for hdr in formats.HDR_TYPES])
+
+
+def _at(index, setting_id):
+    values, levels = index
+    cell = KEYS.index(setting_id)
+    return values[cell], resolution.LEVELS[levels[cell]]
+
+
+def test_precedence_exact_then_all_fps_then_hdr_default():
+    index = _index({'hdr10_24_eac3': -50, 'hdr10_all_eac3': 175},
+                   {'hdr10': 40})
+    assert _at(index, 'hdr10_24_eac3') == (-50, 'exact')
+    assert _at(index, 'hdr10_25_eac3') == (175, 'all_fps')
+    assert _at(index, 'hdr10_all_eac3') == (175, 'exact')
+    assert _at(index, 'hdr10_25_ac3') == (40, 'hdr_default')
+    assert _at(index, 'hdr10_all_ac3') == (40, 'hdr_default')
+    assert _at(index, 'sdr_25_ac3') == (0, 'unset')
+
+
+def test_fallback_stays_within_its_hdr_type_and_audio_format():
+    index = _index({'dolbyvision_all_truehd': 100}, {'sdr': 25})
+    assert _at(index, 'dolbyvision_60_truehd') == (100, 'all_fps')
+    assert _at(index, 'dolbyvision_60_eac3') == (0, 'unset')
+    assert _at(index, 'hdr10_60_truehd') == (0, 'unset')
+    assert _at(index, 'sdr_60_truehd') == (25, 'hdr_default')
+
+
+def test_inherited_is_what_a_stored_zero_would_leave():
+    cube = [0] * formats.CELL_COUNT
+    cube[KEYS.index('hdr10_all_eac3')] = 175
+    cube[KEYS.index('hdr10_24_eac3')] = -50
+    defaults = [40 if hdr == 'hdr10' else 0 for hdr in formats.HDR_TYPES]
+
+    def inherited(setting_id):
+        return resolution.inherited(cube, defaults, KEYS.index(setting_id))
+
+    assert inherited('hdr10_24_eac3') == (175, 'all_fps')
+    assert inherited('hdr10_all_eac3') == (40, 'hdr_default')  # row: default
+    assert inherited('hdr10_24_pcm') == (40, 'hdr_default')
+    assert inherited('sdr_24_eac3') == (0, 'unset')
+
+
+def test_index_covers_every_cell():
+    values, levels = _index({})
+    assert len(values) == len(levels) == formats.CELL_COUNT
+    assert set(levels) == {resolution.LEVELS.index('unset')}
+
+
+@pytest.mark.parametrize('fps, expected', [
+    ('all', ('hlg_all_pcm', 'hlg_default')),
+    (50, ('hlg_50_pcm', 'hlg_all_pcm', 'hlg_default')),
+])
+def test_source_keys_walk_the_chain(fps, expected):
+    profile = StreamProfile(hdr_type='hlg', fps_type=fps, audio_format='pcm',
+                            video_fps=50, player_id=1, audio_channels=2)
+    assert resolution.source_keys(profile) == expected
@@ -8,8 +8,21 @@ event type, so the order pins here are behavioral guarantees, not style.
 import pytest
 
 from resources.lib.aom.app import events
+from resources.lib.aom.app.bulk_edit import HOLD_PROPERTY, BulkEditor
+from resources.lib.aom.app.shadow_detector import ShadowDetector
 from resources.lib.aom.app.stream_detector import StreamDetector
+from resources.lib.aom.kodi.offset_store import SparseOffsetStore
+from resources.lib.aom.kodi.settings import Settings
 from resources.lib.aom.runtime import ServiceRuntime
+from tests.fakes import FakeGui
+
+
+@pytest.fixture(autouse=True)
+def settings_backed_offsets(monkeypatch):
+    # Kodistubs' getBool answers True: keep the opt-in sparse store off
+    # unless a test turns it on (with a real path).
+    monkeypatch.setattr(Settings, 'sparse_offsets_enabled',
+                        lambda self: False)
 
 
 @pytest.fixture
@@ -25,22 +38,29 @@ def test_service_runtime_graph_wiring(runtime):
     assert runtime.seek_coordinator._gateway is runtime.gateway
     assert runtime.adjustment_watcher._gateway is runtime.gateway
     assert runtime.platform_recorder._gateway is runtime.gateway
+    assert runtime.playlist_prefetcher._gateway is runtime.gateway
+    assert runtime.settings_writer._gateway is runtime.gateway
 
     assert runtime.detector._settings is runtime.settings
-    assert runtime.platform_recorder._settings is runtime.settings
+    assert runtime.settings_writer._settings is runtime.settings
     assert runtime.offset_applier._settings is runtime.settings
     assert runtime.notifier._settings is runtime.settings
     assert runtime.seek_scheduler._settings is runtime.settings
     assert runtime.adjustment_watcher._settings is runtime.settings
+    assert runtime.playlist_prefetcher._settings is runtime.settings
 
     assert runtime.offset_applier._offsets is runtime.offsets
     assert runtime.adjustment_watcher._offsets is runtime.offsets
+    assert runtime.settings_writer._offsets is runtime.offsets
+    assert runtime.platform_recorder._writer is runtime.settings_writer
+    assert runtime.adjustment_watcher._writer is runtime.settings_writer
     assert runtime.offsets._settings is runtime.settings
     assert runtime.notifier._gui is runtime.gui
 
     for component in (runtime.detector, runtime.offset_applier,
                       runtime.notifier, runtime.seek_scheduler,
-                      runtime.adjustment_watcher):
+                      runtime.adjustment_watcher,
+                      runtime.playlist_prefetcher):
         assert component._sessions is runtime.session_tracker
 
     # UserOffsetSaved fans out to the seek scheduler ('change' replay) and
@@ -86,11 +106,182 @@ def test_runtime_subscription_order_is_pinned(runtime):
             < stabilized.index(runtime.notifier)
             < stabilized.index(runtime.seek_scheduler))
 
+    # PlaybackStarted: the detector's probe #1 is queued before the
+    # prefetcher's prediction, so a complete stream is adopted first.
+    assert started.index(runtime.detector) < started.index(
+        runtime.playlist_prefetcher)
+
     # Detection events are the detector's alone.
     assert all(isinstance(owner, StreamDetector)
                for owner in owners(events.ProbeStream))
     assert all(isinstance(owner, StreamDetector)
                for owner in owners(events.VerifyStream))
+    assert all(isinstance(owner, StreamDetector)
+               for owner in owners(events.ReprobeStream))
+
+
+def test_settings_save_posts_the_diffed_settings_changed(runtime):
+    posted = []
+    runtime.dispatcher.subscribe(events.SettingsChanged, posted.append)
+    stale = not runtime.settings.get_bool('enable_debug_logging')
+    runtime.settings._snapshot['enable_debug_logging'] = stale
+    runtime.dispatcher.post(events.SettingsSaved())
+    runtime.dispatcher.run_pending()
+    assert posted == [events.SettingsChanged(
+        changed=frozenset(('enable_debug_logging',)))]
+    assert runtime.logger.debug_escalation is not stale
+
+
+def test_settings_save_diff_includes_changed_offsets(runtime, monkeypatch):
+    store = {}
+    monkeypatch.setattr(runtime.settings._settings, 'getInt',
+                        lambda key: store.get(key, 0))
+    runtime.offsets.nonzero()                           # cube loaded
+    posted = []
+    runtime.dispatcher.subscribe(events.SettingsChanged, posted.append)
+    store['hdr10_all_eac3'] = 50                        # dialog edit
+    runtime.dispatcher.post(events.SettingsSaved())
+    runtime.dispatcher.run_pending()
+    assert 'hdr10_all_eac3' in posted[0].changed
+
+
+def test_fleet_overlay_loads_at_start_and_reports_on_save(monkeypatch,
+                                                          tmp_path):
+    import xbmcvfs
+    from resources.lib.aom.domain.offset_file import format_offsets
+    path = tmp_path / 'fleet.json'
+    path.write_text(format_offsets({'hdr10_all_eac3': 50}), encoding='utf-8')
+    monkeypatch.setattr(xbmcvfs, 'translatePath', lambda name: name)
+    monkeypatch.setattr(Settings, 'fleet_overlay_path',
+                        lambda self: str(path))
+    runtime = ServiceRuntime()
+    runtime.dispatcher.post(events.ServiceStarted())
+    runtime.dispatcher.run_pending()
+    assert runtime.offsets._overlay == {'hdr10_all_eac3': 50}
+
+    posted = []
+    runtime.dispatcher.subscribe(events.SettingsChanged, posted.append)
+    path.write_text(format_offsets({'hdr10_all_eac3': 50, 'sdr_default': 5}),
+                    encoding='utf-8')
+    runtime.dispatcher.post(events.SettingsSaved())
+    runtime.dispatcher.run_pending()
+    assert posted[0].changed == frozenset(('sdr_default',))
+    runtime.dispatcher.post(events.SettingsSaved())     # file unchanged
+    runtime.dispatcher.run_pending()
+    assert posted[1].changed == frozenset()
+    assert runtime.overlay.file_loads == 2
+
+
+def test_sparse_offsets_back_the_table_when_enabled(monkeypatch, tmp_path):
+    from resources.lib.aom.kodi import offset_store
+    path = str(tmp_path / 'offsets.json')
+    monkeypatch.setattr(Settings, 'sparse_offsets_enabled', lambda self: True)
+    monkeypatch.setattr(offset_store, 'default_path', lambda: path)
+    monkeypatch.setattr(Settings, 'read_ints',
+                        lambda self, ids, default=0: [
+                            -75 if setting_id == 'hdr10_all_eac3' else 0
+                            for setting_id in ids])
+    runtime = ServiceRuntime()
+    assert isinstance(runtime.offsets._settings, SparseOffsetStore)
+    assert runtime.offsets.nonzero() == {'hdr10_all_eac3': -75}   # migrated
+
+
+def test_bulk_edit_hold_defers_saves_until_its_notification(runtime,
+                                                            monkeypatch):
+    import time
+    properties = {HOLD_PROPERTY: f"{time.time():.3f}"}
+    monkeypatch.setattr(runtime.gateway, 'window_property',
+                        lambda name: properties.get(name, ''))
+    posted = []
+    runtime.dispatcher.subscribe(events.SettingsChanged, posted.append)
+    runtime.dispatcher.post(events.SettingsSaved())     # a write's save
+    runtime.dispatcher.run_pending()
+    assert posted == []
+
+    runtime.monitor.onNotification('script.audiooffsetmanager',
+                                   'Other.OffsetsBulkWritten', '')
+    runtime.dispatcher.run_pending()
+    assert len(posted) == 1
+
+
+def test_bulk_edit_saves_delivered_after_the_script_returned_stay_held(
+        runtime, monkeypatch):
+    # Kodi delivers the writes' saves after run() has returned: the hold
+    # the script left set must still defer them, until the notification
+    # releases it.
+    import time
+    properties = {}
+    monkeypatch.setattr(runtime.gateway, 'window_property',
+                        lambda name: properties.get(name, ''))
+    monkeypatch.setattr(runtime.gateway, 'set_window_property',
+                        properties.__setitem__)
+    monkeypatch.setattr(runtime.gateway, 'clear_window_property',
+                        lambda name: properties.pop(name, None))
+    notified = []
+    monkeypatch.setattr(runtime.gateway, 'notify_all', notified.append)
+    refreshes = []
+    monkeypatch.setattr(runtime.settings, 'refresh',
+                        lambda: refreshes.append(1) or frozenset())
+    posted = []
+    runtime.dispatcher.subscribe(events.SettingsChanged, posted.append)
+
+    class Backend:
+        def read_ints(self, setting_ids, default=0):
+            return [50] * len(setting_ids)
+
+        def write_ints(self, values):
+            return True
+
+    editor = BulkEditor(Backend(), runtime.gateway, FakeGui(),
+                        runtime.settings, clock=time.time,
+                        log_debug=runtime.logger.debug,
+                        log_warning=runtime.logger.warning)
+    assert editor.run(['shift', 'hdr=hdr10', 'ms=25']) > 0
+    assert HOLD_PROPERTY in properties                 # script returned
+
+    for _ in range(3):                                 # the writes' saves
+        runtime.dispatcher.post(events.SettingsSaved())
+    runtime.dispatcher.run_pending()
+    assert posted == [] and refreshes == []
+
+    for message in notified:
+        runtime.monitor.onNotification('script.audiooffsetmanager',
+                                       f"Other.{message}", '')
+    runtime.dispatcher.run_pending()
+    assert len(posted) == 1 and len(refreshes) == 1
+    assert properties == {}                            # released
+
+
+def test_echo_of_our_own_write_reaches_no_handler(runtime, monkeypatch):
+    store = {'platform_hdr_full': False}
+    proxy = runtime.settings._settings
+    monkeypatch.setattr(proxy, 'getBool', lambda key: store.get(key, True))
+    monkeypatch.setattr(proxy, 'setBool', store.__setitem__)
+    reloads = []
+    monkeypatch.setattr(runtime.offsets, 'reload',
+                        lambda: reloads.append(1) or frozenset())
+    posted = []
+    runtime.dispatcher.subscribe(events.SettingsChanged, posted.append)
+    runtime.settings.store_boolean_if_changed('platform_hdr_full', True)
+    runtime.dispatcher.post(events.SettingsSaved())     # Kodi's echo
+    runtime.dispatcher.run_pending()
+    assert posted == []
+    assert runtime.settings.suppressed_echoes == 1
+    assert reloads == []                                # no offset bulk read
+
+    runtime.dispatcher.post(events.SettingsSaved())     # a user's save
+    runtime.dispatcher.run_pending()
+    assert len(posted) == 1 and reloads == [1]
+
+
+def test_unrelated_save_leaves_the_debug_flags_alone(runtime, monkeypatch):
+    monkeypatch.setattr(runtime.settings, 'debug_logging_enabled',
+                        lambda: not runtime.logger.debug_escalation)
+    before = runtime.logger.debug_escalation
+    runtime.dispatcher.post(events.SettingsChanged(
+        changed=frozenset(('enable_notifications',))))
+    runtime.dispatcher.run_pending()
+    assert runtime.logger.debug_escalation is before
 
 
 def test_settings_changed_refreshes_cached_debug_flags(runtime, monkeypatch):
@@ -107,3 +298,33 @@ def test_settings_changed_refreshes_cached_debug_flags(runtime, monkeypatch):
     runtime.dispatcher.run_pending()
     assert runtime.logger.debug_escalation is False
     assert runtime.dispatcher.log_runtimes is False
+
+
+def test_shadow_detector_is_opt_in(monkeypatch):
+    monkeypatch.setattr(Settings, 'shadow_detection_enabled',
+                        lambda self: False)
+    runtime = ServiceRuntime()
+    assert runtime.shadow_detector is None
+    assert events.ShadowEvent not in runtime.dispatcher._subscribers
+
+
+def test_shadow_detector_subscribes_after_the_live_graph(monkeypatch):
+    monkeypatch.setattr(Settings, 'shadow_detection_enabled',
+                        lambda self: True)
+    runtime = ServiceRuntime()
+    shadow = runtime.shadow_detector
+    assert isinstance(shadow, ShadowDetector)
+    assert shadow.detector._gateway is runtime.gateway
+    assert shadow.detector._settings is runtime.settings
+
+    subs = runtime.dispatcher._subscribers
+    started = [getattr(h, '__self__', None)
+               for h in subs[events.PlaybackStarted]]
+    assert started.index(runtime.seek_scheduler) < started.index(
+        shadow.detector)
+    stabilized = [getattr(h, '__self__', None)
+                  for h in subs[events.StreamStabilized]]
+    assert stabilized[-1] is shadow
+    # The shadow's probe/verify work never reaches the live handlers.
+    assert [h.__self__ for h in subs[events.VerifyStream]] == [
+        runtime.detector]
@@ -3,7 +3,7 @@ policy stated as one pure function.
 
 These are pure table tests (no dispatcher, no clock, no fakes): the caller
 resolves every timestamp and the function only decides 'seek' | 'defer' |
-'abandon'. The scheduler-side enforcement (rescheduling, deadline bounding,
+'abandon' (and when that verdict next changes). The scheduler-side enforcement (rescheduling, deadline bounding,
 cross-type suppression as it actually plays out on the bus) is pinned in
 test_seek_scheduler.py; here we pin the decision math and, crucially, its
 DOCUMENTED ORDERING: served-check, then deadline, then quietness.
@@ -62,13 +62,14 @@ from resources.lib.aom.domain import policies
 ])
 def test_seek_decision(case, now, requested_at, last_activity, last_own_seek,
                        expected):
-    assert policies.seek_decision(
+    verdict, _ = policies.seek_decision(
         now=now,
         requested_at=requested_at,
         last_activity=last_activity,
         last_own_seek=last_own_seek,
         quiet_window=2.0,
-        deadline=8.0) == expected, case
+        deadline=8.0)
+    assert verdict == expected, case
 
 
 def test_served_and_deadline_both_true_still_abandons():
@@ -77,4 +78,32 @@ def test_served_and_deadline_both_true_still_abandons():
     # never mistaken for anything else.
     assert policies.seek_decision(
         now=30.0, requested_at=10.0, last_activity=1.0, last_own_seek=25.0,
-        quiet_window=2.0, deadline=8.0) == 'abandon'
+        quiet_window=2.0, deadline=8.0) == ('abandon', None)
+
+
+# --- next_change: when the verdict turns with no new activity ----------------
+
+@pytest.mark.parametrize("case, now, last_activity, expected", [
+    # Defer wakes at the end of the quiet window...
+    ("defer_until_quiet", 10.0, 9.0, ('defer', 11.0)),
+    # ...or at the deadline (request 5.0 + 8.0) when that comes first.
+    ("defer_until_deadline", 12.5, 12.0, ('defer', 13.0)),
+    # A 'seek' verdict turns into 'abandon' at the deadline.
+    ("seek_until_deadline", 10.0, 1.0, ('seek', 13.0)),
+])
+def test_seek_decision_next_change(case, now, last_activity, expected):
+    assert policies.seek_decision(
+        now=now, requested_at=5.0, last_activity=last_activity,
+        last_own_seek=None, quiet_window=2.0, deadline=8.0) == expected, case
+
+
+def test_woken_at_next_change_sees_the_new_verdict():
+    # 0.1 + 0.2 is not 0.3 in floats: the verdict compares against the very
+    # instant it returned, so waking there never defers to the same instant.
+    verdict, wake_at = policies.seek_decision(
+        now=0.25, requested_at=0.0, last_activity=0.1, last_own_seek=None,
+        quiet_window=0.2, deadline=8.0)
+    assert verdict == 'defer'
+    assert policies.seek_decision(
+        now=wake_at, requested_at=0.0, last_activity=0.1, last_own_seek=None,
+        quiet_window=0.2, deadline=8.0)[0] == 'seek'
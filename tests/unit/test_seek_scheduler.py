@@ -9,8 +9,11 @@ window_properties.
 Timing facts the tests rely on (from the module):
 
 * ExecuteSeek attempt #1 is scheduled at delay 0, so it fires on the NEXT
-  pump with no clock advance; a deferred attempt re-schedules RECHECK (0.5s)
-  later, key-replaced so only one attempt per reason is ever live.
+  pump with no clock advance; a deferred attempt re-schedules itself for
+  the instant its verdict can next change (quiet-window end, grace end,
+  deadline) — RECHECK (0.5s) while a vendor reads busy — key-replaced so
+  only one attempt per reason is ever live. StreamStabilized wakes a
+  stability-deferred attempt at once.
 * The session's ``started_at`` counts as seek activity, so a fresh seek must
   wait QUIET_WINDOW (2.0s) from playback start before it can execute — this
   is how the legacy mandatory 2s post-start settle is reproduced.
@@ -22,7 +25,7 @@ Timing facts the tests rely on (from the module):
 
 Race note (pinned, not incidental): when two reasons become eligible on the
 SAME pump, the reason whose attempt-chain started FIRST fires first (lower
-scheduler seq perpetuates through the lock-step 0.5s reschedules). Tests that
+scheduler seq perpetuates through reschedules to the same instant). Tests that
 depend on cross-type ordering exploit this deterministically.
 """
 
@@ -47,7 +50,7 @@ RECIPROCAL = ExternalSeekCoordinator.RECIPROCAL_PROPERTY
 # tests green-but-wrong against a stale window.
 QUIET = SeekScheduler.QUIET_WINDOW_SECONDS
 DEADLINE = SeekScheduler.DEADLINE_SECONDS
-RECHECK = SeekScheduler.RECHECK_SECONDS
+RECHECK = SeekScheduler.VENDOR_RECHECK_SECONDS
 DEBOUNCE = SeekScheduler.DEBOUNCE_SECONDS
 GRACE = SeekScheduler.STABILITY_GRACE_SECONDS
 DEADLINE_STEPS = int(DEADLINE / RECHECK)
@@ -285,8 +288,8 @@ class TestTriggersAndDebounce:
 class TestExecutionGuards:
 
     def test_defers_until_stable_then_executes(self, rig):
-        # Not STABLE -> the attempt defers on the 0.5s cadence; once STABLE and
-        # the window is quiet it executes exactly once.
+        # Not STABLE -> the attempt defers; once STABLE and the window is
+        # quiet it executes exactly once.
         rig.start()                       # STARTING, resume requested
         rig.advance(0.5)
         rig.advance(0.5)
@@ -366,7 +369,7 @@ class TestExecutionGuards:
         # activity view, or we would seek right into its finishing seek.
         rig.start()                       # never stabilized
         rig.gateway.window_properties[VENDOR_PROP] = '1'
-        rig.advance(RECHECK)              # a pre-STABLE attempt fires
+        rig.advance(QUIET)                # the pre-STABLE wakeup fires
         assert rig.coordinator._last_vendor_busy is not None
         assert rig.seeks == []
 
@@ -464,6 +467,103 @@ class TestExecutionGuards:
 # Reciprocity and failed seeks
 # ============================================================================
 
+class TestExactWakeups:
+
+    def _attempts(self, rig):
+        attempts = []
+        rig.dispatcher.subscribe(events.ExecuteSeek,
+                                 lambda event: attempts.append(rig.clock()))
+        return attempts
+
+    def test_seek_lands_the_moment_the_quiet_window_opens(self, rig):
+        attempts = self._attempts(rig)
+        rig.start()
+        rig.make_stable()
+        rig.advance(0.3)
+        rig.post(events.SeekOccurred(time_ms=60000, offset_ms=-4000))
+        rig.advance(QUIET - 0.3)          # t=2.0: quiet since start, not seek
+        assert rig.seeks == []
+        rig.advance(0.3)                  # t=2.3: quiet since the seek
+        assert rig.seeks == [(4, 1)]
+        assert attempts == [0.0, QUIET, 0.3 + QUIET]
+
+    def test_stream_stabilized_wakes_a_stability_defer_at_once(self, rig):
+        rig.start()
+        rig.advance(QUIET + 0.2)          # t=2.2: quiet, not STABLE
+        assert rig.logged('stream not stable yet')
+        rig.make_stable()
+        rig.post(events.StreamStabilized(session_id=rig.session.session_id,
+                                         profile_changed=False))
+        assert rig.seeks == [(4, 1)]      # at t=2.2, not at the grace end
+
+    def test_retrigger_replaces_a_stability_defer(self, rig):
+        rig.start()
+        rig.advance(QUIET + 0.2)          # t=2.2
+        sid = rig.session.session_id
+        rig.post(events.UserOffsetSaved(session_id=sid, profile=None, ms=-50))
+        assert rig.pending_request('change').requested_at == QUIET + 0.2
+        rig.advance(0.5)                  # t=2.7: a seek, then a re-trigger
+        rig.post(events.SeekOccurred(time_ms=60000, offset_ms=-4000))
+        rig.post(events.UserOffsetSaved(session_id=sid, profile=None, ms=-75))
+        rig.make_stable()
+        rig.post(events.StreamStabilized(session_id=sid,
+                                         profile_changed=False))
+        # The re-triggered request waits for quiet; the superseded one is
+        # not revived by the stabilization.
+        assert rig.pending_request('change').requested_at == QUIET + 0.7
+        assert rig.seeks == []
+
+    @staticmethod
+    def _vendor_spell(rig, start, end):
+        """Advance to ``start``, read busy until ``end``, then idle; fine
+        steps so every probe fires on its own time."""
+        rig.advance(start - rig.clock())
+        rig.gateway.window_properties[VENDOR_PROP] = '1'
+        while rig.clock() < end:
+            rig.advance(RECHECK / 2)
+        del rig.gateway.window_properties[VENDOR_PROP]
+
+    def test_a_vendor_spell_inside_a_quiet_defer_is_probed(self, rig):
+        # Stable from the start: the exact wakeup would sleep to t=2.0 and
+        # seek right after a vendor spell it never saw.
+        rig.gateway.addons.add(ExternalSeekCoordinator.VENDOR_ADDONS[0])
+        attempts = self._attempts(rig)
+        rig.start()
+        rig.make_stable()
+        for _ in range(2):
+            rig.advance(RECHECK)          # t=1.0
+        self._vendor_spell(rig, 1.25, 1.75)
+        rig.advance(QUIET - 1.75)         # t=2.0
+        assert rig.seeks == []
+        while not rig.seeks:
+            rig.advance(RECHECK / 2)
+        # Quiet since the t=1.5 probe that sighted the spell.
+        assert rig.clock() == 1.5 + QUIET
+        assert attempts[:4] == [0.0, 0.5, 1.0, 1.5]
+
+    def test_a_vendor_spell_inside_a_stability_defer_is_probed(self, rig):
+        # Quiet but not STABLE: the stability defer would sleep to the grace
+        # end, past a spell it never saw.
+        rig.gateway.addons.add(ExternalSeekCoordinator.VENDOR_ADDONS[1])
+        rig.start()
+        while rig.clock() < QUIET:
+            rig.advance(RECHECK)          # t=2.0: not STABLE
+        assert rig.logged('stream not stable yet')
+        self._vendor_spell(rig, 2.25, 2.75)
+        rig.advance(GRACE - 2.75)         # t=4.0: grace over, not quiet
+        assert rig.seeks == []
+        while not rig.seeks:
+            rig.advance(RECHECK / 2)
+        assert rig.clock() == 2.5 + QUIET
+
+    def test_without_a_vendor_defers_sleep_exactly(self, rig):
+        attempts = self._attempts(rig)
+        rig.start()
+        rig.make_stable()
+        rig.advance(QUIET)
+        assert attempts == [0.0, QUIET]
+
+
 class TestReciprocityAndFailure:
 
     def test_reciprocal_property_set_during_seek_and_cleared_after(self):
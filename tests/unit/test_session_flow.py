@@ -21,8 +21,11 @@ import pytest
 from resources.lib.aom.app import events
 from resources.lib.aom.app.notifier import (STRING_OFFSET_APPLIED,
                                             STRING_OFFSET_SAVED)
-from resources.lib.aom.app.stream_detector import INFOLABEL_FPS, INFOLABEL_HDR
+from resources.lib.aom.app.stream_detector import (INFOLABEL_FPS,
+                                                   INFOLABEL_HDR,
+                                                   StreamDetector)
 from resources.lib.aom.domain.stream_state import StreamState
+from resources.lib.aom.kodi.settings import Settings
 from tests.fakes import FakeClock, FakeGateway
 
 
@@ -37,6 +40,8 @@ INFOLABELS = {
 @pytest.fixture
 def rig(monkeypatch):
     from resources.lib.aom.runtime import ServiceRuntime
+    monkeypatch.setattr(Settings, 'sparse_offsets_enabled',
+                        lambda self: False)
     runtime = ServiceRuntime()
 
     # Deterministic time everywhere: every clock-holding component gets the
@@ -71,7 +76,7 @@ def rig(monkeypatch):
     settings = runtime.settings
     monkeypatch.setattr(settings, 'is_hdr_enabled', lambda hdr: True)
     monkeypatch.setattr(settings, 'fps_override_enabled', lambda hdr: False)
-    monkeypatch.setattr(runtime.offsets, 'get', lambda profile: -125)
+    _offsets_answer(monkeypatch, runtime.offsets, -125)
     # Hermeticity: the platform recorder's writes must not reach the stubs'
     # shared settings state; seek-backs and the watcher are off unless a test
     # enables them, so flow tests only see the events they drive.
@@ -86,7 +91,7 @@ def rig(monkeypatch):
     notified = []
     monkeypatch.setattr(
         runtime.notifier, '_toast',
-        lambda string_id, ms, profile: notified.append(
+        lambda string_id, ms, profile, level='exact': notified.append(
             (string_id, ms, profile.setting_id())))
 
     # The dispatcher stays un-started and is pumped manually; every component
@@ -100,6 +105,20 @@ def _settle(runtime, clock, seconds=1.0):
     runtime.dispatcher.run_pending()
 
 
+def _av_changed(runtime, clock, count=1):
+    """Post an AvChanged burst and pump through the detector's settle window."""
+    for _ in range(count):
+        runtime.dispatcher.post(events.AvChanged())
+    runtime.dispatcher.run_pending()
+    _settle(runtime, clock, StreamDetector.AV_SETTLE_SECONDS)
+
+
+def _offsets_answer(monkeypatch, offsets, ms):
+    """Every profile's offset is ``ms``, set exactly (get and resolve)."""
+    monkeypatch.setattr(offsets, 'get', lambda profile: ms)
+    monkeypatch.setattr(offsets, 'resolve', lambda profile: (ms, 'exact'))
+
+
 def _applied_toasts(notified):
     return [(ms, key) for kind, ms, key in notified
             if kind == STRING_OFFSET_APPLIED]
@@ -116,7 +135,8 @@ def test_startup_apply_is_provisional_then_released_on_stable(rig):
     assert notified == []                              # ...but held (provisional)
     assert session.stream_state is StreamState.STABILIZING
     assert session.applied == ('dolbyvision_all_truehd', -125)
-    assert session.pending_notification == ('dolbyvision_all_truehd', -125)
+    assert session.pending_notification == ('dolbyvision_all_truehd', -125,
+                                            'exact')
     assert session.profile.setting_id() == 'dolbyvision_all_truehd'
 
     _settle(runtime, clock)
@@ -200,14 +220,14 @@ def test_mid_play_change_applies_immediately_and_notifies_on_stable(rig):
     assert len(notified) == 1
 
     gateway.codec = 'eac3'
-    runtime.dispatcher.post(events.AvChanged())
-    runtime.dispatcher.run_pending()
+    _av_changed(runtime, clock)
 
     assert applied == [(1, -125), (1, -125)]           # applied at once
     assert session.applied == ('dolbyvision_all_eac3', -125)
     assert session.stream_state is StreamState.STABILIZING
     assert len(notified) == 1                          # held until re-stable
-    assert session.pending_notification == ('dolbyvision_all_eac3', -125)
+    assert session.pending_notification == ('dolbyvision_all_eac3', -125,
+                                            'exact')
 
     _settle(runtime, clock)
     assert session.stream_state is StreamState.STABLE
@@ -261,11 +281,12 @@ def test_blip_and_revert_announces_no_change(rig):
     baseline_applied, baseline_notified = len(applied), len(notified)
 
     gateway.codec = 'none'                   # blip: profile goes incomplete
-    runtime.dispatcher.post(events.AvChanged())
-    runtime.dispatcher.run_pending()
+    _av_changed(runtime, clock)
     assert session.stream_state is StreamState.STABILIZING
 
     gateway.codec = 'truehd'                 # reverts inside the window
+    _settle(runtime, clock)                  # one agreeing sample of two
+    assert session.stream_state is StreamState.STABILIZING
     _settle(runtime, clock)
     assert session.stream_state is StreamState.STABLE
     assert len(applied) == baseline_applied
@@ -311,10 +332,7 @@ def test_av_change_storm_collapses_to_one_apply(rig):
 
     # A storm of AV changes around one real codec switch.
     gateway.codec = 'eac3'
-    runtime.dispatcher.post(events.AvChanged())
-    runtime.dispatcher.post(events.AvChanged())
-    runtime.dispatcher.post(events.AvChanged())
-    runtime.dispatcher.run_pending()
+    _av_changed(runtime, clock, count=3)
     assert len(applied) == baseline + 1                # exactly one re-apply
 
     _settle(runtime, clock)
@@ -332,8 +350,7 @@ def test_unchanged_av_change_is_ignored(rig):
     session = runtime.session_tracker.current
     baseline_applied, baseline_notified = len(applied), len(notified)
 
-    runtime.dispatcher.post(events.AvChanged())        # nothing changed
-    runtime.dispatcher.run_pending()
+    _av_changed(runtime, clock)                        # nothing changed
     _settle(runtime, clock)
 
     assert session.stream_state is StreamState.STABLE  # never regressed
@@ -431,7 +448,7 @@ def test_watcher_store_echo_never_reapplies(rig, monkeypatch):
 
     # Kodi's onSettingsChanged echo of that write lands afterwards, with the
     # store now answering the saved value.
-    monkeypatch.setattr(runtime.offsets, 'get', lambda profile: -80)
+    _offsets_answer(monkeypatch, runtime.offsets, -80)
     toast_baseline = len(_applied_toasts(notified))
     runtime.dispatcher.post(events.SettingsChanged())
     runtime.dispatcher.run_pending()
@@ -454,7 +471,7 @@ def test_dialog_offset_edit_applies_toasts_and_seeks_back(rig, monkeypatch):
     _settle(runtime, clock)                    # STABLE; startup apply done
     assert gateway.seeks == []                 # the automatic apply: no seek
 
-    monkeypatch.setattr(runtime.offsets, 'get', lambda profile: -150)
+    _offsets_answer(monkeypatch, runtime.offsets, -150)
     runtime.dispatcher.post(events.SettingsChanged())
     runtime.dispatcher.run_pending()
 
@@ -0,0 +1,185 @@
+"""Unit tests for aom.app.settings_writer.SettingsWriter.
+
+A FakeClock plus manually pumped Dispatcher, the scriptable FakeGateway
+(``settings_dialog`` answers the dialog question), a recording boolean
+store and the shared FakeOffsetTable. Writes made in one handler pass land
+in one flush; the dialog is asked once per flush.
+"""
+
+import pytest
+
+from resources.lib.aom.app import events
+from resources.lib.aom.app.dispatcher import Dispatcher
+from resources.lib.aom.app.settings_writer import SettingsWriter
+from resources.lib.aom.domain.profile import StreamProfile
+from tests.fakes import FakeClock, FakeGateway, FakeOffsetTable
+
+
+RETRY = SettingsWriter.RETRY_SECONDS
+
+
+class RecordingSettings:
+    """store_boolean_if_changed recorder; ``store_ok`` False fails it."""
+
+    def __init__(self):
+        self.stored = []   # (setting_id, value), in call order
+        self.store_ok = True
+
+    def store_boolean_if_changed(self, setting_id, value):
+        if not self.store_ok:
+            return False
+        self.stored.append((setting_id, value))
+        return True
+
+
+class DialogCounter(FakeGateway):
+    def __init__(self):
+        super().__init__()
+        self.dialog_checks = 0
+
+    def settings_dialog_open(self):
+        self.dialog_checks += 1
+        return super().settings_dialog_open()
+
+
+class Rig:
+    def __init__(self):
+        self.clock = FakeClock()
+        self.errors = []
+        self.debug = []
+        self.warnings = []
+        self.dispatcher = Dispatcher(clock=self.clock,
+                                     log_error=self.errors.append)
+        self.gateway = DialogCounter()
+        self.settings = RecordingSettings()
+        self.offsets = FakeOffsetTable()
+        self.writer = SettingsWriter(
+            self.dispatcher, self.gateway, self.settings, self.offsets,
+            log_debug=self.debug.append, log_warning=self.warnings.append)
+
+    def pump(self):
+        self.dispatcher.run_pending()
+
+    def advance(self, seconds):
+        self.clock.advance(seconds)
+        self.dispatcher.run_pending()
+
+
+@pytest.fixture
+def rig():
+    return Rig()
+
+
+def _profile(hdr='dolbyvision', audio='truehd'):
+    return StreamProfile(hdr_type=hdr, fps_type='all', audio_format=audio,
+                         video_fps=23, player_id=1, audio_channels=8)
+
+
+def test_writes_batch_into_one_flush_latest_wins(rig):
+    rig.writer.write_bool('platform_hdr_full', False)
+    rig.writer.write_bool('advanced_hlg', True)
+    rig.writer.write_bool('platform_hdr_full', True)
+    assert rig.settings.stored == []                   # nothing until flush
+    rig.pump()
+    assert rig.settings.stored == [('platform_hdr_full', True),
+                                   ('advanced_hlg', True)]
+    assert rig.gateway.dialog_checks == 1
+    assert rig.errors == []
+
+
+def test_offset_write_is_staged_at_once(rig):
+    profile = _profile()
+    rig.writer.write_offset(profile, -50)
+    assert rig.offsets.get(profile) == -50             # read-your-writes
+    assert rig.offsets.stored == []
+    rig.pump()
+    assert rig.offsets.stored == [(profile.setting_id(), -50)]
+    assert rig.offsets.staged == {}
+
+
+def test_dialog_open_holds_the_batch_until_it_closes(rig):
+    rig.gateway.settings_dialog = True
+    rig.writer.write_bool('platform_hdr_full', True)
+    rig.pump()
+    assert rig.settings.stored == []
+    assert any('settings dialog open' in line for line in rig.debug)
+
+    rig.writer.write_bool('advanced_hlg', False)       # joins the held batch
+    rig.pump()
+    rig.advance(RETRY)
+    assert rig.settings.stored == []
+    assert rig.gateway.dialog_checks == 2              # once per flush
+
+    rig.gateway.settings_dialog = False
+    rig.advance(RETRY)
+    assert rig.settings.stored == [('platform_hdr_full', True),
+                                   ('advanced_hlg', False)]
+    rig.advance(RETRY)                                 # nothing left to retry
+    assert rig.gateway.dialog_checks == 3
+
+
+def test_failed_store_is_retried_then_dropped(rig):
+    profile = _profile()
+    rig.offsets.store_ok = False
+    rig.writer.write_offset(profile, 25)
+    rig.pump()
+    for _ in range(SettingsWriter.MAX_ATTEMPTS - 1):
+        assert rig.warnings == []
+        rig.advance(RETRY)
+    assert any('giving up writing dolbyvision_all_truehd' in line
+               for line in rig.warnings)
+    assert rig.offsets.staged == {}                    # unstaged on give-up
+
+    rig.advance(RETRY)                                 # no further attempts
+    assert len(rig.warnings) == 1
+
+
+def test_failed_bool_store_succeeds_on_retry(rig):
+    rig.settings.store_ok = False
+    rig.writer.write_bool('advanced_hlg', True)
+    rig.pump()
+    rig.settings.store_ok = True
+    rig.advance(RETRY)
+    assert rig.settings.stored == [('advanced_hlg', True)]
+    assert rig.warnings == []
+
+
+def test_shutdown_writes_the_held_batch_regardless_of_dialog(rig):
+    profile = _profile()
+    rig.gateway.settings_dialog = True
+    rig.writer.write_offset(profile, 40)
+    rig.writer.write_bool('advanced_hlg', True)
+    rig.pump()
+    assert rig.offsets.stored == []
+
+    rig.writer.shutdown()
+    assert rig.offsets.stored == [(profile.setting_id(), 40)]
+    assert rig.settings.stored == [('advanced_hlg', True)]
+    assert rig.warnings == []
+
+
+def test_shutdown_warns_about_lost_writes(rig):
+    rig.writer.write_bool('advanced_hlg', True)
+    rig.settings.store_ok = False
+    rig.writer.shutdown()
+    assert any('writes lost at shutdown: advanced_hlg' in line
+               for line in rig.warnings)
+
+
+def test_shutdown_with_nothing_pending_is_silent(rig):
+    rig.writer.shutdown()
+    assert rig.debug == []
+    assert rig.warnings == []
+
+
+def test_integers_are_written_with_the_batch(rig):
+    stored = []
+    rig.settings.store_integer_if_changed = (
+        lambda setting_id, value: stored.append((setting_id, value)) or True)
+    rig.writer.write_int('platform_phantom_ms', 900)
+    rig.writer.write_bool('advanced_hlg', True)
+    rig.writer.write_int('platform_phantom_ms', 750)   # latest wins
+    rig.pump()
+    assert stored == [('platform_phantom_ms', 750)]
+    assert rig.settings.stored == [('advanced_hlg', True)]
+    assert rig.gateway.dialog_checks == 1
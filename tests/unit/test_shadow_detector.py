@@ -0,0 +1,154 @@
+"""Unit tests for aom.app.shadow_detector.
+
+The shadow runs a second StreamDetector beside the live one on the same
+dispatcher. These tests pin the isolation guarantees (the live session,
+the live timers and the bus never see the shadow's work) and the
+per-session comparison report. Driven like test_stream_detector: a
+FakeClock plus run_pending() pumping, jitter collapsed with
+``rng=lambda: 0.5``; the live detector verifies with the default window
+(STABLE 1.0s after adoption), the shadow with SAMPLED_VERIFY (0.5s).
+"""
+
+from resources.lib.aom.app import events
+from resources.lib.aom.app.dispatcher import Dispatcher
+from resources.lib.aom.app.offset_applier import OffsetApplier
+from resources.lib.aom.app.session import SessionTracker
+from resources.lib.aom.app.shadow_detector import ShadowDetector
+from resources.lib.aom.app.stream_detector import (INFOLABEL_FPS,
+                                                   INFOLABEL_HDR,
+                                                   StreamDetector)
+from resources.lib.aom.domain.stream_state import StreamState
+from tests.fakes import (FakeClock, FakeFacade, FakeGateway,
+                         FakeOffsetTable)
+
+
+class Rig:
+    """Live tracker/detector/applier plus a shadow, subscribed last."""
+
+    def __init__(self):
+        self.clock = FakeClock()
+        self.errors = []
+        self.debug = []
+        self.dispatcher = Dispatcher(clock=self.clock,
+                                     log_error=self.errors.append)
+        self.tracker = SessionTracker(self.dispatcher)
+        self.gateway = FakeGateway(infolabels={
+            INFOLABEL_FPS: '23.976',
+            INFOLABEL_HDR: 'dolbyvision',
+        })
+        self.facade = FakeFacade()
+        self.offsets = FakeOffsetTable()
+        self.offsets.offsets['dolbyvision_all_truehd'] = 100
+        self.offsets.offsets['dolbyvision_all_eac3'] = 50
+        self.live = StreamDetector(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            log_debug=self.debug.append, log_warning=self.debug.append,
+            rng=lambda: 0.5)
+        self.applier = OffsetApplier(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            self.offsets, log_debug=self.debug.append,
+            log_warning=self.debug.append)
+        self.shadow = ShadowDetector(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            clock=self.clock, log_debug=self.debug.append, rng=lambda: 0.5)
+        self.profiles = []
+        self.probes = []
+        self.stabilized = []
+        self.dispatcher.subscribe(events.ProfileChanged, self.profiles.append)
+        self.dispatcher.subscribe(events.StreamProbed, self.probes.append)
+        self.dispatcher.subscribe(events.StreamStabilized,
+                                  self.stabilized.append)
+
+    def post(self, event):
+        self.dispatcher.post(event)
+        self.dispatcher.run_pending()
+
+    def advance(self, seconds):
+        self.clock.advance(seconds)
+        self.dispatcher.run_pending()
+
+
+def test_shadow_never_touches_the_live_session_or_the_bus():
+    rig = Rig()
+    rig.post(events.PlaybackStarted())
+    rig.advance(2.0)
+
+    session = rig.tracker.current
+    assert session.stream_state is StreamState.STABLE
+    assert rig.shadow._mirror.current is not session
+    # Only the live detector's decisions and gathers reached the bus.
+    assert len(rig.profiles) == 1
+    assert len(rig.stabilized) == 1
+    assert len(rig.probes) == rig.live.full_gathers
+    assert rig.gateway.applied == [(1, 0.1)]
+    assert rig.errors == []
+
+
+def test_shadow_timers_are_namespaced_away_from_the_live_ones():
+    rig = Rig()
+    rig.post(events.PlaybackStarted())
+    keys = set(rig.dispatcher._active_keys)
+    assert 'aom.detector.verify' in keys
+    assert 'aom.shadow:aom.detector.verify' in keys
+    # The live detector alone handles the real detection events.
+    owners = [h.__self__ for h in rig.dispatcher._subscribers[
+        events.VerifyStream]]
+    assert owners == [rig.live]
+
+
+def test_report_compares_time_to_profile_and_time_to_stable():
+    rig = Rig()
+    rig.post(events.PlaybackStarted())
+    rig.advance(0.25)
+    rig.advance(0.25)
+    assert rig.shadow._mirror.current.stream_state is StreamState.STABLE
+    assert rig.tracker.current.stream_state is StreamState.STABILIZING
+    rig.advance(0.5)
+    rig.post(events.PlaybackStopped())
+
+    (report,) = rig.shadow.reports
+    assert report.session_id == 1
+    assert (report.live_profile_s, report.live_stable_s) == (0.0, 1.0)
+    assert (report.shadow_profile_s, report.shadow_stable_s) == (0.0, 0.5)
+    assert report.live_key == report.shadow_key == 'dolbyvision_all_truehd'
+    assert (report.disagreements, report.stabilizations) == (0, 2)
+    assert any('AOM_ShadowDetector: report session #1' in line
+               for line in rig.debug)
+
+
+def test_stabilizing_on_a_different_key_counts_a_disagreement():
+    rig = Rig()
+    rig.post(events.PlaybackStarted())
+    rig.advance(0.25)
+    rig.advance(0.25)                # shadow STABLE on truehd
+    rig.gateway.codec = 'eac3'       # only the live verify re-reads it
+    rig.advance(0.5)                 # live re-adopts eac3
+    rig.advance(1.0)                 # ... and stabilizes on it
+    rig.post(events.PlaybackEnded())
+
+    (report,) = rig.shadow.reports
+    assert report.live_key == 'dolbyvision_all_eac3'
+    assert report.shadow_key == 'dolbyvision_all_truehd'
+    assert report.disagreements == 1
+
+
+def test_in_place_reopen_reports_the_superseded_session():
+    rig = Rig()
+    rig.post(events.PlaybackStarted())
+    rig.advance(1.0)
+    rig.post(events.PlaybackStarted())
+
+    assert [r.session_id for r in rig.shadow.reports] == [1]
+    assert rig.shadow._mirror.current.session_id == 2
+    rig.advance(1.0)
+    assert rig.tracker.current.stream_state is StreamState.STABLE
+
+
+def test_report_history_is_bounded():
+    rig = Rig()
+    for _ in range(ShadowDetector.REPORT_HISTORY + 3):
+        rig.post(events.PlaybackStarted())
+        rig.post(events.PlaybackStopped())
+    assert len(rig.shadow.reports) == ShadowDetector.REPORT_HISTORY
+    assert rig.shadow.reports[-1].session_id == \
+        ShadowDetector.REPORT_HISTORY + 3
@@ -14,7 +14,9 @@ Two surfaces are exercised:
 Timing facts the tests rely on: probe #1 is POSTED on PlaybackStarted (fires
 on the next pump with no clock advance); later probes are scheduled at jittered
 0.5s spacing, which collapses to EXACTLY 0.5s with ``rng=lambda: 0.5``; the
-verify window is 1.0s; the probe budget is 20 attempts.
+verify window is 1.0s; the probe budget is 20 attempts; an AvChanged re-probe
+fires AV_SETTLE_SECONDS after the burst's last callback (``Rig.av_changed``
+pumps through it).
 """
 
 import pytest
@@ -23,6 +25,8 @@ from resources.lib.aom.app import events
 from resources.lib.aom.app.dispatcher import Dispatcher
 from resources.lib.aom.app.session import SessionTracker
 from resources.lib.aom.app.stream_detector import (
+    SAMPLED_VERIFY,
+    WINDOW_VERIFY,
     StreamDetector,
     derive_stream_facts,
     INFOLABEL_FPS,
@@ -71,7 +75,7 @@ class Rig:
     irrelevant to it.
     """
 
-    def __init__(self, fps_override=False):
+    def __init__(self, fps_override=False, verify_plan=WINDOW_VERIFY):
         self.clock = FakeClock()
         self.errors = []
         self.warnings = []
@@ -86,7 +90,8 @@ class Rig:
         self.detector = StreamDetector(
             self.dispatcher, self.tracker, self.gateway, self.facade,
             log_debug=self.debug.append, log_warning=self.warnings.append,
-            rng=lambda: 0.5)  # jittered spacing collapses to exactly 0.5s
+            rng=lambda: 0.5,  # jittered spacing collapses to exactly 0.5s
+            verify_plan=verify_plan)
         self.profiles = []
         self.probes = []
         self.stabilized = []
@@ -104,8 +109,10 @@ class Rig:
         self.dispatcher.run_pending()
 
     def av_changed(self):
+        """One AvChanged, pumped through its settle window to the re-probe."""
         self.dispatcher.post(events.AvChanged())
         self.dispatcher.run_pending()
+        self.advance(StreamDetector.AV_SETTLE_SECONDS)
 
     def advance(self, seconds=1.0):
         self.clock.advance(seconds)
@@ -253,7 +260,10 @@ class TestDiscovery:
         rig.advance(1.0)                     # verify window elapses
         assert session.stream_state is StreamState.STABLE
         assert len(rig.stabilized) == 1
-        assert len(rig.probes) == 2          # the verify gather posts a probe too
+        # The verify gather read the same raw values: short-circuited, so it
+        # posts no second StreamProbed.
+        assert len(rig.probes) == 1
+        assert rig.detector.short_circuited_gathers == 1
         assert rig.errors == []
 
     def test_late_codec_is_adopted_when_it_resolves(self, rig):
@@ -283,8 +293,12 @@ class TestDiscovery:
         assert rig.profiles == []            # never adopted
         assert rig.session.profile is None
         assert rig.session.stream_state is StreamState.STARTING
-        # One gather (one StreamProbed) per attempt, budget attempts total.
-        assert len(rig.probes) == StreamDetector.PROBE_BUDGET
+        # One gather per attempt, budget attempts total; the codec never
+        # moved, so only the first was a full gather posting StreamProbed.
+        assert rig.detector.full_gathers == 1
+        assert rig.detector.short_circuited_gathers == \
+            StreamDetector.PROBE_BUDGET - 1
+        assert len(rig.probes) == 1
 
         probes_after = len(rig.probes)
         rig.advance(10.0)                    # no timer remains after exhaustion
@@ -397,6 +411,8 @@ class TestChangeDetection:
         rig.dispatcher.post(events.AvChanged())
         rig.dispatcher.post(events.AvChanged())
         rig.dispatcher.run_pending()
+        assert len(rig.profiles) == 1        # settling: nothing gathered yet
+        rig.advance(StreamDetector.AV_SETTLE_SECONDS)
         assert len(rig.profiles) == 2        # exactly one new adoption
         assert rig.session.stream_state is StreamState.STABILIZING
         assert len(rig.stabilized) == 1      # not stable again until re-verify
@@ -411,6 +427,51 @@ class TestChangeDetection:
         assert rig.session.profile.setting_id() == 'dolbyvision_all_eac3'
         assert rig.errors == []
 
+    def test_burst_with_transient_readings_adopts_only_the_final_state(
+            self, rig):
+        # Passthrough negotiation: callbacks inside the settle window with
+        # transient intermediate codecs. Only the burst's final state is
+        # gathered — no transient adoption (and so no transient apply).
+        rig.start()
+        rig.advance(1.0)
+        probes_before = len(rig.probes)
+        for codec in ('pcm', 'none', 'eac3'):
+            rig.gateway.codec = codec
+            rig.dispatcher.post(events.AvChanged())
+            rig.advance(0.1)                 # inside the settle window
+        assert len(rig.profiles) == 1
+        assert len(rig.probes) == probes_before
+
+        rig.advance(StreamDetector.AV_SETTLE_SECONDS)
+        assert len(rig.profiles) == 2
+        assert rig.session.profile.setting_id() == 'dolbyvision_all_eac3'
+        assert len(rig.probes) == probes_before + 1
+        assert rig.errors == []
+
+    def test_stop_inside_the_settle_window_cancels_the_reprobe(self, rig):
+        rig.start()
+        rig.advance(1.0)
+        rig.gateway.codec = 'eac3'
+        rig.dispatcher.post(events.AvChanged())
+        rig.dispatcher.post(events.PlaybackStopped())
+        rig.dispatcher.run_pending()
+        rig.advance(StreamDetector.AV_SETTLE_SECONDS)
+        assert len(rig.profiles) == 1
+        assert 'aom.detector.reprobe' not in rig.dispatcher._active_keys
+        assert rig.errors == []
+
+    def test_reprobe_for_a_dead_session_is_inert(self, rig):
+        rig.start()
+        dead_id = rig.session.session_id
+        rig.dispatcher.post(events.PlaybackStarted())   # in-place reopen
+        rig.dispatcher.run_pending()
+        probes_before = len(rig.probes)
+        rig.gateway.codec = 'eac3'
+        rig.dispatcher.post(events.ReprobeStream(session_id=dead_id))
+        rig.dispatcher.run_pending()
+        assert len(rig.probes) == probes_before
+        assert rig.errors == []
+
     def test_av_change_during_discovery_is_ignored(self, rig):
         # Mid-discovery the probe chain already re-reads facts every attempt,
         # so an AvChanged does no immediate gather-adopt; it just gets logged.
@@ -453,6 +514,9 @@ class TestVerificationRecovery:
 
         rig.gateway.codec = 'truehd'         # reverts before the window fires
         rig.advance(1.0)
+        # The run restarted from zero: one agreeing re-gather is not enough.
+        assert rig.session.stream_state is StreamState.STABILIZING
+        rig.advance(1.0)
         assert rig.session.stream_state is StreamState.STABLE
         assert rig.session.profile.setting_id() == original_setting
         assert len(rig.profiles) == 1        # never re-adopted -> no stranding
@@ -582,10 +646,10 @@ class TestOrderingAndGuards:
 
 class TestPlatformFactsEmission:
 
-    def test_every_gather_posts_exactly_one_stream_probed(self, rig):
+    def test_every_full_gather_posts_exactly_one_stream_probed(self, rig):
         # Wrap _gather to count invocations; StreamProbed is posted once per
-        # gather, so the counts must stay equal across startup, settle, an
-        # AV-change re-probe and a second settle (4 gathers total).
+        # FULL gather: startup and the AV-change re-probe read new values,
+        # the two settles re-read the same ones and are short-circuited.
         gathers = []
         original = rig.detector._gather
 
@@ -602,5 +666,331 @@ class TestPlatformFactsEmission:
         rig.advance(1.0)     # gather #4: verify
 
         assert len(gathers) == 4
-        assert len(rig.probes) == len(gathers)   # one StreamProbed per gather
+        assert rig.detector.full_gathers == 2
+        assert rig.detector.short_circuited_gathers == 2
+        assert len(rig.probes) == rig.detector.full_gathers
         assert rig.errors == []
+
+
+# ============================================================================
+# Unchanged-reading short-circuit
+# ============================================================================
+
+class TestGatherShortCircuit:
+
+    def test_unchanged_reading_reuses_the_previous_facts(self, rig):
+        rig.start()
+        first = rig.detector._gather(rig.session.session_id)
+        again = rig.detector._gather(rig.session.session_id)
+        assert again is first
+        assert rig.detector.short_circuited_gathers == 2   # incl. the above
+
+    def test_incidental_change_is_a_full_gather(self, rig):
+        rig.start()
+        rig.gateway.channels = 6             # raw reading differs
+        rig.advance(1.0)
+        assert rig.detector.full_gathers == 2
+        assert len(rig.probes) == 2
+        assert rig.session.profile.audio_channels == 6
+
+    def test_settings_changed_forces_a_full_gather(self, rig):
+        # The FPS-override setting feeds the derivation: identical raw values
+        # may derive a different profile after a save.
+        rig.start()
+        rig.facade.fps_override = True
+        rig.dispatcher.post(events.SettingsChanged())
+        rig.dispatcher.run_pending()
+        rig.advance(1.0)                     # verify re-derives
+        assert rig.detector.full_gathers == 2
+        assert rig.session.profile.setting_id() == 'dolbyvision_23_truehd'
+        assert len(rig.profiles) == 2        # re-adopted under the new key
+
+    def test_save_not_touching_fps_override_keeps_the_memo(self, rig):
+        rig.start()
+        rig.dispatcher.post(events.SettingsChanged(
+            changed=frozenset(('enable_notifications',))))
+        rig.dispatcher.run_pending()
+        rig.advance(1.0)
+        assert rig.detector.full_gathers == 1
+
+    def test_new_session_starts_with_a_full_gather(self, rig):
+        rig.start()
+        rig.dispatcher.post(events.PlaybackStopped())
+        rig.start()
+        assert rig.detector.full_gathers == 2
+        assert len(rig.probes) == 2
+        assert any('short_circuited=' in line for line in rig.debug)
+        assert rig.errors == []
+
+
+# ============================================================================
+# Sampled verification: time-to-STABLE
+# ============================================================================
+
+def _time_to_stable(plan, codec_at, horizon=5.0, step=0.125):
+    """Seconds from start to the first StreamStabilized under ``plan``.
+
+    ``codec_at(t)`` scripts the codec the gateway reports at time t; the
+    clock walks in ``step`` increments (binary-exact, so sample times never
+    drift past a timer) and the scripted flaps land between the detector's
+    samples exactly as a real stream's would.
+    """
+    rig = Rig(verify_plan=plan)
+    rig.start()
+    while not rig.stabilized and rig.clock() < horizon:
+        rig.gateway.codec = codec_at(rig.clock() + step)
+        rig.advance(step)
+    assert rig.errors == []
+    return rig.clock() if rig.stabilized else None
+
+
+def _flapping(t):
+    # Incomplete blips at [0.2, 0.3) and [0.95, 1.05); otherwise TrueHD.
+    return 'none' if 0.2 <= t < 0.3 or 0.95 <= t < 1.05 else 'truehd'
+
+
+class TestSampledVerification:
+
+    def test_clean_start_exits_early(self):
+        window = _time_to_stable(WINDOW_VERIFY, lambda t: 'truehd')
+        sampled = _time_to_stable(SAMPLED_VERIFY, lambda t: 'truehd')
+        assert window == pytest.approx(1.0)
+        assert sampled == pytest.approx(
+            (SAMPLED_VERIFY.agreement - 1) * SAMPLED_VERIFY.spacing_seconds)
+        assert sampled < window
+
+    def test_flapping_stream_restarts_only_a_short_run(self):
+        # A blip restarts the run from zero. The window verifier lands its
+        # single re-gather on the second blip and needs two whole seconds of
+        # agreement after it; the sampler restarts twice (at 0.25 and 1.0)
+        # and then needs only three quarter-second samples.
+        window = _time_to_stable(WINDOW_VERIFY, _flapping)
+        sampled = _time_to_stable(SAMPLED_VERIFY, _flapping)
+        assert window == pytest.approx(3.0)
+        assert sampled == pytest.approx(1.75)
+
+    def test_stabilized_semantics_are_preserved(self):
+        rig = Rig(verify_plan=SAMPLED_VERIFY)
+        rig.start()
+        rig.advance(0.25)
+        assert rig.stabilized == []          # one agreeing sample is not enough
+        assert rig.session.stream_state is StreamState.STABILIZING
+        rig.advance(0.25)
+        assert len(rig.stabilized) == 1
+        assert rig.stabilized[0].initial is True
+        assert rig.stabilized[0].profile_changed is True
+
+        # A blip that reverts re-confirms without announcing a change.
+        rig.gateway.codec = 'none'
+        rig.av_changed()
+        rig.gateway.codec = 'truehd'
+        rig.advance(0.25)
+        rig.advance(0.25)
+        assert len(rig.stabilized) == 1      # the run restarted from zero
+        rig.advance(0.25)
+        assert len(rig.stabilized) == 2
+        assert rig.stabilized[1].initial is False
+        assert rig.stabilized[1].profile_changed is False
+        assert len(rig.profiles) == 1
+        assert rig.errors == []
+
+    def test_change_mid_run_readopts_and_restarts_the_run(self):
+        rig = Rig(verify_plan=SAMPLED_VERIFY)
+        rig.start()
+        rig.advance(0.25)                    # 2 of 3
+        rig.gateway.codec = 'eac3'
+        rig.advance(0.25)                    # changed: re-adopt, run = 1
+        assert len(rig.profiles) == 2
+        assert rig.stabilized == []
+        rig.advance(0.25)
+        rig.advance(0.25)
+        assert len(rig.stabilized) == 1
+        assert rig.session.profile.setting_id() == 'dolbyvision_all_eac3'
+
+
+# ============================================================================
+# Player.* notifications: readiness hints and the notified player id
+# ============================================================================
+
+def _notify(rig, method='Player.OnAVStart', player_id=1):
+    rig.dispatcher.post(events.PlayerNotified(method=method,
+                                              player_id=player_id,
+                                              item_type='movie'))
+    rig.dispatcher.run_pending()
+
+
+class TestPlayerNotifications:
+
+    def test_ready_notification_pulls_the_pending_probe_forward(self, rig):
+        rig.gateway.codec = 'none'
+        rig.start()                          # probe #1 incomplete; #2 at 0.5s
+        rig.gateway.codec = 'truehd'
+        _notify(rig)                         # no clock advance
+        assert len(rig.profiles) == 1
+        assert rig.session.profile.setting_id() == 'dolbyvision_all_truehd'
+        assert any('probing now (attempt 2)' in line for line in rig.debug)
+        rig.advance(0.5)                     # the cadence probe was replaced
+        assert rig.detector.full_gathers == 2
+
+    def test_notified_player_id_spares_the_active_player_rpc(self, rig):
+        rig.gateway.player_id = -1           # GetActivePlayers has nothing yet
+        _notify(rig, player_id=1)
+        rig.start()
+        assert rig.session.profile.player_id == 1
+        assert len(rig.profiles) == 1
+
+    def test_property_notification_records_the_id_without_probing(self, rig):
+        rig.gateway.codec = 'none'
+        rig.start()
+        rig.gateway.codec = 'truehd'
+        _notify(rig, method='Player.OnPropertyChanged', player_id=1)
+        assert rig.profiles == []            # cadence probe still pending
+        rig.advance(0.5)
+        assert len(rig.profiles) == 1
+
+    def test_notification_outside_discovery_is_inert(self, rig):
+        rig.start()
+        _notify(rig, method='Player.OnAVChange')
+        assert rig.detector.full_gathers == 1
+        assert rig.detector.short_circuited_gathers == 0
+        assert len(rig.profiles) == 1
+
+    def test_notified_player_id_is_forgotten_at_session_end(self, rig):
+        _notify(rig, player_id=1)
+        rig.start()
+        rig.dispatcher.post(events.PlaybackStopped())
+        rig.gateway.player_id = -1
+        rig.start()
+        assert rig.session.profile is None   # falls back to the RPC
+        assert rig.errors == []
+
+
+# ============================================================================
+# Audio-switch hint: audio-only re-reads with a full-gather drift guard
+# ============================================================================
+
+class _CountingReads(FakeGateway):
+    def __init__(self, **kwargs):
+        FakeGateway.__init__(self, **kwargs)
+        self.infolabel_reads = 0
+
+    def infolabel(self, label):
+        self.infolabel_reads += 1
+        return FakeGateway.infolabel(self, label)
+
+
+@pytest.fixture
+def counting_rig(rig):
+    rig.gateway = _CountingReads(infolabels=dict(COMPLETE_INFOLABELS))
+    rig.detector._gateway = rig.gateway
+    return rig
+
+
+def _audio_switch(rig, codec, properties=('currentaudiostream',)):
+    """Switch the codec the way Kodi does: property notification + AvChanged."""
+    rig.gateway.codec = codec
+    rig.dispatcher.post(events.PlayerNotified(
+        method='Player.OnPropertyChanged', player_id=1, item_type='movie',
+        properties=properties))
+    rig.av_changed()
+
+
+class TestAudioHint:
+
+    def test_audio_switch_rereads_only_the_audio_stream(self, counting_rig):
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)                     # STABLE
+        reads = rig.gateway.infolabel_reads
+        _audio_switch(rig, 'eac3')
+        assert rig.gateway.infolabel_reads == reads
+        rig.advance(1.0)                     # the switch's own verify
+        assert rig.gateway.infolabel_reads == reads
+        assert rig.detector.audio_only_gathers == 2
+        assert rig.session.profile.setting_id() == 'dolbyvision_all_eac3'
+        assert rig.session.stream_state is StreamState.STABLE
+        assert len(rig.profiles) == 2
+        assert rig.detector._audio_hint is False   # spent at stabilization
+
+    def test_change_during_the_switch_verify_reads_everything(
+            self, counting_rig):
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)
+        _audio_switch(rig, 'eac3')           # adopted; verify pending
+        reads = rig.gateway.infolabel_reads
+        rig.gateway.infolabels[INFOLABEL_HDR] = 'hdr10'
+        rig.av_changed()                     # not the switch's news
+        assert rig.gateway.infolabel_reads == reads + 4
+        assert rig.session.profile.setting_id() == 'hdr10_all_eac3'
+
+    def test_non_audio_property_change_reads_everything(self, counting_rig):
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)
+        reads = rig.gateway.infolabel_reads
+        _audio_switch(rig, 'eac3',
+                      properties=('currentaudiostream', 'currentvideostream'))
+        assert rig.gateway.infolabel_reads == reads + 4
+        assert rig.detector.audio_only_gathers == 0
+
+    def test_video_change_under_a_full_gather_is_adopted(self, counting_rig):
+        # The drift guard: once the run limit is spent, the next gather
+        # re-reads the video axes and sees what changed under the hint.
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)
+        for codec in ('eac3', 'truehd', 'eac3'):
+            _audio_switch(rig, codec)        # three audio-only re-probes
+        rig.gateway.infolabels[INFOLABEL_HDR] = 'hdr10'
+        rig.advance(1.0)                     # verify: full gather
+        assert rig.detector.audio_only_gathers == \
+            StreamDetector.AUDIO_ONLY_RUN_LIMIT
+        assert rig.session.profile.setting_id() == 'hdr10_all_eac3'
+
+    def test_hint_is_dropped_at_stabilization(self, counting_rig):
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)
+        _audio_switch(rig, 'eac3')
+        rig.advance(1.0)                     # STABLE again
+        reads = rig.gateway.infolabel_reads
+        rig.av_changed()                     # no notification this time
+        assert rig.gateway.infolabel_reads == reads + 4
+
+    def test_unchanged_audio_switch_does_not_hide_a_later_video_change(
+            self, counting_rig):
+        # Same-codec track switch: the re-probe finds the same profile. The
+        # hint it spent must not turn the next (video) change audio-only.
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)
+        _audio_switch(rig, 'truehd')
+        assert rig.detector.audio_only_gathers == 1
+        rig.gateway.infolabels[INFOLABEL_HDR] = 'hdr10'
+        _notify(rig, method='Player.OnAVChange')
+        rig.av_changed()
+        assert rig.detector.audio_only_gathers == 1
+        assert rig.session.profile.setting_id() == 'hdr10_all_truehd'
+
+    def test_av_notifications_beyond_the_switch_drop_the_hint(
+            self, counting_rig):
+        rig = counting_rig
+        rig.start()
+        rig.advance(1.0)
+        rig.dispatcher.post(events.PlayerNotified(
+            method='Player.OnPropertyChanged', player_id=1,
+            item_type='movie', properties=('currentaudiostream',)))
+        _notify(rig, method='Player.OnAVChange')     # the switch's own
+        assert rig.detector._audio_hint is True
+        _notify(rig, method='Player.OnAVChange')     # news of another change
+        assert rig.detector._audio_hint is False
+
+    def test_discovery_ignores_the_hint(self, counting_rig):
+        rig = counting_rig
+        rig.gateway.codec = 'none'
+        rig.start()                          # probe #1: full
+        _audio_switch(rig, 'none')           # armed, but still discovering
+        rig.advance(0.5)                     # probe #2
+        assert rig.gateway.infolabel_reads == 8
+        assert rig.detector.audio_only_gathers == 0
@@ -7,6 +7,9 @@ existing users' stored offsets are keyed by it, so these assertions must
 survive every refactor unchanged.
 
 StreamProfile depends only on `dataclasses` (pure Python) — no Kodi stubs needed.
+
+The precomputed caches (interned setting id, axis ordinals, flat cell) and
+the ``interned`` constructor are pinned at the end of the file.
 """
 
 import pytest
@@ -132,3 +135,68 @@ def test_profile_is_frozen():
     profile = make_profile("hdr10", 23, "truehd")
     with pytest.raises(Exception):
         profile.hdr_type = "sdr"  # frozen dataclass -> FrozenInstanceError
+
+
+def test_profile_is_slotted():
+    profile = make_profile("hdr10", 23, "truehd")
+    assert not hasattr(profile, "__dict__")
+
+
+# --- precomputed key, ordinals and interning --------------------------------
+
+def test_ordinals_and_cell_match_the_vocabulary():
+    from resources.lib.aom.domain import formats
+
+    profile = make_profile("hdr10", 23, "eac3")
+    assert profile.hdr_ordinal == formats.HDR_TYPES.index("hdr10")
+    assert profile.fps_ordinal == formats.FPS_KEYS.index("23")
+    assert profile.audio_ordinal == formats.AUDIO_FORMATS.index("eac3")
+    assert formats.all_setting_keys()[profile.cell] == profile.setting_id()
+
+
+def test_unknown_axis_has_no_cell():
+    from resources.lib.aom.domain import formats
+
+    profile = make_profile("hdr10", "unknown", "truehd")
+    assert profile.fps_ordinal == formats.NO_ORDINAL
+    assert profile.cell == formats.NO_ORDINAL
+
+
+def test_setting_id_is_interned():
+    a = make_profile("hdr10", 23, "eac3", player_id=1)
+    b = make_profile("hdr10", "23", "eac3", player_id=2)
+    assert a.setting_id() is b.setting_id()
+
+
+def test_interned_returns_the_same_instance_for_identical_readings():
+    a = StreamProfile.interned("dolbyvision", "all", "truehd", 24, 1, 8)
+    b = StreamProfile.interned("dolbyvision", "all", "truehd", 24, 1, 8)
+    c = StreamProfile.interned("dolbyvision", "all", "truehd", 24, 1, 6)
+    assert a is b
+    assert c is not a
+    assert c == make_profile("dolbyvision", "all", "truehd", video_fps=24,
+                             audio_channels=6)
+
+
+def test_interned_table_is_bounded():
+    StreamProfile._INTERNED.clear()
+    for channels in range(StreamProfile._INTERN_LIMIT + 10):
+        StreamProfile.interned("sdr", "all", "pcm", 24, 1, channels)
+    assert len(StreamProfile._INTERNED) <= StreamProfile._INTERN_LIMIT
+
+
+@pytest.mark.parametrize("other, expected", [
+    (make_profile("hdr10", 23, "eac3", player_id=9, audio_channels=2), True),
+    (make_profile("hdr10", "23", "eac3"), True),
+    (make_profile("hdr10", 24, "eac3"), False),
+    (make_profile("hdr10", 23, "ac3"), False),
+    (None, False),
+])
+def test_same_key_compares_offset_identity(other, expected):
+    assert make_profile("hdr10", 23, "eac3").same_key(other) is expected
+
+
+def test_same_key_for_profiles_outside_the_vocabulary():
+    unknown = make_profile("unknown", "unknown", "unknown")
+    assert unknown.same_key(make_profile("unknown", "unknown", "unknown"))
+    assert not unknown.same_key(make_profile("unknown", "unknown", "pcm"))
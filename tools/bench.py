@@ -0,0 +1,679 @@
+#!/usr/bin/env python3
+"""Hot-path micro-benchmarks for the service, driven entirely on test fakes.
+
+Each scenario assembles the real app components on ``tests.fakes`` (a
+``FakeClock``-driven dispatcher pumped with ``run_pending()``, exactly like
+the unit suite) and reports wall time per iteration. No Kodi, no threads,
+no sleeps: the numbers measure the Python work the dispatcher thread does,
+not Kodi's RPC latency — which is why scenarios that care about RPCs also
+COUNT gateway calls rather than timing them.
+
+Usage:
+    python tools/bench.py                   # run every scenario
+    python tools/bench.py detect            # run one scenario
+    python tools/bench.py --list            # list scenario names
+    python tools/bench.py -n 50000 detect   # override the iteration count
+
+Stdlib only; Python 3.8 compatible. Dev-only (tools/ is export-ignore'd).
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+
+# Make ``resources.lib.aom`` and ``tests.fakes`` importable from anywhere.
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from resources.lib.aom.app import events  # noqa: E402
+from resources.lib.aom.app.adjustment_watcher import (  # noqa: E402
+    AdjustmentWatcher)
+from resources.lib.aom.app.bulk_edit import BulkEditor  # noqa: E402
+from resources.lib.aom.app.dispatcher import Dispatcher  # noqa: E402
+from resources.lib.aom.app.offset_applier import OffsetApplier  # noqa: E402
+from resources.lib.aom.app.seek_scheduler import (  # noqa: E402
+    ExternalSeekCoordinator, SeekScheduler)
+from resources.lib.aom.app.session import SessionTracker  # noqa: E402
+from resources.lib.aom.app.settings_writer import SettingsWriter  # noqa: E402
+from resources.lib.aom.domain import (  # noqa: E402
+    bulk_ops, classify, formats, policies)
+from resources.lib.aom.domain.offset_file import (  # noqa: E402
+    format_offsets, parse_offsets)
+from resources.lib.aom.domain.profile import StreamProfile  # noqa: E402
+from resources.lib.aom.app.stream_detector import (  # noqa: E402
+    INFOLABEL_FPS, INFOLABEL_HDR, StreamDetector, _same_stream,
+    derive_stream_facts)
+from tests.fakes import (  # noqa: E402
+    FakeClock, FakeFacade, FakeGateway, FakeGui, FakeOffsetTable)
+from tools import generate_settings  # noqa: E402
+
+
+def _noop(*_args):
+    return None
+
+
+class _Graph(object):
+    """Tracker + detector + applier on fakes, settled to STABLE."""
+
+    def __init__(self):
+        self.clock = FakeClock()
+        self.dispatcher = Dispatcher(clock=self.clock, log_error=_noop)
+        self.tracker = SessionTracker(self.dispatcher)
+        self.gateway = FakeGateway(infolabels={
+            INFOLABEL_FPS: '23.976',
+            INFOLABEL_HDR: 'dolbyvision',
+        })
+        self.facade = FakeFacade()
+        self.offsets = FakeOffsetTable()
+        self.detector = StreamDetector(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            log_debug=_noop, log_warning=_noop, rng=lambda: 0.5)
+        self.applier = OffsetApplier(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            self.offsets, log_debug=_noop, log_warning=_noop)
+        self.dispatcher.post(events.PlaybackStarted())
+        self.dispatcher.run_pending()
+        self.advance(StreamDetector.VERIFY_WINDOW_SECONDS)
+
+    def advance(self, seconds):
+        self.clock.advance(seconds)
+        self.dispatcher.run_pending()
+
+
+# --------------------------------------------------------------------------- #
+# Scenarios.                                                                  #
+# --------------------------------------------------------------------------- #
+
+def bench_detect(iterations):
+    """gather -> compare -> apply: one steady-state AV change + retry pass.
+
+    The stream never changes, so every iteration is the common case: a
+    re-gather that matches the adopted profile, then a stabilization retry
+    that the applier's dedupe turns into a no-op.
+    """
+    graph = _Graph()
+    session_id = graph.tracker.current.session_id
+    av_changed = events.AvChanged()
+    stabilized = events.StreamStabilized(session_id=session_id,
+                                         profile_changed=False)
+    post = graph.dispatcher.post
+    pump = graph.dispatcher.run_pending
+
+    def one():
+        post(av_changed)
+        post(stabilized)
+        pump()
+
+    seconds = timeit.timeit(one, number=iterations)
+    return {'us_per_iteration': seconds / iterations * 1e6}
+
+
+def bench_profile_key(iterations):
+    """derive -> same-stream compare -> the keyed reads of one apply pass.
+
+    The detector-free core of ``detect``: what a steady-state gather costs
+    once dispatcher overhead is taken out (setting_id() is read by the
+    applier dedupe, the offset lookup and the notifier dedupe key).
+    """
+    adopted = derive_stream_facts(
+        1, 'truehd', 8, '23.976', 'dolbyvision', '', '',
+        lambda hdr: False).profile
+
+    def one():
+        profile = derive_stream_facts(
+            1, 'truehd', 8, '23.976', 'dolbyvision', '', '',
+            lambda hdr: False).profile
+        _same_stream(profile, adopted)
+        profile.setting_id()
+        profile.setting_id()
+        profile.setting_id()
+
+    seconds = timeit.timeit(one, number=iterations)
+    return {'us_per_iteration': seconds / iterations * 1e6}
+
+
+class _CountingGateway(FakeGateway):
+    """FakeGateway that counts every read RPC/InfoLabel the app makes."""
+
+    def __init__(self, **kwargs):
+        FakeGateway.__init__(self, **kwargs)
+        self.rpcs = 0
+        self.infolabel_reads = 0
+
+    def active_player_id(self):
+        self.rpcs += 1
+        return FakeGateway.active_player_id(self)
+
+    def audio_info(self, player_id):
+        self.rpcs += 1
+        return FakeGateway.audio_info(self, player_id)
+
+    def infolabel(self, label):
+        self.infolabel_reads += 1
+        return FakeGateway.infolabel(self, label)
+
+    def audio_settings_dialog_open(self):
+        self.rpcs += 1
+        return FakeGateway.audio_settings_dialog_open(self)
+
+
+class _CountingFacade(FakeFacade):
+    """FakeFacade that counts the watcher's eligibility reads."""
+
+    def __init__(self):
+        FakeFacade.__init__(self)
+        self.reads = 0
+
+    def active_monitoring_enabled(self):
+        self.reads += 1
+        return FakeFacade.active_monitoring_enabled(self)
+
+    def is_hdr_enabled(self, hdr_type):
+        self.reads += 1
+        return FakeFacade.is_hdr_enabled(self, hdr_type)
+
+
+def bench_av_burst(iterations):
+    """RPCs and applies per onAVChange burst (passthrough renegotiation).
+
+    Each burst is four AvChanged callbacks 100ms apart around one real
+    codec switch, with transient intermediate readings ('pcm', then 'none')
+    before the final codec lands. Counts, per burst, the player RPCs
+    (GetActivePlayers + GetProperties), InfoLabel reads, and the
+    Player.SetAudioDelay applies that reached the gateway.
+    """
+    graph = _Graph()
+    gateway = _CountingGateway(infolabels=dict(graph.gateway.infolabels))
+    graph.detector._gateway = gateway
+    graph.applier._gateway = gateway
+    post = graph.dispatcher.post
+    finals = ('eac3', 'truehd')
+
+    def burst(final):
+        for codec in ('pcm', 'none', final, final):
+            gateway.codec = codec
+            post(events.AvChanged())
+            graph.advance(0.1)
+        graph.advance(2.0)          # settle + verify
+
+    started = timeit.default_timer()
+    for index in range(iterations):
+        burst(finals[index % 2])
+    seconds = timeit.default_timer() - started
+    return {
+        'rpcs_per_burst': float(gateway.rpcs) / iterations,
+        'infolabels_per_burst': float(gateway.infolabel_reads) / iterations,
+        'applies_per_burst': float(len(gateway.applied)) / iterations,
+        'us_per_burst': seconds / iterations * 1e6,
+    }
+
+
+def bench_audio_switch(iterations):
+    """Gateway reads per mid-play audio-stream switch, hinted vs. not.
+
+    Each switch flips the codec and fires one AvChanged, then runs the
+    settle + verify window. ``hinted`` delivers the
+    ``Player.OnPropertyChanged`` (``currentaudiostream``) Kodi sends with
+    it, so the detector re-reads only the audio stream; ``unhinted``
+    delivers a ``Player.OnAVChange`` instead (same player id, no axis
+    hint). ``reads`` counts player RPCs plus InfoLabel reads.
+    """
+    def run(hinted):
+        graph = _Graph()
+        gateway = _CountingGateway(infolabels=dict(graph.gateway.infolabels))
+        graph.detector._gateway = gateway
+        graph.applier._gateway = gateway
+        post = graph.dispatcher.post
+        finals = ('eac3', 'truehd')
+        if hinted:
+            notification = events.PlayerNotified(
+                method='Player.OnPropertyChanged', player_id=1,
+                item_type='movie', properties=('currentaudiostream',))
+        else:
+            notification = events.PlayerNotified(
+                method='Player.OnAVChange', player_id=1, item_type='movie')
+        started = timeit.default_timer()
+        for index in range(iterations):
+            gateway.codec = finals[index % 2]
+            post(notification)
+            post(events.AvChanged())
+            graph.advance(0.0)
+            graph.advance(StreamDetector.AV_SETTLE_SECONDS)
+            graph.advance(StreamDetector.VERIFY_WINDOW_SECONDS)
+        seconds = timeit.default_timer() - started
+        reads = gateway.rpcs + gateway.infolabel_reads
+        return float(reads) / iterations, seconds / iterations * 1e6
+
+    hinted_reads, hinted_us = run(True)
+    unhinted_reads, unhinted_us = run(False)
+    return {
+        'reads_per_switch_hinted': hinted_reads,
+        'reads_per_switch_unhinted': unhinted_reads,
+        'us_per_switch_hinted': hinted_us,
+        'us_per_switch_unhinted': unhinted_us,
+    }
+
+
+_WATCH_PROFILE = StreamProfile(hdr_type='dolbyvision', fps_type='all',
+                               audio_format='truehd', video_fps=24,
+                               player_id=1, audio_channels=8)
+
+
+class _WatchRig(object):
+    """Tracker + writer + adjustment watcher on counting fakes; ``play()``
+    starts a watched session with our -125 ms applied."""
+
+    def __init__(self, max_idle_tick, hinted=False):
+        self.clock = FakeClock()
+        self.dispatcher = Dispatcher(clock=self.clock, log_error=_noop)
+        self.tracker = SessionTracker(self.dispatcher, clock=self.clock)
+        self.gateway = _CountingGateway(infolabels={
+            AdjustmentWatcher.INFOLABEL_AUDIO_DELAY: '-0.125 s'})
+        self.facade = _CountingFacade()
+        offsets = FakeOffsetTable()
+        writer = SettingsWriter(self.dispatcher, self.gateway, self.facade,
+                                offsets, log_debug=_noop, log_warning=_noop)
+        self.watcher = AdjustmentWatcher(
+            self.dispatcher, self.tracker, self.gateway, self.facade,
+            offsets, writer, clock=self.clock, log_debug=_noop,
+            max_idle_tick=max_idle_tick)
+        self.hinted = hinted
+
+    def play(self):
+        self.dispatcher.post(events.PlaybackStarted())
+        self.dispatcher.run_pending()
+        session = self.tracker.current
+        session.profile = _WATCH_PROFILE
+        session.applied = (_WATCH_PROFILE.setting_id(), -125)
+        if self.hinted:
+            session.watch_hint_streak = AdjustmentWatcher.HINT_CONFIRMATIONS
+        self.dispatcher.post(events.ProfileChanged(
+            session_id=session.session_id))
+        self.dispatcher.run_pending()
+
+    def stop(self):
+        self.dispatcher.post(events.PlaybackEnded())
+        self.dispatcher.run_pending()
+
+    def advance(self, seconds):
+        self.clock.advance(seconds)
+        self.dispatcher.run_pending()
+
+    @property
+    def reads(self):
+        return (self.gateway.rpcs + self.gateway.infolabel_reads
+                + self.facade.reads)
+
+
+def bench_watch_polling(iterations):
+    """Adjustment-watcher reads per hour of steady playback, the fixed 1 s
+    cadence (``max_idle_tick`` at the idle cadence) vs. the adaptive one.
+
+    ``film`` is an hour of playback with the delay at our applied value;
+    ``paused`` spends 15 minutes of it paused (both variants stop
+    polling while paused; only the back-off differs). ``film_hinted`` is
+    the film with notification hints trusted (the poll at its safety-net
+    ceiling; ``adaptive`` only). ``reads`` counts the
+    delay InfoLabel, dialog-id and settings eligibility reads; ``iterations``
+    is the number of simulated hours per variant.
+    """
+    hour = 3600.0
+
+    def run(max_idle_tick, pause, hinted=False):
+        rig = _WatchRig(max_idle_tick, hinted=hinted)
+        started = timeit.default_timer()
+        for _ in range(iterations):
+            rig.play()
+            end = rig.clock() + hour
+            while rig.clock() < end:
+                if pause and abs(end - rig.clock() - hour / 2) < 0.1:
+                    rig.dispatcher.post(events.Paused())
+                if pause and abs(end - rig.clock() - hour / 4) < 0.1:
+                    rig.dispatcher.post(events.Resumed())
+                rig.advance(0.25)
+            rig.stop()
+        seconds = timeit.default_timer() - started
+        return float(rig.reads) / iterations, seconds / iterations * 1e3
+
+    idle = AdjustmentWatcher.IDLE_TICK_SECONDS
+    result = {}
+    for name, pause in (('film', False), ('paused', True)):
+        fixed, _ = run(idle, pause)
+        adaptive, ms = run(AdjustmentWatcher.MAX_IDLE_TICK_SECONDS, pause)
+        result['reads_per_hour_{0}_fixed'.format(name)] = fixed
+        result['reads_per_hour_{0}_adaptive'.format(name)] = adaptive
+        result['ms_per_simulated_hour_{0}'.format(name)] = ms
+    result['reads_per_hour_film_hinted_adaptive'], _ = run(
+        AdjustmentWatcher.MAX_IDLE_TICK_SECONDS, False, hinted=True)
+    return result
+
+
+def bench_watch_tick(iterations):
+    """CPU per WatchTick on FakeGateway: one tick per 1 s step (the back-off
+    held at the idle cadence), dispatcher included.
+
+    ``steady`` reads the same string every tick (the common case);
+    ``changing`` alternates two strings, each held past quiescence, so
+    every few ticks parse and classify a new value. ``parse`` is
+    ``policies.parse_delay_ms`` alone, for scale. Also reports eligibility
+    settings reads per tick.
+    """
+    idle = AdjustmentWatcher.IDLE_TICK_SECONDS
+    label = AdjustmentWatcher.INFOLABEL_AUDIO_DELAY
+    result = {}
+
+    rig = _WatchRig(idle)
+    rig.play()
+    reads = rig.facade.reads
+    started = timeit.default_timer()
+    for _ in range(iterations):
+        rig.advance(idle)
+    result['us_per_tick_steady'] = (
+        (timeit.default_timer() - started) / iterations * 1e6)
+    result['settings_reads_per_tick'] = (
+        float(rig.facade.reads - reads) / iterations)
+
+    rig = _WatchRig(idle)
+    rig.play()
+    values = ('-0.100 s', '-0.125 s')
+    hold = int(AdjustmentWatcher.QUIESCENCE_SECONDS / idle) + 2
+    started = timeit.default_timer()
+    for index in range(iterations):
+        rig.gateway.infolabels[label] = values[(index // hold) % 2]
+        rig.advance(idle)
+    result['us_per_tick_changing'] = (
+        (timeit.default_timer() - started) / iterations * 1e6)
+
+    result['us_per_parse'] = timeit.timeit(
+        lambda: policies.parse_delay_ms('-0.125 s'),
+        number=iterations) / iterations * 1e6
+    return result
+
+
+def bench_seek_wakeups(iterations):
+    """Seek-back attempts and landing lag for one 'resume' replay.
+
+    The dispatcher is stepped in 10 ms increments: Kodi's own resume seek
+    lands at 0.7 s, the stream reaches STABLE (with its StreamStabilized)
+    at 2.9 s, so the replay is allowed from 2.9 s on. Reports the
+    ``ExecuteSeek`` attempts per replay, the lag from "allowed" to the
+    seek, and wall time per replay.
+    """
+    step = 0.01
+    allowed_at = 2.9
+    attempts = []
+    lags = []
+    started = timeit.default_timer()
+    for _ in range(iterations):
+        clock = FakeClock()
+        dispatcher = Dispatcher(clock=clock, log_error=_noop)
+        tracker = SessionTracker(dispatcher, clock=clock)
+        gateway = FakeGateway()
+        SeekScheduler(dispatcher, tracker, FakeFacade(),
+                      ExternalSeekCoordinator(gateway, clock=clock,
+                                              log_debug=_noop),
+                      clock=clock, log_debug=_noop, log_warning=_noop)
+        count = [0]
+
+        def count_attempt(_event):
+            count[0] += 1
+
+        dispatcher.subscribe(events.ExecuteSeek, count_attempt)
+        dispatcher.post(events.PlaybackStarted())
+        dispatcher.run_pending()
+        session = tracker.current
+        seek_posted = stabilized = False
+        while not gateway.seeks and clock() < 10.0:
+            clock.advance(step)
+            if not seek_posted and clock() >= 0.7:
+                seek_posted = True
+                dispatcher.post(events.SeekOccurred(time_ms=60000,
+                                                    offset_ms=-4000))
+            if not stabilized and clock() >= allowed_at - 1e-9:
+                stabilized = True
+                session.profile = _WATCH_PROFILE
+                session.mark_profile_built()
+                session.mark_stable()
+                dispatcher.post(events.StreamStabilized(
+                    session_id=session.session_id, profile_changed=False))
+            dispatcher.run_pending()
+        attempts.append(count[0])
+        lags.append(clock() - allowed_at)
+    seconds = timeit.default_timer() - started
+    return {
+        'attempts_per_replay': float(sum(attempts)) / iterations,
+        'ms_lag_after_allowed': max(0.0, max(lags)) * 1e3,
+        'us_per_replay': seconds / iterations * 1e6,
+    }
+
+
+CORPUS_PATH = os.path.join(REPO_ROOT, 'tests', 'data',
+                           'classification_corpus.json')
+
+
+def bench_classify(iterations):
+    """Raw codec/HDR readings -> vocabulary, over the shipped corpus.
+
+    ``warm`` is the steady state (every reading already in the exact
+    table); ``cold`` builds fresh classifiers per pass, so every reading
+    takes the normalize + longest-match path once.
+    """
+    with open(CORPUS_PATH, encoding='utf-8') as handle:
+        corpus = json.load(handle)
+    audio_raw = [raw for raw, _expected in corpus['audio']]
+    hdr_raw = [raw for raw, _expected in corpus['hdr']]
+    readings = len(audio_raw) + len(hdr_raw)
+
+    def one_pass(audio, hdr):
+        for raw in audio_raw:
+            audio(raw)
+        for raw in hdr_raw:
+            hdr(raw)
+
+    audio, hdr = classify.audio_classifier(), classify.hdr_classifier()
+    warm = timeit.timeit(lambda: one_pass(audio, hdr), number=iterations)
+    cold = timeit.timeit(
+        lambda: one_pass(classify.audio_classifier(),
+                         classify.hdr_classifier()),
+        number=max(1, iterations // 10))
+    return {
+        'ns_per_reading_warm': warm / iterations / readings * 1e9,
+        'ns_per_reading_cold': (cold / max(1, iterations // 10)
+                                / readings * 1e9),
+    }
+
+
+SETTINGS_XML_PATH = os.path.join(REPO_ROOT, 'resources', 'settings.xml')
+
+
+def bench_settings_load(iterations):
+    """Offset load cost: settings.xml parse vs. the sparse offset file.
+
+    ``xml`` parses the shipped settings.xml with ElementTree (Kodi parses
+    it at service start and on every dialog open) and reports its size;
+    ``sparse_layout_xml`` is the same for the generator's sparse layout;
+    ``sparse_<n>`` decodes an offset file with ``n`` calibrated entries —
+    12 is a typical calibration, 315 is every cell non-zero (the worst
+    case, and what migration produces from a fully calibrated matrix).
+    """
+    with open(SETTINGS_XML_PATH, encoding='utf-8') as handle:
+        xml_text = handle.read()
+    root = ET.fromstring(xml_text)
+    sparse_xml = generate_settings.build_settings_text(
+        generate_settings.LAYOUT_SPARSE)
+    keys = formats.all_setting_keys()
+    typical = format_offsets({key: 25 for key in keys[::len(keys) // 12][:12]})
+    full = format_offsets({key: 25 for key in keys})
+    xml_seconds = timeit.timeit(lambda: ET.fromstring(xml_text),
+                                number=max(1, iterations // 10))
+    sparse_xml_seconds = timeit.timeit(lambda: ET.fromstring(sparse_xml),
+                                       number=max(1, iterations // 10))
+    typical_seconds = timeit.timeit(lambda: parse_offsets(typical),
+                                    number=iterations)
+    full_seconds = timeit.timeit(lambda: parse_offsets(full),
+                                 number=iterations)
+    return {
+        'xml_bytes': len(xml_text.encode('utf-8')),
+        'xml_settings': sum(1 for _ in root.iter('setting')),
+        'us_per_xml_parse': xml_seconds / max(1, iterations // 10) * 1e6,
+        'sparse_layout_xml_bytes': len(sparse_xml.encode('utf-8')),
+        'us_per_sparse_layout_xml_parse': (sparse_xml_seconds
+                                           / max(1, iterations // 10) * 1e6),
+        'sparse_12_bytes': len(typical),
+        'sparse_315_bytes': len(full),
+        'us_per_sparse_12_parse': typical_seconds / iterations * 1e6,
+        'us_per_sparse_315_parse': full_seconds / iterations * 1e6,
+    }
+
+
+def _condition_count(root):
+    """Visibility/enable conditions: ``<condition>`` elements plus shorthand
+    ``<dependency setting=...>`` ones (each is its own condition)."""
+    return (sum(1 for _ in root.iter('condition'))
+            + sum(1 for dependency in root.iter('dependency')
+                  if dependency.get('setting') is not None))
+
+
+def bench_settings_layouts(iterations):
+    """ElementTree parse cost of each generator layout (``full`` is the
+    shipped settings.xml, ``sparse`` the offset-store build), with the size Kodi has to walk: bytes,
+    elements, ``<dependency>`` elements and conditions."""
+    number = max(1, iterations // 10)
+    result = {}
+    for layout in generate_settings.LAYOUTS:
+        text = generate_settings.build_settings_text(layout).encode('utf-8')
+        root = ET.fromstring(text)
+        seconds = timeit.timeit(lambda: ET.fromstring(text), number=number)
+        result[layout + '_bytes'] = len(text)
+        result[layout + '_elements'] = sum(1 for _ in root.iter())
+        result[layout + '_dependency_elements'] = sum(
+            1 for _ in root.iter('dependency'))
+        result[layout + '_conditions'] = _condition_count(root)
+        result['us_per_' + layout + '_parse'] = seconds / number * 1e6
+    return result
+
+
+class _DictOffsets(object):
+    """The bulk editor's offset-backend surface over a dict (no Kodi)."""
+
+    def __init__(self, offsets):
+        self.offsets = offsets
+
+    def read_ints(self, setting_ids, default=0):
+        return [self.offsets.get(setting_id, default)
+                for setting_id in setting_ids]
+
+    def write_ints(self, values):
+        self.offsets.update(values)
+        return True
+
+
+class _Duration(object):
+    def notification_duration_ms(self):
+        return 5000
+
+
+def bench_bulk_edit(iterations):
+    """One RunScript bulk command end to end, on fakes: parse, bulk read,
+    plan, one batched write, hold and notification.
+
+    Over a fully calibrated matrix (every offset at 100 ms). ``shift_hdr``
+    moves one HDR type (64 ids) back and forth by 25 ms; ``copy_hdr``
+    rewrites one HDR type from another that differs in every id. Kodi's
+    own cost is not timed: one ``setInt`` per changed id on the settings
+    store, one file write on the sparse store.
+    """
+    keys = formats.all_offset_keys()
+    gui = FakeGui()
+
+    def editor(offsets):
+        return BulkEditor(_DictOffsets(offsets), FakeGateway(), gui,
+                          _Duration(), log_debug=_noop, log_warning=_noop)
+
+    shifter = editor(dict.fromkeys(keys, 100))
+    shifts = [['shift', 'hdr=dolbyvision', 'ms=25'],
+              ['shift', 'hdr=dolbyvision', 'ms=-25']]
+    shift_ids = shifter.run(shifts[1])
+    counter = iter(range(2 * iterations + 2))
+    shift_seconds = timeit.timeit(
+        lambda: shifter.run(shifts[next(counter) % 2]), number=iterations)
+
+    offsets = dict.fromkeys(keys, 100)
+    copier = editor(offsets)
+    copy_ids = len(bulk_ops.slice_keys(hdr='sdr'))
+
+    def copy():
+        offsets.update(dict.fromkeys(bulk_ops.slice_keys(hdr='sdr'), 50))
+        copier.run(['copy', 'from=hdr10', 'to=sdr'])
+
+    copy_seconds = timeit.timeit(copy, number=iterations)
+    return {
+        'shift_hdr_ids': shift_ids,
+        'us_per_shift_hdr': shift_seconds / iterations * 1e6,
+        'copy_hdr_ids': copy_ids,
+        'us_per_copy_hdr': copy_seconds / iterations * 1e6,
+    }
+
+
+SCENARIOS = {
+    'audio_switch': (bench_audio_switch, 2000),
+    'bulk_edit': (bench_bulk_edit, 2000),
+    'av_burst': (bench_av_burst, 2000),
+    'classify': (bench_classify, 20000),
+    'detect': (bench_detect, 20000),
+    'profile_key': (bench_profile_key, 100000),
+    'seek_wakeups': (bench_seek_wakeups, 200),
+    'settings_layouts': (bench_settings_layouts, 500),
+    'settings_load': (bench_settings_load, 2000),
+    'watch_polling': (bench_watch_polling, 2),
+    'watch_tick': (bench_watch_tick, 20000),
+}
+
+
+# --------------------------------------------------------------------------- #
+# CLI.                                                                        #
+# --------------------------------------------------------------------------- #
+
+def _format(value):
+    if isinstance(value, float):
+        return "{0:.2f}".format(value)
+    return str(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run hot-path benchmarks.")
+    parser.add_argument("scenarios", nargs="*",
+                        help="scenario names (default: all)")
+    parser.add_argument("-n", "--iterations", type=int, default=None,
+                        help="override each scenario's iteration count")
+    parser.add_argument("--list", action="store_true",
+                        help="list scenario names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in sorted(SCENARIOS):
+            print(name)
+        return 0
+
+    names = args.scenarios or sorted(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error("unknown scenario(s): {0}".format(", ".join(unknown)))
+
+    for name in names:
+        function, default_iterations = SCENARIOS[name]
+        iterations = args.iterations or default_iterations
+        result = function(iterations)
+        fields = ", ".join("{0}={1}".format(key, _format(value))
+                           for key, value in sorted(result.items()))
+        print("{0:<12} n={1:<7} {2}".format(name, iterations, fields))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
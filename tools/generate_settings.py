@@ -2,9 +2,10 @@
 """Generate resources/settings.xml from the format vocabulary.
 
 `settings.xml` is a pure Cartesian product: one integer offset slider for every
-`<hdr>_<fps>_<audio>` combination (315 of them), wrapped in a fixed structural
-skeleton (per-HDR enable toggles, seek-back, notifications, platform-info and
-advanced categories). Hand-maintaining ~7,700 lines of that is error-prone, so
+`<hdr>_<fps>_<audio>` combination (315 of them), plus one `<hdr>_default`
+slider per HDR type, wrapped in a fixed structural skeleton (per-HDR enable
+toggles, seek-back, notifications, platform-info and advanced categories).
+Hand-maintaining ~8,100 lines of that is error-prone, so
 this generator emits the whole file instead:
 
 - Everything *vocabulary-shaped* — the HDR types, audio formats, FPS buckets,
@@ -20,9 +21,20 @@ iterated for ordering; the template maps are looked up by key, never iterated
 for content order). It is written with LF line endings and UTF-8, matching the
 canonical form the contract test pins.
 
+The ``sparse`` layout is for builds that keep offsets in the sparse offset
+store (``aom.kodi.offset_store``) instead of the settings: it drops the
+offset-slider matrix, the per-HDR default sliders and the FPS-bucket
+spinners that only navigate the matrix,
+keeps the per-HDR enable/FPS-override toggles and every non-grid category,
+and defaults ``enable_sparse_offsets`` on. The shipped ``settings.xml`` is
+the ``full`` layout; there, every offset slider and FPS spinner is visible
+only while ``enable_sparse_offsets`` is off, so a user on the sparse store
+is not shown sliders the service ignores.
+
 Usage:
     python tools/generate_settings.py            # write resources/settings.xml
     python tools/generate_settings.py --check     # verify the file is current
+    python tools/generate_settings.py --layout sparse -o /tmp/settings.xml
 
 Stdlib only; Python 3.8 compatible.
 """
@@ -41,6 +53,14 @@ from resources.lib.aom.domain import formats  # noqa: E402
 
 SETTINGS_PATH = os.path.join(REPO_ROOT, "resources", "settings.xml")
 
+LAYOUT_FULL = "full"
+LAYOUT_SPARSE = "sparse"
+LAYOUTS = (LAYOUT_FULL, LAYOUT_SPARSE)
+
+# The sparse offset store toggle; while it is on, the full layout hides the
+# offset sliders and FPS spinners (the service reads the store instead).
+SPARSE_OFFSETS_ID = "enable_sparse_offsets"
+
 XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
 INDENT_UNIT = "    "  # 4 spaces
 
@@ -237,6 +257,7 @@ def _offset_slider(hdr, fps, audio):
             _condition(fps_enable_id, "true"),
             _condition(hdr + "_fps", str(fps)),
         ]
+    conditions.append(_condition(SPARSE_OFFSETS_ID, "false"))
     return Node(
         "setting",
         [("id", formats.setting_key(hdr, fps, audio)), ("type", "integer"),
@@ -251,6 +272,28 @@ def _offset_slider(hdr, fps, audio):
     )
 
 
+def _hdr_default_slider(hdr):
+    """The `<hdr>_default` offset slider: the last level of offset
+    resolution (see aom.domain.resolution)."""
+    label, help_id = formats.HDR_DEFAULT_STRING_IDS
+    enable_id = "enable_" + hdr
+    return Node(
+        "setting",
+        [("id", formats.hdr_default_key(hdr)), ("type", "integer"),
+         ("label", label), ("help", help_id), ("parent", enable_id)],
+        children=[
+            _dependencies(_dep_visible_group("and", [
+                _condition(enable_id, "true"),
+                _condition(SPARSE_OFFSETS_ID, "false"),
+            ])),
+            _level("0"),
+            _default("0"),
+            _constraints_range(-1000, 25, 1000),
+            _control_slider_integer(),
+        ],
+    )
+
+
 def _enable_hdr_setting(hdr):
     """The `enable_<hdr>` toggle (HDR10+ is gated on platform capability)."""
     label, help_id = HDR_ENABLE_STRING_IDS[hdr]
@@ -301,6 +344,7 @@ def _fps_spinner_setting(hdr):
             _dependencies(_dep_visible_group("and", [
                 _condition("enable_" + hdr, "true"),
                 _condition("enable_fps_" + hdr, "true"),
+                _condition(SPARSE_OFFSETS_ID, "false"),
             ])),
             _level("0"),
             _default("23"),
@@ -356,6 +400,20 @@ def _info_toggle(setting_id, label):
     )
 
 
+def _info_integer(setting_id, label):
+    """A read-only info number (label only, <enable>false</enable>)."""
+    return Node(
+        "setting",
+        [("id", setting_id), ("type", "integer"), ("label", label)],
+        children=[
+            _level("0"),
+            _enable("false"),
+            _default("0"),
+            Node("control", [("type", "edit"), ("format", "integer")]),
+        ],
+    )
+
+
 # --------------------------------------------------------------------------- #
 # Document assembly.                                                          #
 # --------------------------------------------------------------------------- #
@@ -376,8 +434,10 @@ def _emit_setting(out, node, comment=None, blank_before=False):
     _render(node, 4, out)
 
 
-def _emit_hdr_category(out, hdr):
-    """Emit one HDR category: banner comment, group, 3 toggles, 63 sliders."""
+def _emit_hdr_category(out, hdr, layout):
+    """Emit one HDR category: banner comment, group, 2 toggles, the default
+    slider, the FPS spinner and 63 sliders (the sparse layout: the two
+    toggles only)."""
     label, help_id = HDR_CATEGORY_LABELS[hdr]
     out.append('{0}<category id="{1}" label="{2}" help="{3}">'.format(
         _indent(2), hdr, label, help_id))
@@ -387,6 +447,11 @@ def _emit_hdr_category(out, hdr):
 
     _render(_enable_hdr_setting(hdr), 4, out)
     _render(_enable_fps_setting(hdr), 4, out)
+    if layout == LAYOUT_SPARSE:
+        out.append("{0}</group>".format(_indent(3)))
+        out.append("{0}</category>".format(_indent(2)))
+        return
+    _render(_hdr_default_slider(hdr), 4, out)
     _render(_fps_spinner_setting(hdr), 4, out)
 
     for fps in (formats.FPS_ALL,) + formats.FPS_BUCKETS:
@@ -473,11 +538,12 @@ def _emit_platform_info(out):
     _render(_info_toggle("platform_hdr_full", "32105"), 4, out)
     _render(_info_toggle("platform_hdr10plus", "32052"), 4, out)
     _render(_info_toggle("advanced_hlg", "32054"), 4, out)
+    _render(_info_integer("platform_phantom_ms", "32120"), 4, out)
     out.append("{0}</group>".format(_indent(3)))
     out.append("{0}</category>".format(_indent(2)))
 
 
-def _emit_advanced(out):
+def _emit_advanced(out, layout):
     out.append('{0}<category id="advanced" label="32100" help="32101">'.format(
         _indent(2)))
     out.append('{0}<group id="12" label="32102">'.format(_indent(3)))
@@ -486,12 +552,41 @@ def _emit_advanced(out):
         [("id", "enable_debug_logging"), ("type", "boolean"),
          ("label", "32103"), ("help", "32104")],
         children=[_level("0"), _default("false"), _control_toggle()]), 4, out)
+    _render(Node(
+        "setting",
+        [("id", "enable_shadow_detection"), ("type", "boolean"),
+         ("label", "32106"), ("help", "32107")],
+        children=[_level("0"), _default("false"), _control_toggle()]), 4, out)
+    _render(Node(
+        "setting",
+        [("id", SPARSE_OFFSETS_ID), ("type", "boolean"),
+         ("label", "32108"), ("help", "32109")],
+        children=[_level("0"),
+                  _default("true" if layout == LAYOUT_SPARSE else "false"),
+                  _control_toggle()]), 4, out)
+    _render(Node(
+        "setting",
+        [("id", "enable_apply_verification"), ("type", "boolean"),
+         ("label", "32121"), ("help", "32122")],
+        children=[_level("0"), _default("true"), _control_toggle()]), 4, out)
+    _render(Node(
+        "setting",
+        [("id", "fleet_overlay_path"), ("type", "path"),
+         ("label", "32118"), ("help", "32119")],
+        children=[_level("0"), _default(""),
+                  Node("constraints", children=[
+                      Node("writable", text="false"),
+                      Node("masking", text=".json"),
+                      Node("allowempty", text="true"),
+                  ]),
+                  Node("control", [("type", "button"), ("format", "file")],
+                       children=[Node("heading", text="32118")])]), 4, out)
     out.append("{0}</group>".format(_indent(3)))
     out.append("{0}</category>".format(_indent(2)))
 
 
-def build_settings_text():
-    """Return the full settings.xml text (LF-terminated)."""
+def build_settings_text(layout=LAYOUT_FULL):
+    """Return the settings.xml text of ``layout`` (LF-terminated)."""
     out = [XML_DECLARATION, '<settings version="1">',
            '{0}<section id="script.audiooffsetmanager">'.format(_indent(1))]
 
@@ -500,7 +595,7 @@ def build_settings_text():
             out.append(_comment(2, CATEGORY_COMMENT[hdr]))
         else:
             out.append("")
-        _emit_hdr_category(out, hdr)
+        _emit_hdr_category(out, hdr, layout)
 
     out.append("")
     out.append(_comment(2, CATEGORY_COMMENT["seek_back_settings"]))
@@ -512,7 +607,7 @@ def build_settings_text():
 
     out.append("")
     out.append(_comment(2, CATEGORY_COMMENT["advanced"]))
-    _emit_advanced(out)
+    _emit_advanced(out, layout)
 
     out.append("")
     out.append("{0}</section>".format(_indent(1)))
@@ -557,9 +652,11 @@ def main(argv=None):
                         help="verify the on-disk file matches (exit 1 on drift)")
     parser.add_argument("-o", "--output", default=SETTINGS_PATH,
                         help="output path (default: resources/settings.xml)")
+    parser.add_argument("--layout", choices=LAYOUTS, default=LAYOUT_FULL,
+                        help="settings layout (default: full)")
     args = parser.parse_args(argv)
 
-    text = build_settings_text()
+    text = build_settings_text(args.layout)
     if args.check:
         ok, message = _check(args.output, text)
         print(message)